@@ -3,5 +3,6 @@ Middleware modules for the nobra_calculator API
 """
 
 from .rate_limiter import RateLimitMiddleware, create_redis_client, parse_whitelist
+from .metrics import MetricsMiddleware, instrument_routes
 
-__all__ = ["RateLimitMiddleware", "create_redis_client", "parse_whitelist"]
\ No newline at end of file
+__all__ = ["RateLimitMiddleware", "create_redis_client", "parse_whitelist", "MetricsMiddleware", "instrument_routes"]
\ No newline at end of file
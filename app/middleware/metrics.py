@@ -0,0 +1,151 @@
+"""
+Request latency instrumentation
+
+MetricsMiddleware is the outermost application middleware: it starts the
+timing of each request, records the stage durations into the preaggregated
+metrics of the route when the response starts, and adds them to the
+response as a Server-Timing header. instrument_routes() wraps every API
+route so that the timing learns when routing ended, which route and score
+were matched, and when the endpoint function ran (the time before it is
+FastAPI's request parsing and validation).
+"""
+
+import asyncio
+import functools
+from time import perf_counter
+from typing import Any, Callable, Dict, Optional
+
+from fastapi.routing import APIRoute
+from starlette.routing import Router
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.services.metrics_service import RouteMetrics, current_timing, metrics_service
+from app.services.score_service import score_service
+
+
+class MetricsMiddleware:
+    """ASGI middleware timing every HTTP request by stage"""
+
+    def __init__(self, app: ASGIApp, server_timing: bool = True):
+        """
+        Initializes the middleware
+
+        Args:
+            app (ASGIApp): Application to wrap
+            server_timing (bool): Add the stage durations as a Server-Timing header
+        """
+        self.app = app
+        self.server_timing = server_timing
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timing, token = metrics_service.start_request(perf_counter())
+
+        async def send_with_timing(message: Message):
+            if message["type"] == "http.response.start":
+                durations = timing.finish(perf_counter())
+                (timing.route_metrics or metrics_service.unmatched).record(durations, message["status"])
+                if self.server_timing:
+                    headers = list(message.get("headers", ()))
+                    headers.append((b"server-timing", timing.server_timing().encode("latin-1")))
+                    message["headers"] = headers
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        except Exception:
+            # Unhandled errors never reach send; count them as 500 responses
+            if timing.durations is None:
+                (timing.route_metrics or metrics_service.unmatched).record(timing.finish(perf_counter()), 500)
+            raise
+        finally:
+            metrics_service.end_request(token)
+
+
+class _TimedRoute:
+    """Route app wrapper marking the end of routing and the matched route and score"""
+
+    def __init__(self, route: APIRoute, app: ASGIApp):
+        self.route = route
+        self.app = app
+        score_id = route.path[1:]
+        self.by_parameter = "score_id" in route.param_convertors
+        self.metrics: Optional[RouteMetrics] = None
+        self.score_id = score_id if score_service.score_exists(score_id) else ""
+        self._per_score: Dict[str, RouteMetrics] = {}
+
+    def _route_metrics(self, scope: Scope) -> RouteMetrics:
+        """Returns the metrics of the matched route and score"""
+        if self.by_parameter:
+            score_id = scope.get("path_params", {}).get("score_id")
+            metrics = self._per_score.get(score_id)
+            if metrics is not None:
+                return metrics
+            # Only known scores get their own series, so clients cannot create labels
+            if score_service.score_exists(score_id):
+                metrics = self._per_score[score_id] = metrics_service.route_metrics(self.route.path, score_id)
+                return metrics
+
+        if self.metrics is None:
+            self.metrics = metrics_service.route_metrics(self.route.path, self.score_id)
+        return self.metrics
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        timing = current_timing()
+        if timing is not None:
+            timing.route_reached(perf_counter(), self._route_metrics(scope))
+        await self.app(scope, receive, send)
+
+
+def _timed_endpoint(call: Callable[..., Any]) -> Callable[..., Any]:
+    """Wraps an endpoint function to mark when it starts and returns"""
+    if asyncio.iscoroutinefunction(call):
+        @functools.wraps(call)
+        async def timed(**values):
+            timing = current_timing()
+            if timing is None:
+                return await call(**values)
+            timing.endpoint_start = perf_counter()
+            try:
+                return await call(**values)
+            finally:
+                timing.endpoint_end = perf_counter()
+    else:
+        @functools.wraps(call)
+        def timed(**values):
+            timing = current_timing()
+            if timing is None:
+                return call(**values)
+            timing.endpoint_start = perf_counter()
+            try:
+                return call(**values)
+            finally:
+                timing.endpoint_end = perf_counter()
+    return timed
+
+
+def instrument_routes(router: Router) -> int:
+    """
+    Adds stage timing to every API route of a router
+
+    Must run after the routes are registered; routes added later are
+    reported under the "unmatched" route.
+
+    Args:
+        router (Router): Router whose routes are instrumented (e.g. FastAPI().router)
+
+    Returns:
+        int: Number of routes instrumented by this call
+    """
+    instrumented = 0
+    for route in router.routes:
+        if not isinstance(route, APIRoute) or isinstance(route.app, _TimedRoute):
+            continue
+        # FastAPI's handler calls dependant.call at request time
+        route.dependant.call = _timed_endpoint(route.dependant.call)
+        route.app = _TimedRoute(route, route.app)
+        instrumented += 1
+    return instrumented
@@ -17,6 +17,7 @@ from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import JSONResponse
 import redis
 from redis.exceptions import RedisError
+from app.services.metrics_service import metrics_service
 
 
 class RateLimitMiddleware(BaseHTTPMiddleware):
@@ -133,16 +134,19 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             key = f"rate_limit:{client_ip}:{current_second}"
             
             # Increment the counter for this second
+            start = time.perf_counter()
             count = self.redis_client.incr(key)
             
             # Set expiration to 2 seconds (cleanup old keys)
             if count == 1:
                 self.redis_client.expire(key, 2)
+            metrics_service.record_redis_call(time.perf_counter() - start)
             
             # Check if limit exceeded
             return count <= self.req_per_sec
             
         except RedisError:
+            metrics_service.record_redis_call(time.perf_counter() - start, failed=True)
             # If Redis fails, allow the request (fail open)
             # You could change this to fail closed if preferred
             return True
@@ -152,7 +156,9 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         try:
             current_second = int(time.time())
             key = f"rate_limit:{client_ip}:{current_second}"
+            start = time.perf_counter()
             count = self.redis_client.get(key)
+            metrics_service.record_redis_call(time.perf_counter() - start)
             
             if count is None:
                 return self.req_per_sec
@@ -160,6 +166,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             return max(0, self.req_per_sec - int(count))
             
         except RedisError:
+            metrics_service.record_redis_call(time.perf_counter() - start, failed=True)
             return self.req_per_sec
 
 
@@ -235,6 +235,144 @@ class HealthResponse(BaseModel):
         }
 
 
+class VitalSignsEvent(BaseModel):
+    """Raw vital-sign event for the streaming early warning scores"""
+    patient_id: str = Field(..., description="Identifier of the monitored patient")
+    vitals: Dict[str, Any] = Field(..., description="New raw values of one or more vitals (e.g. respiratory_rate in breaths/min, temperature in °C, consciousness as alert/confusion/voice/pain/unresponsive)")
+    scores: Optional[List[str]] = Field(None, description="Streaming scores to update (default: all streaming scores)")
+    
+    class Config:
+        schema_extra = {
+            "example": {
+                "patient_id": "bed-12",
+                "vitals": {
+                    "respiratory_rate": 24,
+                    "oxygen_saturation": 93,
+                    "heart_rate": 112
+                },
+                "scores": ["news_2"]
+            }
+        }
+
+
+class HistogramSpec(BaseModel):
+    """Fixed-bin histogram of numeric score results"""
+    min: float = Field(..., description="Lower edge of the first bin")
+    max: float = Field(..., description="Upper edge of the last bin")
+    bins: int = Field(20, ge=1, le=1000, description="Number of equal-width bins")
+    
+    @field_validator('max')
+    def validate_range(cls, v, info):
+        if 'min' in info.data and v <= info.data['min']:
+            raise ValueError("Histogram max must be greater than min")
+        return v
+
+
+class BulkScoreRequest(BaseModel):
+    """Population scoring request for one score"""
+    rows: List[Dict[str, Any]] = Field(..., description="One parameter set per patient; fields that are not score parameters (e.g. site, cohort) are kept for grouping only")
+    aggregate: bool = Field(False, description="Return only summary counters, histograms and group means instead of one result per row")
+    group_by: Optional[List[str]] = Field(None, description="Row fields to summarize by in aggregate mode")
+    histogram: Optional[HistogramSpec] = Field(None, description="Fixed-bin histogram of the result in aggregate mode")
+    
+    class Config:
+        schema_extra = {
+            "example": {
+                "rows": [
+                    {"sex": "female", "age": 64, "serum_creatinine": 1.1, "site": "north"},
+                    {"sex": "male", "age": 71, "serum_creatinine": 2.3, "site": "south"}
+                ],
+                "aggregate": True,
+                "group_by": ["site"],
+                "histogram": {"min": 0, "max": 150, "bins": 15}
+            }
+        }
+
+class SweepAxis(BaseModel):
+    """Numeric parameter varied in a sweep"""
+    parameter: str = Field(..., description="Name of the numeric parameter to vary")
+    min: Optional[float] = Field(None, description="First value (default: the parameter's validation min)")
+    max: Optional[float] = Field(None, description="Last value (default: the parameter's validation max)")
+    steps: int = Field(20, ge=2, le=1000, description="Number of evenly spaced values (integer parameters are deduplicated after rounding)")
+
+
+class SweepRequest(BaseModel):
+    """What-if sweep of a score over one or two parameters"""
+    parameters: Dict[str, Any] = Field(..., description="Base parameter set; swept parameters may be omitted")
+    sweep: List[SweepAxis] = Field(..., min_length=1, max_length=2, description="One or two parameters to vary; with two, results are nested by the first")
+    
+    class Config:
+        schema_extra = {
+            "example": {
+                "parameters": {
+                    "age": 55,
+                    "sex": "male",
+                    "race": "white",
+                    "total_cholesterol": 213,
+                    "hdl_cholesterol": 50,
+                    "bp_treatment": False,
+                    "diabetes": False,
+                    "smoker": False
+                },
+                "sweep": [{"parameter": "systolic_bp", "min": 110, "max": 180, "steps": 15}]
+            }
+        }
+
+class BoundaryRequest(BaseModel):
+    """Stage-boundary search over one free numeric parameter"""
+    parameters: Dict[str, Any] = Field(..., description="Base parameter set; the free parameter may be omitted")
+    parameter: str = Field(..., description="Name of the free numeric parameter")
+    min: Optional[float] = Field(None, description="Lower end of the search range (default: the parameter's validation min)")
+    max: Optional[float] = Field(None, description="Upper end of the search range (default: the parameter's validation max)")
+    tolerance: Optional[float] = Field(None, gt=0, description="Width to which float boundaries are narrowed (default: 1e-6 of the range)")
+    
+    class Config:
+        schema_extra = {
+            "example": {
+                "parameters": {
+                    "age": 55,
+                    "sex": "male",
+                    "race": "white",
+                    "total_cholesterol": 213,
+                    "hdl_cholesterol": 50,
+                    "bp_treatment": False,
+                    "diabetes": False,
+                    "smoker": False
+                },
+                "parameter": "systolic_bp"
+            }
+        }
+
+
+class UncertaintySpec(BaseModel):
+    """Measurement uncertainty of one numeric parameter"""
+    cv: Optional[float] = Field(None, ge=0, description="Coefficient of variation, as a fraction of the measured value (e.g. 0.05 for 5%)")
+    sd: Optional[float] = Field(None, ge=0, description="Absolute standard deviation, in the parameter's unit")
+
+
+class UncertaintyRequest(BaseModel):
+    """Monte Carlo uncertainty propagation through a score"""
+    parameters: Dict[str, Any] = Field(..., description="Measured parameter set")
+    uncertainty: Dict[str, UncertaintySpec] = Field(..., description="Uncertainty of each varied numeric parameter; exactly one of cv or sd per parameter")
+    samples: int = Field(1000, ge=1, le=10000, description="Number of Monte Carlo samples")
+    seed: Optional[int] = Field(None, description="Random seed for reproducible results")
+    
+    class Config:
+        schema_extra = {
+            "example": {
+                "parameters": {
+                    "sex": "female",
+                    "age": 60,
+                    "serum_creatinine": 1.3
+                },
+                "uncertainty": {
+                    "serum_creatinine": {"cv": 0.05}
+                },
+                "samples": 2000,
+                "seed": 42
+            }
+        }
+
 class Cha2ds2VascRequest(BaseModel):
     """
     Request model for CHA₂DS₂-VASc Score calculation
@@ -20,7 +20,7 @@ and guides clinical decision-making regarding opioid therapy management.
 """
 
 from pydantic import BaseModel, Field, validator
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Union
 import json
 
 
@@ -88,9 +88,9 @@ class MmeCalculatorRequest(BaseModel):
     - ≥90 MME/day: High risk, careful evaluation, naloxone essential
     
     Input Format:
-    Provide medications as JSON string containing array of medication objects.
-    Each medication must include: medication name, dose, frequency per day.
-    Route is optional (defaults to oral).
+    Provide medications as an array of medication objects, or as a JSON string
+    containing that array. Each medication must include: medication name, dose,
+    frequency per day. Route is optional (defaults to oral).
     
     Example JSON:
     [
@@ -109,15 +109,20 @@ class MmeCalculatorRequest(BaseModel):
     doi: 10.1002/pds.3945.
     """
     
-    opioid_medications: str = Field(
+    opioid_medications: Union[List[OpioidMedication], str] = Field(
         ...,
-        description="JSON array of opioid medications with dosing details. Format: [{\"medication\": \"oxycodone\", \"dose\": 15, \"frequency_per_day\": 2, \"route\": \"oral\"}]",
+        description="Opioid medications with dosing details, as an array of objects or a JSON string of that array. Format: [{\"medication\": \"oxycodone\", \"dose\": 15, \"frequency_per_day\": 2, \"route\": \"oral\"}]",
         example='[{"medication": "oxycodone", "dose": 15, "frequency_per_day": 2, "route": "oral"}, {"medication": "morphine", "dose": 30, "frequency_per_day": 1, "route": "oral"}]'
     )
     
     @validator('opioid_medications')
     def validate_medications_json(cls, v):
-        """Validate that the medications string is valid JSON array"""
+        """Validate that the medications are a non-empty list or a valid JSON array"""
+        if isinstance(v, list):
+            if not v:
+                raise ValueError("At least one medication must be provided")
+            return v
+        
         try:
             medications = json.loads(v)
             if not isinstance(medications, list):
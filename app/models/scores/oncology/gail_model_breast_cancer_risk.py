@@ -23,7 +23,9 @@ Key Features:
 - Validated for women aged 35-85 years without personal history of breast cancer
 - Uses 7 key risk factors: age, race/ethnicity, age at menarche, age at first live birth, 
   family history, breast biopsy history, and atypical hyperplasia
-- Validated for White, African-American, Hispanic, and Asian/Pacific Islander women in the US
+- Implements the BCRAT models for White and African-American women; American Indian/Alaska
+  Native women and unknown race use the White model. Hispanic and Asian-American women need
+  the race-specific BCRAT models, which are not available here
 - Primary clinical threshold: 5-year risk ≥1.67% for chemoprevention consideration
 
 Clinical Applications:
@@ -35,7 +37,7 @@ Clinical Applications:
 
 Risk Factors Evaluated:
 1. **Age**: Current age (35-85 years) - primary driver of baseline risk
-2. **Race/Ethnicity**: White, African-American, Hispanic, Asian-American, American Indian/Alaska Native
+2. **Race/Ethnicity**: White, African-American, American Indian/Alaska Native, unknown
 3. **Age at Menarche**: First menstrual period (7-11, 12-13, >13 years)
 4. **Age at First Live Birth**: <20, 20-24, 25-29, ≥30 years, or nulliparous
 5. **Family History**: Number of first-degree relatives with breast cancer (0, 1, >1)
@@ -58,7 +60,7 @@ The exact NCI Gail Model uses complex race-specific coefficients and competing
 hazards calculations that are proprietary.
 """
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field
 from typing import Literal, Optional
 
 
@@ -128,17 +130,10 @@ class GailModelBreastCancerRiskRequest(BaseModel):
     7. **Race/Ethnicity**
        - **White**: Non-Hispanic White
        - **African-American**: Black or African-American
-       - **Hispanic**: Hispanic or Latina (any race)
-       - **Asian-American**: Asian or Pacific Islander
-       - **American Indian/Alaska Native**: Indigenous populations
-       - **Unknown**: When race/ethnicity is not specified
-    
-    8. **Asian Sub-Race** (if Asian-American selected)
-       - **Chinese**: Chinese ancestry
-       - **Japanese**: Japanese ancestry
-       - **Filipino**: Filipino ancestry
-       - **Hawaiian**: Native Hawaiian
-       - **Pacific Islander**: Other Pacific Islander
+       - **American Indian/Alaska Native**: Indigenous populations (White model)
+       - **Unknown**: When race/ethnicity is not specified (White model)
+       - Hispanic and Asian-American women are not covered: use the NCI Breast Cancer
+         Risk Assessment Tool, which includes their race-specific models
     
     **CLINICAL DECISION THRESHOLDS**:
     
@@ -217,26 +212,12 @@ class GailModelBreastCancerRiskRequest(BaseModel):
         example="no"
     )
     
-    race_ethnicity: Literal["white", "african_american", "hispanic", "asian_american", "american_indian_alaskan_native", "unknown"] = Field(
+    race_ethnicity: Literal["white", "african_american", "american_indian_alaskan_native", "unknown"] = Field(
         ...,
-        description="Race/ethnicity for risk adjustment. Model validated for specific populations",
+        description="Race/ethnicity for risk adjustment. Hispanic and Asian-American women need race-specific BCRAT models that are not available here",
         example="white"
     )
     
-    asian_subrace: Optional[Literal["chinese", "japanese", "filipino", "hawaiian", "pacific_islander"]] = Field(
-        None,
-        description="Asian sub-race (required only if race_ethnicity is asian_american)",
-        example=None
-    )
-    
-    @validator('asian_subrace')
-    def validate_asian_subrace(cls, v, values):
-        if values.get('race_ethnicity') == 'asian_american' and v is None:
-            raise ValueError('asian_subrace is required when race_ethnicity is asian_american')
-        if values.get('race_ethnicity') != 'asian_american' and v is not None:
-            raise ValueError('asian_subrace should only be provided when race_ethnicity is asian_american')
-        return v
-    
     class Config:
         schema_extra = {
             "example": {
@@ -246,8 +227,7 @@ class GailModelBreastCancerRiskRequest(BaseModel):
                 "relatives_with_breast_cancer": "0",
                 "previous_biopsies": "0",
                 "atypical_hyperplasia": "no",
-                "race_ethnicity": "white",
-                "asian_subrace": None
+                "race_ethnicity": "white"
             }
         }
 
@@ -256,7 +236,7 @@ class GailModelBreastCancerRiskResponse(BaseModel):
     """
     Response model for Gail Model Breast Cancer Risk Assessment
     
-    The response provides the calculated 5-year absolute breast cancer risk along with 
+    The response provides the calculated 5-year and lifetime absolute breast cancer risk along with 
     risk classification and evidence-based clinical recommendations for screening, 
     prevention, and management.
     
@@ -369,6 +349,14 @@ class GailModelBreastCancerRiskResponse(BaseModel):
         example=2.1
     )
     
+    lifetime_risk: Optional[float] = Field(
+        None,
+        description="Absolute risk of developing invasive breast cancer up to age 90 (percentage)",
+        ge=0,
+        le=100.0,
+        example=24.8
+    )
+    
     unit: str = Field(
         ...,
         description="Unit of measurement for the risk estimate",
@@ -397,6 +385,7 @@ class GailModelBreastCancerRiskResponse(BaseModel):
         schema_extra = {
             "example": {
                 "result": 2.1,
+                "lifetime_risk": 24.8,
                 "unit": "percentage",
                 "interpretation": "5-year breast cancer risk of 2.1% meets or exceeds the 1.67% threshold. Consider discussing chemoprevention options (tamoxifen, raloxifene, or aromatase inhibitors) with patient after evaluating benefits and risks. Enhanced screening strategies may be appropriate including earlier screening initiation, shorter screening intervals, or consideration of breast MRI. Genetic counseling may be considered if family history is significant.",
                 "stage": "High Risk",
@@ -21,12 +21,15 @@ class AapPediatricHypertensionRequest(BaseModel):
     - Long-term cardiovascular risk assessment
     - School and sports physical evaluations
     
-    **Classification System**:
-    - Normal: <90th percentile for age, sex, and height
-    - Elevated: 90th to <95th percentile or 120/80 to <95th percentile
-    - Stage 1 HTN: 95th percentile to <95th percentile + 12 mmHg or 130/80-139/89 mmHg
+    **Classification System** (children <13 years, whichever threshold is lower):
+    - Normal: <90th percentile for age, sex, and height and <120/80 mmHg
+    - Elevated: ≥90th percentile or ≥120/80 mmHg
+    - Stage 1 HTN: ≥95th percentile or ≥130/80 mmHg
     - Stage 2 HTN: ≥95th percentile + 12 mmHg or ≥140/90 mmHg
     
+    Adolescents ≥13 years use the adult cut points only: Elevated 120-129/<80 mmHg,
+    Stage 1 HTN 130-139/80-89 mmHg, Stage 2 HTN ≥140/90 mmHg.
+    
     **Reference**: Flynn JT, et al. Clinical Practice Guideline for Screening and Management of High Blood Pressure in Children and Adolescents. Pediatrics. 2017;140(3):e20171904.
     """
     age: int = Field(
@@ -127,14 +130,24 @@ class AapPediatricHypertensionResponse(BaseModel):
     )
     systolic_percentile: float = Field(
         ..., 
-        description="Systolic blood pressure percentile for age, sex, and height. Values help determine exact classification and tracking over time.",
+        description="Systolic blood pressure percentile for age, sex, and height from the NHBPEP Fourth Report (2004) equations (not the AAP 2017 tables). Values help determine exact classification and tracking over time.",
         example=75.2
     )
     diastolic_percentile: float = Field(
         ..., 
-        description="Diastolic blood pressure percentile for age, sex, and height. Used in conjunction with systolic percentile for classification.",
+        description="Diastolic blood pressure percentile for age, sex, and height from the NHBPEP Fourth Report (2004) equations (not the AAP 2017 tables). Used in conjunction with systolic percentile for classification.",
         example=68.5
     )
+    normative_reference: str = Field(
+        ...,
+        description="Source of the normative BP percentiles",
+        example="NHBPEP Fourth Report (2004) regression equations"
+    )
+    height_percentile_reference: str = Field(
+        ...,
+        description="Method of the height percentile used to look up the normative BP percentiles",
+        example="CDC 2000 stature-for-age median and coefficient of variation (L = 1)"
+    )
     
     class Config:
         json_schema_extra = {
@@ -145,6 +158,8 @@ class AapPediatricHypertensionResponse(BaseModel):
                 "stage": "Normal",
                 "stage_description": "Normal blood pressure",
                 "systolic_percentile": 75.2,
-                "diastolic_percentile": 68.5
+                "diastolic_percentile": 68.5,
+                "normative_reference": "NHBPEP Fourth Report (2004) regression equations",
+                "height_percentile_reference": "CDC 2000 stature-for-age median and coefficient of variation (L = 1)"
             }
         }
\ No newline at end of file
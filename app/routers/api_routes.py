@@ -2,10 +2,19 @@
 Main API routes for frontend integration
 """
 
-from fastapi import APIRouter, HTTPException, Query
-from typing import List, Optional, Dict, Any
+import codecs
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from pydantic import ValidationError
+from typing import AsyncIterator, List, Optional, Dict, Any
 from app.services.score_service import score_service
 from app.services.calculator_service import calculator_service
+from app.services.cohort_service import CHUNK_ROWS, CohortRun, CsvRows, NdjsonRows, cohort_service
+from app.services.sweep_service import sweep_service
+from app.services.boundary_service import boundary_service
+from app.services.uncertainty_service import uncertainty_service
+from app.services.validation_service import validation_service
+from app.models.score_models import BoundaryRequest, BulkScoreRequest, HistogramSpec, SweepRequest, UncertaintyRequest
 
 router = APIRouter(
     prefix="/api",
@@ -96,6 +105,396 @@ async def get_score_metadata(score_id: str):
             }
         )
 
+@router.post("/scores/{score_id}/calculate", summary="Calculate a Score", description="Calculate any available score from a JSON object of its parameters; parameters are validated against the score's metadata (type, required, options, min/max)", response_description="Calculation result with interpretation", operation_id="calculate_score")
+async def calculate_score(score_id: str, parameters: Dict[str, Any]):
+    """
+    Calculate a score with parameters validated against its metadata
+    
+    Args:
+        score_id: ID of the score
+        parameters: Parameter values keyed by parameter name
+        
+    Returns:
+        Dict: Calculation result with interpretation
+    """
+    if not score_service.score_exists(score_id) or not calculator_service.is_calculator_available(score_id):
+        raise HTTPException(
+            status_code=404,
+            detail={
+                "error": "ScoreNotFound",
+                "message": f"Score '{score_id}' not found",
+                "details": {"score_id": score_id}
+            }
+        )
+    
+    clean, errors = validation_service.validate(score_id, parameters)
+    if errors:
+        raise HTTPException(
+            status_code=422,
+            detail={
+                "error": "ValidationError",
+                "message": f"Invalid parameters for {score_id}",
+                "details": {"score_id": score_id, "errors": errors}
+            }
+        )
+    
+    try:
+        return calculator_service.calculate_score(score_id, clean)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=422,
+            detail={
+                "error": "ValidationError",
+                "message": f"Invalid parameters for {score_id}",
+                "details": {"score_id": score_id, "error": str(e)}
+            }
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail={
+                "error": "InternalServerError",
+                "message": "Internal error in calculation",
+                "details": {"score_id": score_id, "error": str(e)}
+            }
+        )
+
+def _inline_refs(schema: Any, definitions: Dict[str, Any]) -> Any:
+    """Replaces local $defs references of a model schema by the definitions"""
+    if isinstance(schema, dict):
+        reference = schema.get("$ref", "")
+        if reference.startswith("#/$defs/"):
+            return _inline_refs(definitions[reference[len("#/$defs/"):]], definitions)
+        return {key: _inline_refs(value, definitions) for key, value in schema.items() if key != "$defs"}
+    if isinstance(schema, list):
+        return [_inline_refs(item, definitions) for item in schema]
+    return schema
+
+
+# Request bodies of the bulk endpoint (the route reads the raw body to stream it)
+BULK_REQUEST_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "application/x-ndjson": {
+                "schema": {"type": "string", "description": "One JSON object of parameters (and grouping fields) per line"}
+            },
+            "text/csv": {
+                "schema": {"type": "string", "description": "Header line with field names, then one row per line; empty cells are missing values"}
+            },
+            "application/json": {
+                "schema": _inline_refs(BulkScoreRequest.model_json_schema(),
+                                       BulkScoreRequest.model_json_schema().get("$defs", {}))
+            }
+        }
+    }
+}
+
+# Content types read line by line, with the row parser for each
+STREAMED_BODY_TYPES = {
+    "application/x-ndjson": NdjsonRows,
+    "application/jsonl": NdjsonRows,
+    "text/csv": CsvRows
+}
+
+# Largest JSON body accepted; larger populations are uploaded as NDJSON or CSV
+MAX_JSON_BODY_BYTES = 10 * 1024 * 1024
+
+# Longest line accepted in an NDJSON or CSV upload
+MAX_LINE_BYTES = 1024 * 1024
+
+
+def _payload_too_large(score_id: str, message: str) -> HTTPException:
+    return HTTPException(
+        status_code=413,
+        detail={
+            "error": "PayloadTooLarge",
+            "message": message,
+            "details": {"score_id": score_id}
+        }
+    )
+
+
+async def _line_chunks(request: Request, score_id: str) -> AsyncIterator[List[str]]:
+    """Reads the request body incrementally and yields it in chunks of CHUNK_ROWS lines"""
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    pending = ""
+    lines: List[str] = []
+    async for data in request.stream():
+        pending += decoder.decode(data)
+        *complete, pending = pending.split("\n")
+        if len(pending) > MAX_LINE_BYTES:
+            raise _payload_too_large(score_id, f"Lines are limited to {MAX_LINE_BYTES} bytes")
+        for line in complete:
+            lines.append(line)
+            if len(lines) == CHUNK_ROWS:
+                yield lines
+                lines = []
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        lines.append(pending)
+    if lines:
+        yield lines
+
+
+def _feed_lines(run: CohortRun, parser, lines: List[str]):
+    """Parses and scores one chunk of lines (runs in the threadpool)"""
+    run.feed(parser.parse(lines))
+
+
+@router.post("/scores/{score_id}/bulk", summary="Score a Population", description="Score many parameter sets with one score, returning one result per row or, in aggregate mode, only stage counts, result statistics, histograms and group summaries. Large populations are uploaded as NDJSON or CSV, which are read and scored incrementally; options then go in the query string. Each row is validated against the score's metadata first.", response_description="Per-row results or a population summary", operation_id="bulk_score", openapi_extra=BULK_REQUEST_BODY)
+async def bulk_score(
+    score_id: str,
+    request: Request,
+    aggregate: bool = Query(False, description="NDJSON/CSV uploads: return only summary counters"),
+    group_by: Optional[List[str]] = Query(None, description="NDJSON/CSV uploads: row fields to summarize by in aggregate mode"),
+    histogram_min: Optional[float] = Query(None, description="NDJSON/CSV uploads: lower edge of the result histogram"),
+    histogram_max: Optional[float] = Query(None, description="NDJSON/CSV uploads: upper edge of the result histogram"),
+    histogram_bins: int = Query(20, ge=1, le=1000, description="NDJSON/CSV uploads: number of histogram bins")
+):
+    """
+    Score many parameter sets with one score
+    
+    Args:
+        score_id: ID of the score
+        request: Rows as NDJSON, CSV or a JSON BulkScoreRequest
+        aggregate: Return summary counters (NDJSON/CSV uploads)
+        group_by: Row fields to summarize by (NDJSON/CSV uploads)
+        histogram_min: Lower edge of the result histogram (NDJSON/CSV uploads)
+        histogram_max: Upper edge of the result histogram (NDJSON/CSV uploads)
+        histogram_bins: Number of histogram bins (NDJSON/CSV uploads)
+        
+    Returns:
+        Dict: Per-row results, or summary counters in aggregate mode
+    """
+    if not score_service.score_exists(score_id) or not calculator_service.is_calculator_available(score_id):
+        raise HTTPException(
+            status_code=404,
+            detail={
+                "error": "ScoreNotFound",
+                "message": f"Score '{score_id}' not found",
+                "details": {"score_id": score_id}
+            }
+        )
+    
+    content_type = request.headers.get("content-type", "application/json").split(";")[0].strip().lower()
+    parser_class = STREAMED_BODY_TYPES.get(content_type)
+    if parser_class is None and content_type != "application/json":
+        raise HTTPException(
+            status_code=415,
+            detail={
+                "error": "UnsupportedMediaType",
+                "message": f"Unsupported content type '{content_type}'",
+                "details": {"score_id": score_id, "supported": ["application/json", *STREAMED_BODY_TYPES]}
+            }
+        )
+    
+    try:
+        if parser_class is None:
+            body = bytearray()
+            async for data in request.stream():
+                body.extend(data)
+                if len(body) > MAX_JSON_BODY_BYTES:
+                    raise _payload_too_large(
+                        score_id, f"JSON bodies are limited to {MAX_JSON_BODY_BYTES} bytes; upload large populations as NDJSON or CSV"
+                    )
+            bulk_request = BulkScoreRequest.model_validate_json(bytes(body))
+            histogram = bulk_request.histogram
+            run = cohort_service.start(
+                score_id,
+                aggregate=bulk_request.aggregate,
+                group_by=bulk_request.group_by,
+                histogram=(histogram.min, histogram.max, histogram.bins) if histogram else None
+            )
+            await run_in_threadpool(run.feed, bulk_request.rows)
+        else:
+            histogram = None
+            if histogram_min is not None or histogram_max is not None:
+                spec = HistogramSpec(min=histogram_min, max=histogram_max, bins=histogram_bins)
+                histogram = (spec.min, spec.max, spec.bins)
+            run = cohort_service.start(score_id, aggregate=aggregate, group_by=group_by, histogram=histogram)
+            parser = parser_class()
+            async for lines in _line_chunks(request, score_id):
+                await run_in_threadpool(_feed_lines, run, parser, lines)
+        
+        return run.summary()
+        
+    except HTTPException:
+        raise
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=422,
+            detail={
+                "error": "ValidationError",
+                "message": "Invalid bulk request",
+                "details": {"score_id": score_id, "errors": e.errors(include_url=False, include_context=False)}
+            }
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=422,
+            detail={
+                "error": "ValidationError",
+                "message": str(e),
+                "details": {"score_id": score_id}
+            }
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail={
+                "error": "InternalServerError",
+                "message": "Error scoring rows",
+                "details": {"score_id": score_id, "error": str(e)}
+            }
+        )
+
+@router.post("/scores/{score_id}/sweep", summary="Sweep Score Parameters", description="Evaluate a score over a grid of one or two numeric parameters (what-if curves); ranges default to each parameter's validated min/max", response_description="Axis values with result and stage arrays", operation_id="sweep_score")
+async def sweep_score(score_id: str, request: SweepRequest):
+    """
+    Evaluate a score over a grid of one or two numeric parameters
+    
+    Args:
+        score_id: ID of the score
+        request: Base parameters and swept parameters
+        
+    Returns:
+        Dict: Axis values with result and stage arrays
+    """
+    if not score_service.score_exists(score_id) or not calculator_service.is_calculator_available(score_id):
+        raise HTTPException(
+            status_code=404,
+            detail={
+                "error": "ScoreNotFound",
+                "message": f"Score '{score_id}' not found",
+                "details": {"score_id": score_id}
+            }
+        )
+    
+    try:
+        return sweep_service.sweep(
+            score_id,
+            request.parameters,
+            [(axis.parameter, axis.min, axis.max, axis.steps) for axis in request.sweep]
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=422,
+            detail={
+                "error": "ValidationError",
+                "message": str(e),
+                "details": {"score_id": score_id}
+            }
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail={
+                "error": "InternalServerError",
+                "message": "Error sweeping score parameters",
+                "details": {"score_id": score_id, "error": str(e)}
+            }
+        )
+
+@router.post("/scores/{score_id}/boundaries", summary="Find Stage Boundaries", description="Find the values of one free numeric parameter at which the score's interpretation stage changes, within the parameter's validated range", response_description="Stage segments and boundary values", operation_id="find_score_boundaries")
+async def find_score_boundaries(score_id: str, request: BoundaryRequest):
+    """
+    Find where the interpretation stage changes along one free parameter
+    
+    Args:
+        score_id: ID of the score
+        request: Base parameters, free parameter and optional search range
+        
+    Returns:
+        Dict: Stage segments over the range and one entry per boundary
+    """
+    if not score_service.score_exists(score_id) or not calculator_service.is_calculator_available(score_id):
+        raise HTTPException(
+            status_code=404,
+            detail={
+                "error": "ScoreNotFound",
+                "message": f"Score '{score_id}' not found",
+                "details": {"score_id": score_id}
+            }
+        )
+    
+    try:
+        return boundary_service.solve(
+            score_id,
+            request.parameters,
+            request.parameter,
+            low=request.min,
+            high=request.max,
+            tolerance=request.tolerance
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=422,
+            detail={
+                "error": "ValidationError",
+                "message": str(e),
+                "details": {"score_id": score_id, "parameter": request.parameter}
+            }
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail={
+                "error": "InternalServerError",
+                "message": "Error finding stage boundaries",
+                "details": {"score_id": score_id, "error": str(e)}
+            }
+        )
+
+@router.post("/scores/{score_id}/uncertainty", summary="Propagate Measurement Uncertainty", description="Monte Carlo propagation of measurement uncertainty (CV or SD per numeric parameter) through a score with a vectorised batch calculator; returns the result distribution and the probability of each interpretation stage", response_description="Result distribution and stage probabilities", operation_id="propagate_score_uncertainty")
+async def propagate_score_uncertainty(score_id: str, request: UncertaintyRequest):
+    """
+    Propagate measurement uncertainty through a score
+    
+    Args:
+        score_id: ID of the score
+        request: Measured parameters, per-parameter uncertainty and sample count
+        
+    Returns:
+        Dict: Point estimate, result distribution and stage probabilities
+    """
+    if not score_service.score_exists(score_id) or not calculator_service.is_calculator_available(score_id):
+        raise HTTPException(
+            status_code=404,
+            detail={
+                "error": "ScoreNotFound",
+                "message": f"Score '{score_id}' not found",
+                "details": {"score_id": score_id}
+            }
+        )
+    
+    try:
+        return uncertainty_service.propagate(
+            score_id,
+            request.parameters,
+            {name: (spec.cv, spec.sd) for name, spec in request.uncertainty.items()},
+            samples=request.samples,
+            seed=request.seed
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=422,
+            detail={
+                "error": "ValidationError",
+                "message": str(e),
+                "details": {"score_id": score_id}
+            }
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail={
+                "error": "InternalServerError",
+                "message": "Error propagating uncertainty",
+                "details": {"score_id": score_id, "error": str(e)}
+            }
+        )
+
 @router.post("/reload", summary="Reload Scores and Calculators", description="Reload all scores and calculators in the system", response_description="Status of the reload operation", operation_id="reload_scores")
 async def reload_scores():
     """
@@ -108,6 +507,8 @@ async def reload_scores():
         # Reload scores and calculators
         score_service.reload_scores()
         calculator_service.reload_calculators()
+        boundary_service.clear_cache()
+        validation_service.clear_cache()
         
         # Count how many scores were loaded
         scores = score_service.get_available_scores()
@@ -0,0 +1,126 @@
+"""
+Exact-path dispatch for the application router
+
+Starlette resolves a request by trying every route's compiled path regex in
+registration order, so the ~560 per-score endpoints mounted at the root are
+reached after hundreds of failed matches, and so is every /api route
+registered after them. StaticRouteDispatcher sits in front of the router's
+own matching loop: parameter-free paths are resolved with one dictionary
+lookup, and routes with path parameters or mounts are only tried when the
+literal prefix of their path (e.g. "/api/scores/") matches. Everything it
+cannot resolve (wrong methods, trailing-slash redirects, 404s) falls
+through to the regular routing unchanged.
+
+Candidates are compared by registration position, so the route found is
+always the one regex routing would pick.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from starlette.routing import BaseRoute, Match, Route, Router
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class StaticRouteDispatcher:
+    """Resolves HTTP requests by exact path or path prefix before regex routing"""
+
+    def __init__(self, router: Router, fallback: ASGIApp):
+        """
+        Initializes the dispatcher
+
+        Args:
+            router (Router): Application router whose routes are indexed
+            fallback (ASGIApp): Regular routing app, called for unresolved requests
+        """
+        self.router = router
+        self.fallback = fallback
+        self._table: Dict[str, List[Tuple[int, BaseRoute]]] = {}
+        self._dynamic: List[Tuple[str, int, BaseRoute]] = []
+        self._indexed_routes = -1
+
+    def _build_index(self):
+        """Indexes static HTTP routes by path and the other routes by literal path prefix"""
+        table: Dict[str, List[Tuple[int, BaseRoute]]] = {}
+        dynamic: List[Tuple[str, int, BaseRoute]] = []
+        for position, route in enumerate(self.router.routes):
+            path = getattr(route, "path", None)
+            if getattr(route, "path_regex", None) is None or path is None:
+                # A route that can match arbitrary paths (e.g. a host route)
+                # hides everything registered after it
+                break
+
+            if isinstance(route, Route) and not route.param_convertors:
+                table.setdefault(path, []).append((position, route))
+            else:
+                dynamic.append((path.split("{", 1)[0], position, route))
+
+        self._table = table
+        self._dynamic = dynamic
+        self._indexed_routes = len(self.router.routes)
+
+    def match(self, scope: Scope) -> Optional[Tuple[BaseRoute, Dict[str, Any]]]:
+        """
+        Resolves a request to a route
+
+        Args:
+            scope (Scope): ASGI connection scope
+
+        Returns:
+            Optional[Tuple[BaseRoute, Dict]]: (route, child scope) on a full
+            match, None when regular routing must decide
+        """
+        if scope["type"] != "http" or scope.get("root_path"):
+            return None
+
+        # Routes are only ever appended; re-index when new ones are registered
+        if self._indexed_routes != len(self.router.routes):
+            self._build_index()
+
+        path = scope["path"]
+        found = None
+        for position, route in self._table.get(path, ()):
+            match, child_scope = route.matches(scope)
+            if match == Match.FULL:
+                found = (position, route, child_scope)
+                break
+
+        # Routes with path parameters registered before the static match win
+        for prefix, position, route in self._dynamic:
+            if found is not None and position > found[0]:
+                break
+            if path.startswith(prefix):
+                match, child_scope = route.matches(scope)
+                if match == Match.FULL:
+                    found = (position, route, child_scope)
+                    break
+
+        if found is None:
+            return None
+        return found[1], found[2]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        resolved = self.match(scope)
+        if resolved is None:
+            await self.fallback(scope, receive, send)
+            return
+
+        route, child_scope = resolved
+        if "router" not in scope:
+            scope["router"] = self.router
+        scope.update(child_scope)
+        await route.handle(scope, receive, send)
+
+
+def install_static_dispatch(router: Router) -> StaticRouteDispatcher:
+    """
+    Puts exact-path dispatch in front of a router's regex routing
+
+    Args:
+        router (Router): Router to accelerate (e.g. FastAPI().router)
+
+    Returns:
+        StaticRouteDispatcher: The installed dispatcher
+    """
+    dispatcher = StaticRouteDispatcher(router, router.middleware_stack)
+    router.middleware_stack = dispatcher
+    return dispatcher
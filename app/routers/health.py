@@ -3,6 +3,7 @@ Router for health check endpoints
 """
 
 from fastapi import APIRouter
+from app import __version__
 from app.models.score_models import HealthResponse
 
 router = APIRouter(
@@ -23,7 +24,7 @@ async def health_check():
     return HealthResponse(
         status="healthy",
         message="nobra_calculator API is running correctly",
-        version="1.0.0"
+        version=__version__
     )
 
 
@@ -0,0 +1,23 @@
+"""
+Router for the Prometheus metrics endpoint
+"""
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from app.services.metrics_service import metrics_service
+
+router = APIRouter(tags=["health"])
+
+# Content type of the Prometheus text exposition format
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics():
+    """
+    Exposes the latency histograms, error counters and cache hit rates of this process
+    
+    Returns:
+        PlainTextResponse: Metrics in the Prometheus text format
+    """
+    return PlainTextResponse(metrics_service.render(), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -35,9 +35,9 @@ async def calculate_gail_model_breast_cancer_risk(request: GailModelBreastCancer
     live birth, family history, breast biopsy history, and atypical hyperplasia. A 5-year 
     risk ≥1.67% meets the FDA threshold for chemoprevention consideration.
     
-    Valid for women aged 35-85 years without personal history of breast cancer. The model 
-    has been validated for White, African-American, Hispanic, and Asian/Pacific Islander 
-    women in the United States.
+    Valid for women aged 35-85 years without personal history of breast cancer. White and
+    African-American women use their BCRAT models; American Indian/Alaska Native women and
+    unknown race use the White model. Hispanic and Asian-American women are not covered.
     
     Args:
         request: Parameters needed for Gail Model calculation including demographic data,
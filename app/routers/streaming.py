@@ -0,0 +1,180 @@
+"""
+Streaming routes for the early warning scores
+
+Raw vital-sign events are posted per patient (HTTP or WebSocket); change
+events are returned to the sender and broadcast to Server-Sent Events and
+WebSocket subscribers whenever a score value or escalation tier changes.
+"""
+
+import asyncio
+import json
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+
+from app.models.score_models import VitalSignsEvent
+from app.services.streaming_service import streaming_service
+
+# Idle interval after which the SSE stream sends a keep-alive comment
+KEEPALIVE_SECONDS = 15
+
+router = APIRouter(
+    prefix="/api/stream",
+    tags=["streaming"]
+)
+
+
+def _invalid_event(e: Exception, patient_id: Optional[str] = None) -> dict:
+    """Builds the standard error body for a rejected vital-sign event"""
+    return {
+        "error": "ValidationError",
+        "message": str(e),
+        "details": {"patient_id": patient_id}
+    }
+
+
+@router.get("/scores", summary="List Streaming Scores", description="List the early warning scores available in streaming mode with the raw vitals they follow", response_description="Streamable scores with their vitals and components", operation_id="list_streaming_scores")
+async def list_streaming_scores():
+    """
+    List the early warning scores available in streaming mode
+
+    Returns:
+        Dict: Streamable scores with the vitals and components they follow
+    """
+    scores = streaming_service.get_streaming_scores()
+    return {
+        "scores": scores,
+        "total": len(scores)
+    }
+
+
+@router.post("/vitals", summary="Ingest Vital Signs", description="Apply a raw vital-sign event to a patient's early warning scores; returns change events for scores whose value or tier changed", response_description="Change events caused by the vital-sign event", operation_id="ingest_vital_signs")
+async def ingest_vital_signs(event: VitalSignsEvent):
+    """
+    Apply a raw vital-sign event to a patient's early warning scores
+
+    Args:
+        event: Patient identifier, raw vitals and optional score selection
+
+    Returns:
+        Dict: Change events caused by the vital-sign event
+    """
+    try:
+        events = streaming_service.ingest(event.patient_id, event.vitals, event.scores)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=_invalid_event(e, event.patient_id))
+
+    return {"events": events}
+
+
+@router.get("/patients/{patient_id}", summary="Get Patient Streaming State", description="Get the last vitals, component points, score and tier of a followed patient", response_description="Streaming state per score", operation_id="get_streaming_patient_state")
+async def get_patient_state(patient_id: str):
+    """
+    Get the current streaming state of a patient
+
+    Args:
+        patient_id: Patient identifier
+
+    Returns:
+        Dict: Streaming state per score
+    """
+    states = streaming_service.get_patient_state(patient_id)
+    if not states:
+        raise HTTPException(
+            status_code=404,
+            detail={
+                "error": "PatientNotFound",
+                "message": f"Patient '{patient_id}' is not followed",
+                "details": {"patient_id": patient_id}
+            }
+        )
+
+    return {"patient_id": patient_id, "scores": states}
+
+
+@router.delete("/patients/{patient_id}", summary="Discharge Patient", description="Stop following a patient and drop its streaming state", response_description="Discharge status", operation_id="discharge_streaming_patient")
+async def discharge_patient(patient_id: str):
+    """
+    Stop following a patient
+
+    Args:
+        patient_id: Patient identifier
+
+    Returns:
+        Dict: Discharge status
+    """
+    if not streaming_service.discharge(patient_id):
+        raise HTTPException(
+            status_code=404,
+            detail={
+                "error": "PatientNotFound",
+                "message": f"Patient '{patient_id}' is not followed",
+                "details": {"patient_id": patient_id}
+            }
+        )
+
+    return {"status": "success", "patient_id": patient_id}
+
+
+@router.get("/events", summary="Subscribe to Score Changes", description="Server-Sent Events stream of early warning score changes", response_description="text/event-stream of change events", operation_id="stream_score_events")
+async def stream_events(
+    request: Request,
+    scores: Optional[str] = Query(None, description="Comma-separated score IDs to follow (default: all)")
+):
+    """
+    Server-Sent Events stream of score and tier changes
+
+    Args:
+        scores: Comma-separated score IDs to follow (optional)
+
+    Returns:
+        StreamingResponse: text/event-stream of change events
+    """
+    selected = set(scores.split(",")) if scores else None
+    queue = streaming_service.subscribe()
+
+    async def event_source():
+        try:
+            while not await request.is_disconnected():
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    # Comment line keeps proxies from closing an idle stream
+                    yield ": keep-alive\n\n"
+                    continue
+                if selected is None or event["score_id"] in selected:
+                    yield f"event: score_change\ndata: {json.dumps(event)}\n\n"
+        finally:
+            streaming_service.unsubscribe(queue)
+
+    return StreamingResponse(
+        event_source(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.websocket("/ws")
+async def vitals_websocket(websocket: WebSocket):
+    """
+    Bidirectional vitals feed
+
+    Each text message is a JSON vital-sign event ({"patient_id", "vitals",
+    "scores"}); the server answers every message with the change events it
+    caused ({"events": [...]}) or an error body.
+    """
+    await websocket.accept()
+    try:
+        while True:
+            message = await websocket.receive_text()
+            try:
+                event = VitalSignsEvent.model_validate_json(message)
+                events = streaming_service.ingest(event.patient_id, event.vitals, event.scores)
+            except (ValidationError, ValueError) as e:
+                await websocket.send_json(_invalid_event(e))
+                continue
+            await websocket.send_json({"events": events})
+    except WebSocketDisconnect:
+        pass
@@ -0,0 +1,174 @@
+"""
+Service to find where a score's interpretation stage changes
+
+One numeric parameter of a base parameter set is left free. Its validated
+range is scanned on an even grid in one batch; every pair of neighbouring
+grid points with different stages brackets a boundary, and all brackets are
+then narrowed together by bisection, one batch of midpoints per iteration.
+Integer parameters are bisected down to adjacent integers, float parameters
+to the requested tolerance.
+
+Stage changes narrower than the scan spacing can be missed; integer ranges
+up to MAX_SCAN_POINTS values are scanned exhaustively. Solved boundaries
+are cached per base profile.
+"""
+
+import json
+from collections import OrderedDict
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from app.services.calculator_service import calculator_service
+from app.services.score_service import score_service
+from app.services.sweep_service import grid_values, parameter_range
+
+
+# Grid points of the initial scan
+MAX_SCAN_POINTS = 129
+
+# Default float tolerance, relative to the width of the range
+RELATIVE_TOLERANCE = 1e-6
+
+# Bisection iterations before a bracket is reported as is
+MAX_ITERATIONS = 60
+
+# Solved base profiles kept in the cache
+CACHE_SIZE = 1024
+
+
+class BoundaryService:
+    """Service to solve the stage boundaries of one free parameter"""
+
+    def __init__(self):
+        """Initializes the boundary service"""
+        self._cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+    def clear_cache(self):
+        """Drops all solved boundaries (e.g. after calculators are reloaded)"""
+        self._cache.clear()
+
+    def _evaluate(self, score_id: str, base: Mapping[str, Any], parameter: str,
+                  values: List[Any]) -> List[Tuple[Optional[Any], Optional[Any]]]:
+        """Returns (stage, result) at each value of the free parameter; (None, None) on error"""
+        parameter_sets = []
+        for value in values:
+            point = dict(base)
+            point[parameter] = value
+            parameter_sets.append(point)
+
+        outcomes = []
+        for result, error in calculator_service.calculate_batch(score_id, parameter_sets):
+            if error is not None:
+                outcomes.append((None, None))
+            else:
+                outcomes.append((result.get("stage"), result.get("result")))
+        return outcomes
+
+    def solve(self, score_id: str, parameters: Mapping[str, Any], parameter: str,
+              low: Optional[float] = None, high: Optional[float] = None,
+              tolerance: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Finds the values of a free parameter at which the stage changes
+
+        Args:
+            score_id (str): ID of the score
+            parameters (Mapping[str, Any]): Base parameter set (the free
+                parameter, if present, is ignored)
+            parameter (str): Name of the free numeric parameter
+            low (float, optional): Lower bound (default: validation min)
+            high (float, optional): Upper bound (default: validation max)
+            tolerance (float, optional): Width to which float boundaries are
+                narrowed (default: 1e-6 of the range)
+
+        Returns:
+            Dict: Stage segments over the range and one entry per boundary
+
+        Raises:
+            ValueError: If the parameter or range is invalid or the score does not exist
+        """
+        kind, low, high = parameter_range(score_id, parameter, low, high)
+        if tolerance is None:
+            tolerance = (high - low) * RELATIVE_TOLERANCE
+        elif tolerance <= 0:
+            raise ValueError("Tolerance must be positive")
+
+        base = {name: value for name, value in parameters.items() if name != parameter}
+        key = json.dumps([score_id, base, parameter, low, high, tolerance], sort_keys=True, default=str)
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return dict(self._cache[key], cached=True)
+
+        values = grid_values(kind, low, high, MAX_SCAN_POINTS)
+        outcomes = self._evaluate(score_id, base, parameter, values)
+
+        # Brackets of neighbouring scan points whose (valid) stages differ
+        brackets = []
+        for index in range(len(values) - 1):
+            (stage_a, result_a), (stage_b, result_b) = outcomes[index], outcomes[index + 1]
+            if stage_a is None or stage_b is None or stage_a == stage_b:
+                continue
+            brackets.append([values[index], values[index + 1], stage_a, stage_b, result_a, result_b])
+
+        for _ in range(MAX_ITERATIONS):
+            open_brackets = [
+                bracket for bracket in brackets
+                if (bracket[1] - bracket[0] > 1 if kind == "integer" else bracket[1] - bracket[0] > tolerance)
+            ]
+            if not open_brackets:
+                break
+
+            midpoints = [
+                (bracket[0] + bracket[1]) // 2 if kind == "integer" else (bracket[0] + bracket[1]) / 2
+                for bracket in open_brackets
+            ]
+            for bracket, midpoint, (stage, result) in zip(
+                open_brackets, midpoints, self._evaluate(score_id, base, parameter, midpoints)
+            ):
+                if stage == bracket[2]:
+                    bracket[0], bracket[4] = midpoint, result
+                elif stage == bracket[3] or stage is None:
+                    bracket[1], bracket[5] = midpoint, result
+                else:
+                    # A third stage inside the bracket: split it in two crossings
+                    brackets.append([midpoint, bracket[1], stage, bracket[3], result, bracket[5]])
+                    bracket[1], bracket[3], bracket[5] = midpoint, stage, result
+
+        ranges = (score_service.get_score_raw_data(score_id).get("interpretation") or {}).get("ranges") or []
+        boundaries = []
+        for lower, upper, from_stage, to_stage, result_below, result_above in sorted(brackets, key=lambda item: item[0]):
+            boundary = {
+                "value": upper if kind == "integer" else round(upper, 6),
+                "lower": lower if kind == "integer" else round(lower, 6),
+                "upper": upper if kind == "integer" else round(upper, 6),
+                "from_stage": from_stage,
+                "to_stage": to_stage,
+                "result_below": result_below,
+                "result_above": result_above
+            }
+            threshold = next((item for item in ranges if item.get("stage") == to_stage), None)
+            if threshold is not None:
+                boundary["interpretation_range"] = {"min": threshold.get("min"), "max": threshold.get("max")}
+            boundaries.append(boundary)
+
+        segments = []
+        start, stage = low, outcomes[0][0]
+        for boundary in boundaries:
+            segments.append({"from": start, "to": boundary["value"], "stage": boundary["from_stage"]})
+            start, stage = boundary["value"], boundary["to_stage"]
+        segments.append({"from": start, "to": high, "stage": stage})
+
+        solution = {
+            "score_id": score_id,
+            "parameter": parameter,
+            "range": [low, high],
+            "segments": segments,
+            "boundaries": boundaries
+        }
+
+        self._cache[key] = solution
+        if len(self._cache) > CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return dict(solution, cached=False)
+
+
+# Global service instance
+boundary_service = BoundaryService()
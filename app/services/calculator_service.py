@@ -5,7 +5,9 @@ Service to execute medical score calculations
 import importlib
 import sys
 from pathlib import Path
-from typing import Dict, Any, Optional
+from time import perf_counter
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Sequence, Tuple
+from app.services.metrics_service import current_timing, metrics_service
 from app.services.score_service import score_service
 
 
@@ -21,6 +23,9 @@ class CalculatorService:
         """
         self.calculators_directory = Path(calculators_directory)
         self._calculator_cache: Dict[str, Any] = {}
+        self._batch_cache: Dict[str, Optional[Any]] = {}
+        self._calculator_stats = metrics_service.cache_stats("calculator")
+        self._batch_stats = metrics_service.cache_stats("batch_calculator")
         
         # Add the calculators directory to Python's path
         if str(self.calculators_directory.absolute()) not in sys.path:
@@ -37,7 +42,9 @@ class CalculatorService:
             Optional[Any]: Calculation function or None if not found
         """
         if score_id in self._calculator_cache:
+            self._calculator_stats.hits += 1
             return self._calculator_cache[score_id]
+        self._calculator_stats.misses += 1
         
         try:
             # Try to import the calculator module
@@ -74,6 +81,34 @@ class CalculatorService:
             print(f"Unexpected error loading calculator {score_id}: {e}")
             return None
     
+    def _load_batch_calculator(self, score_id: str) -> Optional[Any]:
+        """
+        Loads a score's batch calculation function, if its module declares one
+        
+        Batch functions follow the calculate_{score_id}_batch convention: they
+        take a sequence of parameter mappings and return one result per
+        mapping, as the scalar function would, evaluating the model over all
+        of them at once.
+        
+        Args:
+            score_id (str): ID of the score
+            
+        Returns:
+            Optional[Any]: Batch calculation function or None
+        """
+        if score_id in self._batch_cache:
+            self._batch_stats.hits += 1
+            return self._batch_cache[score_id]
+        self._batch_stats.misses += 1
+        
+        batch_function = None
+        if self._load_calculator(score_id) is not None:
+            calculator_module = sys.modules.get(f"calculators.{score_id}")
+            batch_function = getattr(calculator_module, f"calculate_{score_id}_batch", None)
+        
+        self._batch_cache[score_id] = batch_function
+        return batch_function
+    
     def calculate_score(self, score_id: str, parameters: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
         Executes a score's calculation with the provided parameters
@@ -94,6 +129,9 @@ class CalculatorService:
         if calculator_function is None:
             raise ValueError(f"Calculator for '{score_id}' not found")
         
+        # Time the calculation when serving a request (see metrics_service)
+        timing = current_timing()
+        start = perf_counter()
         try:
             # Execute the calculation
             result = calculator_function(**parameters)
@@ -105,6 +143,86 @@ class CalculatorService:
         except Exception as e:
             # Other calculation errors
             raise ValueError(f"Error calculating {score_id}: {e}")
+        finally:
+            if timing is not None:
+                timing.calculation += perf_counter() - start
+    
+    def calculate_many(self, score_id: str,
+                       parameter_sets: Iterable[Dict[str, Any]]) -> Iterator[Tuple[Optional[Dict[str, Any]], Optional[str]]]:
+        """
+        Executes a score's calculation over many parameter sets
+        
+        The score and its calculator are resolved once; parameter sets are
+        consumed lazily, so callers can stream rows without materializing them.
+        
+        Args:
+            score_id (str): ID of the score
+            parameter_sets (Iterable[dict]): Parameters of each calculation
+            
+        Yields:
+            Tuple[Optional[Dict], Optional[str]]: (result, None) for each
+            successful calculation or (None, error message) for a failed one
+            
+        Raises:
+            ValueError: If the score or its calculator does not exist
+        """
+        if not score_service.score_exists(score_id):
+            raise ValueError(f"Score '{score_id}' not found")
+        
+        calculator_function = self._load_calculator(score_id)
+        if calculator_function is None:
+            raise ValueError(f"Calculator for '{score_id}' not found")
+        
+        # Only the calculator calls are timed, not the caller's work between rows
+        timing = current_timing()
+        for parameters in parameter_sets:
+            start = perf_counter()
+            try:
+                outcome = calculator_function(**parameters), None
+            except TypeError as e:
+                outcome = None, f"Invalid parameters for {score_id}: {e}"
+            except Exception as e:
+                outcome = None, f"Error calculating {score_id}: {e}"
+            if timing is not None:
+                timing.calculation += perf_counter() - start
+            yield outcome
+    
+    def calculate_batch(self, score_id: str,
+                        parameter_sets: Sequence[Dict[str, Any]]) -> List[Tuple[Optional[Dict[str, Any]], Optional[str]]]:
+        """
+        Executes a score's calculation over a batch of parameter sets
+        
+        Uses the score's vectorised batch function when it has one. If the
+        batch is rejected (an invalid parameter set), every set is calculated
+        individually so that errors are reported per set.
+        
+        Args:
+            score_id (str): ID of the score
+            parameter_sets (Sequence[dict]): Parameters of each calculation
+            
+        Returns:
+            List[Tuple[Optional[Dict], Optional[str]]]: (result, error) per set, in input order
+            
+        Raises:
+            ValueError: If the score or its calculator does not exist
+        """
+        if not score_service.score_exists(score_id):
+            raise ValueError(f"Score '{score_id}' not found")
+        
+        batch_function = self._load_batch_calculator(score_id)
+        if batch_function is not None and parameter_sets:
+            timing = current_timing()
+            start = perf_counter()
+            try:
+                return [(result, None) for result in batch_function(parameter_sets)]
+            except Exception:
+                # Fall back to individual calculations to locate the failing sets
+                pass
+            finally:
+                if timing is not None:
+                    timing.calculation += perf_counter() - start
+        
+        return list(self.calculate_many(score_id, parameter_sets))
     
     def validate_parameters(self, score_id: str, parameters: Dict[str, Any]) -> bool:
         """
@@ -157,6 +275,7 @@ class CalculatorService:
     def reload_calculators(self):
         """Clears the calculator cache forcing reload"""
         self._calculator_cache.clear()
+        self._batch_cache.clear()
         
         # Remove calculator modules from Python's cache
         modules_to_remove = []
@@ -179,6 +298,35 @@ class CalculatorService:
         """
         calculator_function = self._load_calculator(score_id)
         return calculator_function is not None
+    
+    def load_all_calculators(self) -> int:
+        """
+        Imports the calculator (and batch function) of every score up front
+        
+        Used to warm a process before it forks workers, so the calculator
+        modules are shared instead of imported again by each worker.
+        
+        Returns:
+            int: Number of scores with an available calculator
+        """
+        loaded = 0
+        for score in score_service.get_available_scores():
+            if self._load_calculator(score.id) is not None:
+                self._load_batch_calculator(score.id)
+                loaded += 1
+        return loaded
+    
+    def is_batch_calculator_available(self, score_id: str) -> bool:
+        """
+        Checks if the score's calculator declares a vectorised batch function
+        
+        Args:
+            score_id (str): ID of the score
+            
+        Returns:
+            bool: True if calculate_{score_id}_batch is available, False otherwise
+        """
+        return self._load_batch_calculator(score_id) is not None
 
 
 # Global service instance
@@ -0,0 +1,326 @@
+"""
+Service to score patient populations
+
+Rows arrive in chunks (an NDJSON or CSV upload is parsed a chunk of lines at
+a time) and are fed to a CohortRun, which checks each row with the score's
+compiled validator and streams the valid ones through the calculator once.
+In aggregate mode only running counters are kept (result statistics, stage
+counts, a fixed-bin histogram and the same counters per group), so the
+memory and the response size grow with the number of groups instead of the
+number of rows.
+"""
+
+import csv
+import json
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from app.services.calculator_service import calculator_service
+from app.services.result_statistics import RunningStats, numeric_result
+from app.services.validation_service import validation_service
+
+
+# Largest number of rows scored in one request
+MAX_ROWS = 100000
+
+# Rows parsed and scored per step of an incremental upload
+CHUNK_ROWS = 1000
+
+# Failed rows reported individually in aggregate mode; the rest are only counted
+MAX_ERROR_SAMPLES = 10
+
+
+class InvalidRow(NamedTuple):
+    """Upload line that could not be read as a row"""
+    error: str
+
+
+Row = Union[Dict[str, Any], InvalidRow]
+
+
+class NdjsonRows:
+    """Parses NDJSON lines (one JSON object per line) into rows"""
+
+    def parse(self, lines: Iterable[str]) -> List[Row]:
+        rows: List[Row] = []
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError as e:
+                rows.append(InvalidRow(f"Invalid JSON: {e}"))
+                continue
+            rows.append(row if isinstance(row, dict) else InvalidRow("Each line must be a JSON object"))
+        return rows
+
+
+class CsvRows:
+    """Parses CSV lines into rows, the first line being the header"""
+
+    def __init__(self):
+        self.header: Optional[List[str]] = None
+
+    def parse(self, lines: Iterable[str]) -> List[Row]:
+        rows: List[Row] = []
+        for values in csv.reader(lines):
+            if not values:
+                continue
+            if self.header is None:
+                self.header = [name.strip() for name in values]
+                continue
+            if len(values) != len(self.header):
+                rows.append(InvalidRow(f"Expected {len(self.header)} fields, got {len(values)}"))
+                continue
+            # Empty cells are missing values; the validator coerces the strings
+            rows.append({name: value for name, value in zip(self.header, values) if value != ""})
+        return rows
+
+
+class Histogram:
+    """Fixed-bin histogram with underflow and overflow counters"""
+
+    __slots__ = ("low", "high", "width", "counts", "underflow", "overflow")
+
+    def __init__(self, low: float, high: float, bins: int):
+        self.low = low
+        self.high = high
+        self.width = (high - low) / bins
+        self.counts = [0] * bins
+        self.underflow = 0
+        self.overflow = 0
+
+    def add(self, value: float):
+        """Counts one value; the upper edge belongs to the last bin"""
+        if value < self.low:
+            self.underflow += 1
+        elif value > self.high:
+            self.overflow += 1
+        else:
+            self.counts[min(int((value - self.low) / self.width), len(self.counts) - 1)] += 1
+
+    def summary(self) -> Dict[str, Any]:
+        """Returns the bin edges and counts"""
+        return {
+            "edges": [self.low + self.width * index for index in range(len(self.counts))] + [self.high],
+            "counts": list(self.counts),
+            "underflow": self.underflow,
+            "overflow": self.overflow
+        }
+
+
+class GroupCounters:
+    """Running counters of one group of rows"""
+
+    __slots__ = ("rows", "errors", "stats", "stages")
+
+    def __init__(self):
+        self.rows = 0
+        self.errors = 0
+        self.stats = RunningStats()
+        self.stages: Dict[str, int] = {}
+
+    def add(self, result: Optional[Dict[str, Any]]):
+        """Counts one calculation result (None for a failed row)"""
+        self.rows += 1
+        if result is None:
+            self.errors += 1
+            return
+
+        value = numeric_result(result)
+        if value is not None:
+            self.stats.add(value)
+        stage = result.get("stage")
+        if stage is not None:
+            self.stages[stage] = self.stages.get(stage, 0) + 1
+
+    def summary(self) -> Dict[str, Any]:
+        """Returns the counters of the group"""
+        return {
+            "rows": self.rows,
+            "errors": self.errors,
+            "result": self.stats.summary(),
+            "stages": dict(self.stages)
+        }
+
+
+class CohortRun:
+    """Scoring of one population, fed with rows chunk by chunk"""
+
+    def __init__(self, score_id: str, aggregate: bool = False,
+                 group_by: Optional[Sequence[str]] = None,
+                 histogram: Optional[Tuple[float, float, int]] = None):
+        """
+        Args:
+            score_id (str): ID of the score
+            aggregate (bool): Keep only summary counters instead of one result per row
+            group_by (Sequence[str], optional): Row fields to summarize by in aggregate mode
+            histogram (Tuple[float, float, int], optional): (min, max, bins) of
+                a fixed-bin histogram of the numeric result in aggregate mode
+
+        Raises:
+            ValueError: If the score does not exist
+        """
+        validator = validation_service.get_validator(score_id)
+        if validator is None:
+            raise ValueError(f"Score '{score_id}' not found")
+
+        self.score_id = score_id
+        self.validator = validator
+        self.rows = 0
+        self.results: Optional[List[Dict[str, Any]]] = None if aggregate else []
+        self.group_by = tuple(group_by or ()) if aggregate else ()
+        self.overall = GroupCounters()
+        self.groups: Dict[Tuple[Any, ...], GroupCounters] = {}
+        self.bins = Histogram(*histogram) if aggregate and histogram else None
+        self.errors: List[Dict[str, Any]] = []
+
+    def _score(self, rows: Sequence[Row]) -> Iterator[Tuple[Row, Optional[Dict[str, Any]], Optional[Dict[str, Any]]]]:
+        """
+        Validates and scores rows in order
+
+        Yields:
+            Tuple: (row, result, None) for a scored row or (row, None, error entry) for a failed one
+        """
+        # Rows rejected by the validator wait in the queue until the
+        # calculator reaches the next valid row, so results stay in row order
+        queue: Deque[Tuple[Row, Optional[Dict[str, Any]]]] = deque()
+
+        def valid_parameters() -> Iterator[Dict[str, Any]]:
+            for row in rows:
+                if isinstance(row, InvalidRow):
+                    queue.append((row, {"error": row.error}))
+                    continue
+                clean, errors = self.validator(row)
+                if errors:
+                    queue.append((row, {"error": f"Invalid parameters for {self.score_id}", "details": errors}))
+                    continue
+                queue.append((row, None))
+                yield clean
+
+        for result, error in calculator_service.calculate_many(self.score_id, valid_parameters()):
+            while queue[0][1] is not None:
+                row, failure = queue.popleft()
+                yield row, None, failure
+            row, _ = queue.popleft()
+            yield row, result, (None if error is None else {"error": error})
+        while queue:
+            row, failure = queue.popleft()
+            yield row, None, failure
+
+    def feed(self, rows: Sequence[Row]):
+        """
+        Scores the next rows of the population
+
+        Raises:
+            ValueError: If the population grows past MAX_ROWS, or the calculator does not exist
+        """
+        if self.rows + len(rows) > MAX_ROWS:
+            raise ValueError(f"At most {MAX_ROWS} rows can be scored in one request")
+
+        for row, result, failure in self._score(rows):
+            index = self.rows
+            self.rows += 1
+            if self.results is not None:
+                entry = {"row": index, "result": result} if failure is None else dict(failure, row=index)
+                self.results.append(entry)
+                continue
+
+            self.overall.add(result)
+            if failure is not None and len(self.errors) < MAX_ERROR_SAMPLES:
+                self.errors.append(dict(failure, row=index))
+            if self.bins is not None and result is not None:
+                value = numeric_result(result)
+                if value is not None:
+                    self.bins.add(value)
+            if self.group_by:
+                fields = row if isinstance(row, dict) else {}
+                key = tuple(_group_value(fields.get(field)) for field in self.group_by)
+                counters = self.groups.get(key)
+                if counters is None:
+                    counters = self.groups[key] = GroupCounters()
+                counters.add(result)
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Returns the outcome of the rows fed so far
+
+        Returns:
+            Dict: One entry per row ({"row", "result"} or {"row", "error"}), or
+            in aggregate mode the overall counters, histogram, group counters
+            and a sample of errors
+        """
+        if self.results is not None:
+            return {"score_id": self.score_id, "results": self.results}
+
+        summary = {"score_id": self.score_id}
+        summary.update(self.overall.summary())
+        if self.bins is not None:
+            summary["histogram"] = self.bins.summary()
+        if self.group_by:
+            summary["group_by"] = list(self.group_by)
+            summary["groups"] = [
+                dict({"group": dict(zip(self.group_by, key))}, **counters.summary())
+                for key, counters in self.groups.items()
+            ]
+        summary["error_samples"] = self.errors
+        return summary
+
+
+class CohortService:
+    """Service to score many patients with one score"""
+
+    def start(self, score_id: str, aggregate: bool = False,
+              group_by: Optional[Sequence[str]] = None,
+              histogram: Optional[Tuple[float, float, int]] = None) -> CohortRun:
+        """
+        Starts scoring a population; feed it rows with CohortRun.feed()
+
+        Args:
+            score_id (str): ID of the score
+            aggregate (bool): Keep only summary counters instead of one result per row
+            group_by (Sequence[str], optional): Row fields to summarize by in aggregate mode
+            histogram (Tuple[float, float, int], optional): (min, max, bins) of
+                a fixed-bin histogram of the numeric result
+
+        Returns:
+            CohortRun: Scoring state of the population
+
+        Raises:
+            ValueError: If the score does not exist
+        """
+        return CohortRun(score_id, aggregate, group_by, histogram)
+
+    def score(self, score_id: str, rows: Iterable[Row], aggregate: bool = False,
+              group_by: Optional[Sequence[str]] = None,
+              histogram: Optional[Tuple[float, float, int]] = None) -> Dict[str, Any]:
+        """
+        Scores a population given as rows and returns the summary
+
+        Rows are fed in chunks of CHUNK_ROWS, so an iterator is never
+        materialized as a whole.
+
+        Raises:
+            ValueError: If the score or its calculator does not exist or there are more than MAX_ROWS rows
+        """
+        run = self.start(score_id, aggregate, group_by, histogram)
+        chunk: List[Row] = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) == CHUNK_ROWS:
+                run.feed(chunk)
+                chunk = []
+        if chunk:
+            run.feed(chunk)
+        return run.summary()
+
+
+def _group_value(value: Any) -> Any:
+    """Makes a row field usable as a group key (lists and dicts are keyed by their JSON-like repr)"""
+    if isinstance(value, (list, dict)):
+        return repr(value)
+    return value
+
+
+# Global service instance
+cohort_service = CohortService()
@@ -0,0 +1,287 @@
+"""
+Service to aggregate request latency metrics
+
+Every request is split into stages (rate limiting, routing, request
+validation, calculation, response construction, serialisation) by a
+RequestTiming object that the metrics middleware puts in a context variable;
+the route wrappers, the rate limiter and calculator_service mark their part
+on it. When the response starts, the stage durations are added to histograms
+that are preaggregated per route and score: each (route, score_id) pair owns
+one RouteMetrics object with a fixed array of bucket counts per stage, so
+recording a request only increments integers, without building label sets.
+render() writes everything in the Prometheus text exposition format.
+
+Metrics are kept per process; with several workers, each one reports its own.
+"""
+
+import contextvars
+from bisect import bisect_left
+from typing import Dict, List, Optional, Tuple
+
+
+# Stages of a request, in the order they happen
+STAGES = ("rate_limit", "routing", "validation", "calculation", "response", "serialization", "total")
+
+# Histogram bucket upper bounds in seconds
+LATENCY_BUCKETS = (
+    0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005,
+    0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+# Server-Timing header value, filled with the stage durations in milliseconds
+SERVER_TIMING_FORMAT = ", ".join(f"{stage};dur=%.3f" for stage in STAGES)
+
+# Route label of requests answered before reaching a route (404, 429, mounts)
+UNMATCHED_ROUTE = "unmatched"
+
+
+class Histogram:
+    """Fixed-bucket latency histogram"""
+
+    __slots__ = ("bounds", "counts", "sum")
+
+    def __init__(self, bounds: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        """Adds one observation (in seconds)"""
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts)
+
+    def render(self, name: str, labels: str) -> List[str]:
+        """Returns the Prometheus sample lines of the histogram"""
+        separator = "," if labels else ""
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.bounds, self.counts):
+            cumulative += count
+            lines.append(f'{name}_bucket{{{labels}{separator}le="{bound:g}"}} {cumulative}')
+        cumulative += self.counts[-1]
+        lines.append(f'{name}_bucket{{{labels}{separator}le="+Inf"}} {cumulative}')
+        lines.append(f"{name}_sum{{{labels}}} {self.sum!r}" if labels else f"{name}_sum {self.sum!r}")
+        lines.append(f"{name}_count{{{labels}}} {cumulative}" if labels else f"{name}_count {cumulative}")
+        return lines
+
+
+class RouteMetrics:
+    """Stage histograms and error counts of one route and score"""
+
+    __slots__ = ("route", "score_id", "stages", "errors")
+
+    def __init__(self, route: str, score_id: str):
+        self.route = route
+        self.score_id = score_id
+        self.stages = [Histogram() for _ in STAGES]
+        self.errors: Dict[int, int] = {}
+
+    def record(self, durations: Tuple[float, ...], status: int):
+        """Records the stage durations (aligned with STAGES) and status of one request"""
+        for histogram, duration in zip(self.stages, durations):
+            histogram.observe(duration)
+        if status >= 400:
+            self.errors[status] = self.errors.get(status, 0) + 1
+
+
+class CacheStats:
+    """Hit and miss counters of one cache"""
+
+    __slots__ = ("hits", "misses")
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+
+class RequestTiming:
+    """Timestamps and stage durations of the request being served"""
+
+    __slots__ = ("start", "rate_limit", "routed", "routing", "endpoint_start", "endpoint_end",
+                 "calculation", "route_metrics", "durations")
+
+    def __init__(self, start: float):
+        self.start = start
+        self.rate_limit = 0.0
+        self.routed = 0.0
+        self.routing = 0.0
+        self.endpoint_start = 0.0
+        self.endpoint_end = 0.0
+        self.calculation = 0.0
+        self.route_metrics: Optional[RouteMetrics] = None
+        self.durations: Optional[Tuple[float, ...]] = None
+
+    def route_reached(self, now: float, route_metrics: RouteMetrics):
+        """Marks the end of routing (the matched route starts handling the request)"""
+        self.routed = now
+        self.routing = now - self.start - self.rate_limit
+        self.route_metrics = route_metrics
+
+    def finish(self, now: float) -> Tuple[float, ...]:
+        """
+        Splits the time up to the response start into stages
+
+        Validation runs from the route to the endpoint call (or to the error
+        response when validation fails); whatever happens after the endpoint
+        returns (response model validation, JSON rendering, middleware) is
+        serialisation.
+
+        Returns:
+            Tuple[float, ...]: Stage durations in seconds, aligned with STAGES
+        """
+        total = now - self.start
+        routing = self.routing
+        validation = response = 0.0
+        calculation = self.calculation
+        if not self.routed:
+            routing = total - self.rate_limit
+        elif self.endpoint_start:
+            validation = self.endpoint_start - self.routed
+            response = max(0.0, (self.endpoint_end or now) - self.endpoint_start - calculation)
+        else:
+            validation = now - self.routed
+        serialization = max(0.0, total - self.rate_limit - routing - validation - calculation - response)
+
+        self.durations = (self.rate_limit, routing, validation, calculation, response, serialization, total)
+        return self.durations
+
+    def server_timing(self) -> str:
+        """Returns the Server-Timing header value of the finished request"""
+        return SERVER_TIMING_FORMAT % tuple(duration * 1000 for duration in self.durations)
+
+
+# Timing of the request handled by the current task
+_current_timing: contextvars.ContextVar[Optional[RequestTiming]] = contextvars.ContextVar(
+    "request_timing", default=None
+)
+
+
+def current_timing() -> Optional[RequestTiming]:
+    """Returns the timing of the request being served, if any"""
+    return _current_timing.get()
+
+
+def _escape(value: str) -> str:
+    """Escapes a Prometheus label value"""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class MetricsService:
+    """Service holding the preaggregated request, rate limiter and cache metrics"""
+
+    def __init__(self):
+        """Initializes the metrics service"""
+        self._routes: Dict[Tuple[str, str], RouteMetrics] = {}
+        self._caches: Dict[str, CacheStats] = {}
+        self.redis_latency = Histogram()
+        self.redis_errors = 0
+        self.unmatched = self.route_metrics(UNMATCHED_ROUTE)
+
+    def route_metrics(self, route: str, score_id: str = "") -> RouteMetrics:
+        """
+        Returns the metrics of a route and score, creating them on first use
+
+        Args:
+            route (str): Path template of the route
+            score_id (str): ID of the score served, "" for other routes
+
+        Returns:
+            RouteMetrics: Metrics to keep a reference to and record into
+        """
+        key = (route, score_id)
+        metrics = self._routes.get(key)
+        if metrics is None:
+            metrics = self._routes[key] = RouteMetrics(route, score_id)
+        return metrics
+
+    def cache_stats(self, cache: str) -> CacheStats:
+        """
+        Returns the hit/miss counters of a named cache, creating them on first use
+
+        Args:
+            cache (str): Name of the cache (e.g. "calculator")
+
+        Returns:
+            CacheStats: Counters the cache owner increments
+        """
+        stats = self._caches.get(cache)
+        if stats is None:
+            stats = self._caches[cache] = CacheStats()
+        return stats
+
+    def start_request(self, start: float) -> Tuple[RequestTiming, contextvars.Token]:
+        """Creates the timing of a new request and makes it current"""
+        timing = RequestTiming(start)
+        return timing, _current_timing.set(timing)
+
+    def end_request(self, token: contextvars.Token):
+        """Restores the timing context after a request"""
+        _current_timing.reset(token)
+
+    def record_redis_call(self, seconds: float, failed: bool = False):
+        """Records one rate limiter round trip to Redis"""
+        self.redis_latency.observe(seconds)
+        if failed:
+            self.redis_errors += 1
+        timing = _current_timing.get()
+        if timing is not None:
+            timing.rate_limit += seconds
+
+    def render(self) -> str:
+        """
+        Renders every metric in the Prometheus text exposition format (0.0.4)
+
+        Returns:
+            str: Exposition document
+        """
+        routes = sorted(self._routes.values(), key=lambda metrics: (metrics.route, metrics.score_id))
+        lines = [
+            "# HELP nobra_request_stage_seconds Time spent in each stage of a request, up to the response start",
+            "# TYPE nobra_request_stage_seconds histogram"
+        ]
+        for metrics in routes:
+            if not metrics.stages[-1].count:
+                continue
+            labels = f'route="{_escape(metrics.route)}",score_id="{_escape(metrics.score_id)}"'
+            for stage, histogram in zip(STAGES, metrics.stages):
+                lines.extend(histogram.render("nobra_request_stage_seconds", f'{labels},stage="{stage}"'))
+
+        lines.append("# HELP nobra_request_errors_total Responses with an error status")
+        lines.append("# TYPE nobra_request_errors_total counter")
+        for metrics in routes:
+            labels = f'route="{_escape(metrics.route)}",score_id="{_escape(metrics.score_id)}"'
+            for status, count in sorted(metrics.errors.items()):
+                lines.append(f'nobra_request_errors_total{{{labels},status="{status}"}} {count}')
+
+        lines.append("# HELP nobra_rate_limit_redis_seconds Latency of the rate limiter's Redis calls")
+        lines.append("# TYPE nobra_rate_limit_redis_seconds histogram")
+        lines.extend(self.redis_latency.render("nobra_rate_limit_redis_seconds", ""))
+        lines.append("# HELP nobra_rate_limit_redis_errors_total Failed rate limiter Redis calls")
+        lines.append("# TYPE nobra_rate_limit_redis_errors_total counter")
+        lines.append(f"nobra_rate_limit_redis_errors_total {self.redis_errors}")
+
+        caches = sorted(self._caches.items())
+        for name, kind, help_text in (
+            ("nobra_cache_hits_total", "counter", "Cache lookups served from the cache"),
+            ("nobra_cache_misses_total", "counter", "Cache lookups that had to load the entry"),
+            ("nobra_cache_hit_ratio", "gauge", "Share of cache lookups served from the cache")
+        ):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for cache, stats in caches:
+                if kind == "gauge":
+                    lookups = stats.hits + stats.misses
+                    value = stats.hits / lookups if lookups else "NaN"
+                else:
+                    value = stats.hits if name == "nobra_cache_hits_total" else stats.misses
+                lines.append(f'{name}{{cache="{_escape(cache)}"}} {value}')
+
+        return "\n".join(lines) + "\n"
+
+
+# Global service instance
+metrics_service = MetricsService()
@@ -0,0 +1,53 @@
+"""
+Running statistics over calculation results, shared by the services that
+summarize many calculations of one score
+"""
+
+import math
+from typing import Any, Dict, Optional
+
+
+class RunningStats:
+    """Count, mean, standard deviation and range of a stream of values"""
+
+    __slots__ = ("count", "mean", "m2", "min", "max")
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float):
+        """Adds one value (Welford update)"""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def summary(self) -> Dict[str, Any]:
+        """Returns the statistics, with null moments when no value was added"""
+        if not self.count:
+            return {"count": 0, "mean": None, "sd": None, "min": None, "max": None}
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "sd": math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else 0.0,
+            "min": self.min,
+            "max": self.max
+        }
+
+
+def numeric_result(result: Dict[str, Any]) -> Optional[float]:
+    """Returns the numeric result of a calculation, or None for categorical results"""
+    value = result.get("result")
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    if math.isnan(value) or math.isinf(value):
+        return None
+    return float(value)
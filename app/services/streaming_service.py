@@ -0,0 +1,180 @@
+"""
+Service to follow early warning scores over streams of raw vital signs
+"""
+
+import asyncio
+import importlib
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set
+
+from calculators.engines.streaming import ScoreStream
+
+
+# Scores whose calculator module declares a STREAMING_SCORE definition
+STREAMING_SCORES = (
+    "news",
+    "news_2",
+    "modified_early_warning_score",
+    "qsofa_score",
+    "modified_sofa"
+)
+
+# Pending events kept per subscriber before the oldest ones are dropped
+SUBSCRIBER_QUEUE_SIZE = 1000
+
+
+class StreamingService:
+    """Service keeping per-patient streaming state for the early warning scores"""
+
+    def __init__(self):
+        """Initializes the streaming service"""
+        self._streams: Dict[str, ScoreStream] = {}
+        self._subscribers: Set[asyncio.Queue] = set()
+
+    def _get_stream(self, score_id: str) -> ScoreStream:
+        """
+        Returns the stream of a score, loading its definition on first use
+
+        Args:
+            score_id (str): ID of the score
+
+        Returns:
+            ScoreStream: Incremental scorer for the score
+
+        Raises:
+            ValueError: If the score does not support streaming
+        """
+        if score_id in self._streams:
+            return self._streams[score_id]
+
+        if score_id not in STREAMING_SCORES:
+            raise ValueError(f"Score '{score_id}' does not support streaming")
+
+        module = importlib.import_module(f"calculators.{score_id}")
+        stream = ScoreStream(module.STREAMING_SCORE)
+        self._streams[score_id] = stream
+        return stream
+
+    def get_streaming_scores(self) -> List[Dict[str, Any]]:
+        """
+        Lists the streamable scores with the vitals and components they follow
+
+        Returns:
+            List[Dict]: One entry per streamable score
+        """
+        scores = []
+        for score_id in STREAMING_SCORES:
+            definition = self._get_stream(score_id).score
+            scores.append({
+                "score_id": score_id,
+                "vitals": list(definition.inputs),
+                "components": list(definition.component_names)
+            })
+        return scores
+
+    def ingest(self, patient_id: str, vitals: Mapping[str, Any],
+               score_ids: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Applies a raw vital-sign event to the followed scores of one patient
+
+        Each score only receives the vitals it reads, so one feed can drive all
+        streamable scores at once.
+
+        Args:
+            patient_id (str): Patient identifier
+            vitals (Mapping[str, Any]): New raw values of one or more vitals
+            score_ids (Iterable[str], optional): Scores to update (default: all)
+
+        The event is applied all or nothing: every selected score validates
+        and scores it before any patient state changes, so a rejected event
+        leaves all scores as they were.
+
+        Returns:
+            List[Dict]: Change events for scores whose value or tier changed
+
+        Raises:
+            ValueError: If a score is not streamable, no vital is used by the
+                selected scores or a value is invalid
+        """
+        streams = [self._get_stream(score_id) for score_id in (score_ids or STREAMING_SCORES)]
+
+        used = set()
+        pending = []
+        for stream in streams:
+            score_vitals = {name: value for name, value in vitals.items()
+                            if stream.score.dependents(name)}
+            if not score_vitals:
+                continue
+            used.update(score_vitals)
+            pending.append((stream, stream.prepare(patient_id, score_vitals)))
+
+        unused = [name for name in vitals if name not in used]
+        if unused and not used:
+            raise ValueError(f"No selected score uses the vitals: {', '.join(unused)}")
+
+        events = []
+        for stream, update in pending:
+            event = stream.commit(update)
+            if event is not None:
+                events.append(event)
+
+        self._publish(events)
+        return events
+
+    def get_patient_state(self, patient_id: str) -> List[Dict[str, Any]]:
+        """
+        Returns the current state of a patient in every followed score
+
+        Args:
+            patient_id (str): Patient identifier
+
+        Returns:
+            List[Dict]: State per score that follows the patient
+        """
+        states = []
+        for stream in self._streams.values():
+            state = stream.state(patient_id)
+            if state is not None:
+                states.append(state)
+        return states
+
+    def discharge(self, patient_id: str) -> bool:
+        """
+        Stops following a patient in every score
+
+        Args:
+            patient_id (str): Patient identifier
+
+        Returns:
+            bool: True if the patient was followed by at least one score
+        """
+        discharged = False
+        for stream in self._streams.values():
+            discharged = stream.discharge(patient_id) or discharged
+        return discharged
+
+    def subscribe(self) -> asyncio.Queue:
+        """
+        Registers a subscriber for change events (SSE and WebSocket clients)
+
+        Returns:
+            asyncio.Queue: Queue receiving every published change event
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self._subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        """Removes a subscriber queue"""
+        self._subscribers.discard(queue)
+
+    def _publish(self, events: List[Dict[str, Any]]):
+        """Pushes change events to every subscriber, dropping the oldest on overflow"""
+        for queue in self._subscribers:
+            for event in events:
+                if queue.full():
+                    queue.get_nowait()
+                queue.put_nowait(event)
+
+
+# Global service instance
+streaming_service = StreamingService()
@@ -0,0 +1,190 @@
+"""
+Service to evaluate scores over parameter grids (what-if curves)
+
+A base parameter set is varied along one or two numeric parameters; ranges
+default to the parameter's validation min/max in the score JSON. The whole
+grid is evaluated in one batch, through the score's vectorised batch
+function when it has one.
+"""
+
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from app.services.calculator_service import calculator_service
+from app.services.score_service import score_service
+
+
+# Parameter types that can be swept
+NUMERIC_TYPES = ("integer", "float")
+
+# Largest number of grid points evaluated in one request
+MAX_GRID_POINTS = 10000
+
+# Failed grid points reported individually; the rest are only marked null
+MAX_ERROR_SAMPLES = 10
+
+
+def numeric_parameter(score_id: str, name: str) -> Tuple[str, Optional[float], Optional[float]]:
+    """
+    Returns the type and validated range of a numeric score parameter
+
+    Args:
+        score_id (str): ID of the score
+        name (str): Parameter name
+
+    Returns:
+        Tuple[str, Optional[float], Optional[float]]: (type, min, max); bounds
+        are None when the score JSON does not declare them
+
+    Raises:
+        ValueError: If the score does not exist or the parameter is not numeric
+    """
+    score_data = score_service.get_score_raw_data(score_id)
+    if score_data is None:
+        raise ValueError(f"Score '{score_id}' not found")
+
+    for parameter in score_data["parameters"]:
+        if parameter["name"] != name:
+            continue
+        if parameter.get("type") not in NUMERIC_TYPES:
+            raise ValueError(f"Parameter '{name}' of {score_id} is not numeric")
+        validation = parameter.get("validation") or {}
+        return parameter["type"], validation.get("min"), validation.get("max")
+
+    raise ValueError(f"Score '{score_id}' has no parameter '{name}'")
+
+
+def parameter_range(score_id: str, name: str, low: Optional[float] = None,
+                    high: Optional[float] = None) -> Tuple[str, float, float]:
+    """
+    Resolves the range of a numeric parameter, defaulting to its validation bounds
+
+    Args:
+        score_id (str): ID of the score
+        name (str): Parameter name
+        low (float, optional): Requested lower bound
+        high (float, optional): Requested upper bound
+
+    Returns:
+        Tuple[str, float, float]: (type, low, high)
+
+    Raises:
+        ValueError: If a bound is missing or outside the validated range
+    """
+    kind, valid_low, valid_high = numeric_parameter(score_id, name)
+    low = valid_low if low is None else low
+    high = valid_high if high is None else high
+
+    if low is None or high is None:
+        raise ValueError(f"Parameter '{name}' has no validated range; min and max must be given")
+    if (valid_low is not None and low < valid_low) or (valid_high is not None and high > valid_high):
+        raise ValueError(f"Range of '{name}' must lie within {valid_low} to {valid_high}")
+    if low >= high:
+        raise ValueError(f"Range of '{name}' must have min lower than max")
+
+    return kind, low, high
+
+
+def grid_values(kind: str, low: float, high: float, steps: int) -> List[Any]:
+    """
+    Returns evenly spaced values between two bounds
+
+    Integer parameters are rounded and deduplicated, so short integer ranges
+    give fewer points than requested.
+
+    Args:
+        kind (str): Parameter type ("integer" or "float")
+        low (float): First value
+        high (float): Last value
+        steps (int): Number of values (at least 2)
+
+    Returns:
+        List: Values in increasing order
+    """
+    step = (high - low) / (steps - 1)
+    values = [low + step * index for index in range(steps - 1)] + [high]
+    if kind == "integer":
+        return sorted({int(round(value)) for value in values})
+    return [round(value, 6) for value in values]
+
+
+class SweepService:
+    """Service to evaluate a score over a grid of one or two parameters"""
+
+    def sweep(self, score_id: str, parameters: Mapping[str, Any],
+              axes: Sequence[Tuple[str, Optional[float], Optional[float], int]]) -> Dict[str, Any]:
+        """
+        Evaluates a score over a parameter grid
+
+        Args:
+            score_id (str): ID of the score
+            parameters (Mapping[str, Any]): Base parameter set
+            axes (Sequence[Tuple]): One or two (parameter, min, max, steps)
+                entries; min/max may be None to use the validated range
+
+        Returns:
+            Dict: Axis values and result/stage arrays (nested by the first
+            axis when two parameters are swept), with null for failed points
+
+        Raises:
+            ValueError: If the sweep definition is invalid or the score does not exist
+        """
+        if not 1 <= len(axes) <= 2:
+            raise ValueError("One or two parameters can be swept")
+        names = [name for name, _, _, _ in axes]
+        if len(set(names)) != len(names):
+            raise ValueError("Swept parameters must be distinct")
+
+        axis_values = []
+        for name, low, high, steps in axes:
+            kind, low, high = parameter_range(score_id, name, low, high)
+            axis_values.append(grid_values(kind, low, high, steps))
+
+        points = 1
+        for values in axis_values:
+            points *= len(values)
+        if points > MAX_GRID_POINTS:
+            raise ValueError(f"Grid has {points} points; at most {MAX_GRID_POINTS} are allowed")
+
+        base = dict(parameters)
+        if len(axes) == 1:
+            coordinates = [(value,) for value in axis_values[0]]
+        else:
+            coordinates = [(first, second) for first in axis_values[0] for second in axis_values[1]]
+
+        parameter_sets = []
+        for coordinate in coordinates:
+            point = dict(base)
+            point.update(zip(names, coordinate))
+            parameter_sets.append(point)
+
+        results = calculator_service.calculate_batch(score_id, parameter_sets)
+
+        values: List[Any] = []
+        stages: List[Any] = []
+        errors: List[Dict[str, Any]] = []
+        for index, (result, error) in enumerate(results):
+            if error is not None:
+                values.append(None)
+                stages.append(None)
+                if len(errors) < MAX_ERROR_SAMPLES:
+                    errors.append({"point": dict(zip(names, coordinates[index])), "error": error})
+                continue
+            values.append(result.get("result"))
+            stages.append(result.get("stage"))
+
+        if len(axes) == 2:
+            width = len(axis_values[1])
+            values = [values[start:start + width] for start in range(0, len(values), width)]
+            stages = [stages[start:start + width] for start in range(0, len(stages), width)]
+
+        return {
+            "score_id": score_id,
+            "axes": [{"parameter": name, "values": axis} for name, axis in zip(names, axis_values)],
+            "result": values,
+            "stage": stages,
+            "errors": errors
+        }
+
+
+# Global service instance
+sweep_service = SweepService()
@@ -0,0 +1,179 @@
+"""
+Service to propagate measurement uncertainty through a score
+
+Numeric parameters (typically lab values) are given a coefficient of
+variation or an absolute standard deviation. Normally distributed samples
+are drawn around the measured values, clipped to the validated range and
+rounded for integer parameters, and all samples are evaluated in one batch
+through the score's vectorised batch function. The response describes the
+distribution of the result and the probability of each interpretation
+stage.
+"""
+
+import math
+import random
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from app.services.calculator_service import calculator_service
+from app.services.result_statistics import RunningStats, numeric_result
+from app.services.sweep_service import numeric_parameter
+
+
+# Default and largest number of Monte Carlo samples per request
+DEFAULT_SAMPLES = 1000
+MAX_SAMPLES = 10000
+
+# Percentiles of the result distribution reported in the summary
+PERCENTILES = (2.5, 5, 25, 50, 75, 95, 97.5)
+
+# Failed samples reported individually; the rest are only counted
+MAX_ERROR_SAMPLES = 10
+
+
+def percentile(ordered: List[float], percent: float) -> float:
+    """
+    Returns a percentile of sorted values by linear interpolation
+
+    Args:
+        ordered (List[float]): Values in increasing order (non-empty)
+        percent (float): Percentile (0-100)
+
+    Returns:
+        float: Interpolated percentile
+    """
+    position = (len(ordered) - 1) * percent / 100
+    lower = int(math.floor(position))
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+class UncertaintyService:
+    """Service to estimate the distribution of a score under input uncertainty"""
+
+    def _sampler(self, score_id: str, name: str, value: Any, cv: Optional[float],
+                 sd: Optional[float]) -> Tuple[str, float, float, float, float]:
+        """
+        Resolves the sampling distribution of one uncertain parameter
+
+        Returns:
+            Tuple: (type, mean, sd, low, high), with infinite bounds when the
+            score JSON declares none
+
+        Raises:
+            ValueError: If the parameter or its uncertainty is invalid
+        """
+        kind, low, high = numeric_parameter(score_id, name)
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError(f"Parameter '{name}' needs a numeric value to carry uncertainty")
+        if (cv is None) == (sd is None):
+            raise ValueError(f"Uncertainty of '{name}' needs exactly one of cv or sd")
+        spread = abs(value) * cv if cv is not None else sd
+        if spread < 0:
+            raise ValueError(f"Uncertainty of '{name}' must not be negative")
+
+        return (
+            kind,
+            float(value),
+            float(spread),
+            -math.inf if low is None else low,
+            math.inf if high is None else high
+        )
+
+    def propagate(self, score_id: str, parameters: Mapping[str, Any],
+                  uncertainty: Mapping[str, Tuple[Optional[float], Optional[float]]],
+                  samples: int = DEFAULT_SAMPLES, seed: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Runs a Monte Carlo simulation of a score
+
+        Args:
+            score_id (str): ID of the score
+            parameters (Mapping[str, Any]): Measured parameter set
+            uncertainty (Mapping[str, Tuple]): (cv, sd) per uncertain numeric
+                parameter; exactly one of the two is given
+            samples (int): Number of Monte Carlo samples
+            seed (int, optional): Seed for reproducible draws
+
+        Returns:
+            Dict: Point estimate, result distribution and stage probabilities
+
+        Raises:
+            ValueError: If the score, a parameter or the simulation size is invalid
+        """
+        if not calculator_service.is_batch_calculator_available(score_id):
+            raise ValueError(f"Score '{score_id}' does not support uncertainty mode")
+        if not uncertainty:
+            raise ValueError("At least one parameter must carry an uncertainty")
+        if not 1 <= samples <= MAX_SAMPLES:
+            raise ValueError(f"Samples must be between 1 and {MAX_SAMPLES}")
+
+        samplers = []
+        for name, (cv, sd) in uncertainty.items():
+            if name not in parameters:
+                raise ValueError(f"Parameter '{name}' carries an uncertainty but has no value")
+            samplers.append((name,) + self._sampler(score_id, name, parameters[name], cv, sd))
+
+        generator = random.Random(seed)
+        gauss = generator.gauss
+        base = dict(parameters)
+        parameter_sets = []
+        clipped = dict.fromkeys(uncertainty, 0)
+        for _ in range(samples):
+            point = dict(base)
+            for name, kind, mean, spread, low, high in samplers:
+                value = gauss(mean, spread)
+                if value < low or value > high:
+                    value = low if value < low else high
+                    clipped[name] += 1
+                point[name] = int(round(value)) if kind == "integer" else value
+            parameter_sets.append(point)
+
+        point_estimate, point_error = calculator_service.calculate_batch(score_id, [base])[0]
+        if point_error is not None:
+            raise ValueError(point_error)
+
+        stats = RunningStats()
+        values: List[float] = []
+        stages: Dict[str, int] = {}
+        errors: List[Dict[str, Any]] = []
+        error_count = 0
+        for index, (result, error) in enumerate(calculator_service.calculate_batch(score_id, parameter_sets)):
+            if error is not None:
+                error_count += 1
+                if len(errors) < MAX_ERROR_SAMPLES:
+                    errors.append({"sample": index, "error": error})
+                continue
+            value = numeric_result(result)
+            if value is not None:
+                stats.add(value)
+                values.append(value)
+            stage = result.get("stage")
+            if stage is not None:
+                stages[stage] = stages.get(stage, 0) + 1
+
+        valid = samples - error_count
+        summary = stats.summary()
+        if values:
+            values.sort()
+            summary["percentiles"] = {f"p{item:g}".replace(".", "_"): percentile(values, item) for item in PERCENTILES}
+
+        return {
+            "score_id": score_id,
+            "samples": samples,
+            "valid_samples": valid,
+            "point_estimate": {
+                "result": point_estimate.get("result"),
+                "stage": point_estimate.get("stage")
+            },
+            "result": summary,
+            "stage_probabilities": {
+                stage: count / valid
+                for stage, count in sorted(stages.items(), key=lambda item: -item[1])
+            },
+            "clipped": clipped,
+            "seed": seed,
+            "error_samples": errors
+        }
+
+
+# Global service instance
+uncertainty_service = UncertaintyService()
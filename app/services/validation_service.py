@@ -0,0 +1,270 @@
+"""
+Service to validate score parameters against the score JSON
+
+Each score's `parameters` list (type, required, options and validation
+min/max/enum) is compiled once into a list of small check closures, one per
+parameter, so validating a request is a single pass over plain dictionaries
+with no model classes involved. Coercion follows Pydantic's lax mode for the
+common cases (e.g. "3" or 3.0 for an integer, 1 for a float, a JSON array
+string for an array).
+"""
+
+import json
+import math
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.services.metrics_service import metrics_service
+from app.services.score_service import score_service
+
+
+# Marker returned by a coercion function for an unusable value
+_INVALID = object()
+
+# String values accepted for boolean parameters
+_TRUE_STRINGS = frozenset(("true", "yes", "1", "on"))
+_FALSE_STRINGS = frozenset(("false", "no", "0", "off"))
+
+ParameterCheck = Callable[[Dict[str, Any], Dict[str, Any], List[Dict[str, Any]]], None]
+CompiledValidator = Callable[[Dict[str, Any]], Tuple[Dict[str, Any], List[Dict[str, Any]]]]
+
+
+def _to_integer(value: Any) -> Any:
+    """Coerces an integer, an integral float or an integer string"""
+    if type(value) is int:
+        return value
+    if isinstance(value, bool):
+        return _INVALID
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float):
+        return int(value) if value.is_integer() else _INVALID
+    if isinstance(value, str):
+        try:
+            return int(value.strip())
+        except ValueError:
+            return _INVALID
+    return _INVALID
+
+
+def _to_float(value: Any) -> Any:
+    """Coerces a finite number or numeric string"""
+    if type(value) is float:
+        return value if math.isfinite(value) else _INVALID
+    if isinstance(value, bool):
+        return _INVALID
+    if isinstance(value, (int, float)):
+        number = float(value)
+    elif isinstance(value, str):
+        try:
+            number = float(value.strip())
+        except ValueError:
+            return _INVALID
+    else:
+        return _INVALID
+    return number if math.isfinite(number) else _INVALID
+
+
+def _to_boolean(value: Any) -> Any:
+    """Coerces a boolean, 0/1 or a yes/no-style string"""
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, int) and value in (0, 1):
+        return bool(value)
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in _TRUE_STRINGS:
+            return True
+        if lowered in _FALSE_STRINGS:
+            return False
+    return _INVALID
+
+
+def _to_string(value: Any) -> Any:
+    """Accepts strings only"""
+    return value if isinstance(value, str) else _INVALID
+
+
+def _to_array(value: Any) -> Any:
+    """Accepts a list or the JSON string of a list"""
+    if isinstance(value, list):
+        return value
+    if isinstance(value, str):
+        try:
+            decoded = json.loads(value)
+        except ValueError:
+            return _INVALID
+        return decoded if isinstance(decoded, list) else _INVALID
+    return _INVALID
+
+
+# Coercion and error wording per JSON parameter type
+COERCIONS: Dict[str, Tuple[Callable[[Any], Any], str]] = {
+    "integer": (_to_integer, "an integer"),
+    "float": (_to_float, "a number"),
+    "boolean": (_to_boolean, "a boolean"),
+    "string": (_to_string, "a string"),
+    "array": (_to_array, "a list")
+}
+
+
+def _allowed_values(parameter: Dict[str, Any], coerce: Callable[[Any], Any]) -> Optional[frozenset]:
+    """
+    Returns the values a parameter accepts, or None when it is unrestricted
+
+    validation.enum is authoritative. Without it, options restrict the value
+    when they are plain values or {"value": ...} entries; descriptive
+    options (e.g. "yes - Present") are documentation only.
+    """
+    validation = parameter.get("validation") or {}
+    if "enum" in validation:
+        candidates = validation["enum"]
+    else:
+        options = parameter.get("options")
+        if not isinstance(options, list) or not options:
+            return None
+        candidates = [option.get("value") if isinstance(option, dict) else option for option in options]
+        if any(isinstance(option, str) and " - " in option for option in candidates):
+            return None
+
+    allowed = set()
+    for candidate in candidates:
+        value = coerce(candidate)
+        if value is _INVALID:
+            return None
+        allowed.add(value)
+    return frozenset(allowed)
+
+
+def _compile_parameter(parameter: Dict[str, Any]) -> ParameterCheck:
+    """Builds the check closure of one parameter"""
+    name = parameter["name"]
+    required = parameter.get("required", True)
+    kind = parameter.get("type", "string")
+    coerce, expected = COERCIONS.get(kind, (lambda value: value, "a value"))
+    validation = parameter.get("validation") or {}
+    low = validation.get("min") if kind in ("integer", "float") else None
+    high = validation.get("max") if kind in ("integer", "float") else None
+
+    if kind == "array":
+        # Arrays restrict their items, not the list itself
+        allowed = _allowed_values(parameter, _to_string)
+        coerce_item = _to_string
+    else:
+        allowed = _allowed_values(parameter, coerce)
+        coerce_item = None
+
+    def check(parameters: Dict[str, Any], clean: Dict[str, Any], errors: List[Dict[str, Any]]):
+        raw = parameters.get(name)
+        if raw is None:
+            if required:
+                errors.append({"parameter": name, "message": "Field required"})
+            return
+
+        value = coerce(raw)
+        if value is _INVALID:
+            errors.append({"parameter": name, "message": f"Must be {expected}", "value": raw})
+            return
+
+        if coerce_item is not None:
+            if allowed is not None:
+                invalid = [item for item in value if coerce_item(item) is _INVALID or item not in allowed]
+                if invalid:
+                    errors.append({"parameter": name, "message": f"Items must be one of {sorted(allowed)}",
+                                   "value": invalid})
+                    return
+        elif allowed is not None and value not in allowed:
+            errors.append({"parameter": name, "message": f"Must be one of {sorted(allowed, key=str)}",
+                           "value": raw})
+            return
+
+        if low is not None and value < low:
+            errors.append({"parameter": name, "message": f"Must be at least {low}", "value": value})
+            return
+        if high is not None and value > high:
+            errors.append({"parameter": name, "message": f"Must be at most {high}", "value": value})
+            return
+
+        clean[name] = value
+
+    return check
+
+
+def compile_validator(parameters: List[Dict[str, Any]]) -> CompiledValidator:
+    """
+    Compiles a score's parameter definitions into a validator
+
+    Args:
+        parameters (List[Dict]): The `parameters` list of a score JSON
+
+    Returns:
+        Callable: validator(parameters) -> (clean parameters, errors); the
+        clean parameters hold only the score's own parameters, coerced to
+        their declared types
+    """
+    checks = [_compile_parameter(parameter) for parameter in parameters]
+
+    def validate(values: Dict[str, Any]) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        clean: Dict[str, Any] = {}
+        errors: List[Dict[str, Any]] = []
+        for check in checks:
+            check(values, clean, errors)
+        return clean, errors
+
+    return validate
+
+
+class ValidationService:
+    """Service to validate request parameters with per-score compiled validators"""
+
+    def __init__(self):
+        """Initializes the validation service"""
+        self._validators: Dict[str, CompiledValidator] = {}
+        self._stats = metrics_service.cache_stats("validator")
+
+    def clear_cache(self):
+        """Drops the compiled validators (e.g. after scores are reloaded)"""
+        self._validators.clear()
+
+    def get_validator(self, score_id: str) -> Optional[CompiledValidator]:
+        """
+        Returns the compiled validator of a score, compiling it on first use
+
+        Args:
+            score_id (str): ID of the score
+
+        Returns:
+            Optional[Callable]: Validator or None if the score does not exist
+        """
+        validator = self._validators.get(score_id)
+        if validator is not None:
+            self._stats.hits += 1
+        else:
+            self._stats.misses += 1
+            score_data = score_service.get_score_raw_data(score_id)
+            if score_data is None:
+                return None
+            validator = self._validators[score_id] = compile_validator(score_data["parameters"])
+        return validator
+
+    def validate(self, score_id: str, parameters: Dict[str, Any]) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """
+        Validates and coerces the parameters of a score calculation
+
+        Args:
+            score_id (str): ID of the score
+            parameters (dict): Parameters as received
+
+        Returns:
+            Tuple[Dict, List[Dict]]: (clean parameters, one error per invalid parameter)
+
+        Raises:
+            ValueError: If the score does not exist
+        """
+        validator = self.get_validator(score_id)
+        if validator is None:
+            raise ValueError(f"Score '{score_id}' not found")
+        return validator(parameters)
+
+
+# Global service instance
+validation_service = ValidationService()
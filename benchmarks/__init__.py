@@ -0,0 +1,3 @@
+"""
+Performance benchmarks for the nobra_calculator engines and API
+"""
@@ -0,0 +1,85 @@
+"""
+Charlson ICD-10 ingestion benchmark
+
+Compares regex classification of ICD-10 codes (one compiled alternation per
+Charlson condition, as in a typical preprocessing job) followed by the
+calculator with streaming encounter scoring on the compiled prefix index.
+
+Usage:
+    python -m benchmarks.charlson_icd10 [--encounters 200000]
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from calculators.charlson_comorbidity_index import (
+    ICD10_CODE_SETS,
+    CharlsonComorbidityIndexCalculator,
+    comorbidities_from_conditions
+)
+from calculators.engines.codes import expand_code_ranges, normalize_code
+
+
+# Codes outside the Charlson sets, as found in real extracts
+BACKGROUND_CODES = ["Z00.0", "R05.1", "J06.9", "M54.5", "E78.5", "I10", "K21.9", "N39.0", "R51", "Z23"]
+
+
+def build_encounters(encounters: int, seed: int = 42):
+    """Builds encounters with 3-12 codes each, a quarter of them Charlson codes"""
+    rng = random.Random(seed)
+    charlson_codes = []
+    for prefixes in ICD10_CODE_SETS.values():
+        for prefix in expand_code_ranges(prefixes):
+            code = prefix if len(prefix) > 3 else prefix + str(rng.randint(0, 9))
+            charlson_codes.append(f"{code[:3]}.{code[3:]}")
+    return [
+        (encounter, rng.randint(18, 95), [
+            rng.choice(charlson_codes) if rng.random() < 0.25 else rng.choice(BACKGROUND_CODES)
+            for _ in range(rng.randint(3, 12))
+        ])
+        for encounter in range(encounters)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ICD-10 Charlson scoring")
+    parser.add_argument("--encounters", type=int, default=200000, help="Number of encounters")
+    args = parser.parse_args()
+
+    encounters = build_encounters(args.encounters)
+    calculator = CharlsonComorbidityIndexCalculator()
+
+    patterns = {
+        condition: re.compile("|".join(expand_code_ranges(prefixes)))
+        for condition, prefixes in ICD10_CODE_SETS.items()
+    }
+
+    start = time.perf_counter()
+    for _, age, codes in encounters:
+        normalized = [normalize_code(code) for code in codes]
+        conditions = {
+            condition for condition, pattern in patterns.items()
+            if any(pattern.match(code) for code in normalized)
+        }
+        calculator.calculate(age=age, **comorbidities_from_conditions(conditions))
+    regex_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in calculator.score_encounters(encounters):
+        pass
+    index_seconds = time.perf_counter() - start
+
+    print(f"Encounters:        {args.encounters}")
+    print(f"Regex + calculate: {regex_seconds:.3f} s ({args.encounters / regex_seconds:,.0f} encounters/s)")
+    print(f"Prefix index:      {index_seconds:.3f} s ({args.encounters / index_seconds:,.0f} encounters/s)")
+    print(f"Speedup:           {regex_seconds / index_seconds:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Benchmark: cold start with and without the bytecode bundle
+
+Copies the application into a temporary directory without any __pycache__
+and starts fresh interpreters with PYTHONDONTWRITEBYTECODE=1, as the
+production image does. Every start imports main (all routers and models)
+and then loads every calculator, from the sources and from bytecode bundles
+at optimisation levels 1 and 2 (docstrings stripped, OpenAPI document
+served from the bundle). Installed dependencies keep their own bytecode, so
+the difference is the compilation of the application itself. CPU times are
+reported next to wall times, which vary more on shared machines.
+
+Usage:
+    python -m benchmarks.cold_start [--trials 5]
+"""
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import bytecode_bundle  # noqa: E402
+
+
+# Files copied into the scratch project
+PROJECT_FILES = ("main.py", "bytecode_bundle.py", "app", "calculators", "scores")
+
+# Runs in each fresh interpreter; prints the timings as JSON on the last line
+CHILD_SCRIPT = """
+import json, time, warnings
+warnings.simplefilter("ignore")
+start, start_cpu = time.perf_counter(), time.process_time()
+import main
+ready, ready_cpu = time.perf_counter(), time.process_time()
+from app.services.calculator_service import calculator_service
+from app.services.score_service import score_service
+loaded = sum(calculator_service.is_calculator_available(score.id) for score in score_service.get_available_scores())
+done, done_cpu = time.perf_counter(), time.process_time()
+print(json.dumps({
+    "import_main": ready - start, "import_main_cpu": ready_cpu - start_cpu,
+    "load_calculators": done - ready, "load_calculators_cpu": done_cpu - ready_cpu,
+    "calculators": loaded
+}))
+"""
+
+
+def copy_project(target: Path):
+    """Copies the application sources without bytecode caches"""
+    ignore = shutil.ignore_patterns("__pycache__", "*.pyc")
+    for name in PROJECT_FILES:
+        source = ROOT / name
+        if source.is_dir():
+            shutil.copytree(source, target / name, ignore=ignore)
+        else:
+            shutil.copy2(source, target / name)
+
+
+def start_once(project: Path, bundle: str = None) -> dict:
+    """Starts one fresh interpreter and returns its timings"""
+    environment = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+    environment.pop(bytecode_bundle.BUNDLE_ENVIRONMENT_VARIABLE, None)
+    if bundle is not None:
+        environment[bytecode_bundle.BUNDLE_ENVIRONMENT_VARIABLE] = bundle
+
+    start = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-c", CHILD_SCRIPT], cwd=project, env=environment,
+        capture_output=True, text=True, check=True
+    )
+    wall = time.perf_counter() - start
+    timings = json.loads(completed.stdout.strip().splitlines()[-1])
+    timings["process"] = wall
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--trials", type=int, default=5, help="Fresh interpreters started per mode")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as scratch:
+        project = Path(scratch)
+        copy_project(project)
+
+        print("Building bundles...")
+        optimised = project / "build" / "bytecode.zip"
+        stripped = project / "build" / "bytecode-stripped.zip"
+        manifest = bytecode_bundle.build(optimised, root=project)
+        bytecode_bundle.build(stripped, root=project, strip_docstrings=True,
+                              openapi=bytecode_bundle.render_openapi())
+        print(f"{manifest['modules']} modules; bundle {optimised.stat().st_size / 1e6:.1f} MB, "
+              f"stripped {stripped.stat().st_size / 1e6:.1f} MB")
+        print()
+
+        modes = [("source", None), ("bundle -O", str(optimised)), ("bundle -OO", str(stripped))]
+        results = {}
+        for label, bundle in modes:
+            start_once(project, bundle)  # warm the OS file cache
+            trials = [start_once(project, bundle) for _ in range(args.trials)]
+            results[label] = {
+                key: statistics.median(trial[key] for trial in trials)
+                for key in ("import_main", "import_main_cpu", "load_calculators", "load_calculators_cpu", "process")
+            }
+            results[label]["calculators"] = trials[0]["calculators"]
+
+    print(f"Median of {args.trials} cold starts (seconds; CPU / wall)")
+    print(f"{'mode':<12} {'import main':>15} {'calculators':>13} {'process':>8} {'loaded':>7}")
+    for label, timing in results.items():
+        print(f"{label:<12} {timing['import_main_cpu']:>7.2f} / {timing['import_main']:<5.2f} "
+              f"{timing['load_calculators_cpu']:>5.2f} / {timing['load_calculators']:<5.2f} "
+              f"{timing['process']:>8.2f} {timing['calculators']:>7}")
+
+    source, best = results["source"], results["bundle -OO"]
+    source_cpu = source["import_main_cpu"] + source["load_calculators_cpu"]
+    best_cpu = best["import_main_cpu"] + best["load_calculators_cpu"]
+    print(f"\nSpeedup: {source_cpu / best_cpu:.2f}x CPU time to import main and load all calculators "
+          f"({source_cpu - best_cpu:.2f}s saved per cold start)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+CTCAE lab grading benchmark
+
+Compares per-result calls to calculate_ctcae with the columnar bulk grader
+over a morning lab table of a chemotherapy cohort.
+
+Usage:
+    python -m benchmarks.ctcae_grading [--patients 20000]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from calculators.ctcae import CtcaeCalculator, LAB_ANALYTES, calculate_ctcae
+
+
+VALUE_RANGES = {
+    "hemoglobin": (5.0, 17.0),
+    "neutrophil_count": (100, 6000),
+    "platelet_count": (10000, 400000),
+    "wbc_count": (1000, 60000),
+    "lymphocyte_count": (100, 3000)
+}
+
+
+def build_lab_table(patients: int, seed: int = 42):
+    """Builds one result per analyte per patient, with a temperature per patient"""
+    rng = random.Random(seed)
+    columns = {name: [] for name in ("patient_ids", "analytes", "values", "sexes", "temperatures")}
+    for patient in range(patients):
+        sex = rng.choice(["male", "female"])
+        temperature = round(rng.uniform(36.0, 39.5), 1)
+        for analyte, (low, high) in VALUE_RANGES.items():
+            value = round(rng.uniform(low, high), 1) if analyte == "hemoglobin" else rng.randint(low, high)
+            columns["patient_ids"].append(f"patient-{patient}")
+            columns["analytes"].append(analyte)
+            columns["values"].append(value)
+            columns["sexes"].append(sex)
+            columns["temperatures"].append(temperature if analyte == "neutrophil_count" else None)
+    return columns
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark CTCAE bulk lab grading")
+    parser.add_argument("--patients", type=int, default=20000, help="Cohort size")
+    args = parser.parse_args()
+
+    table = build_lab_table(args.patients)
+    results = len(table["values"])
+
+    start = time.perf_counter()
+    for analyte, value, sex, temperature in zip(table["analytes"], table["values"],
+                                                table["sexes"], table["temperatures"]):
+        event = LAB_ANALYTES[analyte][0]
+        calculate_ctcae(event, sex, **{analyte: value})
+        if temperature is not None:
+            calculate_ctcae("febrile_neutropenia", sex, neutrophil_count=value, temperature=temperature)
+    scalar_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    CtcaeCalculator().calculate_batch(**table)
+    batch_seconds = time.perf_counter() - start
+
+    print(f"Lab results:       {results} ({args.patients} patients)")
+    print(f"Scalar calculator: {scalar_seconds:.3f} s ({results / scalar_seconds:,.0f} results/s)")
+    print(f"Bulk grader:       {batch_seconds:.3f} s ({results / batch_seconds:,.0f} results/s)")
+    print(f"Speedup:           {scalar_seconds / batch_seconds:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
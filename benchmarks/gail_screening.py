@@ -0,0 +1,70 @@
+"""
+Gail model screening list benchmark
+
+Compares per-woman calls to calculate_gail_model_breast_cancer_risk with the
+columnar batch path over a mammography screening list. Both share the
+memoized BCRAT projection of each covariate profile; the batch path skips
+per-call setup and interpretation text.
+
+Usage:
+    python -m benchmarks.gail_screening [--women 100000]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from calculators.gail_model_breast_cancer_risk import (
+    GailModelBreastCancerRiskCalculator,
+    calculate_gail_model_breast_cancer_risk
+)
+
+
+ANSWERS = {
+    "age_at_menarche": ["unknown", "7_to_11", "12_to_13", "over_13"],
+    "age_at_first_birth": ["unknown", "no_births", "under_20", "20_to_24", "25_to_29", "30_or_over"],
+    "relatives_with_breast_cancer": ["unknown", "0", "1", "more_than_1"],
+    "previous_biopsies": ["unknown", "0", "1", "more_than_1"],
+    "atypical_hyperplasia": ["unknown", "no", "yes"],
+    "race_ethnicity": ["white", "african_american", "american_indian_alaskan_native", "unknown"]
+}
+
+
+def build_screening_list(women: int, seed: int = 42):
+    """Builds one column per model input for women aged 40-74"""
+    rng = random.Random(seed)
+    columns = {"ages": [rng.randint(40, 74) for _ in range(women)]}
+    for name, answers in ANSWERS.items():
+        columns[name] = [rng.choice(answers) for _ in range(women)]
+    return columns
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Gail model risk over a screening list")
+    parser.add_argument("--women", type=int, default=100000, help="Screening list size")
+    args = parser.parse_args()
+
+    columns = build_screening_list(args.women)
+    names = list(ANSWERS)
+
+    start = time.perf_counter()
+    for row in zip(columns["ages"], *(columns[name] for name in names)):
+        calculate_gail_model_breast_cancer_risk(*row)
+    scalar_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    GailModelBreastCancerRiskCalculator().calculate_batch(**columns)
+    batch_seconds = time.perf_counter() - start
+
+    print(f"Women:             {args.women}")
+    print(f"Scalar calculator: {scalar_seconds:.3f} s ({args.women / scalar_seconds:,.0f} women/s)")
+    print(f"Columnar batch:    {batch_seconds:.3f} s ({args.women / batch_seconds:,.0f} women/s)")
+    print(f"Speedup:           {scalar_seconds / batch_seconds:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,422 @@
+"""
+Import-time and memory budget of the application modules
+
+Imports the app in a fresh interpreter the way a worker starts (main, then
+every calculator as the preload profile does) with a meta path finder that
+wraps each module's loader, and records per module:
+
+    time    wall-clock time of executing the module, including the
+            third-party packages it imports first but excluding the
+            application modules it imports (those are reported on their own)
+    memory  memory retained after the module ran (tracemalloc), with the
+            same attribution
+
+Time and memory come from separate interpreters, as tracemalloc slows
+imports down; time is the fastest of --runs interpreters. Garbage collector
+pauses are left out of the module times and reported as one total: a full
+collection of the growing heap takes up to a few hundred milliseconds and
+lands on whichever module happens to allocate at that point. A dependency
+shared by several modules is charged to the first one that imports it, and
+so is the growth of shared tables (interned strings, sys.modules): a module
+may show about a megabyte more, or a few KiB less, than its own objects.
+
+The report sorts the app.models.scores.*, app.routers.scores.* and
+calculators.* modules by cost, sums them per specialty and lists the
+heaviest third-party imports with the module that pulls them in. `check`
+exits with status 1 when benchmarks/import_budget.json is exceeded: a
+module, specialty or group over its time or memory budget, the whole import
+over its total, or a forbidden package (e.g. SciPy) imported at all.
+
+Usage:
+    python -m benchmarks.import_budget report [--runs 3] [--top 20] [--output build/import_budget.json]
+    python -m benchmarks.import_budget check [--budget benchmarks/import_budget.json] [--runs 3]
+"""
+
+import argparse
+import gc
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+
+BUDGET_PATH = ROOT / "benchmarks" / "import_budget.json"
+RESULTS_PATH = ROOT / "build" / "import_budget.json"
+
+# Module groups with budgets, reported per module and per specialty
+GROUPS = ("app.models.scores", "app.routers.scores", "calculators")
+
+
+def first_party_names() -> frozenset:
+    """Top-level modules and packages of the repository"""
+    names = {path.stem for path in ROOT.glob("*.py") if path.stem.isidentifier()}
+    # Regular and namespace packages (calculators/ has no __init__.py)
+    names.update(path.parent.name for path in ROOT.glob("*/*.py") if path.parent.name.isidentifier())
+    return frozenset(names)
+
+
+class _Import:
+    """Measurements of one module while it executes"""
+
+    __slots__ = ("name", "start", "collecting", "memory", "nested_time", "nested_memory")
+
+    def __init__(self, name: str, start: float, collecting: float, memory: int):
+        self.name = name
+        self.start = start
+        self.collecting = collecting
+        self.memory = memory
+        self.nested_time = 0.0
+        self.nested_memory = 0
+
+
+class _TimedLoader:
+    """Loader proxy measuring exec_module; everything else goes to the real loader"""
+
+    def __init__(self, recorder: "ImportRecorder", loader):
+        self._recorder = recorder
+        self._loader = loader
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        # Leave the module as the real loader would (pkgutil/importlib.resources use it)
+        module.__loader__ = self._loader
+        if module.__spec__ is not None:
+            module.__spec__.loader = self._loader
+        self._recorder.enter(module.__name__)
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._recorder.leave(module.__name__)
+
+
+class ImportRecorder:
+    """
+    Meta path finder recording the cost of every module imported after install()
+
+    Application modules get their own entry; third-party modules are
+    charged to the application module whose import triggered them.
+    """
+
+    def __init__(self, first_party: frozenset, memory: bool):
+        self.first_party = first_party
+        self.memory = memory
+        self.stack: List[_Import] = []
+        self.modules: Dict[str, Dict[str, Any]] = {}
+        self.dependencies: Dict[str, Dict[str, Any]] = {}
+        self.collecting = 0.0
+        self._collection_start = 0.0
+
+    def install(self):
+        sys.meta_path.insert(0, self)
+        gc.callbacks.append(self._collection)
+
+    def uninstall(self):
+        sys.meta_path.remove(self)
+        gc.callbacks.remove(self._collection)
+
+    def _collection(self, phase: str, info: Dict[str, Any]):
+        if phase == "start":
+            self._collection_start = time.perf_counter()
+        else:
+            self.collecting += time.perf_counter() - self._collection_start
+
+    def find_spec(self, fullname, path=None, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is None:
+                continue
+            if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                spec.loader = _TimedLoader(self, spec.loader)
+            return spec
+        return None
+
+    def _traced(self) -> int:
+        if not self.memory:
+            return 0
+        import tracemalloc
+        return tracemalloc.get_traced_memory()[0]
+
+    def _is_first_party(self, name: str) -> bool:
+        return name.partition(".")[0] in self.first_party
+
+    def enter(self, name: str):
+        self.stack.append(_Import(name, time.perf_counter(), self.collecting, self._traced()))
+
+    def leave(self, name: str):
+        current = self.stack.pop()
+        inclusive_time = time.perf_counter() - current.start - (self.collecting - current.collecting)
+        inclusive_memory = self._traced() - current.memory
+
+        # Nearest application module on the stack, which this import is charged to
+        owner = next((entry for entry in reversed(self.stack) if self._is_first_party(entry.name)), None)
+        if self._is_first_party(name):
+            self.modules[name] = {
+                "seconds": inclusive_time - current.nested_time,
+                "bytes": inclusive_memory - current.nested_memory,
+                "inclusive_seconds": inclusive_time,
+                "inclusive_bytes": inclusive_memory
+            }
+            if owner is not None:
+                owner.nested_time += inclusive_time
+                owner.nested_memory += inclusive_memory
+        elif self.stack and self.stack[-1] is owner and owner is not None:
+            # Third-party package imported directly by an application module
+            self.dependencies[name] = {
+                "imported_by": owner.name, "seconds": inclusive_time, "bytes": inclusive_memory
+            }
+
+
+def measure(memory: bool) -> Dict[str, Any]:
+    """
+    Imports the app in this interpreter and returns the cost of every module
+
+    Must run in a fresh interpreter, before the app is imported.
+    """
+    import warnings
+
+    if memory:
+        import tracemalloc
+        tracemalloc.start()
+
+    sys.path.insert(0, str(ROOT))
+    recorder = ImportRecorder(first_party_names(), memory)
+    start = time.perf_counter()
+    recorder.install()
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            import main  # noqa: F401
+            from app.services.calculator_service import calculator_service
+            calculator_service.load_all_calculators()
+    finally:
+        recorder.uninstall()
+    total_seconds = time.perf_counter() - start
+
+    return {
+        "total_seconds": total_seconds,
+        "gc_seconds": recorder.collecting,
+        "total_bytes": recorder._traced(),
+        "modules": recorder.modules,
+        "dependencies": recorder.dependencies,
+        "loaded": sorted(name for name in sys.modules)
+    }
+
+
+def _child(mode: str) -> Dict[str, Any]:
+    """Runs measure() in a fresh interpreter"""
+    with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as handle:
+        output = handle.name
+    try:
+        subprocess.run(
+            [sys.executable, "-m", "benchmarks.import_budget", "measure", "--mode", mode, "--output", output],
+            cwd=ROOT, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"}
+        )
+        with open(output) as f:
+            return json.load(f)
+    finally:
+        os.unlink(output)
+
+
+def group_of(name: str) -> Optional[str]:
+    """Returns the budgeted group of a module, if any"""
+    for group in GROUPS:
+        if name == group or name.startswith(group + "."):
+            return group
+    return None
+
+
+def specialty_of(name: str) -> Optional[str]:
+    """Returns the specialty package of an app.models/routers.scores module, e.g. app.models.scores.cardiology"""
+    parts = name.split(".")
+    if len(parts) >= 4 and name.startswith(("app.models.scores.", "app.routers.scores.")):
+        return ".".join(parts[:4])
+    return None
+
+
+def collect(runs: int) -> Dict[str, Any]:
+    """
+    Measures the app in fresh interpreters and combines the runs
+
+    Args:
+        runs (int): Interpreters timing the import (the fastest time per module is kept)
+
+    Returns:
+        Dict: Per-module milliseconds and KiB, specialty and group totals,
+        third-party dependencies and the loaded module names
+    """
+    timings = [_child("time") for _ in range(max(runs, 1))]
+    memory = _child("memory")
+
+    modules: Dict[str, Dict[str, Any]] = {}
+    for name, entry in memory["modules"].items():
+        seconds = min(run["modules"].get(name, entry)["seconds"] for run in timings)
+        modules[name] = {"ms": round(max(seconds, 0.0) * 1000, 3), "kib": round(entry["bytes"] / 1024, 1)}
+
+    specialties: Dict[str, Dict[str, float]] = {}
+    groups: Dict[str, Dict[str, float]] = {group: {"ms": 0.0, "kib": 0.0, "modules": 0} for group in GROUPS}
+    for name, entry in modules.items():
+        group = group_of(name)
+        if group is None:
+            continue
+        groups[group]["ms"] += entry["ms"]
+        groups[group]["kib"] += entry["kib"]
+        groups[group]["modules"] += 1
+        specialty = specialty_of(name)
+        if specialty is not None:
+            totals = specialties.setdefault(specialty, {"ms": 0.0, "kib": 0.0, "modules": 0})
+            totals["ms"] += entry["ms"]
+            totals["kib"] += entry["kib"]
+            totals["modules"] += 1
+    for totals in list(specialties.values()) + list(groups.values()):
+        totals["ms"] = round(totals["ms"], 3)
+        totals["kib"] = round(totals["kib"], 1)
+
+    dependencies = {
+        name: {
+            "imported_by": entry["imported_by"],
+            "ms": round(min(run["dependencies"].get(name, entry)["seconds"] for run in timings) * 1000, 3),
+            "kib": round(entry["bytes"] / 1024, 1)
+        }
+        for name, entry in memory["dependencies"].items()
+    }
+
+    return {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "python": sys.version.split()[0],
+        "runs": runs,
+        "total": {
+            "ms": round(min(run["total_seconds"] for run in timings) * 1000, 1),
+            "gc_ms": round(min(run["gc_seconds"] for run in timings) * 1000, 1),
+            "kib": round(memory["total_bytes"] / 1024, 1)
+        },
+        "groups": groups,
+        "specialties": specialties,
+        "modules": modules,
+        "dependencies": dependencies,
+        "loaded": memory["loaded"]
+    }
+
+
+def _limit(entries: Dict[str, Any], name: str) -> Dict[str, Any]:
+    """Limits of a group or specialty: its own entry, else the "default" entry"""
+    return entries.get(name, entries.get("default", {}))
+
+
+def check_budget(results: Dict[str, Any], budget: Dict[str, Any]) -> List[str]:
+    """
+    Compares measurements with a budget
+
+    Returns:
+        List[str]: One line per exceeded limit (empty when within budget)
+    """
+    violations = []
+
+    def over(label: str, measured: Dict[str, Any], limits: Dict[str, Any]):
+        for key, unit in (("ms", "ms"), ("kib", "KiB")):
+            limit = limits.get(key)
+            if limit is not None and measured[key] > limit:
+                violations.append(f"{label}: {measured[key]:.1f} {unit} > budget {limit:g} {unit}")
+
+    over("total import", results["total"], budget.get("total", {}))
+    for group, totals in results["groups"].items():
+        over(f"group {group}", totals, _limit(budget.get("groups", {}), group))
+    for specialty, totals in results["specialties"].items():
+        over(f"specialty {specialty}", totals, _limit(budget.get("specialties", {}), specialty))
+    modules, module_defaults = budget.get("modules", {}), budget.get("module_defaults", {})
+    for name, entry in results["modules"].items():
+        group = group_of(name)
+        if group is not None:
+            over(f"module {name}", entry, modules.get(name, module_defaults.get(group, {})))
+
+    loaded = set(results["loaded"])
+    dependencies = results["dependencies"]
+    for package in budget.get("forbidden_imports", []):
+        if package in loaded:
+            importer = dependencies.get(package, {}).get("imported_by", "unknown module")
+            violations.append(f"forbidden import {package} (pulled in by {importer})")
+    return violations
+
+
+def print_report(results: Dict[str, Any], top: int):
+    total = results["total"]
+    print(f"App import: {total['ms']:.1f} ms including {total['gc_ms']:.1f} ms of collector pauses, "
+          f"{total['kib'] / 1024:.1f} MiB retained (fastest of {results['runs']} runs)\n")
+
+    print(f"{'group':<24} {'modules':>8} {'ms':>9} {'MiB':>8}")
+    for group, totals in results["groups"].items():
+        print(f"{group:<24} {totals['modules']:>8} {totals['ms']:>9.1f} {totals['kib'] / 1024:>8.2f}")
+
+    print(f"\n{'specialty':<45} {'modules':>8} {'ms':>9} {'KiB':>9}")
+    specialties = sorted(results["specialties"].items(), key=lambda item: item[1]["ms"], reverse=True)
+    for specialty, totals in specialties[:top]:
+        print(f"{specialty:<45} {totals['modules']:>8} {totals['ms']:>9.1f} {totals['kib']:>9.1f}")
+
+    for group in GROUPS:
+        modules = sorted(
+            ((name, entry) for name, entry in results["modules"].items() if group_of(name) == group),
+            key=lambda item: item[1]["ms"], reverse=True
+        )
+        print(f"\nSlowest {group} modules")
+        print(f"{'module':<70} {'ms':>8} {'KiB':>8}")
+        for name, entry in modules[:top]:
+            print(f"{name:<70} {entry['ms']:>8.2f} {entry['kib']:>8.1f}")
+
+    print("\nHeaviest third-party imports")
+    print(f"{'package':<30} {'ms':>8} {'KiB':>9}  imported by")
+    dependencies = sorted(results["dependencies"].items(), key=lambda item: item[1]["ms"], reverse=True)
+    for name, entry in dependencies[:top]:
+        print(f"{name:<30} {entry['ms']:>8.1f} {entry['kib']:>9.1f}  {entry['imported_by']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    report_parser = subparsers.add_parser("report", help="Measure the app import and print the sorted report")
+    check_parser = subparsers.add_parser("check", help="Measure the app import and enforce the budget")
+    for subparser in (report_parser, check_parser):
+        subparser.add_argument("--runs", type=int, default=3, help="Interpreters timing the import")
+        subparser.add_argument("--top", type=int, default=20, help="Rows per report section")
+        subparser.add_argument("--output", type=Path, default=RESULTS_PATH, help="JSON results to write")
+    check_parser.add_argument("--budget", type=Path, default=BUDGET_PATH, help="Budget JSON")
+
+    measure_parser = subparsers.add_parser("measure", help=argparse.SUPPRESS)
+    measure_parser.add_argument("--mode", choices=("time", "memory"), required=True)
+    measure_parser.add_argument("--output", type=Path, required=True)
+    args = parser.parse_args()
+
+    if args.command == "measure":
+        args.output.write_text(json.dumps(measure(args.mode == "memory")))
+        return
+
+    results = collect(args.runs)
+    print_report(results, args.top)
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(results, indent=1) + "\n")
+    print(f"\nResults written to {args.output}")
+
+    if args.command == "check":
+        violations = check_budget(results, json.loads(args.budget.read_text()))
+        if violations:
+            print(f"\n{len(violations)} budget violations ({args.budget}):")
+            for violation in violations:
+                print(f"  {violation}")
+            sys.exit(1)
+        print(f"\nWithin budget ({args.budget})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,400 @@
+"""
+Latency fuzzer: worst-case inputs of every calculator, from the score metadata
+
+The validation section of each score JSON describes the calculator's input
+domain (enum/options, min/max, type). For every score, the fuzzer starts
+from the parameters its endpoint passes to the calculator for a valid
+request (captured as in the score suite) and calls calculate_<id> directly
+with inputs drawn from that domain:
+
+    boundary  one parameter at a time at each option, min, max, just inside
+              the bounds and the midpoint
+    random    every parameter drawn from its domain (uniform, with a share of
+              boundary values)
+    invalid   one parameter at a time below min, above max, outside the
+              options, of the wrong type or None; the request models reject
+              these before the calculator, but the generic endpoint and
+              calculator-side checks (ValueError messages) still see them
+
+Each input is timed as the best of a few wall-clock calls with the garbage
+collector off, including the time to raise. The report ranks scores by
+their p99 and slowest input, lists the slowest inputs overall and the
+scores that raise on inputs inside their documented domain.
+
+Usage:
+    python -m benchmarks.latency_fuzzer [--scores ckd_epi_2021 ...] [--samples 200] [--repeat 3]
+                                        [--seed 0] [--top 20] [--output build/latency_fuzz.json]
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import random
+import statistics
+import sys
+import time
+import warnings
+from collections import Counter
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from benchmarks.score_suite import build_payload, capture_calculator_calls, score_request  # noqa: E402
+
+RESULTS_PATH = ROOT / "build" / "latency_fuzz.json"
+
+# Share of random parameter draws taken from the boundary values
+BOUNDARY_SHARE = 0.2
+
+# Inputs slower than this (seconds) are timed once instead of --repeat times
+SLOW_CALL = 0.05
+
+# Slowest inputs kept per score
+SLOWEST_INPUTS = 3
+
+
+def numeric_domain(parameter: Dict[str, Any], base: Any) -> Tuple[float, float]:
+    """Returns the (low, high) range of a numeric parameter"""
+    validation = parameter.get("validation") or {}
+    low, high = validation.get("min"), validation.get("max")
+    anchor = base if isinstance(base, (int, float)) and not isinstance(base, bool) else 1
+    if low is None and high is None:
+        return 0, max(abs(anchor) * 2, 1)
+    if low is None:
+        return min(0, high), high
+    if high is None:
+        return low, max(low * 2, low + 100, anchor)
+    return low, high
+
+
+def choices(parameter: Dict[str, Any]) -> List[Any]:
+    """Returns the allowed values of a parameter with a closed set of values"""
+    validation = parameter.get("validation") or {}
+    if validation.get("enum"):
+        return list(validation["enum"])
+    options = parameter.get("options")
+    if isinstance(options, list) and options:
+        values = [option.get("value") if isinstance(option, dict) else option for option in options]
+        # Numeric parameters often list display labels ("4 - Spontaneous") as options
+        if parameter.get("type") not in ("integer", "float") or all(
+            isinstance(value, (int, float)) and not isinstance(value, bool) for value in values
+        ):
+            return values
+    if parameter.get("type") == "boolean":
+        return [False, True]
+    return []
+
+
+def boundary_values(parameter: Dict[str, Any], base: Any) -> List[Any]:
+    """Returns the edge values of a parameter's domain"""
+    values = choices(parameter)
+    if values:
+        return values
+    kind = parameter.get("type")
+    if kind not in ("integer", "float"):
+        return []
+    low, high = numeric_domain(parameter, base)
+    if kind == "integer":
+        low, high = int(low), int(high)
+        candidates = [low, low + 1, (low + high) // 2, high - 1, high]
+    else:
+        step = (high - low) * 1e-3 or 1e-3
+        candidates = [float(low), low + step, (low + high) / 2, high - step, float(high)]
+    return [value for value in dict.fromkeys(candidates) if low <= value <= high]
+
+
+def random_value(parameter: Dict[str, Any], base: Any, rng: random.Random) -> Any:
+    """Draws a value from a parameter's domain"""
+    values = choices(parameter)
+    if values:
+        return rng.choice(values)
+    kind = parameter.get("type")
+    if kind not in ("integer", "float"):
+        return base
+    if rng.random() < BOUNDARY_SHARE:
+        return rng.choice(boundary_values(parameter, base) or [base])
+    low, high = numeric_domain(parameter, base)
+    if kind == "integer":
+        return rng.randint(int(low), int(high))
+    return round(rng.uniform(low, high), 4)
+
+
+def invalid_values(parameter: Dict[str, Any], base: Any) -> List[Any]:
+    """Returns values outside a parameter's domain"""
+    values: List[Any] = [None]
+    kind = parameter.get("type")
+    validation = parameter.get("validation") or {}
+    if choices(parameter) and kind != "boolean":
+        values.append("__not_an_option__")
+    if kind in ("integer", "float"):
+        values.append("not a number")
+        low, high = validation.get("min"), validation.get("max")
+        if low is not None:
+            values.append(low - 1 if kind == "integer" else low - max(abs(low) * 0.5, 1.0))
+        if high is not None:
+            values.append(high + 1 if kind == "integer" else high + max(abs(high) * 0.5, 1.0))
+        values.append(-1 if kind == "integer" else -1.0)
+        values.append(10 ** 9 if kind == "integer" else 1e12)
+    elif kind == "boolean":
+        values.append("yes")
+    return values
+
+
+def generate_inputs(parameters: List[Dict[str, Any]], base: Dict[str, Any], samples: int,
+                    rng: random.Random) -> List[Tuple[str, Dict[str, Any]]]:
+    """
+    Builds the inputs of one score
+
+    Args:
+        parameters (List[Dict]): Parameter metadata of the score
+        base (Dict): Valid calculator parameters to vary
+        samples (int): Number of inputs to build
+        rng (random.Random): Random source
+
+    Returns:
+        List[Tuple[str, Dict]]: (kind, changed parameters) pairs; the base
+        input first, then boundary, invalid and random inputs
+    """
+    known = [parameter for parameter in parameters if parameter.get("name") in base]
+    inputs: List[Tuple[str, Dict[str, Any]]] = [("base", {})]
+    single = [
+        ("boundary", {parameter["name"]: value})
+        for parameter in known for value in boundary_values(parameter, base[parameter["name"]])
+        if value != base[parameter["name"]]
+    ]
+    invalid = [
+        ("invalid", {parameter["name"]: value})
+        for parameter in known for value in invalid_values(parameter, base[parameter["name"]])
+    ]
+    # Keep a mix of both when they do not fit, random draws fill the rest
+    budget = max(samples - 1, 0)
+    if len(single) + len(invalid) > budget:
+        rng.shuffle(single)
+        rng.shuffle(invalid)
+        kept_invalid = min(len(invalid), budget // 3)
+        single, invalid = single[:budget - kept_invalid], invalid[:kept_invalid]
+    inputs.extend(single)
+    inputs.extend(invalid)
+
+    while known and len(inputs) < samples:
+        inputs.append(("random", {
+            parameter["name"]: random_value(parameter, base[parameter["name"]], rng) for parameter in known
+        }))
+    return inputs[:max(samples, 1)]
+
+
+def time_call(function: Callable[..., Any], parameters: Dict[str, Any], repeat: int) -> Tuple[float, Optional[str]]:
+    """
+    Times a calculator call
+
+    Returns:
+        Tuple[float, str]: Best duration in seconds and the exception class
+        name, or None when the call returned
+    """
+    best = float("inf")
+    outcome = None
+    for attempt in range(repeat):
+        start = time.perf_counter()
+        try:
+            function(**parameters)
+            outcome = None
+        except Exception as e:
+            outcome = type(e).__name__
+        elapsed = time.perf_counter() - start
+        best = min(best, elapsed)
+        if elapsed > SLOW_CALL:
+            break
+    return best, outcome
+
+
+def percentile(ordered: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of sorted values"""
+    return ordered[min(len(ordered) - 1, max(0, int(round(fraction * len(ordered) + 0.5)) - 1))]
+
+
+def fuzz_score(function: Callable[..., Any], parameters: List[Dict[str, Any]], base: Dict[str, Any],
+               samples: int, repeat: int, rng: random.Random) -> Dict[str, Any]:
+    """Times one calculator over its generated inputs and summarizes the timings"""
+    timings: List[Tuple[float, str, Dict[str, Any], Optional[str]]] = []
+    for kind, changes in generate_inputs(parameters, base, samples, rng):
+        seconds, outcome = time_call(function, {**base, **changes}, repeat)
+        timings.append((seconds, kind, changes, outcome))
+
+    ordered = sorted(seconds for seconds, _, _, _ in timings)
+    by_kind: Dict[str, Counter] = {}
+    for _, kind, _, outcome in timings:
+        counts = by_kind.setdefault(kind, Counter())
+        counts["inputs"] += 1
+        if outcome is not None:
+            counts[outcome] += 1
+    raised = [seconds for seconds, _, _, outcome in timings if outcome is not None]
+    returned = [seconds for seconds, _, _, outcome in timings if outcome is None]
+
+    def rate(kinds: Tuple[str, ...]) -> Optional[float]:
+        total = sum(by_kind[kind]["inputs"] for kind in kinds if kind in by_kind)
+        errors = sum(sum(by_kind[kind].values()) - by_kind[kind]["inputs"] for kind in kinds if kind in by_kind)
+        return round(errors / total, 4) if total else None
+
+    slowest = sorted(timings, key=lambda timing: timing[0], reverse=True)[:SLOWEST_INPUTS]
+    return {
+        "inputs": len(timings),
+        "p50_us": round(percentile(ordered, 0.50) * 1e6, 2),
+        "p99_us": round(percentile(ordered, 0.99) * 1e6, 2),
+        "max_us": round(ordered[-1] * 1e6, 2),
+        "returned_p50_us": round(statistics.median(returned) * 1e6, 2) if returned else None,
+        "raised_p50_us": round(statistics.median(raised) * 1e6, 2) if raised else None,
+        "exception_rate_valid": rate(("base", "boundary", "random")),
+        "exception_rate_invalid": rate(("invalid",)),
+        "exceptions": {
+            kind: {name: count for name, count in counts.items() if name != "inputs"}
+            for kind, counts in by_kind.items() if len(counts) > 1
+        },
+        "slowest": [
+            {"us": round(seconds * 1e6, 2), "kind": kind, "changes": changes, "outcome": outcome or "ok"}
+            for seconds, kind, changes, outcome in slowest
+        ]
+    }
+
+
+def run_fuzzer(score_ids: Optional[List[str]], samples: int, repeat: int, seed: int) -> Dict[str, Any]:
+    """
+    Fuzzes the calculators of the given scores
+
+    Args:
+        score_ids (List[str], optional): Scores to fuzz (default: all)
+        samples (int): Inputs per score
+        repeat (int): Calls per input (the fastest is kept)
+        seed (int): Seed of the random inputs
+
+    Returns:
+        Dict: Summary per score and scores that could not be fuzzed with the reason
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        from fastapi.routing import APIRoute
+        from main import app
+        from app.services.calculator_service import calculator_service
+        from app.services.score_service import score_service
+
+    post_routes = {
+        route.path: route for route in app.router.routes
+        if isinstance(route, APIRoute) and "POST" in route.methods
+    }
+    if score_ids is None:
+        score_ids = sorted(score.id for score in score_service.get_available_scores())
+
+    gc.collect()
+    gc.freeze()
+
+    loop = asyncio.new_event_loop()
+    results: Dict[str, Dict[str, Any]] = {}
+    skipped: Dict[str, str] = {}
+    try:
+        for score_id in score_ids:
+            score_data = score_service.get_score_raw_data(score_id)
+            if score_data is None:
+                skipped[score_id] = "unknown score"
+                continue
+            function = calculator_service._load_calculator(score_id)
+            if function is None:
+                skipped[score_id] = "calculator does not load"
+                continue
+
+            path, payload = score_request(post_routes, score_id, score_data)
+            try:
+                status, _, calls = capture_calculator_calls(loop, app, score_id, path, json.dumps(payload).encode())
+            except Exception:
+                status, calls = 500, []
+            # When the example request fails, start from the metadata values alone
+            base = calls[-1] if status == 200 and calls else build_payload(score_data)
+
+            # Seeded per score, so a subset reproduces the inputs of a full run
+            rng = random.Random(f"{seed}:{score_id}")
+            # Untimed first call: lazy imports and caches of the calculator
+            time_call(function, base, 1)
+            gc.disable()
+            try:
+                results[score_id] = fuzz_score(function, score_data.get("parameters", []), base, samples, repeat, rng)
+            finally:
+                gc.enable()
+            results[score_id]["base_from_request"] = status == 200 and bool(calls)
+    finally:
+        loop.close()
+
+    return {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "python": sys.version.split()[0],
+        "settings": {"samples": samples, "repeat": repeat, "seed": seed},
+        "unit": "wall-clock microseconds per call (best of repeat)",
+        "scores": results,
+        "skipped": skipped
+    }
+
+
+def print_report(report: Dict[str, Any], top: int):
+    """Prints the ranked scores, the slowest inputs and the scores raising on valid inputs"""
+    scores = report["scores"]
+    print(f"{len(scores)} scores fuzzed with up to {report['settings']['samples']} inputs each\n")
+
+    print("Slowest scores by p99 (µs)")
+    print(f"{'score':<42} {'p50':>9} {'p99':>10} {'max':>10} {'raise p50':>10} {'exc valid':>9} {'exc invalid':>11}")
+    ranked = sorted(scores.items(), key=lambda item: (item[1]["p99_us"], item[1]["max_us"]), reverse=True)
+    for score_id, entry in ranked[:top]:
+        raised = f"{entry['raised_p50_us']:.1f}" if entry["raised_p50_us"] is not None else "-"
+        valid = f"{entry['exception_rate_valid']:.0%}" if entry["exception_rate_valid"] is not None else "-"
+        invalid = f"{entry['exception_rate_invalid']:.0%}" if entry["exception_rate_invalid"] is not None else "-"
+        print(f"{score_id:<42} {entry['p50_us']:>9.1f} {entry['p99_us']:>10.1f} {entry['max_us']:>10.1f} "
+              f"{raised:>10} {valid:>9} {invalid:>11}")
+
+    print("\nSlowest inputs")
+    inputs = [
+        (slow["us"], score_id, slow) for score_id, entry in scores.items() for slow in entry["slowest"]
+    ]
+    for microseconds, score_id, slow in sorted(inputs, key=lambda item: item[0], reverse=True)[:top]:
+        changes = json.dumps(slow["changes"], default=str)
+        changes = changes if len(changes) <= 70 else changes[:67] + "..."
+        print(f"{microseconds:>10.1f} µs  {score_id:<36} {slow['kind']:<8} {slow['outcome']:<18} {changes}")
+
+    failing = [
+        (entry["exception_rate_valid"], score_id, entry) for score_id, entry in scores.items()
+        if entry["exception_rate_valid"]
+    ]
+    if failing:
+        print(f"\nScores raising on inputs inside their documented domain ({len(failing)})")
+        for exception_rate, score_id, entry in sorted(failing, reverse=True)[:top]:
+            names = Counter()
+            for kind in ("base", "boundary", "random"):
+                names.update(entry["exceptions"].get(kind, {}))
+            summary = ", ".join(f"{name} x{count}" for name, count in names.most_common(3))
+            # Without a working example request, the base input itself may be invalid
+            origin = "" if entry["base_from_request"] else "  (base from metadata)"
+            print(f"{score_id:<42} {exception_rate:>6.0%}  {summary}{origin}")
+
+    if report["skipped"]:
+        print(f"\nNot fuzzed: {', '.join(f'{score_id} ({reason})' for score_id, reason in report['skipped'].items())}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scores", nargs="+", help="Only these score ids")
+    parser.add_argument("--samples", type=int, default=200, help="Inputs per score")
+    parser.add_argument("--repeat", type=int, default=3, help="Calls per input, keeping the fastest")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the random inputs")
+    parser.add_argument("--top", type=int, default=20, help="Rows per report section")
+    parser.add_argument("--output", type=Path, default=RESULTS_PATH, help="JSON report to write")
+    args = parser.parse_args()
+
+    started = time.time()
+    report = run_fuzzer(args.scores, args.samples, args.repeat, args.seed)
+    print_report(report, args.top)
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=1, default=str) + "\n")
+    print(f"\nReport written to {args.output} ({time.time() - started:.0f}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,571 @@
+"""
+Load harness: replays a JSONL request log against the app
+
+Each line of a request log is one HTTP request:
+
+    {"method": "POST", "path": "/ckd_epi_2021", "body": {"sex": "female", ...}, "weight": 3.5}
+
+("method" defaults to POST when there is a body, "weight" to 1; lines without
+a "path", such as the change requests in the repository's requests.jsonl,
+are skipped). `generate` writes such a log with one valid request per score,
+weighted by a Zipf popularity over a shuffled score ranking or by a JSON
+file of {score_id: weight}.
+
+`run` sends the requests to the app in-process (ASGI, default) or to a
+local uvicorn started by the harness (--uvicorn) or already running (--url):
+
+    closed loop   --concurrency N workers, each sending its next request when
+                  the previous one completes
+    open loop     --rate R requests/sec with Poisson (or --uniform) arrivals;
+                  latency counts from the scheduled send time, so a saturated
+                  app shows up as queueing instead of a lower offered rate
+
+Requests are drawn by weight (--mix weighted) or replayed in log order
+(--mix sequential). --rate-limit N enables the real RateLimitMiddleware at N
+req/sec per client IP, backed by the bundled Redis stand-in
+(benchmarks/redis_standin.py); --client-ips spreads requests over that many
+X-Forwarded-For addresses. The report gives throughput, p50/p95/p99
+latency, status counts and the 429 rate, overall and per path.
+
+Usage:
+    python -m benchmarks.load_harness generate --output build/requests.jsonl [--zipf 1.1 | --popularity weights.json]
+    python -m benchmarks.load_harness run --log build/requests.jsonl [--concurrency 8 | --rate 200]
+                                          [--duration 10] [--warmup N] [--rate-limit 50 --client-ips 4]
+                                          [--uvicorn | --url http://127.0.0.1:8000] [--json report.json]
+"""
+
+import argparse
+import asyncio
+import bisect
+import itertools
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+import warnings
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from benchmarks.redis_standin import RedisStandIn  # noqa: E402
+
+# Paths listed individually in the report
+REPORTED_PATHS = 10
+
+
+class RequestSpec:
+    """One replayable request, with its body encoded once"""
+
+    __slots__ = ("method", "path", "body", "weight")
+
+    def __init__(self, method: str, path: str, body: bytes, weight: float):
+        self.method = method
+        self.path = path
+        self.body = body
+        self.weight = weight
+
+
+def load_log(path: Path) -> Tuple[List[RequestSpec], int]:
+    """
+    Reads a JSONL request log
+
+    Returns:
+        Tuple[List[RequestSpec], int]: (requests, number of lines skipped)
+    """
+    requests: List[RequestSpec] = []
+    skipped = 0
+    with open(path) as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                skipped += 1
+                continue
+            if not isinstance(entry, dict) or not str(entry.get("path", "")).startswith("/"):
+                skipped += 1
+                continue
+            body = entry.get("body")
+            encoded = b"" if body is None else (body.encode() if isinstance(body, str) else json.dumps(body).encode())
+            method = entry.get("method") or ("POST" if body is not None else "GET")
+            requests.append(RequestSpec(method.upper(), entry["path"], encoded, float(entry.get("weight", 1.0))))
+    return requests, skipped
+
+
+def generate_log(output: Path, zipf: float, popularity: Optional[Dict[str, float]], seed: int) -> Dict[str, Any]:
+    """
+    Writes a request log with one checked request per score
+
+    Payloads are built like the score suite's (request model examples
+    completed from the score JSON); only requests the app answers with 200
+    are written.
+
+    Args:
+        output (Path): Log file to write
+        zipf (float): Exponent of the Zipf popularity over a shuffled score ranking
+        popularity (Dict, optional): Explicit weight per score id (overrides zipf)
+        seed (int): Seed of the ranking shuffle
+
+    Returns:
+        Dict: Counts of written and rejected scores
+    """
+    from benchmarks.score_suite import request, score_request
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        from fastapi.routing import APIRoute
+        from main import app
+        from app.services.score_service import score_service
+
+    post_routes = {
+        route.path: route for route in app.router.routes
+        if isinstance(route, APIRoute) and "POST" in route.methods
+    }
+    score_ids = sorted(score.id for score in score_service.get_available_scores())
+    ranking = score_ids[:]
+    random.Random(seed).shuffle(ranking)
+    rank = {score_id: position for position, score_id in enumerate(ranking, 1)}
+
+    written, rejected = 0, []
+    loop = asyncio.new_event_loop()
+    output.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        with open(output, "w") as f:
+            for score_id in score_ids:
+                path, payload = score_request(post_routes, score_id, score_service.get_score_raw_data(score_id))
+
+                try:
+                    status, _ = loop.run_until_complete(request(app, path, json.dumps(payload).encode()))
+                except Exception:
+                    status = 500
+                if status != 200:
+                    rejected.append(score_id)
+                    continue
+
+                weight = popularity.get(score_id, 0.0) if popularity is not None else rank[score_id] ** -zipf
+                if weight <= 0:
+                    continue
+                f.write(json.dumps({"method": "POST", "path": path, "body": payload,
+                                    "weight": round(weight, 6)}) + "\n")
+                written += 1
+    finally:
+        loop.close()
+    return {"written": written, "rejected": rejected}
+
+
+class RequestPicker:
+    """Draws the next request by weight or in log order"""
+
+    def __init__(self, requests: List[RequestSpec], mix: str, seed: int):
+        self.requests = requests
+        self.random = random.Random(seed)
+        self.sequence = itertools.cycle(requests)
+        self.mix = mix
+        self.cumulative = list(itertools.accumulate(spec.weight for spec in requests))
+
+    def next(self) -> RequestSpec:
+        if self.mix == "sequential":
+            return next(self.sequence)
+        position = bisect.bisect_right(self.cumulative, self.random.random() * self.cumulative[-1])
+        return self.requests[min(position, len(self.requests) - 1)]
+
+
+def _headers(spec: RequestSpec, client_ip: Optional[str]) -> List[Tuple[bytes, bytes]]:
+    headers = [(b"host", b"loadtest"), (b"content-type", b"application/json"),
+               (b"content-length", str(len(spec.body)).encode())]
+    if client_ip is not None:
+        headers.append((b"x-forwarded-for", client_ip.encode()))
+    return headers
+
+
+class AsgiTarget:
+    """Sends requests to the ASGI app in this process"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def send(self, spec: RequestSpec, client_ip: Optional[str]) -> int:
+        status = 0
+        body_sent = False
+
+        async def receive():
+            nonlocal body_sent
+            if body_sent:
+                # Nothing more to read; wait as a real client that keeps the connection open
+                await asyncio.sleep(3600)
+            body_sent = True
+            return {"type": "http.request", "body": spec.body, "more_body": False}
+
+        async def send_message(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+
+        scope = {
+            "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+            "method": spec.method, "scheme": "http", "path": spec.path, "raw_path": spec.path.encode(),
+            "root_path": "", "query_string": b"", "headers": _headers(spec, client_ip),
+            "client": ("127.0.0.1", 50000), "server": ("loadtest", 80)
+        }
+        await self.app(scope, receive, send_message)
+        return status
+
+    async def close(self):
+        pass
+
+
+class HttpTarget:
+    """Sends requests over keep-alive HTTP/1.1 connections to a running server"""
+
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self.idle: List[Tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+
+    async def send(self, spec: RequestSpec, client_ip: Optional[str]) -> int:
+        connection = self.idle.pop() if self.idle else await asyncio.open_connection(self.host, self.port)
+        reader, writer = connection
+        head = [f"{spec.method} {spec.path} HTTP/1.1".encode()]
+        head.extend(name + b": " + value for name, value in _headers(spec, client_ip))
+        writer.write(b"\r\n".join(head) + b"\r\n\r\n" + spec.body)
+        await writer.drain()
+
+        status = int((await reader.readline()).split()[1])
+        length, chunked, keep_alive = 0, False, True
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            name, value = name.strip().lower(), value.strip().lower()
+            if name == "content-length":
+                length = int(value)
+            elif name == "transfer-encoding" and "chunked" in value:
+                chunked = True
+            elif name == "connection" and value == "close":
+                keep_alive = False
+
+        if chunked:
+            while True:
+                size = int((await reader.readline()).split(b";")[0], 16)
+                await reader.readexactly(size + 2)
+                if size == 0:
+                    break
+        elif length:
+            await reader.readexactly(length)
+
+        if keep_alive:
+            self.idle.append(connection)
+        else:
+            writer.close()
+        return status
+
+    async def close(self):
+        for _, writer in self.idle:
+            writer.close()
+        self.idle.clear()
+
+
+class Recorder:
+    """Latencies and status codes, overall and per path"""
+
+    def __init__(self):
+        self.latencies: List[float] = []
+        self.statuses: Counter = Counter()
+        self.by_path: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Counter = Counter()
+
+    def add(self, path: str, latency: float, status: int):
+        self.latencies.append(latency)
+        self.statuses[status] += 1
+        self.by_path[path].append(latency)
+
+
+def percentile(ordered: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of sorted values"""
+    if not ordered:
+        return float("nan")
+    return ordered[min(len(ordered) - 1, max(0, int(round(fraction * len(ordered) + 0.5)) - 1))]
+
+
+async def _timed(target, spec: RequestSpec, client_ip: Optional[str], origin: float,
+                 recorder: Optional[Recorder]):
+    """Sends one request and records its latency from origin"""
+    try:
+        status = await target.send(spec, client_ip)
+    except Exception as e:
+        if recorder is not None:
+            recorder.errors[type(e).__name__] += 1
+        return
+    if recorder is not None:
+        recorder.add(spec.path, time.perf_counter() - origin, status)
+
+
+async def closed_loop(target, picker: RequestPicker, ips: List[Optional[str]], concurrency: int,
+                      duration: float, recorder: Recorder):
+    """Runs concurrency workers back to back for duration seconds"""
+    deadline = time.perf_counter() + duration
+    counter = itertools.count()
+
+    async def worker():
+        while time.perf_counter() < deadline:
+            spec = picker.next()
+            await _timed(target, spec, ips[next(counter) % len(ips)], time.perf_counter(), recorder)
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+
+async def open_loop(target, picker: RequestPicker, ips: List[Optional[str]], rate: float, duration: float,
+                    poisson: bool, max_in_flight: int, recorder: Recorder, seed: int) -> int:
+    """
+    Sends requests at a fixed average rate, regardless of completions
+
+    Returns:
+        int: Requests that could not start on time because max_in_flight were pending
+    """
+    arrivals = random.Random(seed)
+    slots = asyncio.Semaphore(max_in_flight)
+    tasks = set()
+    delayed = 0
+    start = time.perf_counter()
+    scheduled = start
+    sent = 0
+
+    async def fire(spec: RequestSpec, client_ip: Optional[str], origin: float):
+        try:
+            await _timed(target, spec, client_ip, origin, recorder)
+        finally:
+            slots.release()
+
+    while scheduled - start < duration:
+        wait = scheduled - time.perf_counter()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        if slots.locked():
+            delayed += 1
+        await slots.acquire()
+        task = asyncio.ensure_future(fire(picker.next(), ips[sent % len(ips)], scheduled))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+        sent += 1
+        scheduled += arrivals.expovariate(rate) if poisson else 1 / rate
+
+    if tasks:
+        await asyncio.gather(*tasks)
+    return delayed
+
+
+def start_uvicorn(environment: Dict[str, str]) -> Tuple[subprocess.Popen, int]:
+    """Starts uvicorn serving main:app on a free port and waits for it"""
+    import socket
+    import urllib.request
+
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(port),
+         "--no-access-log", "--log-level", "warning"],
+        cwd=ROOT, env=environment, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    deadline = time.time() + 120
+    while time.time() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError("uvicorn exited during start-up")
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/health/", timeout=2) as response:
+                if response.status == 200:
+                    return server, port
+        except OSError:
+            time.sleep(0.5)
+    server.terminate()
+    raise RuntimeError("uvicorn did not become ready")
+
+
+def report(recorder: Recorder, elapsed: float, settings: Dict[str, Any]) -> Dict[str, Any]:
+    """Summarizes a run"""
+    ordered = sorted(recorder.latencies)
+    total = len(ordered)
+    paths = sorted(recorder.by_path.items(), key=lambda item: len(item[1]), reverse=True)
+    return {
+        "settings": settings,
+        "requests": total,
+        "seconds": round(elapsed, 3),
+        "throughput": round(total / elapsed, 1) if elapsed else 0.0,
+        "latency_ms": {
+            "p50": round(percentile(ordered, 0.50) * 1000, 3),
+            "p95": round(percentile(ordered, 0.95) * 1000, 3),
+            "p99": round(percentile(ordered, 0.99) * 1000, 3),
+            "max": round(ordered[-1] * 1000, 3) if ordered else None
+        },
+        "statuses": {str(status): count for status, count in sorted(recorder.statuses.items())},
+        "rate_limited": round(recorder.statuses.get(429, 0) / total, 4) if total else 0.0,
+        "client_errors": dict(recorder.errors),
+        "paths": {
+            path: {
+                "requests": len(latencies),
+                "p50_ms": round(percentile(sorted(latencies), 0.50) * 1000, 3),
+                "p95_ms": round(percentile(sorted(latencies), 0.95) * 1000, 3)
+            }
+            for path, latencies in paths[:REPORTED_PATHS]
+        }
+    }
+
+
+def print_report(summary: Dict[str, Any]):
+    latency = summary["latency_ms"]
+    offered = f" (offered {summary['settings']['offered_rate']:g} req/s)" if summary["settings"]["offered_rate"] else ""
+    print(f"Requests: {summary['requests']} in {summary['seconds']:.1f}s -> {summary['throughput']:.1f} req/s{offered}")
+    print(f"Latency (ms): p50 {latency['p50']:.2f}  p95 {latency['p95']:.2f}  "
+          f"p99 {latency['p99']:.2f}  max {latency['max'] or 0:.2f}")
+    print(f"Statuses: {', '.join(f'{status}: {count}' for status, count in summary['statuses'].items())}")
+    print(f"429 rate: {summary['rate_limited']:.2%}")
+    if summary["client_errors"]:
+        print(f"Failed requests: {summary['client_errors']}")
+    if "delayed" in summary:
+        print(f"Sends delayed by the in-flight limit: {summary['delayed']}")
+    print(f"\n{'path':<45} {'requests':>8} {'p50 ms':>8} {'p95 ms':>8}")
+    for path, stats in summary["paths"].items():
+        print(f"{path:<45} {stats['requests']:>8} {stats['p50_ms']:>8.2f} {stats['p95_ms']:>8.2f}")
+
+
+async def replay(args, requests: List[RequestSpec], redis_url: Optional[str]) -> Dict[str, Any]:
+    """Runs the load against the selected target and returns the report"""
+    server = None
+    if args.url or args.uvicorn:
+        if args.uvicorn:
+            environment = dict(os.environ)
+            if redis_url is not None:
+                environment.update(REDIS_URL=redis_url, REQ_PER_SEC=str(args.rate_limit), WHITE_LIST="[]")
+            else:
+                # Keep the server's rate limiter off, as in-process runs without --rate-limit
+                environment.update(REDIS_URL="redis://127.0.0.1:1")
+            server, port = start_uvicorn(environment)
+            host = "127.0.0.1"
+        else:
+            address = args.url.split("://", 1)[-1].rstrip("/")
+            host, _, port_text = address.partition(":")
+            port = int(port_text or 80)
+        target = HttpTarget(host, port)
+    else:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            from main import app
+        target = AsgiTarget(app)
+
+    try:
+        picker = RequestPicker(requests, args.mix, args.seed)
+        ips: List[Optional[str]] = (
+            [f"10.0.{index // 250}.{index % 250 + 1}" for index in range(args.client_ips)]
+            if args.client_ips else [None]
+        )
+        # Calculators load on first use; without a warm-up the first requests to each score queue the rest
+        warmup = requests if args.warmup is None else list(itertools.islice(itertools.cycle(requests), args.warmup))
+        for spec in warmup:
+            await _timed(target, spec, ips[0], time.perf_counter(), None)
+        if redis_url is not None:
+            # Let the warm-up's rate limit window pass
+            await asyncio.sleep(1.1)
+
+        recorder = Recorder()
+        start = time.perf_counter()
+        delayed = None
+        if args.rate:
+            delayed = await open_loop(target, picker, ips, args.rate, args.duration, not args.uniform,
+                                      args.max_in_flight, recorder, args.seed)
+        else:
+            await closed_loop(target, picker, ips, args.concurrency, args.duration, recorder)
+        elapsed = time.perf_counter() - start
+    finally:
+        await target.close()
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=30)
+
+    settings = {
+        "target": args.url or ("uvicorn" if args.uvicorn else "asgi"),
+        "mode": f"open loop {args.rate:g} req/s ({'uniform' if args.uniform else 'poisson'})" if args.rate
+        else f"closed loop x{args.concurrency}",
+        "offered_rate": args.rate, "mix": args.mix, "duration": args.duration, "requests_in_log": len(requests),
+        "rate_limit": args.rate_limit, "client_ips": args.client_ips, "redis_latency_ms": args.redis_latency
+    }
+    summary = report(recorder, elapsed, settings)
+    if delayed is not None:
+        summary["delayed"] = delayed
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    generate_parser = subparsers.add_parser("generate", help="Write a request log with one request per score")
+    generate_parser.add_argument("--output", type=Path, default=ROOT / "build" / "requests.jsonl", help="Log to write")
+    generate_parser.add_argument("--zipf", type=float, default=1.1, help="Zipf exponent of the score popularity")
+    generate_parser.add_argument("--popularity", type=Path, help="JSON file of {score_id: weight}")
+    generate_parser.add_argument("--seed", type=int, default=0, help="Seed of the popularity ranking")
+
+    run_parser = subparsers.add_parser("run", help="Replay a request log and report latency and throughput")
+    run_parser.add_argument("--log", type=Path, default=ROOT / "build" / "requests.jsonl", help="JSONL request log")
+    run_parser.add_argument("--mix", choices=("weighted", "sequential"), default="weighted",
+                            help="Draw requests by weight or replay them in order")
+    run_parser.add_argument("--concurrency", type=int, default=8, help="Closed loop: concurrent clients")
+    run_parser.add_argument("--rate", type=float, help="Open loop: average requests/sec (disables --concurrency)")
+    run_parser.add_argument("--uniform", action="store_true", help="Open loop: evenly spaced instead of Poisson")
+    run_parser.add_argument("--max-in-flight", type=int, default=1000, help="Open loop: pending request limit")
+    run_parser.add_argument("--duration", type=float, default=10.0, help="Seconds of load")
+    run_parser.add_argument("--warmup", type=int, help="Requests sent before measuring (default: every log line once)")
+    run_parser.add_argument("--rate-limit", type=int, help="Enable the rate limiter at this many req/sec per IP")
+    run_parser.add_argument("--redis-latency", type=float, default=0.0, help="Milliseconds added per Redis command")
+    run_parser.add_argument("--client-ips", type=int, default=0, help="Spread requests over this many client IPs")
+    run_parser.add_argument("--uvicorn", action="store_true", help="Start a local uvicorn instead of running in-process")
+    run_parser.add_argument("--url", help="Send to a running server (e.g. http://127.0.0.1:8000)")
+    run_parser.add_argument("--seed", type=int, default=0, help="Seed of the request mix and arrivals")
+    run_parser.add_argument("--json", type=Path, help="Also write the report as JSON")
+    args = parser.parse_args()
+
+    if args.command == "generate":
+        popularity = json.loads(args.popularity.read_text()) if args.popularity else None
+        result = generate_log(args.output, args.zipf, popularity, args.seed)
+        print(f"{result['written']} requests written to {args.output}")
+        if result["rejected"]:
+            print(f"Scores without a valid example payload: {', '.join(result['rejected'])}")
+        return
+
+    requests, skipped = load_log(args.log)
+    if not requests:
+        parser.error(f"{args.log} has no replayable requests (lines need a \"path\")")
+    if skipped:
+        print(f"Skipped {skipped} lines without a request", file=sys.stderr)
+
+    redis = None
+    redis_url = None
+    if args.rate_limit:
+        redis = RedisStandIn(latency=args.redis_latency / 1000).start()
+        redis_url = redis.url
+        if not (args.uvicorn or args.url):
+            # main.py enables RateLimitMiddleware at import when Redis answers
+            os.environ.update(REDIS_URL=redis_url, REQ_PER_SEC=str(args.rate_limit), WHITE_LIST="[]")
+    elif not (args.uvicorn or args.url):
+        os.environ["REDIS_URL"] = "redis://127.0.0.1:1"
+
+    try:
+        summary = asyncio.run(replay(args, requests, redis_url))
+    finally:
+        if redis is not None:
+            redis.stop()
+
+    print_report(summary)
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_text(json.dumps(summary, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
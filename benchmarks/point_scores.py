@@ -0,0 +1,68 @@
+"""
+Point score throughput benchmark
+
+Compares per-patient calls to calculate_cha2ds2_vasc with columnar
+evaluation of the compiled CHA₂DS₂-VASc points table.
+
+Usage:
+    python -m benchmarks.point_scores [--patients 100000]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from calculators.cha2ds2_vasc import POINT_SCORE, calculate_cha2ds2_vasc
+
+
+BOOLEAN_PARAMETERS = (
+    "congestive_heart_failure",
+    "hypertension",
+    "stroke_tia_thromboembolism",
+    "vascular_disease",
+    "diabetes"
+)
+
+
+def build_cohort(patients: int, seed: int = 42):
+    """Builds random but valid CHA₂DS₂-VASc input columns"""
+    rng = random.Random(seed)
+    columns = {
+        "age": [rng.randint(18, 100) for _ in range(patients)],
+        "sex": [rng.choice(["male", "female"]) for _ in range(patients)]
+    }
+    for name in BOOLEAN_PARAMETERS:
+        columns[name] = [rng.random() < 0.3 for _ in range(patients)]
+    return columns
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the point score engine")
+    parser.add_argument("--patients", type=int, default=100000, help="Cohort size")
+    args = parser.parse_args()
+
+    columns = build_cohort(args.patients)
+    names = list(columns)
+    rows = [dict(zip(names, row)) for row in zip(*(columns[name] for name in names))]
+
+    start = time.perf_counter()
+    for row in rows:
+        calculate_cha2ds2_vasc(**row)
+    scalar_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    POINT_SCORE.evaluate_columns(columns)
+    columnar_seconds = time.perf_counter() - start
+
+    print(f"Patients:          {args.patients}")
+    print(f"Scalar calculator: {scalar_seconds:.3f} s ({args.patients / scalar_seconds:,.0f} patients/s)")
+    print(f"Columnar engine:   {columnar_seconds:.3f} s ({args.patients / columnar_seconds:,.0f} patients/s)")
+    print(f"Speedup:           {scalar_seconds / columnar_seconds:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+PSA doubling time cohort benchmark
+
+Compares per-patient calls to calculate_psa_doubling_time_calculator with the
+columnar batch path, which fits every patient's ln(PSA) trend in one pass
+and also returns R² and confidence intervals.
+
+Usage:
+    python -m benchmarks.psa_doubling_time [--patients 50000]
+"""
+
+import argparse
+import math
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from calculators.psa_doubling_time_calculator import (
+    PsaDoublingTimeCalculator,
+    calculate_psa_doubling_time_calculator
+)
+
+
+def build_cohort(patients: int, seed: int = 42):
+    """Builds random follow-up series of two to five PSA measurements per patient"""
+    rng = random.Random(seed)
+    series = []
+    for patient in range(patients):
+        measurements = rng.randint(2, 5)
+        days = sorted(rng.sample(range(0, 1500), measurements))
+        slope = rng.uniform(-0.01, 0.3)
+        baseline = rng.uniform(0.2, 5.0)
+        psa = [round(baseline * math.exp(slope * day / 30.44 + rng.gauss(0, 0.05)), 2)
+               for day in days]
+        series.append((f"patient-{patient}", days, psa))
+    return series
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark PSA doubling time over a cohort")
+    parser.add_argument("--patients", type=int, default=50000, help="Cohort size")
+    args = parser.parse_args()
+
+    series = build_cohort(args.patients)
+
+    start = time.perf_counter()
+    for _, days, psa in series:
+        parameters = {}
+        for number, (value, day) in enumerate(zip(psa, days), start=1):
+            parameters[f"psa_{number}"] = value
+            parameters[f"days_{number}"] = day
+        calculate_psa_doubling_time_calculator(**parameters)
+    scalar_seconds = time.perf_counter() - start
+
+    patient_ids, days_column, psa_column = [], [], []
+    for patient_id, days, psa in series:
+        patient_ids.extend([patient_id] * len(days))
+        days_column.extend(days)
+        psa_column.extend(psa)
+
+    start = time.perf_counter()
+    PsaDoublingTimeCalculator().calculate_batch(patient_ids, days_column, psa_column)
+    batch_seconds = time.perf_counter() - start
+
+    print(f"Patients:          {args.patients} ({len(psa_column)} measurements)")
+    print(f"Scalar calculator: {scalar_seconds:.3f} s ({args.patients / scalar_seconds:,.0f} patients/s)")
+    print(f"Columnar batch:    {batch_seconds:.3f} s ({args.patients / batch_seconds:,.0f} patients/s)")
+    print(f"Speedup:           {scalar_seconds / batch_seconds:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
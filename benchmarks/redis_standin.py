@@ -0,0 +1,177 @@
+"""
+Local Redis stand-in for offline rate limiter measurements
+
+A small in-memory server speaking the Redis protocol (RESP2) with the
+commands the rate limiter and redis-py's connection handshake use: PING,
+AUTH, SELECT, CLIENT, INCR/INCRBY, GET, SET, EXPIRE, TTL, DEL and FLUSHALL. Keys
+expire lazily. The real redis client and RateLimitMiddleware talk to it over
+loopback TCP exactly as they would to Redis, so rate limiting can be turned
+on without a Redis installation; --latency adds a fixed delay per command
+to mimic a remote instance.
+
+Usage:
+    python -m benchmarks.redis_standin [--port 6379] [--latency 0.5]
+
+    REDIS_URL=redis://127.0.0.1:6379 REQ_PER_SEC=50 python main.py
+"""
+
+import argparse
+import socketserver
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+
+class _Store:
+    """Key space with lazy expiry, shared by all connections"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.values: Dict[bytes, Tuple[bytes, Optional[float]]] = {}
+
+    def get(self, key: bytes) -> Optional[bytes]:
+        item = self.values.get(key)
+        if item is None:
+            return None
+        value, expires = item
+        if expires is not None and expires <= time.monotonic():
+            del self.values[key]
+            return None
+        return value
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    """Serves the RESP commands of one client connection"""
+
+    def read_command(self) -> Optional[List[bytes]]:
+        line = self.rfile.readline()
+        if not line:
+            return None
+        if not line.startswith(b"*"):
+            # Inline command (e.g. typed into telnet)
+            return line.split()
+        arguments = []
+        for _ in range(int(line[1:])):
+            length = int(self.rfile.readline()[1:])
+            arguments.append(self.rfile.read(length + 2)[:-2])
+        return arguments
+
+    def handle(self):
+        while True:
+            command = self.read_command()
+            if command is None:
+                return
+            if not command:
+                continue
+            if self.server.latency:
+                time.sleep(self.server.latency)
+            reply = self.execute(command[0].upper(), command[1:])
+            self.wfile.write(reply)
+            if command[0].upper() == b"QUIT":
+                return
+
+    def execute(self, name: bytes, arguments: List[bytes]) -> bytes:
+        store: _Store = self.server.store
+        with store.lock:
+            if name == b"PING":
+                return b"+PONG\r\n"
+            if name in (b"AUTH", b"SELECT", b"CLIENT", b"QUIT"):
+                return b"+OK\r\n"
+            if name == b"GET":
+                return _bulk(store.get(arguments[0]))
+            if name == b"SET":
+                store.values[arguments[0]] = (arguments[1], None)
+                return b"+OK\r\n"
+            if name in (b"INCR", b"INCRBY"):
+                current = store.get(arguments[0])
+                try:
+                    value = int(current or 0) + (int(arguments[1]) if name == b"INCRBY" else 1)
+                except ValueError:
+                    return b"-ERR value is not an integer or out of range\r\n"
+                expires = store.values.get(arguments[0], (None, None))[1] if current is not None else None
+                store.values[arguments[0]] = (str(value).encode(), expires)
+                return f":{value}\r\n".encode()
+            if name == b"EXPIRE":
+                current = store.get(arguments[0])
+                if current is None:
+                    return b":0\r\n"
+                store.values[arguments[0]] = (current, time.monotonic() + int(arguments[1]))
+                return b":1\r\n"
+            if name == b"TTL":
+                if store.get(arguments[0]) is None:
+                    return b":-2\r\n"
+                expires = store.values[arguments[0]][1]
+                return b":-1\r\n" if expires is None else f":{max(0, round(expires - time.monotonic()))}\r\n".encode()
+            if name == b"DEL":
+                removed = sum(store.values.pop(key, None) is not None for key in arguments)
+                return f":{removed}\r\n".encode()
+            if name == b"FLUSHALL":
+                store.values.clear()
+                return b"+OK\r\n"
+        return f"-ERR unknown command '{name.decode(errors='replace')}'\r\n".encode()
+
+
+def _bulk(value: Optional[bytes]) -> bytes:
+    """Encodes a bulk string reply"""
+    if value is None:
+        return b"$-1\r\n"
+    return b"$%d\r\n%s\r\n" % (len(value), value)
+
+
+class RedisStandIn(socketserver.ThreadingTCPServer):
+    """In-memory Redis protocol server running in a background thread"""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0):
+        """
+        Binds the server (port 0 picks a free port)
+
+        Args:
+            host (str): Interface to listen on
+            port (int): TCP port
+            latency (float): Delay added to every command, in seconds
+        """
+        super().__init__((host, port), _Handler)
+        self.store = _Store()
+        self.latency = latency
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """redis:// URL of the server, in the form main.py expects in REDIS_URL"""
+        host, port = self.server_address[:2]
+        return f"redis://{host}:{port}"
+
+    def start(self) -> "RedisStandIn":
+        """Serves in a daemon thread"""
+        self._thread = threading.Thread(target=self.serve_forever, name="redis-standin", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stops serving and closes the socket"""
+        self.shutdown()
+        self.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to listen on")
+    parser.add_argument("--port", type=int, default=6379, help="TCP port")
+    parser.add_argument("--latency", type=float, default=0.0, help="Milliseconds added to every command")
+    args = parser.parse_args()
+
+    server = RedisStandIn(args.host, args.port, args.latency / 1000)
+    print(f"Redis stand-in listening on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""
+Benchmark: route resolution for the per-score endpoints
+
+Resolves requests to the first and the last registered score endpoint with
+Starlette's regex routing (every route tried in registration order) and
+with the exact-path dispatcher, then times complete requests through the
+ASGI app with both. The request body is empty, so the handler only returns
+a validation error and the timing is dominated by routing.
+
+Usage:
+    python -m benchmarks.score_routing [--repeat 2000]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+import warnings
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from starlette.routing import Match  # noqa: E402
+
+
+def build_scope(path: str) -> dict:
+    """Builds the ASGI scope of a JSON POST request"""
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"content-type", b"application/json"), (b"content-length", b"2")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("testserver", 80)
+    }
+
+
+def regex_match(routes, scope):
+    """Resolves a request the way Starlette's router does"""
+    for route in routes:
+        match, child_scope = route.matches(scope)
+        if match == Match.FULL:
+            return route
+    return None
+
+
+async def request(app, path: str) -> int:
+    """Sends one request through the ASGI app and returns the status code"""
+    status = 0
+    body_sent = False
+
+    async def receive():
+        nonlocal body_sent
+        if body_sent:
+            return {"type": "http.disconnect"}
+        body_sent = True
+        return {"type": "http.request", "body": b"{}", "more_body": False}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(build_scope(path), receive, send)
+    return status
+
+
+async def time_requests(app, path: str, repeat: int) -> float:
+    """Returns the mean time of a complete request in microseconds"""
+    await request(app, path)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        await request(app, path)
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=2000, help="Resolutions/requests per measurement")
+    args = parser.parse_args()
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        from main import app
+        from app.routers.scores import router as scores_router
+
+    dispatcher = app.router.middleware_stack
+    routes = app.router.routes
+    score_routes = scores_router.routes
+    paths = [("first", score_routes[0].path), ("last", score_routes[-1].path)]
+
+    print(f"Routes registered: {len(routes)}; static paths indexed: ", end="")
+    dispatcher.match(build_scope(paths[0][1]))
+    print(len(dispatcher._table))
+    print()
+
+    print("Route resolution (µs per request)")
+    print(f"{'score':<8} {'path':<40} {'position':>8} {'regex':>9} {'exact':>9} {'speedup':>8}")
+    for label, path in paths:
+        scope = build_scope(path)
+        route = regex_match(routes, scope)
+        assert dispatcher.match(scope)[0] is route, f"Dispatcher resolved {path} to a different route"
+
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            regex_match(routes, scope)
+        regex_time = (time.perf_counter() - start) / args.repeat * 1e6
+
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            dispatcher.match(scope)
+        exact_time = (time.perf_counter() - start) / args.repeat * 1e6
+
+        print(f"{label:<8} {path:<40} {routes.index(route):>8} {regex_time:>9.2f} {exact_time:>9.2f} "
+              f"{regex_time / exact_time:>7.1f}x")
+    print()
+
+    print("Complete requests through the ASGI app (µs per request)")
+    print(f"{'score':<8} {'status':>6} {'regex':>9} {'exact':>9} {'speedup':>8}")
+    loop = asyncio.new_event_loop()
+    try:
+        for label, path in paths:
+            app.router.middleware_stack = dispatcher.fallback
+            status = loop.run_until_complete(request(app, path))
+            regex_time = loop.run_until_complete(time_requests(app, path, args.repeat))
+            app.router.middleware_stack = dispatcher
+            exact_time = loop.run_until_complete(time_requests(app, path, args.repeat))
+            print(f"{label:<8} {status:>6} {regex_time:>9.1f} {exact_time:>9.1f} {regex_time / exact_time:>7.2f}x")
+            if label == "last":
+                print(f"\nSpeedup: {regex_time / exact_time:.2f}x for the last registered score")
+    finally:
+        loop.close()
+        app.router.middleware_stack = dispatcher
+
+
+if __name__ == "__main__":
+    main()
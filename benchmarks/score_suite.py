@@ -0,0 +1,530 @@
+"""
+Benchmark suite: every score at three layers, with regression baselines
+
+For every score, builds a valid payload from the examples of its Pydantic
+request model (the model's json_schema_extra/schema_extra example, then the
+Field examples) and fills the remaining required fields from its JSON
+metadata (enum, options, min/max midpoint). One request through the app
+checks the payload and captures the parameters the endpoint passes to the
+calculator; then three layers are timed separately:
+
+    calculator  the raw calculate_<id> function
+    service     CalculatorService.calculate_score
+    asgi        the complete POST request through the ASGI app, in-process
+
+Scores without their own endpoint go through POST /api/scores/{id}/calculate.
+Each timing is the best of several rounds of process CPU time, calibrated
+to a minimum duration, over several passes through all the scores.
+
+Usage:
+    python -m benchmarks.score_suite run [--scores ckd_epi_2021 ...] [--output build/score_suite.json]
+    python -m benchmarks.score_suite compare [--baseline benchmarks/baselines/score_suite.json]
+                                             [--current build/score_suite.json] [--threshold 0.25]
+                                             [--confirm]
+
+Refresh the committed baseline with
+`run --output benchmarks/baselines/score_suite.json` on the reference
+machine; compare exits with status 1 when a layer of a score regressed.
+"""
+
+import argparse
+import asyncio
+import functools
+import gc
+import json
+import math
+import platform
+import statistics
+import sys
+import time
+import warnings
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+# Default locations of the committed baseline and of new runs
+BASELINE_PATH = ROOT / "benchmarks" / "baselines" / "score_suite.json"
+RESULTS_PATH = ROOT / "build" / "score_suite.json"
+
+LAYERS = ("calculator", "service", "asgi")
+
+
+def build_scope(path: str, body: bytes) -> dict:
+    """Builds the ASGI scope of a JSON POST request"""
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())],
+        "client": ("127.0.0.1", 50000),
+        "server": ("testserver", 80)
+    }
+
+
+async def request(app, path: str, body: bytes) -> Tuple[int, bytes]:
+    """Sends one POST request through the ASGI app and returns (status, body)"""
+    status = 0
+    chunks = []
+    body_sent = False
+
+    async def receive():
+        nonlocal body_sent
+        if body_sent:
+            return {"type": "http.disconnect"}
+        body_sent = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    await app(build_scope(path, body), receive, send)
+    return status, b"".join(chunks)
+
+
+def model_example(model) -> Dict[str, Any]:
+    """Returns the example payload declared on a Pydantic request model"""
+    for key in ("json_schema_extra", "schema_extra"):
+        extra = model.model_config.get(key)
+        if not isinstance(extra, dict):
+            continue
+        if isinstance(extra.get("example"), dict):
+            return dict(extra["example"])
+        examples = extra.get("examples")
+        if isinstance(examples, list) and examples and isinstance(examples[0], dict):
+            # Either plain payloads or OpenAPI example objects ({"value": payload})
+            first = examples[0]
+            return dict(first["value"]) if isinstance(first.get("value"), dict) else dict(first)
+
+    payload = {}
+    for name, field in model.model_fields.items():
+        extra = field.json_schema_extra if isinstance(field.json_schema_extra, dict) else {}
+        if "example" in extra:
+            payload[field.alias or name] = extra["example"]
+        elif field.examples:
+            payload[field.alias or name] = field.examples[0]
+    return payload
+
+
+def metadata_value(parameter: Dict[str, Any]) -> Any:
+    """Returns a plausible value of a parameter from its JSON metadata"""
+    kind = parameter.get("type", "string")
+    validation = parameter.get("validation") or {}
+    if validation.get("enum"):
+        return validation["enum"][0]
+
+    options = parameter.get("options")
+    if isinstance(options, list) and options:
+        option = options[0]
+        return option.get("value") if isinstance(option, dict) else option
+
+    if kind in ("integer", "float"):
+        low, high = validation.get("min"), validation.get("max")
+        if low is not None and high is not None:
+            value = (low + high) / 2
+        elif low is not None:
+            value = low
+        elif high is not None:
+            value = high
+        else:
+            value = 1
+        return int(round(value)) if kind == "integer" else float(value)
+    if kind == "boolean":
+        return False
+    if kind == "array":
+        return []
+    return ""
+
+
+def build_payload(score_data: Dict[str, Any], model=None) -> Dict[str, Any]:
+    """
+    Builds a request payload for a score
+
+    Args:
+        score_data (Dict): Score JSON metadata
+        model: Pydantic request model of the score endpoint, if it has one
+
+    Returns:
+        Dict: Model examples completed with metadata values for the missing
+        required parameters
+    """
+    payload = model_example(model) if model is not None else {}
+    for parameter in score_data.get("parameters", []):
+        name = parameter["name"]
+        if name not in payload and parameter.get("required", True):
+            payload[name] = metadata_value(parameter)
+
+    if model is not None:
+        # Keep only what the model knows (its example may use aliases)
+        accepted = {field.alias or name for name, field in model.model_fields.items()}
+        payload = {name: value for name, value in payload.items() if name in accepted}
+    return payload
+
+
+def score_request(post_routes: Dict[str, Any], score_id: str, score_data: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+    """
+    Returns the path and a payload to calculate a score through the app
+
+    Args:
+        post_routes (Dict): POST APIRoutes of the app by path
+        score_id (str): ID of the score
+        score_data (Dict): Score JSON metadata
+
+    Returns:
+        Tuple[str, Dict]: The score's own endpoint and a payload for its
+        request model, or the generic calculation endpoint and a payload
+        built from the metadata
+    """
+    route = post_routes.get(f"/{score_id}")
+    if route is not None and len(route.dependant.body_params) == 1:
+        return route.path, build_payload(score_data, route.dependant.body_params[0].type_)
+    return f"/api/scores/{score_id}/calculate", build_payload(score_data)
+
+
+def capture_calculator_calls(loop, app, score_id: str, path: str,
+                             body: bytes) -> Tuple[int, bytes, List[Dict[str, Any]]]:
+    """
+    Sends one request and captures the parameters passed to the score's calculator
+
+    Returns:
+        Tuple[int, bytes, List[Dict]]: Response status and body, and the
+        parameters of every calculator_service.calculate_score call for the score
+    """
+    from app.services.calculator_service import calculator_service
+
+    captured = []
+    original = calculator_service.calculate_score
+
+    def capture(captured_id, parameters):
+        if captured_id == score_id:
+            captured.append(dict(parameters))
+        return original(captured_id, parameters)
+
+    calculator_service.calculate_score = capture
+    try:
+        status, response = loop.run_until_complete(request(app, path, body))
+    finally:
+        del calculator_service.calculate_score
+    return status, response, captured
+
+
+def calibrate(run_batch: Callable[[int], float], min_time: float) -> int:
+    """
+    Returns how many calls make a batch last at least min_time seconds
+
+    Args:
+        run_batch (Callable): run_batch(n) performs n calls and returns the elapsed seconds
+        min_time (float): Minimum duration of one batch in seconds
+    """
+    number = 1
+    while True:
+        elapsed = run_batch(number)
+        if elapsed >= min_time:
+            return number
+        number *= 2 if elapsed <= 0 else min(10, max(2, int(min_time / elapsed) + 1))
+
+
+def best_time(run_batch: Callable[[int], float], number: int, rounds: int) -> float:
+    """
+    Times batches of calls and keeps the best
+
+    Batches are timed in process CPU time, which other tenants of a shared
+    machine do not inflate, and, like timeit, with the garbage collector
+    paused.
+
+    Args:
+        run_batch (Callable): run_batch(n) performs n calls and returns the elapsed seconds
+        number (int): Calls per batch
+        rounds (int): Batches timed
+
+    Returns:
+        float: Best time per call in microseconds
+    """
+    gc.disable()
+    try:
+        best = min(run_batch(number) for _ in range(rounds)) / number
+    finally:
+        gc.enable()
+    return best * 1e6
+
+
+def sync_batch(call: Callable[[], Any]) -> Callable[[int], float]:
+    """Returns a batch runner for a synchronous call"""
+    def run(number: int) -> float:
+        start = time.process_time()
+        for _ in range(number):
+            call()
+        return time.process_time() - start
+    return run
+
+
+def asgi_batch(loop, app, path: str, body: bytes) -> Callable[[int], float]:
+    """Returns a batch runner sending requests through the ASGI app"""
+    async def requests(number: int) -> float:
+        start = time.process_time()
+        for _ in range(number):
+            await request(app, path, body)
+        return time.process_time() - start
+
+    return lambda number: loop.run_until_complete(requests(number))
+
+
+def run_suite(score_ids: Optional[List[str]], min_time: float, rounds: int, passes: int) -> Dict[str, Any]:
+    """
+    Benchmarks the scores at every layer
+
+    Every score is timed once per pass and its best pass is kept: slow
+    phases of a shared machine last seconds and would otherwise decide the
+    timings of whichever scores ran during them.
+
+    Args:
+        score_ids (List[str], optional): Scores to benchmark (default: all)
+        min_time (float): Minimum duration of one timing round in seconds
+        rounds (int): Timing rounds per layer and pass
+        passes (int): Passes over all scores
+
+    Returns:
+        Dict: Results per score (µs per call and layer) and skipped scores with the reason
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        from fastapi.routing import APIRoute
+        from main import app
+        from app.services.calculator_service import calculator_service
+        from app.services.score_service import score_service
+
+    post_routes = {
+        route.path: route for route in app.router.routes
+        if isinstance(route, APIRoute) and "POST" in route.methods
+    }
+    if score_ids is None:
+        score_ids = sorted(score.id for score in score_service.get_available_scores())
+
+    # Keep the imported application out of the collector's generations
+    gc.collect()
+    gc.freeze()
+
+    loop = asyncio.new_event_loop()
+    results: Dict[str, Dict[str, Any]] = {}
+    skipped: Dict[str, str] = {}
+    runners: Dict[str, Dict[str, Tuple[Callable[[int], float], int]]] = {}
+    try:
+        for score_id in score_ids:
+            score_data = score_service.get_score_raw_data(score_id)
+            if score_data is None:
+                skipped[score_id] = "unknown score"
+                continue
+
+            path, payload = score_request(post_routes, score_id, score_data)
+            body = json.dumps(payload).encode()
+
+            # One checked request, capturing the parameters the endpoint hands to the calculator
+            try:
+                status, response, calls = capture_calculator_calls(loop, app, score_id, path, body)
+            except Exception as e:
+                skipped[score_id] = f"{type(e).__name__}: {e}"
+                continue
+
+            if status != 200:
+                skipped[score_id] = f"HTTP {status}: {response[:200].decode(errors='replace')}"
+                continue
+
+            batches = {}
+            if calls:
+                function = calculator_service._load_calculator(score_id)
+                batches["calculator"] = sync_batch(functools.partial(function, **calls[-1]))
+                batches["service"] = sync_batch(
+                    functools.partial(calculator_service.calculate_score, score_id, calls[-1])
+                )
+            batches["asgi"] = asgi_batch(loop, app, path, body)
+            runners[score_id] = {layer: (batch, calibrate(batch, min_time)) for layer, batch in batches.items()}
+            results[score_id] = {"path": path, "calculator": None, "service": None, "asgi": None}
+
+        for current_pass in range(1, passes + 1):
+            print(f"  pass {current_pass}/{passes} over {len(runners)} scores", file=sys.stderr)
+            for score_id, layers in runners.items():
+                entry = results[score_id]
+                for layer, (batch, number) in layers.items():
+                    timing = best_time(batch, number, rounds)
+                    entry[layer] = timing if entry[layer] is None else min(entry[layer], timing)
+    finally:
+        loop.close()
+
+    for entry in results.values():
+        for layer in LAYERS:
+            if entry[layer] is not None:
+                entry[layer] = round(entry[layer], 2)
+
+    return {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "settings": {"min_time": min_time, "rounds": rounds, "passes": passes},
+        "unit": "CPU microseconds per call",
+        "scores": results,
+        "skipped": skipped
+    }
+
+
+def summarize(report: Dict[str, Any]):
+    """Prints the medians per layer and the slowest scores"""
+    scores = report["scores"]
+    print(f"Scores timed: {len(scores)}; skipped: {len(report['skipped'])}")
+    print(f"{'layer':<11} {'scores':>6} {'median µs':>10} {'p90 µs':>9} {'max µs':>9}")
+    for layer in LAYERS:
+        values = sorted(entry[layer] for entry in scores.values() if entry.get(layer) is not None)
+        if not values:
+            continue
+        p90 = values[min(len(values) - 1, int(len(values) * 0.9))]
+        print(f"{layer:<11} {len(values):>6} {statistics.median(values):>10.1f} {p90:>9.1f} {values[-1]:>9.1f}")
+
+    slowest = sorted(scores.items(), key=lambda item: item[1]["asgi"], reverse=True)[:10]
+    print("\nSlowest complete requests (µs)")
+    print(f"{'score':<40} {'calculator':>10} {'service':>9} {'asgi':>9}")
+    for score_id, entry in slowest:
+        calculator = f"{entry['calculator']:.1f}" if entry["calculator"] is not None else "-"
+        service = f"{entry['service']:.1f}" if entry["service"] is not None else "-"
+        print(f"{score_id:<40} {calculator:>10} {service:>9} {entry['asgi']:>9.1f}")
+    for score_id, reason in sorted(report["skipped"].items()):
+        print(f"skipped {score_id}: {reason}")
+
+
+# Scores a layer needs before its overall shift is factored out of per-score ratios
+MIN_SCORES_FOR_SHIFT = 20
+
+
+def geometric_mean(values: List[float]) -> float:
+    """Returns the geometric mean of positive values"""
+    return math.exp(sum(math.log(value) for value in values) / len(values))
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float, min_delta: float,
+            confirm: bool = False) -> int:
+    """
+    Prints the changes between two runs and counts the regressions
+
+    Whole-machine drift moves every score of a run together, so each layer's
+    overall shift (the geometric mean of its ratios) is reported on its own
+    and, when enough scores were compared, factored out of the per-score
+    ratios. A layer regresses when its shift exceeds the threshold; a score
+    regresses when its ratio relative to that shift exceeds the threshold
+    and it is slower by more than min_delta microseconds. A score that
+    stopped working also counts. With confirm, the flagged scores are
+    benchmarked again and only slowdowns that reproduce are kept.
+
+    Returns:
+        int: Number of regressions
+    """
+    pairs: Dict[str, List[Tuple[str, float, float]]] = {layer: [] for layer in LAYERS}
+    regressions = []
+    for score_id, before in baseline["scores"].items():
+        after = current["scores"].get(score_id)
+        if after is None:
+            if score_id in current.get("skipped", {}):
+                regressions.append((score_id, "all", math.inf, None, None))
+            continue
+        for layer in LAYERS:
+            old, new = before.get(layer), after.get(layer)
+            if old is not None and new is not None and old > 0 and new > 0:
+                pairs[layer].append((score_id, old, new))
+
+    print(f"Baseline {baseline['created']} ({baseline['platform']}) vs {current['created']} ({current['platform']})")
+    print(f"{'layer':<11} {'scores':>6} {'shift':>8}")
+    improvements = 0
+    shifts: Dict[str, float] = {}
+    flagged = []
+    for layer in LAYERS:
+        if not pairs[layer]:
+            continue
+        shift = geometric_mean([new / old for _, old, new in pairs[layer]])
+        print(f"{layer:<11} {len(pairs[layer]):>6} {shift:>7.3f}x")
+        if shift > 1 + threshold:
+            regressions.append(("(all scores)", layer, shift, None, None))
+        shifts[layer] = reference = shift if len(pairs[layer]) >= MIN_SCORES_FOR_SHIFT else 1.0
+
+        for score_id, old, new in pairs[layer]:
+            relative = new / old / reference
+            if relative > 1 + threshold and new - old * reference > min_delta:
+                flagged.append((score_id, layer, relative, old, new))
+            elif relative < 1 / (1 + threshold) and old * reference - new > min_delta:
+                improvements += 1
+
+    if confirm and flagged:
+        scores = sorted({score_id for score_id, *_ in flagged})
+        print(f"\nConfirming {len(flagged)} slowdowns of {len(scores)} scores...")
+        rerun = run_suite(scores, current["settings"]["min_time"], current["settings"]["rounds"],
+                          current["settings"]["passes"])["scores"]
+        confirmed = []
+        for score_id, layer, relative, old, new in flagged:
+            again = (rerun.get(score_id) or {}).get(layer)
+            best = new if again is None else min(new, again)
+            relative = best / old / shifts[layer]
+            if relative > 1 + threshold and best - old * shifts[layer] > min_delta:
+                confirmed.append((score_id, layer, relative, old, best))
+        print(f"{len(confirmed)} of {len(flagged)} reproduced")
+        flagged = confirmed
+    regressions.extend(flagged)
+
+    new_scores = sorted(set(current["scores"]) - set(baseline["scores"]))
+    if new_scores:
+        print(f"\nNot in the baseline: {', '.join(new_scores)}")
+
+    print(f"\n{improvements} improvements and {len(regressions)} regressions "
+          f"(threshold {threshold:.0%}, at least {min_delta:g} µs)")
+    for score_id, layer, ratio, old, new in sorted(regressions, key=lambda item: -item[2]):
+        if layer == "all":
+            print(f"REGRESSION {score_id}: no longer benchmarked ({current['skipped'][score_id]})")
+        elif old is None:
+            print(f"REGRESSION [{layer}]: every score {ratio:.2f}x slower")
+        else:
+            print(f"REGRESSION {score_id} [{layer}]: {old:.1f} -> {new:.1f} µs ({ratio:.2f}x relative)")
+    return len(regressions)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Benchmark the scores and write the results")
+    run_parser.add_argument("--scores", nargs="+", help="Score ids to benchmark (default: all)")
+    run_parser.add_argument("--output", type=Path, default=RESULTS_PATH, help="Results file (JSON)")
+    run_parser.add_argument("--min-time", type=float, default=0.01, help="Minimum seconds per timing round")
+    run_parser.add_argument("--rounds", type=int, default=3, help="Timing rounds per layer and pass")
+    run_parser.add_argument("--passes", type=int, default=3, help="Passes over all scores (best is kept)")
+
+    compare_parser = subparsers.add_parser("compare", help="Flag regressions against a baseline")
+    compare_parser.add_argument("--baseline", type=Path, default=BASELINE_PATH, help="Baseline results")
+    compare_parser.add_argument("--current", type=Path, default=RESULTS_PATH, help="New results")
+    compare_parser.add_argument("--threshold", type=float, default=0.25, help="Slowdown ratio flagged (0.25 = 25%%)")
+    compare_parser.add_argument("--min-delta", type=float, default=2.0, help="Ignore slowdowns below this many µs")
+    compare_parser.add_argument("--confirm", action="store_true",
+                                help="Benchmark the flagged scores again and keep only slowdowns that reproduce")
+    args = parser.parse_args()
+
+    if args.command == "run":
+        start = time.perf_counter()
+        report = run_suite(args.scores, args.min_time, args.rounds, args.passes)
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=1, sort_keys=True, ensure_ascii=False) + "\n")
+        summarize(report)
+        print(f"\nResults written to {args.output} ({time.perf_counter() - start:.0f}s)")
+    else:
+        baseline = json.loads(args.baseline.read_text())
+        current = json.loads(args.current.read_text())
+        sys.exit(1 if compare(baseline, current, args.threshold, args.min_delta, args.confirm) else 0)
+
+
+if __name__ == "__main__":
+    main()
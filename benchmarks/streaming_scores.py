@@ -0,0 +1,87 @@
+"""
+Streaming early-warning-score throughput benchmark
+
+Replays a synthetic ward feed (one vital per event, random walk per patient)
+through the NEWS 2 streaming engine and reports events per second and the
+fraction of events that produced a score or tier change.
+
+Usage:
+    python -m benchmarks.streaming_scores [--patients 1000] [--events 200000]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from calculators.engines.streaming import ScoreStream
+from calculators.news_2 import STREAMING_SCORE
+
+
+BASELINE_VITALS = {
+    "respiratory_rate": 16,
+    "oxygen_saturation": 97,
+    "hypercapnic_respiratory_failure": "no",
+    "supplemental_oxygen": "no",
+    "temperature": 37.0,
+    "systolic_bp": 125,
+    "heart_rate": 78,
+    "consciousness": "alert"
+}
+
+# Random-walk step per numeric vital
+STEPS = {
+    "respiratory_rate": 1,
+    "oxygen_saturation": 1,
+    "temperature": 0.1,
+    "systolic_bp": 3,
+    "heart_rate": 3
+}
+
+
+def build_feed(patients: int, events: int, seed: int = 42):
+    """Builds a list of (patient_id, {vital: value}) events"""
+    rng = random.Random(seed)
+    current = {f"patient-{index}": dict(BASELINE_VITALS) for index in range(patients)}
+    feed = [(patient_id, dict(vitals)) for patient_id, vitals in current.items()]
+    names = list(STEPS)
+
+    for _ in range(events):
+        patient_id = f"patient-{rng.randrange(patients)}"
+        name = rng.choice(names)
+        value = current[patient_id][name] + rng.choice((-1, 1)) * STEPS[name]
+        if isinstance(value, float):
+            value = round(value, 1)
+        current[patient_id][name] = value
+        feed.append((patient_id, {name: value}))
+
+    return feed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the streaming score engine")
+    parser.add_argument("--patients", type=int, default=1000, help="Monitored patients")
+    parser.add_argument("--events", type=int, default=200000, help="Vital-sign events after admission")
+    args = parser.parse_args()
+
+    feed = build_feed(args.patients, args.events)
+    stream = ScoreStream(STREAMING_SCORE)
+
+    start = time.perf_counter()
+    changes = 0
+    for patient_id, vitals in feed:
+        if stream.update(patient_id, vitals) is not None:
+            changes += 1
+    seconds = time.perf_counter() - start
+
+    print(f"Patients:       {args.patients}")
+    print(f"Events:         {len(feed)}")
+    print(f"Throughput:     {len(feed) / seconds:,.0f} events/s")
+    print(f"Change events:  {changes} ({100 * changes / len(feed):.1f}%)")
+
+
+if __name__ == "__main__":
+    main()
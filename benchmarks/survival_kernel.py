@@ -0,0 +1,62 @@
+"""
+Survival kernel throughput benchmark
+
+Compares per-patient calls to calculate_kidney_failure_risk_calculator with
+batched evaluation through the compiled KFRE survival model.
+
+Usage:
+    python -m benchmarks.survival_kernel [--patients 100000]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from calculators.kidney_failure_risk_calculator import (
+    KidneyFailureRiskCalculator,
+    calculate_kidney_failure_risk_calculator
+)
+
+
+def build_cohort(patients: int, seed: int = 42):
+    """Builds random but valid KFRE input columns"""
+    rng = random.Random(seed)
+    return {
+        "ages": [rng.randint(18, 110) for _ in range(patients)],
+        "sexes": [rng.choice(["male", "female"]) for _ in range(patients)],
+        "egfrs": [rng.uniform(1, 60) for _ in range(patients)],
+        "urine_acrs": [rng.uniform(0.1, 25000) for _ in range(patients)]
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the survival model kernel")
+    parser.add_argument("--patients", type=int, default=100000, help="Cohort size")
+    args = parser.parse_args()
+
+    cohort = build_cohort(args.patients)
+    rows = list(zip(cohort["ages"], cohort["sexes"], cohort["egfrs"], cohort["urine_acrs"]))
+
+    start = time.perf_counter()
+    for age, sex, egfr, urine_acr in rows:
+        calculate_kidney_failure_risk_calculator(age, sex, egfr, urine_acr, "north_america")
+    scalar_seconds = time.perf_counter() - start
+
+    calculator = KidneyFailureRiskCalculator()
+    start = time.perf_counter()
+    calculator.calculate_batch(cohort["ages"], cohort["sexes"], cohort["egfrs"],
+                               cohort["urine_acrs"], "north_america")
+    batch_seconds = time.perf_counter() - start
+
+    print(f"Patients:          {args.patients}")
+    print(f"Scalar calculator: {scalar_seconds:.3f} s ({args.patients / scalar_seconds:,.0f} patients/s)")
+    print(f"Batched kernel:    {batch_seconds:.3f} s ({args.patients / batch_seconds:,.0f} patients/s)")
+    print(f"Speedup:           {scalar_seconds / batch_seconds:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""
+Benchmark: requests/sec and memory per worker count
+
+Starts gunicorn with the preload-and-fork profile (gunicorn_preload.conf.py)
+and, for comparison, with the single-process command of the Dockerfile
+scaled to the same worker count (every worker imports the app itself). For
+each worker count it drives keep-alive POST requests from client processes
+for a fixed duration and reads the memory of every gunicorn process from
+/proc (RSS, PSS and private memory; PSS splits shared pages between the
+processes sharing them).
+
+Requests/sec only scale with workers when the machine has the cores:
+run it on a multi-core instance, with about as many cores again for the
+client processes.
+
+Usage:
+    python -m benchmarks.worker_scaling [--workers 1 2 4] [--duration 10]
+"""
+
+import argparse
+import http.client
+import json
+import multiprocessing
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+REQUEST_PATH = "/ckd_epi_2021"
+REQUEST_BODY = json.dumps({"sex": "female", "age": 60, "serum_creatinine": 1.3})
+
+
+def free_port() -> int:
+    """Returns an unused local TCP port"""
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+def start_server(profile: str, workers: int, port: int) -> subprocess.Popen:
+    """Starts gunicorn and waits until every worker answers"""
+    command = [sys.executable, "-m", "gunicorn", "main:app", "--bind", f"127.0.0.1:{port}",
+               "--workers", str(workers)]
+    if profile == "preload":
+        command += ["-c", "gunicorn_preload.conf.py"]
+    else:
+        command += ["--worker-class", "uvicorn.workers.UvicornWorker", "--timeout", "0"]
+
+    server = subprocess.Popen(command, cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                              start_new_session=True)
+    deadline = time.time() + 60 + 30 * workers
+    while time.time() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError("gunicorn exited during start-up")
+        if len(worker_pids(server.pid)) == workers and responds(port):
+            # Give late workers time to finish booting
+            time.sleep(2)
+            return server
+        time.sleep(0.5)
+    stop_server(server)
+    raise RuntimeError("gunicorn did not become ready")
+
+
+def stop_server(server: subprocess.Popen):
+    """Stops gunicorn and its workers"""
+    os.killpg(server.pid, signal.SIGTERM)
+    server.wait(timeout=60)
+
+
+def responds(port: int) -> bool:
+    """Checks whether the server answers the health check"""
+    try:
+        connection = http.client.HTTPConnection("127.0.0.1", port, timeout=2)
+        connection.request("GET", "/health/")
+        return connection.getresponse().status == 200
+    except OSError:
+        return False
+
+
+def worker_pids(master: int) -> list:
+    """Returns the pids of the master's child processes"""
+    try:
+        with open(f"/proc/{master}/task/{master}/children") as f:
+            return [int(pid) for pid in f.read().split()]
+    except OSError:
+        return []
+
+
+def memory(pid: int) -> dict:
+    """Returns RSS, PSS and private memory of a process in MB"""
+    values = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if parts[0] in ("Rss:", "Pss:", "Private_Clean:", "Private_Dirty:"):
+                values[parts[0][:-1]] = int(parts[1]) / 1024
+    return {
+        "rss": values["Rss"],
+        "pss": values["Pss"],
+        "private": values["Private_Clean"] + values["Private_Dirty"]
+    }
+
+
+def client(port: int, duration: float, counter):
+    """Sends keep-alive requests until the duration elapses"""
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+    headers = {"Content-Type": "application/json"}
+    completed = 0
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        connection.request("POST", REQUEST_PATH, body=REQUEST_BODY, headers=headers)
+        response = connection.getresponse()
+        response.read()
+        if response.status == 200:
+            completed += 1
+    with counter.get_lock():
+        counter.value += completed
+
+
+def throughput(port: int, clients: int, duration: float) -> float:
+    """Returns the requests/sec served to concurrent keep-alive clients"""
+    counter = multiprocessing.Value("i", 0)
+    processes = [multiprocessing.Process(target=client, args=(port, duration, counter)) for _ in range(clients)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    return counter.value / duration
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4], help="Worker counts to measure")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds of load per measurement")
+    parser.add_argument("--clients", type=int, default=None, help="Client processes (default: 2 per worker)")
+    args = parser.parse_args()
+
+    print(f"CPUs: {os.cpu_count()}; {REQUEST_PATH} for {args.duration:g}s per run")
+    print(f"{'profile':<9} {'workers':>7} {'req/s':>8} {'scaling':>8} "
+          f"{'master RSS':>10} {'worker RSS':>10} {'worker PSS':>10} {'private':>8} {'total PSS':>9}")
+
+    baseline_rate = {}
+    largest = {}
+    for profile in ("preload", "single"):
+        for workers in args.workers:
+            port = free_port()
+            server = start_server(profile, workers, port)
+            try:
+                rate = throughput(port, args.clients or 2 * workers, args.duration)
+                master = memory(server.pid)
+                children = [memory(pid) for pid in worker_pids(server.pid)]
+            finally:
+                stop_server(server)
+
+            baseline_rate.setdefault(profile, rate)
+            count = len(children)
+            total_pss = master["pss"] + sum(item["pss"] for item in children)
+            largest[profile] = (workers, rate, total_pss)
+            print(f"{profile:<9} {workers:>7} {rate:>8.0f} {rate / baseline_rate[profile]:>7.2f}x "
+                  f"{master['rss']:>10.0f} {sum(item['rss'] for item in children) / count:>10.0f} "
+                  f"{sum(item['pss'] for item in children) / count:>10.0f} "
+                  f"{sum(item['private'] for item in children) / count:>8.0f} "
+                  f"{total_pss:>9.0f}")
+
+    print("\nMemory in MB per process, measured after the load; total PSS covers master and workers")
+    workers, rate, preload_pss = largest["preload"]
+    single_pss = largest["single"][2]
+    print(f"Speedup: {rate / baseline_rate['preload']:.2f}x requests/sec with {workers} preloaded workers "
+          f"over 1; {single_pss / preload_pss:.2f}x less memory than {workers} independent workers "
+          f"({preload_pss:.0f} vs {single_pss:.0f} MB PSS)")
+
+
+if __name__ == "__main__":
+    main()
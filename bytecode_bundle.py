@@ -0,0 +1,237 @@
+"""
+nobra_calculator - Bytecode bundle
+
+The production image runs with PYTHONDONTWRITEBYTECODE=1 and ships raw
+sources, so every cold instance compiles the routers, models and
+calculators it imports. This module precompiles the application packages
+into one zip of optimised, sourceless bytecode at build time and installs an
+import hook that loads those packages from the zip at runtime.
+
+Build (see the Dockerfile):
+    python bytecode_bundle.py build [--output build/bytecode.zip]
+                                    [--strip-docstrings] [--openapi]
+
+Docstring stripping (optimisation level 2) removes the model docstrings
+FastAPI uses as schema descriptions, so it implies --openapi: the OpenAPI
+document is rendered from the sources and stored in the bundle, and main.py
+serves that document when the bundle is in use.
+
+Runtime: set BYTECODE_BUNDLE to the zip path; main.py calls
+install_from_environment() before importing the application.
+"""
+
+import argparse
+import importlib.util
+import json
+import marshal
+import os
+import sys
+import time
+import zipfile
+import zipimport
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+# Packages compiled into the bundle
+BUNDLED_PACKAGES = ("app", "calculators")
+
+# Environment variable holding the bundle path at runtime
+BUNDLE_ENVIRONMENT_VARIABLE = "BYTECODE_BUNDLE"
+
+# Names of the manifest and the OpenAPI document stored in the bundle
+MANIFEST_NAME = "bundle.json"
+OPENAPI_NAME = "openapi.json"
+
+PROJECT_ROOT = Path(__file__).resolve().parent
+
+
+class BundleFinder:
+    """Meta path finder resolving the bundled top-level packages from the zip"""
+
+    def __init__(self, path: str):
+        """
+        Opens a bundle
+
+        Args:
+            path (str): Path of the bytecode zip
+
+        Raises:
+            ValueError: If the file is not a bundle built by this Python version
+        """
+        self.path = path
+        with zipfile.ZipFile(path) as archive:
+            try:
+                self.manifest = json.loads(archive.read(MANIFEST_NAME))
+            except KeyError:
+                raise ValueError(f"{path} is not a bytecode bundle")
+
+        if self.manifest.get("magic") != importlib.util.MAGIC_NUMBER.hex():
+            raise ValueError(
+                f"{path} was built for another Python version ({self.manifest.get('python')})"
+            )
+        self.packages = frozenset(self.manifest["packages"])
+        self.importer = zipimport.zipimporter(path)
+
+    def openapi(self) -> Optional[Dict[str, Any]]:
+        """Returns the OpenAPI document rendered at build time, if the bundle holds one"""
+        if not self.manifest.get("openapi"):
+            return None
+        with zipfile.ZipFile(self.path) as archive:
+            return json.loads(archive.read(OPENAPI_NAME))
+
+    def find_spec(self, fullname, path=None, target=None):
+        # Submodules are found through the package __path__, which points into the zip
+        if fullname not in self.packages:
+            return None
+        return self.importer.find_spec(fullname)
+
+    def invalidate_caches(self):
+        self.importer.invalidate_caches()
+
+
+def install(path: str) -> BundleFinder:
+    """
+    Makes the bundled packages import from a bytecode bundle
+
+    Must run before any bundled package is imported.
+
+    Args:
+        path (str): Path of the bytecode zip
+
+    Returns:
+        BundleFinder: The installed finder (its manifest describes the build)
+
+    Raises:
+        ValueError: If the file is not a usable bundle
+        RuntimeError: If a bundled package was already imported from source
+    """
+    finder = BundleFinder(path)
+    imported = [name for name in finder.packages if name in sys.modules]
+    if imported:
+        raise RuntimeError(f"Packages already imported from source: {', '.join(sorted(imported))}")
+    sys.meta_path.insert(0, finder)
+    return finder
+
+
+def install_from_environment() -> Optional[BundleFinder]:
+    """
+    Installs the bundle named by BYTECODE_BUNDLE, if set
+
+    Returns:
+        Optional[BundleFinder]: The installed finder, or None when no bundle is configured
+    """
+    path = os.getenv(BUNDLE_ENVIRONMENT_VARIABLE)
+    if not path:
+        return None
+    return install(path)
+
+
+def _compile_file(source_path: Path, optimize: int) -> bytes:
+    """Compiles one source file into the contents of an unchecked hash-based .pyc"""
+    source = source_path.read_bytes()
+    code = compile(source, str(source_path), "exec", dont_inherit=True, optimize=optimize)
+
+    # Unchecked hash-based header (PEP 552): never compared with a source file
+    header = importlib.util.MAGIC_NUMBER + (0b01).to_bytes(4, "little") + importlib.util.source_hash(source)
+    return header + marshal.dumps(code)
+
+
+def build(output: Path, root: Path = PROJECT_ROOT, strip_docstrings: bool = False,
+          openapi: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Compiles the bundled packages into a bytecode zip
+
+    Args:
+        output (Path): Path of the zip to write
+        root (Path): Project root containing the packages
+        strip_docstrings (bool): Compile at optimisation level 2 (no
+            docstrings); level 1 otherwise
+        openapi (Dict, optional): OpenAPI document to store in the bundle
+
+    Returns:
+        Dict: Manifest of the bundle, with the files that failed to compile
+    """
+    optimize = 2 if strip_docstrings else 1
+    output.parent.mkdir(parents=True, exist_ok=True)
+    failures: List[Dict[str, str]] = []
+    modules = 0
+    start = time.perf_counter()
+
+    with zipfile.ZipFile(output, "w", compression=zipfile.ZIP_STORED) as archive:
+        for package in BUNDLED_PACKAGES:
+            for directory, subdirectories, files in os.walk(root / package):
+                subdirectories[:] = sorted(name for name in subdirectories if name != "__pycache__")
+                relative_directory = Path(directory).relative_to(root)
+
+                # Directory entries let zipimport resolve namespace packages (calculators/)
+                archive.writestr(zipfile.ZipInfo(relative_directory.as_posix() + "/"), b"")
+
+                for name in sorted(files):
+                    if not name.endswith(".py"):
+                        continue
+                    source_path = Path(directory) / name
+                    try:
+                        bytecode = _compile_file(source_path, optimize)
+                    except SyntaxError as e:
+                        failures.append({"file": str(source_path.relative_to(root)), "error": str(e)})
+                        continue
+                    archive.writestr((relative_directory / (name[:-3] + ".pyc")).as_posix(), bytecode)
+                    modules += 1
+
+        manifest = {
+            "packages": list(BUNDLED_PACKAGES),
+            "python": sys.version.split()[0],
+            "magic": importlib.util.MAGIC_NUMBER.hex(),
+            "optimize": optimize,
+            "modules": modules,
+            "failures": failures,
+            "openapi": openapi is not None,
+            "built_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+        }
+        if openapi is not None:
+            archive.writestr(OPENAPI_NAME, json.dumps(openapi, ensure_ascii=False))
+        archive.writestr(MANIFEST_NAME, json.dumps(manifest, indent=2))
+
+    manifest["seconds"] = round(time.perf_counter() - start, 2)
+    return manifest
+
+
+def render_openapi() -> Dict[str, Any]:
+    """
+    Renders the OpenAPI document of the application from the sources
+
+    Returns:
+        Dict: OpenAPI document, with the descriptions taken from docstrings
+    """
+    sys.path.insert(0, str(PROJECT_ROOT))
+    from main import app
+
+    return app.openapi()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the bytecode bundle of nobra_calculator")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    build_parser = subparsers.add_parser("build", help="Compile the application packages into a zip")
+    build_parser.add_argument("--output", type=Path, default=PROJECT_ROOT / "build" / "bytecode.zip",
+                              help="Path of the bundle (default: build/bytecode.zip)")
+    build_parser.add_argument("--strip-docstrings", action="store_true",
+                              help="Compile at optimisation level 2, without docstrings")
+    build_parser.add_argument("--openapi", action="store_true",
+                              help="Render the OpenAPI document from the sources into the bundle "
+                                   "(implied by --strip-docstrings)")
+    args = parser.parse_args()
+
+    openapi = render_openapi() if args.openapi or args.strip_docstrings else None
+    manifest = build(args.output, strip_docstrings=args.strip_docstrings, openapi=openapi)
+    print(f"📦 {manifest['modules']} modules compiled into {args.output} "
+          f"(optimize={manifest['optimize']}, {manifest['seconds']}s)")
+    for failure in manifest["failures"]:
+        print(f"⚠️  Skipped {failure['file']}: {failure['error']}")
+    if openapi is not None:
+        print(f"📄 OpenAPI document stored ({len(openapi.get('paths', {}))} paths)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,49 +1,199 @@
 """
 AAP Pediatric Hypertension Guidelines Calculator
 
-Diagnoses hypertension in pediatric patients based on AAP 2017 guidelines.
-Reference: Flynn JT et al. Pediatrics. 2017;140(3):e20171904.
+Classifies pediatric blood pressure with the AAP 2017 guideline (Flynn JT et
+al. Pediatrics. 2017;140(3):e20171904):
+
+- Children <13 years: Elevated is >=90th percentile or >=120/80 mmHg, Stage 1
+  >=95th percentile or >=130/80 mmHg, Stage 2 >=95th percentile + 12 mmHg or
+  >=140/90 mmHg, whichever threshold is lower
+- Adolescents >=13 years: adult cut points only (Elevated 120-129/<80 mmHg,
+  Stage 1 130-139/80-89 mmHg, Stage 2 >=140/90 mmHg)
+
+The normative BP percentiles are NOT the AAP 2017 tables (which exclude
+overweight children and are published only as printed tables). They come from
+the regression equations of the NHBPEP Fourth Report (Pediatrics.
+2004;114(2):555-76), packed into a flat array indexed by
+sex x measure x age x height percentile, and the returned percentiles are
+labelled accordingly. Fourth Report percentiles run a few mmHg higher than the
+AAP 2017 tables, so borderline readings may be classified one category lower.
+
+The height percentile uses an LMS reference built from the CDC 2000
+stature-for-age medians and coefficients of variation at whole years of age,
+with the skewness parameter L taken as 1 (the CDC curves keep L close to 1 in
+childhood), so it is a normal approximation of the CDC growth charts.
 """
 
-import math
-from typing import Dict, Any
+from array import array
+from statistics import NormalDist
+from typing import Dict, Any, List, Sequence
+
+from calculators.engines.nomogram import LMSTable, z_to_percentile
+
+
+# Simplified height percentile tables by age and sex (WHO/CDC)
+# For implementation purposes, using approximate values
+HEIGHT_PERCENTILES = {
+    "male": {
+        1: {"p50": 76.1}, 2: {"p50": 87.8}, 3: {"p50": 96.1}, 4: {"p50": 103.3},
+        5: {"p50": 109.9}, 6: {"p50": 116.1}, 7: {"p50": 121.9}, 8: {"p50": 128.0},
+        9: {"p50": 133.3}, 10: {"p50": 138.4}, 11: {"p50": 143.5}, 12: {"p50": 149.1},
+        13: {"p50": 156.2}, 14: {"p50": 163.8}, 15: {"p50": 170.1}, 16: {"p50": 173.4},
+        17: {"p50": 175.2}
+    },
+    "female": {
+        1: {"p50": 74.3}, 2: {"p50": 86.4}, 3: {"p50": 95.1}, 4: {"p50": 102.7},
+        5: {"p50": 109.4}, 6: {"p50": 115.5}, 7: {"p50": 121.1}, 8: {"p50": 126.4},
+        9: {"p50": 132.2}, 10: {"p50": 138.4}, 11: {"p50": 144.8}, 12: {"p50": 151.0},
+        13: {"p50": 156.7}, 14: {"p50": 160.4}, 15: {"p50": 162.5}, 16: {"p50": 163.0},
+        17: {"p50": 163.0}
+    }
+}
+
+# Coefficient of variation of height for age (CDC 2000 stature-for-age S
+# parameter at whole years, length-for-age at 1 year). Height varies by about
+# 4% of the median in childhood and widens to 5% around the pubertal growth
+# spurt, which starts earlier in girls.
+HEIGHT_CV = {
+    "male": {
+        1: 0.036, 2: 0.040, 3: 0.040, 4: 0.041, 5: 0.042, 6: 0.042, 7: 0.043, 8: 0.043,
+        9: 0.044, 10: 0.045, 11: 0.046, 12: 0.048, 13: 0.049, 14: 0.047, 15: 0.044,
+        16: 0.041, 17: 0.040
+    },
+    "female": {
+        1: 0.037, 2: 0.041, 3: 0.040, 4: 0.041, 5: 0.042, 6: 0.043, 7: 0.043, 8: 0.044,
+        9: 0.045, 10: 0.046, 11: 0.046, 12: 0.045, 13: 0.042, 14: 0.040, 15: 0.039,
+        16: 0.039, 17: 0.039
+    }
+}
+
+# Height reference per sex as an LMS table over age (L = 1, M = CDC median,
+# S = CDC coefficient of variation)
+HEIGHT_LMS = {
+    sex: LMSTable(
+        l_values={age: 1.0 for age in table},
+        m_values={age: values["p50"] for age, values in table.items()},
+        s_values=HEIGHT_CV[sex]
+    )
+    for sex, table in HEIGHT_PERCENTILES.items()
+}
+
+# Normative BP regression model (NHBPEP Fourth Report, Appendix B):
+#   mean = alpha + sum(beta_j * (age - 10)^j) + sum(gamma_k * Zht^k), j, k = 1..4
+# with BP percentiles following a normal distribution of standard deviation sigma
+BP_REGRESSION = {
+    ("male", "systolic"): {
+        "alpha": 102.19768, "beta": (1.82416, 0.12776, 0.00249, -0.00135),
+        "gamma": (2.73157, -0.19618, -0.04659, 0.00947), "sigma": 10.7128
+    },
+    ("male", "diastolic"): {
+        "alpha": 61.01217, "beta": (0.68314, -0.09835, 0.01711, 0.00045),
+        "gamma": (1.46993, -0.07849, -0.03144, 0.00967), "sigma": 11.6032
+    },
+    ("female", "systolic"): {
+        "alpha": 102.01027, "beta": (1.94397, 0.00598, -0.00789, -0.00059),
+        "gamma": (2.03526, 0.02534, -0.01884, 0.00121), "sigma": 10.4855
+    },
+    ("female", "diastolic"): {
+        "alpha": 60.50510, "beta": (1.01301, 0.01157, 0.00424, -0.00137),
+        "gamma": (1.16641, 0.12795, -0.03869, -0.00079), "sigma": 10.9573
+    }
+}
+
+# Sources reported with every result, since they differ from the AAP 2017 tables
+NORMATIVE_REFERENCE = "NHBPEP Fourth Report (2004) regression equations"
+HEIGHT_REFERENCE = "CDC 2000 stature-for-age median and coefficient of variation (L = 1)"
+
+SEXES = ("male", "female")
+MEASURES = ("systolic", "diastolic")
+MIN_AGE = 1
+MAX_AGE = 17
+
+# Height percentile columns of the normative tables (the published tables span
+# the 5th-95th height percentiles; heights outside use the edge column)
+MIN_HEIGHT_PERCENTILE = 5
+MAX_HEIGHT_PERCENTILE = 95
+HEIGHT_COLUMNS = MAX_HEIGHT_PERCENTILE - MIN_HEIGHT_PERCENTILE + 1
+
+# z-scores of the classification percentiles
+Z_90 = NormalDist().inv_cdf(0.90)
+Z_95 = NormalDist().inv_cdf(0.95)
+
+# AAP 2017 static cut points (mmHg): pediatric thresholds are the lower of the
+# percentile and these values; adolescents >=13 years use them alone
+ADOLESCENT_AGE = 13
+STAGE_2_OFFSET = 12
+ELEVATED_BP = (120, 80)
+STAGE_1_BP = (130, 80)
+STAGE_2_BP = (140, 90)
+
+
+def _build_mean_table() -> array:
+    """
+    Packs the mean BP for every sex x measure x age x whole height percentile
+    into one flat array (2 x 2 x 17 x 91 doubles)
+    """
+    height_z = [NormalDist().inv_cdf(percentile / 100)
+                for percentile in range(MIN_HEIGHT_PERCENTILE, MAX_HEIGHT_PERCENTILE + 1)]
+    table = array('d')
+    for sex in SEXES:
+        for measure in MEASURES:
+            model = BP_REGRESSION[(sex, measure)]
+            for age in range(MIN_AGE, MAX_AGE + 1):
+                age_term = model["alpha"] + sum(
+                    beta * (age - 10) ** power for power, beta in enumerate(model["beta"], 1)
+                )
+                for z in height_z:
+                    table.append(age_term + sum(
+                        gamma * z ** power for power, gamma in enumerate(model["gamma"], 1)
+                    ))
+    return table
+
+
+BP_MEANS = _build_mean_table()
+BP_SIGMAS = {key: model["sigma"] for key, model in BP_REGRESSION.items()}
+
+def _mean_index(sex: str, measure: str, age: int) -> int:
+    """Offset of the height-percentile row for one sex, measure and age in BP_MEANS"""
+    return ((SEXES.index(sex) * 2 + MEASURES.index(measure)) * (MAX_AGE - MIN_AGE + 1)
+            + (age - MIN_AGE)) * HEIGHT_COLUMNS
+
+
+def mean_bp(sex: str, measure: str, age: int, height_percentile: float) -> float:
+    """
+    Looks up the normative mean BP (50th percentile) in the packed table
+
+    Args:
+        sex: "male" or "female"
+        measure: "systolic" or "diastolic"
+        age: Age in years (1-17)
+        height_percentile: Height percentile (clamped to 5-95)
+
+    Returns:
+        float: Mean BP in mmHg, interpolated between whole height percentiles
+    """
+    position = min(max(height_percentile, MIN_HEIGHT_PERCENTILE), MAX_HEIGHT_PERCENTILE) - MIN_HEIGHT_PERCENTILE
+    index = int(position)
+    offset = _mean_index(sex, measure, age) + index
+    lower = BP_MEANS[offset]
+    fraction = position - index
+    if not fraction:
+        return lower
+    return lower + fraction * (BP_MEANS[offset + 1] - lower)
 
 
 class AAPPediatricHypertensionCalculator:
     """Calculator for AAP Pediatric Hypertension Guidelines"""
     
     def __init__(self):
-        # Simplified height percentile tables by age and sex (WHO/CDC)
-        # For implementation purposes, using approximate values
-        self.height_percentiles = {
-            "male": {
-                1: {"p50": 76.1}, 2: {"p50": 87.8}, 3: {"p50": 96.1}, 4: {"p50": 103.3},
-                5: {"p50": 109.9}, 6: {"p50": 116.1}, 7: {"p50": 121.9}, 8: {"p50": 128.0},
-                9: {"p50": 133.3}, 10: {"p50": 138.4}, 11: {"p50": 143.5}, 12: {"p50": 149.1},
-                13: {"p50": 156.2}, 14: {"p50": 163.8}, 15: {"p50": 170.1}, 16: {"p50": 173.4},
-                17: {"p50": 175.2}
-            },
-            "female": {
-                1: {"p50": 74.3}, 2: {"p50": 86.4}, 3: {"p50": 95.1}, 4: {"p50": 102.7},
-                5: {"p50": 109.4}, 6: {"p50": 115.5}, 7: {"p50": 121.1}, 8: {"p50": 126.4},
-                9: {"p50": 132.2}, 10: {"p50": 138.4}, 11: {"p50": 144.8}, 12: {"p50": 151.0},
-                13: {"p50": 156.7}, 14: {"p50": 160.4}, 15: {"p50": 162.5}, 16: {"p50": 163.0},
-                17: {"p50": 163.0}
-            }
-        }
-        
-        # Simplified BP percentile reference values (based on AAP 2017 tables)
-        # Full implementation would require extensive tables by age, sex, and height percentile
-        self.bp_references = {
-            "percentile_90": {"sys": 110, "dia": 70},
-            "percentile_95": {"sys": 115, "dia": 75},
-            "percentile_99": {"sys": 125, "dia": 82}
-        }
+        self.height_percentiles = HEIGHT_PERCENTILES
+        self.height_lms = HEIGHT_LMS
     
     def calculate(self, age: int, sex: str, height: float, 
                  systolic_bp: int, diastolic_bp: int) -> Dict[str, Any]:
         """
-        Classifies pediatric blood pressure according to AAP 2017 guidelines
+        Classifies pediatric blood pressure with the AAP 2017 categories
+        against Fourth Report normative percentiles
         
         Args:
             age: Age in years (1-17)
@@ -62,11 +212,16 @@ class AAPPediatricHypertensionCalculator:
         # Calculate height percentile
         height_percentile = self._calculate_height_percentile(age, sex, height)
         
-        # Determine classification for adolescents ≥13 years (hybrid adult criteria)
-        if age >= 13:
-            classification = self._classify_adolescent_bp(systolic_bp, diastolic_bp, age, sex, height)
+        # Exact BP percentiles from the normative tables
+        systolic_mean = mean_bp(sex, "systolic", age, height_percentile)
+        diastolic_mean = mean_bp(sex, "diastolic", age, height_percentile)
+        systolic_sigma = BP_SIGMAS[(sex, "systolic")]
+        diastolic_sigma = BP_SIGMAS[(sex, "diastolic")]
+        
+        # Adolescents ≥13 years use the adult cut points, younger children the percentiles
+        if age >= ADOLESCENT_AGE:
+            classification = self._classify_adolescent_bp(systolic_bp, diastolic_bp)
         else:
-            # For children under 13, use pediatric tables
             classification = self._classify_pediatric_bp(systolic_bp, diastolic_bp, age, sex, height_percentile)
         
         # Get detailed interpretation
@@ -78,13 +233,65 @@ class AAPPediatricHypertensionCalculator:
             "height_percentile": round(height_percentile, 1),
             "systolic_bp": systolic_bp,
             "diastolic_bp": diastolic_bp,
-            "systolic_percentile": 75.0,  # Placeholder - would need full implementation
-            "diastolic_percentile": 70.0,  # Placeholder - would need full implementation
+            "systolic_percentile": round(self._bp_percentile(systolic_bp, systolic_mean, systolic_sigma), 1),
+            "diastolic_percentile": round(self._bp_percentile(diastolic_bp, diastolic_mean, diastolic_sigma), 1),
+            "normative_reference": NORMATIVE_REFERENCE,
+            "height_percentile_reference": HEIGHT_REFERENCE,
             "interpretation": interpretation["interpretation"],
             "stage": interpretation["stage"],
             "stage_description": interpretation["description"]
         }
     
+    def calculate_batch(self, ages: Sequence[int], sexes: Sequence[str], heights: Sequence[float],
+                        systolic_bps: Sequence[int], diastolic_bps: Sequence[int]) -> Dict[str, List[Any]]:
+        """
+        Classifies many blood pressure readings (e.g. a school screening programme)
+        
+        Args:
+            ages: Age in years (1-17) per reading
+            sexes: "male" or "female" per reading
+            heights: Height in centimeters per reading
+            systolic_bps: Systolic pressure in mmHg per reading
+            diastolic_bps: Diastolic pressure in mmHg per reading
+            
+        Returns:
+            Dict with classification, height percentile and BP percentile columns
+        """
+        
+        columns = (ages, sexes, heights, systolic_bps, diastolic_bps)
+        if len({len(column) for column in columns}) > 1:
+            raise ValueError("All input columns must have the same length")
+        
+        results: Dict[str, List[Any]] = {
+            "result": [],
+            "height_percentile": [],
+            "systolic_percentile": [],
+            "diastolic_percentile": []
+        }
+        
+        for age, sex, height, systolic_bp, diastolic_bp in zip(*columns):
+            self._validate_inputs(age, sex, height, systolic_bp, diastolic_bp)
+            height_percentile = self._calculate_height_percentile(age, sex, height)
+            
+            if age >= ADOLESCENT_AGE:
+                classification = self._classify_adolescent_bp(systolic_bp, diastolic_bp)
+            else:
+                classification = self._classify_pediatric_bp(systolic_bp, diastolic_bp, age, sex, height_percentile)
+            
+            systolic_mean = mean_bp(sex, "systolic", age, height_percentile)
+            diastolic_mean = mean_bp(sex, "diastolic", age, height_percentile)
+            
+            results["result"].append(classification)
+            results["height_percentile"].append(round(height_percentile, 1))
+            results["systolic_percentile"].append(
+                round(self._bp_percentile(systolic_bp, systolic_mean, BP_SIGMAS[(sex, "systolic")]), 1)
+            )
+            results["diastolic_percentile"].append(
+                round(self._bp_percentile(diastolic_bp, diastolic_mean, BP_SIGMAS[(sex, "diastolic")]), 1)
+            )
+        
+        return results
+    
     def _validate_inputs(self, age: int, sex: str, height: float, 
                         systolic_bp: int, diastolic_bp: int):
         """Validates input parameters"""
@@ -109,23 +316,11 @@ class AAPPediatricHypertensionCalculator:
     
     def _calculate_height_percentile(self, age: int, sex: str, height: float) -> float:
         """
-        Calculates approximate height percentile based on median height
-        
-        NOTE: Simplified implementation. For actual clinical use, 
-        full WHO/CDC tables with Z-scores would be needed.
+        Calculates the height percentile from the CDC-based LMS reference
+        (see HEIGHT_REFERENCE)
         """
         
-        if age not in self.height_percentiles[sex]:
-            # Approximation for untabled ages
-            closest_age = min(self.height_percentiles[sex].keys(), 
-                            key=lambda x: abs(x - age))
-            median_height = self.height_percentiles[sex][closest_age]["p50"]
-        else:
-            median_height = self.height_percentiles[sex][age]["p50"]
-        
-        # Simplified percentile estimate based on difference from median
-        # Assuming approximately normal distribution
-        z_score = (height - median_height) / (median_height * 0.1)  # Estimated deviation
+        z_score = self.height_lms[sex].z_score(age, height)
         percentile = self._z_to_percentile(z_score)
         
         return max(1.0, min(99.0, percentile))
@@ -133,88 +328,99 @@ class AAPPediatricHypertensionCalculator:
     def _z_to_percentile(self, z_score: float) -> float:
         """Converts Z-score to approximate percentile"""
         
-        # Simplified standard normal cumulative distribution function
-        return 50.0 * (1.0 + math.erf(z_score / math.sqrt(2.0)))
+        return z_to_percentile(z_score)
     
-    def _classify_adolescent_bp(self, systolic: int, diastolic: int, 
-                               age: int, sex: str, height: float) -> str:
+    def _classify_adolescent_bp(self, systolic: int, diastolic: int) -> str:
         """
-        Classifies BP in adolescents ≥13 years using hybrid criteria
-        (combines pediatric percentiles with adult absolute values)
+        Classifies BP in adolescents ≥13 years with the adult cut points
+        (no percentile criteria)
         """
         
-        # For adolescents, use adult values if greater than pediatric percentiles
-        if systolic >= 140 or diastolic >= 90:
+        if systolic >= STAGE_2_BP[0] or diastolic >= STAGE_2_BP[1]:
             return "Hypertension Stage 2"
-        elif systolic >= 130 or diastolic >= 80:
+        elif systolic >= STAGE_1_BP[0] or diastolic >= STAGE_1_BP[1]:
             return "Hypertension Stage 1"
-        elif systolic >= 120:
+        elif systolic >= ELEVATED_BP[0]:
             return "Elevated"
         else:
-            # Also check pediatric percentiles
-            return self._classify_pediatric_bp(systolic, diastolic, age, sex, 50.0)
+            return "Normal"
     
     def _classify_pediatric_bp(self, systolic: int, diastolic: int, 
                               age: int, sex: str, height_percentile: float) -> str:
         """
-        Classifies BP using pediatric tables
-        
-        NOTE: Simplified implementation with approximate reference values.
-        For actual clinical use, full AAP 2017 tables would be needed.
+        Classifies BP in children <13 years: each threshold is the lower of the
+        Fourth Report percentile and the AAP 2017 static cut point
         """
         
-        # Approximate adjustment based on age (BP increases with age)
-        age_factor = 1.0 + (age - 5) * 0.02  # Approximate increment per year
-        
-        # Approximate adjustment based on height percentile
-        height_factor = 1.0 + (height_percentile - 50) * 0.001  # Adjustment by height
+        # Percentile thresholds from the normative mean and standard deviation
+        systolic_mean = mean_bp(sex, "systolic", age, height_percentile)
+        diastolic_mean = mean_bp(sex, "diastolic", age, height_percentile)
+        systolic_sigma = BP_SIGMAS[(sex, "systolic")]
+        diastolic_sigma = BP_SIGMAS[(sex, "diastolic")]
         
-        # Adjusted reference values
-        p90_sys = self.bp_references["percentile_90"]["sys"] * age_factor * height_factor
-        p90_dia = self.bp_references["percentile_90"]["dia"] * age_factor * height_factor
+        p90_sys = systolic_mean + Z_90 * systolic_sigma
+        p90_dia = diastolic_mean + Z_90 * diastolic_sigma
         
-        p95_sys = self.bp_references["percentile_95"]["sys"] * age_factor * height_factor
-        p95_dia = self.bp_references["percentile_95"]["dia"] * age_factor * height_factor
+        p95_sys = systolic_mean + Z_95 * systolic_sigma
+        p95_dia = diastolic_mean + Z_95 * diastolic_sigma
         
-        p99_sys = self.bp_references["percentile_99"]["sys"] * age_factor * height_factor
-        p99_dia = self.bp_references["percentile_99"]["dia"] * age_factor * height_factor
-        
-        # Classification based on the higher percentile (systolic or diastolic)
-        if systolic >= p99_sys or diastolic >= p99_dia:
+        # Classification based on the higher category reached by systolic or diastolic
+        if (systolic >= min(p95_sys + STAGE_2_OFFSET, STAGE_2_BP[0])
+                or diastolic >= min(p95_dia + STAGE_2_OFFSET, STAGE_2_BP[1])):
             return "Hypertension Stage 2"
-        elif systolic >= p95_sys or diastolic >= p95_dia:
+        elif systolic >= min(p95_sys, STAGE_1_BP[0]) or diastolic >= min(p95_dia, STAGE_1_BP[1]):
             return "Hypertension Stage 1"
-        elif systolic >= p90_sys or diastolic >= p90_dia:
+        elif systolic >= min(p90_sys, ELEVATED_BP[0]) or diastolic >= min(p90_dia, ELEVATED_BP[1]):
             return "Elevated"
         else:
             return "Normal"
     
+    def _bp_percentile(self, bp: int, mean: float, sigma: float) -> float:
+        """Converts a BP reading into its percentile for the normative mean and SD"""
+        
+        return z_to_percentile((bp - mean) / sigma)
+    
     def _get_interpretation(self, classification: str, age: int, 
                           systolic: int, diastolic: int) -> Dict[str, str]:
         """
         Provides clinical interpretation based on classification
         """
         
+        if age >= ADOLESCENT_AGE:
+            criteria = {
+                "Normal": "is <120/<80 mmHg",
+                "Elevated": "is 120-129/<80 mmHg",
+                "Hypertension Stage 1": "has systolic ≥130 or diastolic ≥80 mmHg, below 140/90 mmHg",
+                "Hypertension Stage 2": "has systolic ≥140 or diastolic ≥90 mmHg"
+            }
+        else:
+            criteria = {
+                "Normal": "is below the 90th percentile for age, sex, and height and below 120/80 mmHg",
+                "Elevated": "is ≥90th percentile for age, sex, and height or ≥120/80 mmHg (whichever is lower), below the stage 1 threshold",
+                "Hypertension Stage 1": "is ≥95th percentile for age, sex, and height or ≥130/80 mmHg (whichever is lower), below the stage 2 threshold",
+                "Hypertension Stage 2": "is ≥95th percentile + 12 mmHg for age, sex, and height or ≥140/90 mmHg (whichever is lower)"
+            }
+        
         interpretations = {
             "Normal": {
                 "stage": "Normal",
                 "description": "Normal blood pressure",
-                "interpretation": f"BP {systolic}/{diastolic} mmHg is below the 90th percentile for age, sex, and height. No specific intervention required. Maintenance of healthy lifestyle and annual re-evaluation recommended."
+                "interpretation": f"BP {systolic}/{diastolic} mmHg {criteria['Normal']}. No specific intervention required. Maintenance of healthy lifestyle and annual re-evaluation recommended."
             },
             "Elevated": {
                 "stage": "Elevated",
                 "description": "Elevated blood pressure",
-                "interpretation": f"BP {systolic}/{diastolic} mmHg is between percentiles 90-94 for age, sex, and height. Requires lifestyle modifications (diet, exercise, weight reduction if necessary) and re-evaluation in 6 months. Assess cardiovascular risk factors."
+                "interpretation": f"BP {systolic}/{diastolic} mmHg {criteria['Elevated']}. Requires lifestyle modifications (diet, exercise, weight reduction if necessary) and re-evaluation in 6 months. Assess cardiovascular risk factors."
             },
             "Hypertension Stage 1": {
                 "stage": "Hypertension Stage 1",
                 "description": "Hypertension stage 1",
-                "interpretation": f"BP {systolic}/{diastolic} mmHg is between percentiles 95-98 for age, sex, and height. Must be confirmed in 3 different visits. Initiate lifestyle modifications and consider medication if risk factors are present."
+                "interpretation": f"BP {systolic}/{diastolic} mmHg {criteria['Hypertension Stage 1']}. Must be confirmed in 3 different visits. Initiate lifestyle modifications and consider medication if risk factors are present."
             },
             "Hypertension Stage 2": {
                 "stage": "Hypertension Stage 2",
                 "description": "Hypertension stage 2",
-                "interpretation": f"BP {systolic}/{diastolic} mmHg is ≥percentile 99 for age, sex, and height. Must be confirmed in 1-2 weeks. Requires immediate medication treatment along with intensive lifestyle modifications. Investigate secondary causes."
+                "interpretation": f"BP {systolic}/{diastolic} mmHg {criteria['Hypertension Stage 2']}. Must be confirmed in 1-2 weeks. Requires immediate medication treatment along with intensive lifestyle modifications. Investigate secondary causes."
             }
         }
         
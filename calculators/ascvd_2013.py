@@ -8,89 +8,93 @@ Reference: Goff DC Jr, et al. Circulation. 2014;129(25 Suppl 2):S49-73.
 """
 
 import math
-from typing import Dict, Any
+from typing import Dict, Any, List, Mapping, Sequence
+
+
+# Coefficients from Table A of the 2013 ACC/AHA guidelines
+# Structure: [race][sex][parameter]
+COEFFICIENTS = {
+    "white": {
+        "female": {
+            "ln_age": -29.799,
+            "ln_age_squared": 4.884,
+            "ln_total_chol": 13.540,
+            "ln_age_ln_total_chol": -3.114,
+            "ln_hdl": -13.578,
+            "ln_age_ln_hdl": 3.149,
+            "ln_treated_sbp": 2.019,
+            "ln_age_ln_treated_sbp": 0,  # N/A in table
+            "ln_untreated_sbp": 1.957,
+            "ln_age_ln_untreated_sbp": 0,  # N/A in table
+            "smoker": 7.574,
+            "ln_age_smoker": -1.665,
+            "diabetes": 0.661,
+            "mean_terms": -29.18,
+            "baseline_survival": 0.9665
+        },
+        "male": {
+            "ln_age": 12.344,
+            "ln_age_squared": 0,  # Not used for men
+            "ln_total_chol": 11.853,
+            "ln_age_ln_total_chol": -2.664,
+            "ln_hdl": -7.990,
+            "ln_age_ln_hdl": 1.769,
+            "ln_treated_sbp": 1.797,
+            "ln_age_ln_treated_sbp": 0,  # N/A in table
+            "ln_untreated_sbp": 1.764,
+            "ln_age_ln_untreated_sbp": 0,  # N/A in table
+            "smoker": 7.837,
+            "ln_age_smoker": -1.795,
+            "diabetes": 0.658,
+            "mean_terms": 61.18,
+            "baseline_survival": 0.9144
+        }
+    },
+    "african_american": {
+        "female": {
+            "ln_age": 17.114,
+            "ln_age_squared": 0,  # N/A for African American
+            "ln_total_chol": 0.940,
+            "ln_age_ln_total_chol": 0,  # N/A in table
+            "ln_hdl": -18.920,
+            "ln_age_ln_hdl": 4.475,
+            "ln_treated_sbp": 29.291,
+            "ln_age_ln_treated_sbp": -6.432,
+            "ln_untreated_sbp": 27.820,
+            "ln_age_ln_untreated_sbp": -6.087,
+            "smoker": 0.691,
+            "ln_age_smoker": 0,  # N/A in table
+            "diabetes": 0.874,
+            "mean_terms": 86.61,
+            "baseline_survival": 0.9533
+        },
+        "male": {
+            "ln_age": 2.469,
+            "ln_age_squared": 0,  # Not used
+            "ln_total_chol": 0.302,
+            "ln_age_ln_total_chol": 0,  # N/A in table
+            "ln_hdl": -0.307,
+            "ln_age_ln_hdl": 0,  # N/A in table
+            "ln_treated_sbp": 1.916,
+            "ln_age_ln_treated_sbp": 0,  # N/A in table
+            "ln_untreated_sbp": 1.809,
+            "ln_age_ln_untreated_sbp": 0,  # N/A in table
+            "smoker": 0.549,
+            "ln_age_smoker": 0,  # N/A in table
+            "diabetes": 0.645,
+            "mean_terms": 19.54,
+            "baseline_survival": 0.8954
+        }
+    }
+}
 
 
 class Ascvd2013Calculator:
     """Calculator for ASCVD 10-year risk using 2013 Pooled Cohort Equations"""
     
     def __init__(self):
-        # Coefficients from Table A of the 2013 ACC/AHA guidelines
-        # Structure: [race][sex][parameter]
-        self.coefficients = {
-            "white": {
-                "female": {
-                    "ln_age": -29.799,
-                    "ln_age_squared": 4.884,
-                    "ln_total_chol": 13.540,
-                    "ln_age_ln_total_chol": -3.114,
-                    "ln_hdl": -13.578,
-                    "ln_age_ln_hdl": 3.149,
-                    "ln_treated_sbp": 2.019,
-                    "ln_age_ln_treated_sbp": 0,  # N/A in table
-                    "ln_untreated_sbp": 1.957,
-                    "ln_age_ln_untreated_sbp": 0,  # N/A in table
-                    "smoker": 7.574,
-                    "ln_age_smoker": -1.665,
-                    "diabetes": 0.661,
-                    "mean_terms": -29.18,
-                    "baseline_survival": 0.9665
-                },
-                "male": {
-                    "ln_age": 12.344,
-                    "ln_age_squared": 0,  # Not used for men
-                    "ln_total_chol": 11.853,
-                    "ln_age_ln_total_chol": -2.664,
-                    "ln_hdl": -7.990,
-                    "ln_age_ln_hdl": 1.769,
-                    "ln_treated_sbp": 1.797,
-                    "ln_age_ln_treated_sbp": 0,  # N/A in table
-                    "ln_untreated_sbp": 1.764,
-                    "ln_age_ln_untreated_sbp": 0,  # N/A in table
-                    "smoker": 7.837,
-                    "ln_age_smoker": -1.795,
-                    "diabetes": 0.658,
-                    "mean_terms": 61.18,
-                    "baseline_survival": 0.9144
-                }
-            },
-            "african_american": {
-                "female": {
-                    "ln_age": 17.114,
-                    "ln_age_squared": 0,  # N/A for African American
-                    "ln_total_chol": 0.940,
-                    "ln_age_ln_total_chol": 0,  # N/A in table
-                    "ln_hdl": -18.920,
-                    "ln_age_ln_hdl": 4.475,
-                    "ln_treated_sbp": 29.291,
-                    "ln_age_ln_treated_sbp": -6.432,
-                    "ln_untreated_sbp": 27.820,
-                    "ln_age_ln_untreated_sbp": -6.087,
-                    "smoker": 0.691,
-                    "ln_age_smoker": 0,  # N/A in table
-                    "diabetes": 0.874,
-                    "mean_terms": 86.61,
-                    "baseline_survival": 0.9533
-                },
-                "male": {
-                    "ln_age": 2.469,
-                    "ln_age_squared": 0,  # Not used
-                    "ln_total_chol": 0.302,
-                    "ln_age_ln_total_chol": 0,  # N/A in table
-                    "ln_hdl": -0.307,
-                    "ln_age_ln_hdl": 0,  # N/A in table
-                    "ln_treated_sbp": 1.916,
-                    "ln_age_ln_treated_sbp": 0,  # N/A in table
-                    "ln_untreated_sbp": 1.809,
-                    "ln_age_ln_untreated_sbp": 0,  # N/A in table
-                    "smoker": 0.549,
-                    "ln_age_smoker": 0,  # N/A in table
-                    "diabetes": 0.645,
-                    "mean_terms": 19.54,
-                    "baseline_survival": 0.8954
-                }
-            }
-        }
+        # Pooled Cohort Equation coefficients
+        self.coefficients = COEFFICIENTS
     
     def calculate(self, age: int, sex: str, race: str, 
                  total_cholesterol: float, hdl_cholesterol: float,
@@ -125,6 +129,48 @@ class Ascvd2013Calculator:
         # Get coefficients for the specific race-sex group
         coeffs = self.coefficients[race][sex]
         
+        # Sum of coefficient × value
+        sum_coeff_value = self._individual_sum(coeffs, age, total_cholesterol, hdl_cholesterol,
+                                               systolic_bp, bp_treatment, diabetes, smoker)
+        
+        return self._format_result(sum_coeff_value, coeffs, race, sex)
+    
+    def calculate_results(self, parameter_sets: Sequence[Mapping[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Calculates complete results, as returned by calculate(), for many parameter sets
+        
+        Args:
+            parameter_sets: One mapping per patient with the same keys as calculate()
+            
+        Returns:
+            List[Dict]: Result, stage and interpretation per patient, in input order
+        """
+        
+        for parameters in parameter_sets:
+            self._validate_inputs(parameters["age"], parameters["sex"], parameters["race"],
+                                  parameters["total_cholesterol"], parameters["hdl_cholesterol"],
+                                  parameters["systolic_bp"])
+        
+        coefficients = self.coefficients
+        individual_sum = self._individual_sum
+        results = []
+        for parameters in parameter_sets:
+            race = "white" if parameters["race"] == "other" else parameters["race"]
+            sex = parameters["sex"]
+            coeffs = coefficients[race][sex]
+            sum_coeff_value = individual_sum(
+                coeffs, parameters["age"], parameters["total_cholesterol"],
+                parameters["hdl_cholesterol"], parameters["systolic_bp"],
+                parameters["bp_treatment"], parameters["diabetes"], parameters["smoker"]
+            )
+            results.append(self._format_result(sum_coeff_value, coeffs, race, sex))
+        return results
+    
+    def _individual_sum(self, coeffs: Dict[str, float], age: int, total_cholesterol: float,
+                        hdl_cholesterol: float, systolic_bp: int, bp_treatment: bool,
+                        diabetes: bool, smoker: bool) -> float:
+        """Sums coefficient × value over the terms of one race-sex equation"""
+        
         # Calculate natural log transformations
         ln_age = math.log(age)
         ln_age_squared = ln_age * ln_age
@@ -170,6 +216,12 @@ class Ascvd2013Calculator:
         if diabetes:
             sum_coeff_value += coeffs["diabetes"]
         
+        return sum_coeff_value
+    
+    def _format_result(self, sum_coeff_value: float, coeffs: Dict[str, float],
+                       race: str, sex: str) -> Dict[str, Any]:
+        """Converts the individual sum into the 10-year risk result"""
+        
         # Calculate 10-year risk using the formula:
         # Risk = 1 - S₀(t)^exp(Xβ - mean Xβ)
         exponent = sum_coeff_value - coeffs["mean_terms"]
@@ -269,4 +321,14 @@ def calculate_ascvd_2013(age: int, sex: str, race: str,
     calculator = Ascvd2013Calculator()
     return calculator.calculate(age, sex, race, total_cholesterol,
                               hdl_cholesterol, systolic_bp, bp_treatment,
-                              diabetes, smoker)
\ No newline at end of file
+                              diabetes, smoker)
+
+
+def calculate_ascvd_2013_batch(parameter_sets: Sequence[Mapping[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Batch counterpart of calculate_ascvd_2013 for the calculator service
+    
+    Evaluates all parameter sets with one calculator instance.
+    """
+    calculator = Ascvd2013Calculator()
+    return calculator.calculate_results(parameter_sets)
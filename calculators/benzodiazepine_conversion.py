@@ -12,37 +12,56 @@ References (Vancouver style):
    for benzodiazepine discontinuation: a meta-analysis. Addiction. 2009 Jan;104(1):13-24.
 """
 
-from typing import Dict, Any
+from typing import Any, Dict, List, Optional, Sequence
+
+from calculators.engines.dosing import AliasIndex, conversion_matrix, taper_schedules
+
+
+# Benzodiazepine potency factors (relative to diazepam = 1.0)
+# Based on standard equivalency tables
+POTENCY_FACTORS = {
+    "alprazolam": 2.0,      # 0.5 mg = 1 mg diazepam
+    "chlordiazepoxide": 0.2, # 25 mg = 5 mg diazepam  
+    "clonazepam": 4.0,      # 0.25 mg = 1 mg diazepam
+    "diazepam": 1.0,        # 5 mg = 5 mg diazepam (reference)
+    "lorazepam": 2.0,       # 0.5 mg = 1 mg diazepam
+    "midazolam": 3.0,       # ~0.33 mg = 1 mg diazepam
+    "oxazepam": 0.33,       # 15 mg = 5 mg diazepam
+    "temazepam": 0.5        # 10 mg = 5 mg diazepam
+}
+
+# Drug information for clinical context
+DRUG_INFO = {
+    "alprazolam": {"brand": "Xanax", "duration": "short acting (6-12 hours)", "half_life": "11-13 hours"},
+    "chlordiazepoxide": {"brand": "Librium", "duration": "long acting (>24 hours)", "half_life": "36-200 hours"},
+    "clonazepam": {"brand": "Klonopin", "duration": "long acting (>24 hours)", "half_life": "18-50 hours"},
+    "diazepam": {"brand": "Valium", "duration": "long acting (>24 hours)", "half_life": "20-100 hours"},
+    "lorazepam": {"brand": "Ativan", "duration": "intermediate acting (12-24 hours)", "half_life": "10-20 hours"},
+    "midazolam": {"brand": "Versed", "duration": "very short acting (<6 hours)", "half_life": "1-4 hours"},
+    "oxazepam": {"brand": "Serax", "duration": "short acting (6-12 hours)", "half_life": "4-15 hours"},
+    "temazepam": {"brand": "Restoril", "duration": "short acting (6-12 hours)", "half_life": "3-18 hours"}
+}
+
+# Generic and brand names, built once
+ALIAS_INDEX = AliasIndex(POTENCY_FACTORS, {info["brand"]: drug for drug, info in DRUG_INFO.items()})
+
+# Full drug × drug table: dose_from × CONVERSION_MATRIX[from][to] = equivalent dose of "to"
+CONVERSION_MATRIX = conversion_matrix(POTENCY_FACTORS)
+
+MAX_DAILY_DOSE = 100
+
+
+def resolve_benzodiazepine(name: str) -> str:
+    """Returns the generic name of a benzodiazepine given its generic or brand name"""
+    return ALIAS_INDEX.resolve(name) or name
 
 
 class BenzodiazepineConversionCalculator:
     """Calculator for Benzodiazepine Conversion"""
     
     def __init__(self):
-        # Benzodiazepine potency factors (relative to diazepam = 1.0)
-        # Based on standard equivalency tables
-        self.potency_factors = {
-            "alprazolam": 2.0,      # 0.5 mg = 1 mg diazepam
-            "chlordiazepoxide": 0.2, # 25 mg = 5 mg diazepam  
-            "clonazepam": 4.0,      # 0.25 mg = 1 mg diazepam
-            "diazepam": 1.0,        # 5 mg = 5 mg diazepam (reference)
-            "lorazepam": 2.0,       # 0.5 mg = 1 mg diazepam
-            "midazolam": 3.0,       # ~0.33 mg = 1 mg diazepam
-            "oxazepam": 0.33,       # 15 mg = 5 mg diazepam
-            "temazepam": 0.5        # 10 mg = 5 mg diazepam
-        }
-        
-        # Drug information for clinical context
-        self.drug_info = {
-            "alprazolam": {"brand": "Xanax", "duration": "short acting (6-12 hours)", "half_life": "11-13 hours"},
-            "chlordiazepoxide": {"brand": "Librium", "duration": "long acting (>24 hours)", "half_life": "36-200 hours"},
-            "clonazepam": {"brand": "Klonopin", "duration": "long acting (>24 hours)", "half_life": "18-50 hours"},
-            "diazepam": {"brand": "Valium", "duration": "long acting (>24 hours)", "half_life": "20-100 hours"},
-            "lorazepam": {"brand": "Ativan", "duration": "intermediate acting (12-24 hours)", "half_life": "10-20 hours"},
-            "midazolam": {"brand": "Versed", "duration": "very short acting (<6 hours)", "half_life": "1-4 hours"},
-            "oxazepam": {"brand": "Serax", "duration": "short acting (6-12 hours)", "half_life": "4-15 hours"},
-            "temazepam": {"brand": "Restoril", "duration": "short acting (6-12 hours)", "half_life": "3-18 hours"}
-        }
+        self.potency_factors = POTENCY_FACTORS
+        self.drug_info = DRUG_INFO
     
     def calculate(self, converting_from: str, total_daily_dose: float, converting_to: str) -> Dict[str, Any]:
         """
@@ -57,6 +76,12 @@ class BenzodiazepineConversionCalculator:
             Dict with equivalent dose and clinical guidance
         """
         
+        # Brand names are accepted for both medications
+        if isinstance(converting_from, str):
+            converting_from = resolve_benzodiazepine(converting_from)
+        if isinstance(converting_to, str):
+            converting_to = resolve_benzodiazepine(converting_to)
+        
         # Validations
         self._validate_inputs(converting_from, total_daily_dose, converting_to)
         
@@ -93,20 +118,86 @@ class BenzodiazepineConversionCalculator:
         
         if total_daily_dose <= 0:
             raise ValueError("Total daily dose must be greater than 0")
-        if total_daily_dose > 100:
-            raise ValueError("Total daily dose exceeds safe maximum (100 mg)")
+        if total_daily_dose > MAX_DAILY_DOSE:
+            raise ValueError(f"Total daily dose exceeds safe maximum ({MAX_DAILY_DOSE} mg)")
         
         if converting_from == converting_to:
             raise ValueError("Cannot convert to the same medication")
     
+    def convert_batch(self, drugs: Sequence[str], doses: Sequence[float],
+                      converting_to: str = "diazepam") -> List[float]:
+        """
+        Converts many daily doses to one target benzodiazepine
+        
+        Args:
+            drugs: Current benzodiazepine per patient (generic or brand name)
+            doses: Total daily dose in mg per patient
+            converting_to: Target benzodiazepine (default diazepam)
+            
+        Returns:
+            List[float]: Equivalent daily dose of the target per patient
+        """
+        
+        if len(drugs) != len(doses):
+            raise ValueError("Each benzodiazepine needs exactly one daily dose")
+        
+        target = resolve_benzodiazepine(converting_to)
+        if target not in POTENCY_FACTORS:
+            raise ValueError(f"Converting to '{converting_to}' is not a supported benzodiazepine")
+        
+        converted = []
+        for row, (drug, dose) in enumerate(zip(drugs, doses), start=1):
+            ratios = CONVERSION_MATRIX.get(resolve_benzodiazepine(drug))
+            if ratios is None:
+                raise ValueError(f"Row {row}: '{drug}' is not a supported benzodiazepine")
+            if not isinstance(dose, (int, float)) or not 0 < dose <= MAX_DAILY_DOSE:
+                raise ValueError(f"Row {row}: total daily dose must be greater than 0 and at most {MAX_DAILY_DOSE} mg")
+            converted.append(round(dose * ratios[target], 2))
+        return converted
+    
+    def taper_schedules(self, drugs: Sequence[str], doses: Sequence[float],
+                        taper_with: str = "diazepam", reduction: float = 0.1,
+                        interval_days: int = 14, increment: Optional[float] = 1.0) -> List[Dict[str, Any]]:
+        """
+        Builds benzodiazepine withdrawal schedules for many patients
+        
+        Following the Ashton approach, each patient's current dose is converted
+        to a long-acting agent (diazepam by default) and then reduced by a
+        fraction of the current dose every one to two weeks.
+        
+        Args:
+            drugs: Current benzodiazepine per patient (generic or brand name)
+            doses: Total daily dose in mg per patient
+            taper_with: Benzodiazepine used for the taper
+            reduction: Fraction of the current dose removed at each step
+            interval_days: Days between steps
+            increment: Dose unit of the taper drug each step is rounded to
+            
+        Returns:
+            List[Dict]: Per patient the taper drug, its starting dose and the
+            {"day", "daily_dose"} steps ending at zero
+        """
+        
+        starting_doses = self.convert_batch(drugs, doses, taper_with)
+        taper_drug = resolve_benzodiazepine(taper_with)
+        
+        schedules = taper_schedules(
+            starting_doses, reduction, interval_days, "proportional", increment
+        )
+        return [
+            {
+                "taper_drug": taper_drug,
+                "starting_dose": starting_dose,
+                "steps": [{"day": day, "daily_dose": dose} for day, dose in schedule]
+            }
+            for starting_dose, schedule in zip(starting_doses, schedules)
+        ]
+    
     def _calculate_conversion(self, converting_from: str, dose: float, converting_to: str) -> float:
         """Calculates the equivalent dose conversion"""
         
-        # Convert current dose to diazepam equivalents first
-        diazepam_equivalent = dose * self.potency_factors[converting_from]
-        
-        # Convert from diazepam equivalent to target medication
-        target_dose = diazepam_equivalent / self.potency_factors[converting_to]
+        # One lookup in the precomputed conversion matrix
+        target_dose = dose * CONVERSION_MATRIX[converting_from][converting_to]
         
         # Round to appropriate precision (2 decimal places)
         return round(target_dose, 2)
@@ -17,6 +17,23 @@ References:
 
 from typing import Dict, Any
 
+from calculators.engines.points import PointScore
+
+
+# Points table, evaluated by the point-score engine
+POINTS = {
+    "components": [
+        {"name": "tonsillar_exudate", "when": {"parameter": "tonsillar_exudate", "eq": "yes"}, "points": 1},
+        {"name": "tender_cervical_nodes", "when": {"parameter": "tender_cervical_nodes", "eq": "yes"}, "points": 1},
+        {"name": "history_of_fever", "when": {"parameter": "history_of_fever", "eq": "yes"}, "points": 1},
+        {"name": "absence_of_cough", "when": {"parameter": "absence_of_cough", "eq": "yes"}, "points": 1},
+        {"name": "age_adjustment", "parameter": "age_years", "ge": [15, 45], "points": [1, 0, -1]}
+    ]
+}
+
+# Compiled Modified Centor points table
+POINT_SCORE = PointScore("centor_score", POINTS)
+
 
 class CentorScoreCalculator:
     """Calculator for Centor Score (Modified/McIsaac) for Strep Pharyngitis"""
@@ -58,16 +75,15 @@ class CentorScoreCalculator:
             absence_of_cough, age_years
         )
         
-        # Calculate base score from clinical criteria
-        base_score = self._calculate_clinical_score(
-            tonsillar_exudate, tender_cervical_nodes, history_of_fever, absence_of_cough
-        )
-        
-        # Apply age adjustment
-        age_adjustment = self._get_age_adjustment(age_years)
-        
-        # Calculate total score
-        total_score = base_score + age_adjustment
+        # Calculate score from the declarative points table (POINTS)
+        total_score, components = POINT_SCORE.evaluate({
+            "tonsillar_exudate": tonsillar_exudate,
+            "tender_cervical_nodes": tender_cervical_nodes,
+            "history_of_fever": history_of_fever,
+            "absence_of_cough": absence_of_cough,
+            "age_years": age_years
+        })
+        age_adjustment = components["age_adjustment"]
         
         # Get probability assessment
         probability = self._get_probability_assessment(total_score)
@@ -115,35 +131,6 @@ class CentorScoreCalculator:
         if not isinstance(age, int) or not (3 <= age <= 120):
             raise ValueError("Age must be an integer between 3-120 years")
     
-    def _calculate_clinical_score(self, tonsillar, nodes, fever, cough):
-        """Calculates score from clinical criteria (1 point each)"""
-        
-        score = 0
-        
-        if tonsillar == "yes":
-            score += 1
-        
-        if nodes == "yes":
-            score += 1
-        
-        if fever == "yes":
-            score += 1
-        
-        if cough == "yes":
-            score += 1
-        
-        return score
-    
-    def _get_age_adjustment(self, age: int) -> int:
-        """Gets age adjustment for modified Centor score"""
-        
-        if 3 <= age <= 14:
-            return 1  # Higher risk of streptococcal infection in children
-        elif 15 <= age <= 44:
-            return 0  # Baseline risk
-        else:  # age >= 45
-            return -1  # Lower risk of streptococcal infection in older adults
-    
     def _get_probability_assessment(self, score: int) -> Dict[str, Any]:
         """Gets probability assessment based on total score"""
         
@@ -7,6 +7,25 @@ Reference: Lip GY et al. Chest. 2010;137(2):263-72.
 
 from typing import Dict, Any
 
+from calculators.engines.points import PointScore
+
+
+# Points table, evaluated by the point-score engine
+POINTS = {
+    "components": [
+        {"name": "congestive_heart_failure", "when": {"parameter": "congestive_heart_failure", "eq": True}, "points": 1},
+        {"name": "hypertension", "when": {"parameter": "hypertension", "eq": True}, "points": 1},
+        {"name": "age_points", "parameter": "age", "ge": [65, 75], "points": [0, 1, 2]},
+        {"name": "diabetes", "when": {"parameter": "diabetes", "eq": True}, "points": 1},
+        {"name": "stroke_tia", "when": {"parameter": "stroke_tia_thromboembolism", "eq": True}, "points": 2},
+        {"name": "vascular_disease", "when": {"parameter": "vascular_disease", "eq": True}, "points": 1},
+        {"name": "sex_category", "parameter": "sex", "map": {"female": 1}}
+    ]
+}
+
+# Compiled CHA₂DS₂-VASc points table
+POINT_SCORE = PointScore("cha2ds2_vasc", POINTS)
+
 
 class Cha2ds2VascCalculator:
     """Calculator for CHA₂DS₂-VASc Score"""
@@ -48,38 +67,16 @@ class Cha2ds2VascCalculator:
         # Validations
         self._validate_inputs(age, sex)
         
-        # Calculate score
-        score = 0
-        
-        # C - Congestive heart failure (1 point)
-        if congestive_heart_failure:
-            score += 1
-        
-        # H - Hypertension (1 point)
-        if hypertension:
-            score += 1
-        
-        # A₂ - Age (0-2 points)
-        if age >= 75:
-            score += 2
-        elif age >= 65:
-            score += 1
-        
-        # D - Diabetes (1 point)
-        if diabetes:
-            score += 1
-        
-        # S₂ - Stroke/TIA/TE (2 points)
-        if stroke_tia_thromboembolism:
-            score += 2
-        
-        # V - Vascular disease (1 point)
-        if vascular_disease:
-            score += 1
-        
-        # Sc - Sex category (1 point if female)
-        if sex.lower() == "female":
-            score += 1
+        # Calculate score from the declarative points table (POINTS)
+        score, components = POINT_SCORE.evaluate({
+            "age": age,
+            "sex": sex.lower(),
+            "congestive_heart_failure": congestive_heart_failure,
+            "hypertension": hypertension,
+            "stroke_tia_thromboembolism": stroke_tia_thromboembolism,
+            "vascular_disease": vascular_disease,
+            "diabetes": diabetes
+        })
         
         # Get interpretation
         interpretation = self._get_interpretation(score, sex)
@@ -92,15 +89,7 @@ class Cha2ds2VascCalculator:
             "stage": interpretation["stage"],
             "stage_description": interpretation["description"],
             "annual_stroke_risk": f"{annual_risk}%",
-            "components": {
-                "congestive_heart_failure": 1 if congestive_heart_failure else 0,
-                "hypertension": 1 if hypertension else 0,
-                "age_points": 2 if age >= 75 else (1 if age >= 65 else 0),
-                "diabetes": 1 if diabetes else 0,
-                "stroke_tia": 2 if stroke_tia_thromboembolism else 0,
-                "vascular_disease": 1 if vascular_disease else 0,
-                "sex_category": 1 if sex.lower() == "female" else 0
-            }
+            "components": components
         }
     
     def _validate_inputs(self, age: int, sex: str):
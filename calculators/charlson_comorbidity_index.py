@@ -11,64 +11,142 @@ References:
    J Clin Epidemiol. 1994;47(11):1245-51.
 3. Deyo RA, Cherkin DC, Ciol MA. Adapting a clinical comorbidity index for use with ICD-9-CM 
    administrative databases. J Clin Epidemiol. 1992;45(6):613-9.
+4. Quan H, Sundararajan V, Halfon P, Fong A, Burnand B, Luthi JC, et al. Coding algorithms for 
+   defining comorbidities in ICD-9-CM and ICD-10 administrative data. Med Care. 2005;43(11):1130-9.
 """
 
 import math
-from typing import Dict, Any
+from bisect import bisect_right
+from typing import Dict, Any, Iterable, Iterator, Set, Tuple
+
+from calculators.engines.codes import PrefixIndex
+
+
+# Comorbidity point values
+COMORBIDITY_POINTS = {
+    # 1 point conditions
+    "myocardial_infarction": 1,
+    "congestive_heart_failure": 1,
+    "peripheral_vascular_disease": 1,
+    "cerebrovascular_disease": 1,
+    "dementia": 1,
+    "chronic_pulmonary_disease": 1,
+    "connective_tissue_disease": 1,
+    "peptic_ulcer_disease": 1,
+    # liver_disease handled separately (1 or 3 points)
+    # diabetes handled separately (1 or 2 points)
+    
+    # 2 point conditions
+    "hemiplegia": 2,
+    "moderate_severe_ckd": 2,
+    "localized_solid_tumor": 2,
+    "leukemia": 2,
+    "lymphoma": 2,
+    
+    # 6 point conditions
+    "metastatic_solid_tumor": 6,
+    "aids": 6
+}
+
+# Age adjustment points
+AGE_POINTS = {
+    range(0, 50): 0,
+    range(50, 60): 1,
+    range(60, 70): 2,
+    range(70, 80): 3,
+    range(80, 121): 4  # Maximum 4 points for age ≥80
+}
+
+# Liver disease points
+LIVER_DISEASE_POINTS = {
+    "none": 0,
+    "mild": 1,
+    "moderate_severe": 3
+}
+
+# Diabetes points
+DIABETES_POINTS = {
+    "none": 0,
+    "uncomplicated": 1,
+    "with_end_organ_damage": 2
+}
+
+# ICD-10 code sets per condition (Quan et al. 2005 Charlson coding algorithm).
+# Quan's "any malignancy" set is split into the leukemia, lymphoma and
+# localized solid tumor items scored by this calculator.
+ICD10_CODE_SETS = {
+    "myocardial_infarction": ["I21-I22", "I25.2"],
+    "congestive_heart_failure": [
+        "I09.9", "I11.0", "I13.0", "I13.2", "I25.5", "I42.0", "I42.5-I42.9", "I43", "I50", "P29.0"
+    ],
+    "peripheral_vascular_disease": [
+        "I70-I71", "I73.1", "I73.8", "I73.9", "I77.1", "I79.0", "I79.2",
+        "K55.1", "K55.8", "K55.9", "Z95.8", "Z95.9"
+    ],
+    "cerebrovascular_disease": ["G45-G46", "H34.0", "I60-I69"],
+    "dementia": ["F00-F03", "F05.1", "G30", "G31.1"],
+    "chronic_pulmonary_disease": ["I27.8", "I27.9", "J40-J47", "J60-J67", "J68.4", "J70.1", "J70.3"],
+    "connective_tissue_disease": ["M05-M06", "M31.5", "M32-M34", "M35.1", "M35.3", "M36.0"],
+    "peptic_ulcer_disease": ["K25-K28"],
+    "mild_liver_disease": [
+        "B18", "K70.0-K70.3", "K70.9", "K71.3-K71.5", "K71.7", "K73-K74",
+        "K76.0", "K76.2-K76.4", "K76.8", "K76.9", "Z94.4"
+    ],
+    "moderate_severe_liver_disease": [
+        "I85.0", "I85.9", "I86.4", "I98.2", "K70.4", "K71.1", "K72.1", "K72.9", "K76.5-K76.7"
+    ],
+    "diabetes_uncomplicated": [
+        "E10.0", "E10.1", "E10.6", "E10.8", "E10.9", "E11.0", "E11.1", "E11.6", "E11.8", "E11.9",
+        "E12.0", "E12.1", "E12.6", "E12.8", "E12.9", "E13.0", "E13.1", "E13.6", "E13.8", "E13.9",
+        "E14.0", "E14.1", "E14.6", "E14.8", "E14.9"
+    ],
+    "diabetes_with_end_organ_damage": [
+        "E10.2-E10.5", "E10.7", "E11.2-E11.5", "E11.7", "E12.2-E12.5", "E12.7",
+        "E13.2-E13.5", "E13.7", "E14.2-E14.5", "E14.7"
+    ],
+    "hemiplegia": ["G04.1", "G11.4", "G80.1", "G80.2", "G81-G82", "G83.0-G83.4", "G83.9"],
+    "moderate_severe_ckd": [
+        "I12.0", "I13.1", "N03.2-N03.7", "N05.2-N05.7", "N18-N19", "N25.0",
+        "Z49.0-Z49.2", "Z94.0", "Z99.2"
+    ],
+    "localized_solid_tumor": ["C00-C26", "C30-C34", "C37-C41", "C43", "C45-C58", "C60-C76", "C97"],
+    "leukemia": ["C91-C95"],
+    "lymphoma": ["C81-C85", "C88", "C90", "C96"],
+    "metastatic_solid_tumor": ["C77-C80"],
+    "aids": ["B20-B22", "B24"]
+}
+
+# Compiled ICD-10 prefix index over the code sets
+ICD10_INDEX = PrefixIndex(ICD10_CODE_SETS)
+
+# Conditions that are not counted when the more severe form is also coded
+SUPERSEDED_BY = {
+    "mild_liver_disease": "moderate_severe_liver_disease",
+    "diabetes_uncomplicated": "diabetes_with_end_organ_damage",
+    "localized_solid_tumor": "metastatic_solid_tumor"
+}
+
+# Points per coded condition, including the severity forms of liver disease and diabetes
+CONDITION_POINTS = {
+    **COMORBIDITY_POINTS,
+    "mild_liver_disease": LIVER_DISEASE_POINTS["mild"],
+    "moderate_severe_liver_disease": LIVER_DISEASE_POINTS["moderate_severe"],
+    "diabetes_uncomplicated": DIABETES_POINTS["uncomplicated"],
+    "diabetes_with_end_organ_damage": DIABETES_POINTS["with_end_organ_damage"]
+}
+
+# Lower age bound of each age point band above 0 points
+AGE_POINT_BOUNDS = (50, 60, 70, 80)
 
 
 class CharlsonComorbidityIndexCalculator:
     """Calculator for Charlson Comorbidity Index (CCI)"""
     
     def __init__(self):
-        # Comorbidity point values
-        self.comorbidity_points = {
-            # 1 point conditions
-            "myocardial_infarction": 1,
-            "congestive_heart_failure": 1,
-            "peripheral_vascular_disease": 1,
-            "cerebrovascular_disease": 1,
-            "dementia": 1,
-            "chronic_pulmonary_disease": 1,
-            "connective_tissue_disease": 1,
-            "peptic_ulcer_disease": 1,
-            # liver_disease handled separately (1 or 3 points)
-            # diabetes handled separately (1 or 2 points)
-            
-            # 2 point conditions
-            "hemiplegia": 2,
-            "moderate_severe_ckd": 2,
-            "localized_solid_tumor": 2,
-            "leukemia": 2,
-            "lymphoma": 2,
-            
-            # 6 point conditions
-            "metastatic_solid_tumor": 6,
-            "aids": 6
-        }
-        
-        # Age adjustment points
-        self.age_points = {
-            range(0, 50): 0,
-            range(50, 60): 1,
-            range(60, 70): 2,
-            range(70, 80): 3,
-            range(80, 121): 4  # Maximum 4 points for age ≥80
-        }
-        
-        # Liver disease points
-        self.liver_disease_points = {
-            "none": 0,
-            "mild": 1,
-            "moderate_severe": 3
-        }
-        
-        # Diabetes points
-        self.diabetes_points = {
-            "none": 0,
-            "uncomplicated": 1,
-            "with_end_organ_damage": 2
-        }
+        self.comorbidity_points = COMORBIDITY_POINTS
+        self.age_points = AGE_POINTS
+        self.liver_disease_points = LIVER_DISEASE_POINTS
+        self.diabetes_points = DIABETES_POINTS
     
     def calculate(
         self,
@@ -172,6 +250,58 @@ class CharlsonComorbidityIndexCalculator:
             "stage_description": risk_assessment["stage_description"]
         }
     
+    def calculate_from_codes(self, age: int, icd10_codes: Iterable[str]) -> Dict[str, Any]:
+        """
+        Calculates the Charlson Comorbidity Index from ICD-10 diagnosis codes
+        
+        Codes are mapped onto the comorbidity parameters with the Quan ICD-10
+        code sets and then scored by calculate().
+        
+        Args:
+            age: Patient age in years
+            icd10_codes: ICD-10 codes of the patient, with or without dots
+            
+        Returns:
+            Dict as returned by calculate(), with the codes supporting each
+            matched condition under result["icd10_matches"]
+        """
+        
+        codes = list(icd10_codes)
+        matches = ICD10_INDEX.matches(codes)
+        result = self.calculate(age=age, **comorbidities_from_conditions(set(matches)))
+        result["result"]["icd10_matches"] = matches
+        return result
+    
+    def score_encounters(self, encounters: Iterable[Tuple[Any, int, Iterable[str]]]) -> Iterator[Tuple[Any, int, int]]:
+        """
+        Scores a stream of encounters from their ICD-10 codes
+        
+        Encounters are consumed lazily, so extracts of any size can be scored
+        straight from a file or database cursor.
+        
+        Args:
+            encounters: (encounter_id, age, icd10_codes) per encounter
+            
+        Yields:
+            Tuple: (encounter_id, total_score, comorbidity_points) per encounter
+        """
+        
+        classify = ICD10_INDEX.classify
+        points = CONDITION_POINTS
+        superseded_by = SUPERSEDED_BY
+        
+        for encounter_id, age, codes in encounters:
+            if not isinstance(age, int) or age < 0 or age > 120:
+                raise ValueError(f"Encounter {encounter_id!r}: age must be an integer between 0 and 120")
+            
+            conditions = classify(codes)
+            comorbidity_points = 0
+            for condition in conditions:
+                if superseded_by.get(condition) not in conditions:
+                    comorbidity_points += points[condition]
+            
+            yield encounter_id, bisect_right(AGE_POINT_BOUNDS, age) + comorbidity_points, comorbidity_points
+    
     def _validate_inputs(self, age, *comorbidity_params):
         """Validates input parameters"""
         
@@ -376,6 +506,42 @@ class CharlsonComorbidityIndexCalculator:
         }
 
 
+def comorbidities_from_conditions(conditions: Set[str]) -> Dict[str, str]:
+    """
+    Converts coded conditions into the calculator's comorbidity parameters
+    
+    The more severe form of liver disease, diabetes and solid tumor takes
+    precedence when both forms are coded.
+    
+    Args:
+        conditions: Conditions matched in ICD10_CODE_SETS
+        
+    Returns:
+        Dict: Value per comorbidity parameter of calculate()
+    """
+    parameters = {
+        name: "yes" if name in conditions else "no" for name in COMORBIDITY_POINTS
+    }
+    if "metastatic_solid_tumor" in conditions:
+        parameters["localized_solid_tumor"] = "no"
+    
+    if "moderate_severe_liver_disease" in conditions:
+        parameters["liver_disease"] = "moderate_severe"
+    elif "mild_liver_disease" in conditions:
+        parameters["liver_disease"] = "mild"
+    else:
+        parameters["liver_disease"] = "none"
+    
+    if "diabetes_with_end_organ_damage" in conditions:
+        parameters["diabetes"] = "with_end_organ_damage"
+    elif "diabetes_uncomplicated" in conditions:
+        parameters["diabetes"] = "uncomplicated"
+    else:
+        parameters["diabetes"] = "none"
+    
+    return parameters
+
+
 def calculate_charlson_comorbidity_index(
     age: int,
     myocardial_infarction: str,
@@ -9,9 +9,14 @@ References:
 2. Motwani SS, et al. J Clin Oncol. 2018 Mar 1;36(7):682-688.
 """
 
-import math
 from typing import Dict, Any
 
+from calculators.engines.logistic import LogisticModel
+
+
+# Calibration of the total point score to risk (logit = -3.5 + 0.45 * score)
+MODEL = LogisticModel(intercept=-3.5, numeric={"total_score": 0.45})
+
 
 class CisplatinAkiCalculator:
     """Calculator for Cisplatin-Associated Acute Kidney Injury (CP-AKI) Risk"""
@@ -117,8 +122,7 @@ class CisplatinAkiCalculator:
         
         # Convert score to risk percentage using logistic function
         # Calibrated to approximate the reported risk ranges
-        logit = -3.5 + (0.45 * total_score)
-        risk_percentage = 100 / (1 + math.exp(-logit))
+        risk_percentage = 100 * MODEL.predict({"total_score": total_score})
         
         # Round to 1 decimal place
         risk_percentage = round(risk_percentage, 1)
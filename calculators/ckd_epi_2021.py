@@ -12,7 +12,7 @@ Where:
 """
 
 import math
-from typing import Dict, Any
+from typing import Dict, Any, List, Mapping, Sequence
 
 
 class CKDEpi2021Calculator:
@@ -45,6 +45,39 @@ class CKDEpi2021Calculator:
         # Validations
         self._validate_inputs(sex, age, serum_creatinine)
         
+        # Calculate eGFR
+        egfr = self._calculate_egfr(sex, age, serum_creatinine)
+        
+        # Round to 1 decimal place
+        egfr = round(egfr, 1)
+        
+        return self._format_result(egfr)
+    
+    def calculate_results(self, parameter_sets: Sequence[Mapping[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Calculates complete results, as returned by calculate(), for many parameter sets
+        
+        Args:
+            parameter_sets: One mapping per patient with the same keys as calculate()
+            
+        Returns:
+            List[Dict]: Result, stage and interpretation per patient, in input order
+        """
+        
+        for parameters in parameter_sets:
+            self._validate_inputs(parameters["sex"], parameters["age"], parameters["serum_creatinine"])
+        
+        calculate_egfr = self._calculate_egfr
+        format_result = self._format_result
+        return [
+            format_result(round(calculate_egfr(parameters["sex"], parameters["age"],
+                                               parameters["serum_creatinine"]), 1))
+            for parameters in parameter_sets
+        ]
+    
+    def _calculate_egfr(self, sex: str, age: int, serum_creatinine: float) -> float:
+        """Evaluates the CKD-EPI 2021 equation (unrounded)"""
+        
         # Determine constants based on sex
         if sex.lower() == "female":
             kappa = self.KAPPA_FEMALE
@@ -74,8 +107,10 @@ class CKDEpi2021Calculator:
                 age_component * 
                 sex_multiplier)
         
-        # Round to 1 decimal place
-        egfr = round(egfr, 1)
+        return egfr
+    
+    def _format_result(self, egfr: float) -> Dict[str, Any]:
+        """Builds the result with its interpretation"""
         
         # Get interpretation
         interpretation = self._get_interpretation(egfr)
@@ -166,3 +201,13 @@ def calculate_ckd_epi_2021(sex: str, age: int, serum_creatinine: float) -> Dict[
     """
     calculator = CKDEpi2021Calculator()
     return calculator.calculate(sex, age, serum_creatinine)
+
+
+def calculate_ckd_epi_2021_batch(parameter_sets: Sequence[Mapping[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Batch counterpart of calculate_ckd_epi_2021 for the calculator service
+    
+    Evaluates all parameter sets with one calculator instance.
+    """
+    calculator = CKDEpi2021Calculator()
+    return calculator.calculate_results(parameter_sets)
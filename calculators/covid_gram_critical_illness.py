@@ -11,34 +11,65 @@ References:
    doi:10.1001/jamainternmed.2020.2033
 """
 
-import math
-from typing import Dict, Any
+from typing import Dict, Any, List, Mapping, Sequence
+
+from calculators.engines.logistic import LogisticModel
+
+
+# Coefficients from the original COVID-GRAM model
+COEFFICIENTS = {
+    "chest_xray_abnormality": 27.1464,
+    "age": 0.6139,
+    "hemoptysis": 33.6210,
+    "dyspnea": 14.0569,
+    "unconsciousness": 34.4617,
+    "number_of_comorbidities": 10.3826,
+    "cancer_history": 31.2211,
+    "neutrophil_lymphocyte_ratio": 1.25,
+    "lactate_dehydrogenase": 0.0534,
+    "direct_bilirubin": 3.0605
+}
+
+# Intercept for logistic regression
+INTERCEPT = -146.5
+
+# Risk thresholds
+LOW_RISK_THRESHOLD = 1.7
+HIGH_RISK_THRESHOLD = 40.4
+
+NUMERIC_FACTORS = (
+    "age",
+    "number_of_comorbidities",
+    "neutrophil_lymphocyte_ratio",
+    "lactate_dehydrogenase",
+    "direct_bilirubin"
+)
+
+YES_NO_FACTORS = (
+    "chest_xray_abnormality",
+    "hemoptysis",
+    "dyspnea",
+    "unconsciousness",
+    "cancer_history"
+)
+
+# Compiled model: yes/no findings are one-hot encoded with "no" as reference
+MODEL = LogisticModel(
+    intercept=INTERCEPT,
+    numeric={factor: COEFFICIENTS[factor] for factor in NUMERIC_FACTORS},
+    categorical={factor: {"no": 0.0, "yes": COEFFICIENTS[factor]} for factor in YES_NO_FACTORS}
+)
 
 
 class CovidGramCriticalIllnessCalculator:
     """Calculator for COVID-GRAM Critical Illness Risk Score"""
     
     def __init__(self):
-        # Coefficients from the original COVID-GRAM model
-        self.COEFFICIENTS = {
-            "chest_xray_abnormality": 27.1464,
-            "age": 0.6139,
-            "hemoptysis": 33.6210,
-            "dyspnea": 14.0569,
-            "unconsciousness": 34.4617,
-            "number_of_comorbidities": 10.3826,
-            "cancer_history": 31.2211,
-            "neutrophil_lymphocyte_ratio": 1.25,
-            "lactate_dehydrogenase": 0.0534,
-            "direct_bilirubin": 3.0605
-        }
-        
-        # Intercept for logistic regression
-        self.INTERCEPT = -146.5
-        
-        # Risk thresholds
-        self.LOW_RISK_THRESHOLD = 1.7
-        self.HIGH_RISK_THRESHOLD = 40.4
+        self.COEFFICIENTS = COEFFICIENTS
+        self.INTERCEPT = INTERCEPT
+        self.LOW_RISK_THRESHOLD = LOW_RISK_THRESHOLD
+        self.HIGH_RISK_THRESHOLD = HIGH_RISK_THRESHOLD
+        self.model = MODEL
     
     def calculate(
         self,
@@ -157,46 +188,45 @@ class CovidGramCriticalIllnessCalculator:
     ) -> float:
         """Calculate the linear predictor for the logistic regression model"""
         
-        # Convert binary variables to numeric
-        xray_score = 1 if chest_xray_abnormality == "yes" else 0
-        hemoptysis_score = 1 if hemoptysis == "yes" else 0
-        dyspnea_score = 1 if dyspnea == "yes" else 0
-        unconsciousness_score = 1 if unconsciousness == "yes" else 0
-        cancer_score = 1 if cancer_history == "yes" else 0
-        
-        # Calculate weighted sum
-        linear_predictor = (
-            self.INTERCEPT +
-            (xray_score * self.COEFFICIENTS["chest_xray_abnormality"]) +
-            (age * self.COEFFICIENTS["age"]) +
-            (hemoptysis_score * self.COEFFICIENTS["hemoptysis"]) +
-            (dyspnea_score * self.COEFFICIENTS["dyspnea"]) +
-            (unconsciousness_score * self.COEFFICIENTS["unconsciousness"]) +
-            (number_of_comorbidities * self.COEFFICIENTS["number_of_comorbidities"]) +
-            (cancer_score * self.COEFFICIENTS["cancer_history"]) +
-            (neutrophil_lymphocyte_ratio * self.COEFFICIENTS["neutrophil_lymphocyte_ratio"]) +
-            (lactate_dehydrogenase * self.COEFFICIENTS["lactate_dehydrogenase"]) +
-            (direct_bilirubin * self.COEFFICIENTS["direct_bilirubin"])
-        )
-        
-        return linear_predictor
+        return self.model.linear_predictor({
+            "chest_xray_abnormality": chest_xray_abnormality,
+            "age": age,
+            "hemoptysis": hemoptysis,
+            "dyspnea": dyspnea,
+            "unconsciousness": unconsciousness,
+            "number_of_comorbidities": number_of_comorbidities,
+            "cancer_history": cancer_history,
+            "neutrophil_lymphocyte_ratio": neutrophil_lymphocyte_ratio,
+            "lactate_dehydrogenase": lactate_dehydrogenase,
+            "direct_bilirubin": direct_bilirubin
+        })
     
     def _calculate_probability(self, linear_predictor: float) -> float:
         """Convert linear predictor to probability using logistic function"""
-        try:
-            # Logistic function: p = e^x / (1 + e^x) = 1 / (1 + e^(-x))
-            probability = 1 / (1 + math.exp(-linear_predictor))
-            
-            # Convert to percentage and ensure reasonable bounds
-            probability_percent = probability * 100
-            return max(0.1, min(99.9, probability_percent))
+        # Logistic function: p = e^x / (1 + e^x) = 1 / (1 + e^(-x))
+        probability_percent = self.model.probability(linear_predictor) * 100
+        
+        # Ensure reasonable bounds
+        return max(0.1, min(99.9, probability_percent))
+    
+    def calculate_batch(self, patients: Sequence[Mapping[str, Any]]) -> List[float]:
+        """
+        Calculates critical illness risk for many admitted patients
+        
+        Args:
+            patients: One mapping per patient with the same keys as calculate()
             
-        except OverflowError:
-            # Handle extreme values
-            if linear_predictor > 0:
-                return 99.9
-            else:
-                return 0.1
+        Returns:
+            List[float]: Risk percentage per patient, in input order
+        """
+        
+        for patient in patients:
+            self._validate_inputs(**patient)
+        
+        return [
+            round(max(0.1, min(99.9, risk * 100)), 1)
+            for risk in self.model.predict_batch(patients)
+        ]
     
     def _get_interpretation(self, risk_probability: float) -> Dict[str, Any]:
         """
@@ -16,66 +16,90 @@ References:
    2014;106(9):dju244.
 """
 
-from typing import Dict, Any, Optional
+from bisect import bisect_left, bisect_right
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+
+# Normal reference ranges by sex
+NORMAL_RANGES = {
+    "hemoglobin": {
+        "male": {"min": 14.0, "max": 18.0},      # g/dL
+        "female": {"min": 12.0, "max": 16.0}     # g/dL
+    },
+    "neutrophil": {"min": 1500, "max": 8000},    # cells/mm³
+    "platelet": {"min": 150000, "max": 450000},   # cells/mm³
+    "wbc": {"min": 4000, "max": 11000},          # cells/mm³
+    "lymphocyte": {"min": 1000, "max": 4000}     # cells/mm³
+}
+
+# CTCAE v5.0 grade cut-offs for hematologic adverse events, ascending. Events
+# graded on low values count the cut-offs the value falls below (e.g. ANC
+# <200 → 4, <500 → 3, <1000 → 2, <LLN → 1); leukocytosis counts the cut-offs
+# the value exceeds (>ULN → 1, >20,000 → 2, >50,000 → 3, >100,000 → 4).
+GRADE_CUTOFFS = {
+    "anemia": {
+        "male": (6.5, 8.0, 10.0, NORMAL_RANGES["hemoglobin"]["male"]["min"]),         # g/dL
+        "female": (6.5, 8.0, 10.0, NORMAL_RANGES["hemoglobin"]["female"]["min"])      # g/dL
+    },
+    "neutropenia": (200, 500, 1000, NORMAL_RANGES["neutrophil"]["min"]),             # cells/mm³
+    "thrombocytopenia": (25000, 50000, 75000, NORMAL_RANGES["platelet"]["min"]),     # cells/mm³
+    "leukocytosis": (NORMAL_RANGES["wbc"]["max"], 20000, 50000, 100000),             # cells/mm³
+    "lymphopenia": (200, 500, 800, NORMAL_RANGES["lymphocyte"]["min"])               # cells/mm³
+}
+
+# Events graded on values above the upper limit of normal
+HIGH_VALUE_EVENTS = ("leukocytosis",)
+
+# Febrile neutropenia criteria
+FEBRILE_NEUTROPENIA_CRITERIA = {
+    "neutrophil_threshold": 1000,  # ANC <1.0 x 10⁹/L
+    "temperature_threshold": 38.3,  # Temperature >38.3°C
+    "sustained_temperature_threshold": 38.0,  # Or sustained ≥38°C for >1 hour
+    "grade": 3  # Febrile neutropenia is always Grade 3
+}
+
+# Lab analytes accepted by the bulk grader: analyte -> (adverse event, minimum,
+# maximum, unit). Analyte names match the calculator parameters.
+LAB_ANALYTES = {
+    "hemoglobin": ("anemia", 0.0, 25.0, "g/dL"),
+    "neutrophil_count": ("neutropenia", 0.0, 50000.0, "cells/mm³"),
+    "platelet_count": ("thrombocytopenia", 0.0, 2000000.0, "cells/mm³"),
+    "wbc_count": ("leukocytosis", 0.0, 500000.0, "cells/mm³"),
+    "lymphocyte_count": ("lymphopenia", 0.0, 50000.0, "cells/mm³")
+}
+
+TEMPERATURE_RANGE = (30.0, 45.0)
+
+SEXES = ("male", "female")
+
+
+def _compile_grader(cutoffs: Sequence[float], high_values: bool) -> Callable[[float], int]:
+    """Builds the grade lookup of one cut-off array"""
+    cutoffs = tuple(cutoffs)
+    if high_values:
+        return lambda value: bisect_left(cutoffs, value)
+    worst = len(cutoffs)
+    return lambda value: worst - bisect_right(cutoffs, value)
+
+
+# Compiled grade lookups per (adverse event, sex)
+GRADERS: Dict[Tuple[str, str], Callable[[float], int]] = {
+    (event, sex): _compile_grader(
+        cutoffs[sex] if isinstance(cutoffs, dict) else cutoffs,
+        event in HIGH_VALUE_EVENTS
+    )
+    for event, cutoffs in GRADE_CUTOFFS.items()
+    for sex in SEXES
+}
 
 
 class CtcaeCalculator:
     """Calculator for Common Terminology Criteria for Adverse Events (CTCAE) v5.0"""
     
     def __init__(self):
-        # Normal reference ranges by sex
-        self.NORMAL_RANGES = {
-            "hemoglobin": {
-                "male": {"min": 14.0, "max": 18.0},      # g/dL
-                "female": {"min": 12.0, "max": 16.0}     # g/dL
-            },
-            "neutrophil": {"min": 1500, "max": 8000},    # cells/mm³
-            "platelet": {"min": 150000, "max": 450000},   # cells/mm³
-            "wbc": {"min": 4000, "max": 11000},          # cells/mm³
-            "lymphocyte": {"min": 1000, "max": 4000}     # cells/mm³
-        }
-        
-        # CTCAE v5.0 Grading Criteria for Hematologic Adverse Events
-        self.GRADING_CRITERIA = {
-            "anemia": {
-                "grade_1": {"male": {"min": 10.0, "max": 13.9}, "female": {"min": 10.0, "max": 11.9}},
-                "grade_2": {"min": 8.0, "max": 9.9},
-                "grade_3": {"min": 6.5, "max": 7.9, "requires_transfusion": True},
-                "grade_4": {"max": 6.4}
-            },
-            "neutropenia": {
-                "grade_1": {"min": 1000, "max": 1499},  # <LLN - 1500/mm³
-                "grade_2": {"min": 500, "max": 999},    # <1500 - 1000/mm³  
-                "grade_3": {"min": 200, "max": 499},    # <1.0 - 0.5 x 10⁹/L
-                "grade_4": {"max": 199}                 # <0.5 x 10⁹/L
-            },
-            "thrombocytopenia": {
-                "grade_1": {"min": 75000, "max": 149999},   # <LLN - 75,000/mm³
-                "grade_2": {"min": 50000, "max": 74999},    # <75,000 - 50,000/mm³
-                "grade_3": {"min": 25000, "max": 49999},    # <50,000 - 25,000/mm³
-                "grade_4": {"max": 24999}                   # <25,000/mm³
-            },
-            "leukocytosis": {
-                "grade_1": {"min": 11001, "max": 20000},    # >ULN - 20,000/mm³
-                "grade_2": {"min": 20001, "max": 50000},    # >20,000 - 50,000/mm³
-                "grade_3": {"min": 50001, "max": 100000},   # >50,000 - 100,000/mm³
-                "grade_4": {"min": 100001}                  # >100,000/mm³
-            },
-            "lymphopenia": {
-                "grade_1": {"min": 800, "max": 999},        # <LLN - 800/mm³
-                "grade_2": {"min": 500, "max": 799},        # <800 - 500/mm³
-                "grade_3": {"min": 200, "max": 499},        # <500 - 200/mm³
-                "grade_4": {"max": 199}                     # <200/mm³
-            }
-        }
-        
-        # Febrile neutropenia criteria
-        self.FEBRILE_NEUTROPENIA_CRITERIA = {
-            "neutrophil_threshold": 1000,  # ANC <1.0 x 10⁹/L
-            "temperature_threshold": 38.3,  # Temperature >38.3°C
-            "sustained_temperature_threshold": 38.0,  # Or sustained ≥38°C for >1 hour
-            "grade": 3  # Febrile neutropenia is always Grade 3
-        }
+        self.NORMAL_RANGES = NORMAL_RANGES
+        self.GRADE_CUTOFFS = GRADE_CUTOFFS
+        self.FEBRILE_NEUTROPENIA_CRITERIA = FEBRILE_NEUTROPENIA_CRITERIA
     
     def calculate(
         self,
@@ -228,93 +252,130 @@ class CtcaeCalculator:
         if transfusion_indicated is not None and transfusion_indicated not in ["yes", "no"]:
             raise ValueError("Transfusion indication must be 'yes' or 'no'")
     
-    def _grade_anemia(self, hemoglobin: float, patient_sex: str, transfusion_indicated: Optional[str]) -> int:
-        """Grades anemia according to CTCAE v5.0 criteria"""
+    def calculate_batch(
+        self,
+        patient_ids: Sequence[Any],
+        analytes: Sequence[str],
+        values: Sequence[float],
+        sexes: Sequence[str],
+        temperatures: Optional[Sequence[Optional[float]]] = None,
+        transfusion_indicated: Optional[Sequence[Optional[str]]] = None
+    ) -> Dict[str, Any]:
+        """
+        Grades a columnar lab table, one row per lab result
         
-        normal_range = self.NORMAL_RANGES["hemoglobin"][patient_sex]
-        criteria = self.GRADING_CRITERIA["anemia"]
+        Every row is graded for the adverse event of its analyte through the
+        compiled cut-off arrays. Neutrophil rows with a temperature are also
+        graded for febrile neutropenia.
         
-        # Check if within normal limits
-        if hemoglobin >= normal_range["min"]:
-            return 0
+        Args:
+            patient_ids: Patient identifier per row
+            analytes: Analyte per row (hemoglobin, neutrophil_count,
+                platelet_count, wbc_count or lymphocyte_count)
+            values: Lab value per row, in the unit of the analyte
+            sexes: Patient sex per row (male/female)
+            temperatures: Body temperature in Celsius per row (optional)
+            transfusion_indicated: yes/no per row, used for anemia grade 3
+                (optional; anemia is capped at grade 2 without it)
+            
+        Returns:
+            Dict with "rows" (adverse_event, grade and febrile_neutropenia
+            columns in input order) and "patients" (worst grade overall and
+            per adverse event for every patient)
+        """
         
-        # Grade 4: Life-threatening
-        if hemoglobin <= criteria["grade_4"]["max"]:
-            return 4
+        rows = len(patient_ids)
+        if not len(analytes) == len(values) == len(sexes) == rows:
+            raise ValueError("Patient, analyte, value and sex columns must have the same length")
+        if temperatures is None:
+            temperatures = [None] * rows
+        if transfusion_indicated is None:
+            transfusion_indicated = [None] * rows
+        if not len(temperatures) == len(transfusion_indicated) == rows:
+            raise ValueError("Temperature and transfusion columns must match the table length")
+        
+        graders = GRADERS
+        neutrophil_threshold = FEBRILE_NEUTROPENIA_CRITERIA["neutrophil_threshold"]
+        fever_threshold = FEBRILE_NEUTROPENIA_CRITERIA["sustained_temperature_threshold"]
+        febrile_grade = FEBRILE_NEUTROPENIA_CRITERIA["grade"]
+        
+        event_column: List[str] = []
+        grade_column: List[int] = []
+        febrile_column: List[Optional[int]] = []
+        patients: Dict[Any, Dict[str, int]] = {}
+        
+        for row, (patient_id, analyte, value, sex, temperature, transfusion) in enumerate(
+            zip(patient_ids, analytes, values, sexes, temperatures, transfusion_indicated), start=1
+        ):
+            lab = LAB_ANALYTES.get(analyte)
+            if lab is None:
+                raise ValueError(f"Row {row}: unsupported analyte '{analyte}'. "
+                                 f"Must be one of: {list(LAB_ANALYTES)}")
+            event, minimum, maximum, unit = lab
+            if sex not in SEXES:
+                raise ValueError(f"Row {row}: patient sex must be 'male' or 'female'")
+            if not isinstance(value, (int, float)) or not minimum <= value <= maximum:
+                raise ValueError(f"Row {row}: {analyte} must be between {minimum:,g} and {maximum:,g} {unit}")
+            
+            grade = graders[(event, sex)](value)
+            if event == "anemia" and grade == 3 and transfusion != "yes":
+                # Grade 3 anemia requires an indication for transfusion
+                grade = 2
+            
+            febrile = None
+            if event == "neutropenia" and temperature is not None:
+                if not TEMPERATURE_RANGE[0] <= temperature <= TEMPERATURE_RANGE[1]:
+                    raise ValueError(f"Row {row}: temperature must be between 30.0 and 45.0°C")
+                febrile = febrile_grade if value < neutrophil_threshold and temperature >= fever_threshold else 0
+            
+            event_column.append(event)
+            grade_column.append(grade)
+            febrile_column.append(febrile)
+            
+            worst = patients.setdefault(patient_id, {})
+            if grade > worst.get(event, -1):
+                worst[event] = grade
+            if febrile is not None and febrile > worst.get("febrile_neutropenia", -1):
+                worst["febrile_neutropenia"] = febrile
+        
+        summary = {}
+        for patient_id, grades in patients.items():
+            worst_event = max(grades, key=grades.get)
+            summary[patient_id] = {
+                "worst_grade": grades[worst_event],
+                "worst_adverse_event": worst_event if grades[worst_event] > 0 else None,
+                "grades": grades
+            }
         
-        # Grade 3: Severe (may require transfusion)
-        if (criteria["grade_3"]["min"] <= hemoglobin <= criteria["grade_3"]["max"]):
-            # Grade 3 can be assigned if transfusion is indicated
-            if transfusion_indicated == "yes":
-                return 3
-            # Otherwise treat as Grade 2
-            return 2
+        return {
+            "rows": {
+                "adverse_event": event_column,
+                "grade": grade_column,
+                "febrile_neutropenia": febrile_column
+            },
+            "patients": summary
+        }
+    
+    def _grade_anemia(self, hemoglobin: float, patient_sex: str, transfusion_indicated: Optional[str]) -> int:
+        """Grades anemia according to CTCAE v5.0 criteria"""
         
-        # Grade 2: Moderate
-        if criteria["grade_2"]["min"] <= hemoglobin <= criteria["grade_2"]["max"]:
-            return 2
+        grade = GRADERS[("anemia", patient_sex)](hemoglobin)
         
-        # Grade 1: Mild
-        grade_1_criteria = criteria["grade_1"][patient_sex]
-        if grade_1_criteria["min"] <= hemoglobin <= grade_1_criteria["max"]:
-            return 1
+        # Grade 3 can be assigned if transfusion is indicated, otherwise treat as Grade 2
+        if grade == 3 and transfusion_indicated != "yes":
+            return 2
         
-        # If hemoglobin is very low but not captured above, default to Grade 4
-        return 4
+        return grade
     
     def _grade_neutropenia(self, neutrophil_count: float) -> int:
         """Grades neutropenia according to CTCAE v5.0 criteria"""
         
-        criteria = self.GRADING_CRITERIA["neutropenia"]
-        
-        # Check if within normal limits
-        if neutrophil_count >= self.NORMAL_RANGES["neutrophil"]["min"]:
-            return 0
-        
-        # Grade 4: Life-threatening
-        if neutrophil_count <= criteria["grade_4"]["max"]:
-            return 4
-        
-        # Grade 3: Severe
-        if criteria["grade_3"]["min"] <= neutrophil_count <= criteria["grade_3"]["max"]:
-            return 3
-        
-        # Grade 2: Moderate
-        if criteria["grade_2"]["min"] <= neutrophil_count <= criteria["grade_2"]["max"]:
-            return 2
-        
-        # Grade 1: Mild
-        if criteria["grade_1"]["min"] <= neutrophil_count <= criteria["grade_1"]["max"]:
-            return 1
-        
-        return 0
+        return GRADERS[("neutropenia", "male")](neutrophil_count)
     
     def _grade_thrombocytopenia(self, platelet_count: float) -> int:
         """Grades thrombocytopenia according to CTCAE v5.0 criteria"""
         
-        criteria = self.GRADING_CRITERIA["thrombocytopenia"]
-        
-        # Check if within normal limits
-        if platelet_count >= self.NORMAL_RANGES["platelet"]["min"]:
-            return 0
-        
-        # Grade 4: Life-threatening
-        if platelet_count <= criteria["grade_4"]["max"]:
-            return 4
-        
-        # Grade 3: Severe
-        if criteria["grade_3"]["min"] <= platelet_count <= criteria["grade_3"]["max"]:
-            return 3
-        
-        # Grade 2: Moderate
-        if criteria["grade_2"]["min"] <= platelet_count <= criteria["grade_2"]["max"]:
-            return 2
-        
-        # Grade 1: Mild
-        if criteria["grade_1"]["min"] <= platelet_count <= criteria["grade_1"]["max"]:
-            return 1
-        
-        return 0
+        return GRADERS[("thrombocytopenia", "male")](platelet_count)
     
     def _grade_febrile_neutropenia(self, neutrophil_count: float, temperature: float) -> int:
         """Grades febrile neutropenia according to CTCAE v5.0 criteria"""
@@ -337,56 +398,12 @@ class CtcaeCalculator:
     def _grade_leukocytosis(self, wbc_count: float) -> int:
         """Grades leukocytosis according to CTCAE v5.0 criteria"""
         
-        criteria = self.GRADING_CRITERIA["leukocytosis"]
-        
-        # Check if within normal limits
-        if wbc_count <= self.NORMAL_RANGES["wbc"]["max"]:
-            return 0
-        
-        # Grade 4: Life-threatening
-        if wbc_count >= criteria["grade_4"]["min"]:
-            return 4
-        
-        # Grade 3: Severe
-        if criteria["grade_3"]["min"] <= wbc_count <= criteria["grade_3"]["max"]:
-            return 3
-        
-        # Grade 2: Moderate
-        if criteria["grade_2"]["min"] <= wbc_count <= criteria["grade_2"]["max"]:
-            return 2
-        
-        # Grade 1: Mild
-        if criteria["grade_1"]["min"] <= wbc_count <= criteria["grade_1"]["max"]:
-            return 1
-        
-        return 0
+        return GRADERS[("leukocytosis", "male")](wbc_count)
     
     def _grade_lymphopenia(self, lymphocyte_count: float) -> int:
         """Grades lymphopenia according to CTCAE v5.0 criteria"""
         
-        criteria = self.GRADING_CRITERIA["lymphopenia"]
-        
-        # Check if within normal limits
-        if lymphocyte_count >= self.NORMAL_RANGES["lymphocyte"]["min"]:
-            return 0
-        
-        # Grade 4: Life-threatening
-        if lymphocyte_count <= criteria["grade_4"]["max"]:
-            return 4
-        
-        # Grade 3: Severe
-        if criteria["grade_3"]["min"] <= lymphocyte_count <= criteria["grade_3"]["max"]:
-            return 3
-        
-        # Grade 2: Moderate
-        if criteria["grade_2"]["min"] <= lymphocyte_count <= criteria["grade_2"]["max"]:
-            return 2
-        
-        # Grade 1: Mild
-        if criteria["grade_1"]["min"] <= lymphocyte_count <= criteria["grade_1"]["max"]:
-            return 1
-        
-        return 0
+        return GRADERS[("lymphopenia", "male")](lymphocyte_count)
     
     def _get_interpretation(self, grade: int, adverse_event_type: str, primary_value, unit: str) -> Dict[str, str]:
         """Generates clinical interpretation of CTCAE grade"""
@@ -8,6 +8,23 @@ Reference: Lim WS et al. Thorax. 2003;58(5):377-82.
 
 from typing import Dict, Any
 
+from calculators.engines.points import PointScore
+
+
+# Points table, evaluated by the point-score engine
+POINTS = {
+    "components": [
+        {"name": "confusion", "when": {"parameter": "confusion", "eq": True}, "points": 1},
+        {"name": "urea", "when": {"parameter": "urea", "gt": 19.0}, "points": 1},
+        {"name": "respiratory_rate", "when": {"parameter": "respiratory_rate", "ge": 30}, "points": 1},
+        {"name": "blood_pressure", "any": [{"parameter": "systolic_bp", "lt": 90}, {"parameter": "diastolic_bp", "le": 60}], "points": 1},
+        {"name": "age", "when": {"parameter": "age", "ge": 65}, "points": 1}
+    ]
+}
+
+# Compiled CURB-65 points table
+POINT_SCORE = PointScore("curb_65", POINTS)
+
 
 class Curb65Calculator:
     """Calculator for CURB-65 Score"""
@@ -43,28 +60,15 @@ class Curb65Calculator:
         # Validations
         self._validate_inputs(confusion, urea, respiratory_rate, systolic_bp, diastolic_bp, age)
         
-        # Calculate score
-        score = 0
-        
-        # C - Confusion (1 point if present)
-        if confusion:
-            score += 1
-        
-        # U - Urea > 19 mg/dL (1 point)
-        if urea > 19.0:
-            score += 1
-        
-        # R - Respiratory rate ≥ 30/min (1 point)
-        if respiratory_rate >= 30:
-            score += 1
-        
-        # B - Blood pressure: SBP < 90 mmHg OR DBP ≤ 60 mmHg (1 point)
-        if systolic_bp < 90 or diastolic_bp <= 60:
-            score += 1
-        
-        # 65 - Age ≥ 65 years (1 point)
-        if age >= 65:
-            score += 1
+        # Calculate score from the declarative points table (POINTS)
+        score, components = POINT_SCORE.evaluate({
+            "confusion": confusion,
+            "urea": urea,
+            "respiratory_rate": respiratory_rate,
+            "systolic_bp": systolic_bp,
+            "diastolic_bp": diastolic_bp,
+            "age": age
+        })
         
         # Get interpretation
         interpretation = self._get_interpretation(score)
@@ -77,13 +81,7 @@ class Curb65Calculator:
             "stage": interpretation["stage"],
             "stage_description": interpretation["description"],
             "mortality_risk": f"{mortality_risk}%",
-            "components": {
-                "confusion": 1 if confusion else 0,
-                "urea": 1 if urea > 19.0 else 0,
-                "respiratory_rate": 1 if respiratory_rate >= 30 else 0,
-                "blood_pressure": 1 if (systolic_bp < 90 or diastolic_bp <= 60) else 0,
-                "age": 1 if age >= 65 else 0
-            }
+            "components": components
         }
     
     def _validate_inputs(self, confusion: bool, urea: float, respiratory_rate: int,
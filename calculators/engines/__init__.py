@@ -0,0 +1,40 @@
+"""
+Shared calculation engines used by the score calculators
+
+Engines hold model definitions (coefficients, baseline survivals, tables) as
+data, compile them once at import time and evaluate them for a single patient
+or for a batch of patients.
+"""
+
+from .codes import PrefixIndex, normalize_code
+from .dosing import AliasIndex, conversion_matrix, taper_schedules
+from .hazards import CompetingRiskTable
+from .logistic import LogisticModel
+from .nomogram import CurveGrid, LMSTable, Nomogram
+from .points import PointScore
+from .regression import LinearFit, fit_groups, fit_line, slope_interval
+from .streaming import Bands, ScoreStream, StreamComponent, StreamingScore
+from .survival import SurvivalModel
+
+__all__ = [
+    "AliasIndex",
+    "Bands",
+    "CompetingRiskTable",
+    "CurveGrid",
+    "LMSTable",
+    "LinearFit",
+    "LogisticModel",
+    "Nomogram",
+    "PointScore",
+    "PrefixIndex",
+    "ScoreStream",
+    "StreamComponent",
+    "StreamingScore",
+    "SurvivalModel",
+    "conversion_matrix",
+    "fit_groups",
+    "fit_line",
+    "normalize_code",
+    "slope_interval",
+    "taper_schedules"
+]
@@ -0,0 +1,156 @@
+"""
+Code Prefix Index
+
+Maps coded diagnoses (e.g. ICD-10) onto score categories declared as code
+prefixes. Category code sets are compiled once into a hash index keyed by
+prefix, together with the distinct prefix lengths in use; a code is
+classified with one dictionary probe per prefix length instead of matching
+it against every pattern. Classified codes are memoized, since claims and EHR
+extracts repeat a small vocabulary of codes across millions of encounters.
+
+Codes are normalized before lookup: surrounding whitespace and dots are
+removed and letters upper-cased, so "i21.4", "I21.4" and "I214" match alike.
+"""
+
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Set, Tuple
+
+
+EMPTY: FrozenSet[str] = frozenset()
+
+
+def normalize_code(code: str) -> str:
+    """
+    Normalizes a diagnosis code for prefix matching
+
+    Args:
+        code (str): Code as written in the source (e.g. "I21.4")
+
+    Returns:
+        str: Upper-cased code without dots or surrounding whitespace
+    """
+    return code.strip().replace(".", "").upper()
+
+
+def expand_code_ranges(specs: Iterable[str]) -> List[str]:
+    """
+    Expands code-set notation into plain prefixes
+
+    Each spec is either a single prefix ("I25.2", "B18") or an inclusive
+    range of prefixes of equal length sharing their leading letter
+    ("I60-I69", "K70.0-K70.3").
+
+    Args:
+        specs (Iterable[str]): Prefixes and prefix ranges
+
+    Returns:
+        List[str]: Normalized prefixes
+
+    Raises:
+        ValueError: If a range is malformed
+    """
+    prefixes = []
+    for spec in specs:
+        if "-" not in spec:
+            prefixes.append(normalize_code(spec))
+            continue
+
+        first, last = (normalize_code(part) for part in spec.split("-"))
+        if len(first) != len(last) or first[0] != last[0] or not (first[1:] + last[1:]).isdigit():
+            raise ValueError(f"Invalid code range '{spec}'")
+        width = len(first) - 1
+        for number in range(int(first[1:]), int(last[1:]) + 1):
+            prefixes.append(f"{first[0]}{number:0{width}d}")
+    return prefixes
+
+
+class PrefixIndex:
+    """Compiled code-prefix → category index"""
+
+    def __init__(self, categories: Mapping[str, Iterable[str]], cache_size: int = 1 << 17):
+        """
+        Compiles the code sets of every category
+
+        Args:
+            categories (Mapping[str, Iterable[str]]): Prefixes and prefix
+                ranges per category (see expand_code_ranges)
+            cache_size (int): Number of distinct codes memoized before the
+                lookup cache is reset
+        """
+        prefixes: Dict[str, Set[str]] = {}
+        for category, specs in categories.items():
+            for prefix in expand_code_ranges(specs):
+                prefixes.setdefault(prefix, set()).add(category)
+
+        self.categories: Tuple[str, ...] = tuple(categories)
+        self._prefixes: Dict[str, FrozenSet[str]] = {
+            prefix: frozenset(names) for prefix, names in prefixes.items()
+        }
+        self._lengths: Tuple[int, ...] = tuple(sorted({len(prefix) for prefix in prefixes}))
+        self._cache: Dict[str, FrozenSet[str]] = {}
+        self._cache_size = cache_size
+
+    def __len__(self) -> int:
+        return len(self._prefixes)
+
+    def lookup(self, code: str) -> FrozenSet[str]:
+        """
+        Returns the categories of one code
+
+        Args:
+            code (str): Diagnosis code
+
+        Returns:
+            FrozenSet[str]: Categories with a prefix matching the code
+        """
+        found = self._cache.get(code)
+        if found is not None:
+            return found
+
+        key = normalize_code(code)
+        prefixes = self._prefixes
+        found = EMPTY
+        for length in self._lengths:
+            if length > len(key):
+                break
+            names = prefixes.get(key[:length])
+            if names is not None:
+                found = found | names
+
+        if len(self._cache) >= self._cache_size:
+            self._cache.clear()
+        self._cache[code] = found
+        return found
+
+    def classify(self, codes: Iterable[str]) -> Set[str]:
+        """
+        Returns the categories present in a list of codes
+
+        Args:
+            codes (Iterable[str]): Diagnosis codes (e.g. of one encounter)
+
+        Returns:
+            Set[str]: Categories matched by at least one code
+        """
+        lookup = self.lookup
+        found: Set[str] = set()
+        for code in codes:
+            names = lookup(code)
+            if names:
+                found |= names
+        return found
+
+    def matches(self, codes: Iterable[str]) -> Dict[str, List[str]]:
+        """
+        Returns the codes supporting each matched category
+
+        Args:
+            codes (Iterable[str]): Diagnosis codes
+
+        Returns:
+            Dict[str, List[str]]: Matching codes per category, in category order
+        """
+        found: Dict[str, List[str]] = {}
+        for code in codes:
+            for name in self.lookup(code):
+                found.setdefault(name, []).append(code)
+        return {name: found[name] for name in self.categories if name in found}
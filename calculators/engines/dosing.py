@@ -0,0 +1,147 @@
+"""
+Dose Conversion and Taper Engine
+
+Shared building blocks for equivalence-table calculators (opioid morphine
+equivalents, benzodiazepine diazepam equivalents):
+
+- AliasIndex: resolves generic names, brand names and spelling variants to
+  one canonical drug name through a single dictionary built at import time
+- conversion_matrix: precomputes the full drug × drug ratio table from
+  per-drug factors relative to a reference drug, so a conversion is one
+  lookup and one multiplication
+- taper_schedules: builds stepwise dose-reduction schedules for many
+  patients at once
+"""
+
+from functools import lru_cache
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+
+# Separators treated as underscores when normalizing drug names
+_SEPARATORS = str.maketrans({" ": "_", "-": "_"})
+
+
+def normalize_drug_name(name: str) -> str:
+    """
+    Normalizes a drug name for lookup
+
+    Args:
+        name (str): Drug name as entered (e.g. "MS Contin")
+
+    Returns:
+        str: Lower-case name with spaces and hyphens replaced by underscores
+    """
+    return name.strip().lower().translate(_SEPARATORS)
+
+
+class AliasIndex:
+    """Precompiled drug name → canonical name index"""
+
+    def __init__(self, canonical: Iterable[str], aliases: Optional[Mapping[str, str]] = None):
+        """
+        Builds the index
+
+        Args:
+            canonical (Iterable[str]): Canonical drug names
+            aliases (Mapping[str, str], optional): Alternative name -> canonical name
+
+        Raises:
+            ValueError: If an alias points to an unknown canonical name
+        """
+        names = {normalize_drug_name(name): name for name in canonical}
+        for alias, target in (aliases or {}).items():
+            if target not in names.values():
+                raise ValueError(f"Alias '{alias}' points to unknown drug '{target}'")
+            names[normalize_drug_name(alias)] = target
+        self._names: Dict[str, str] = names
+        self.resolve = lru_cache(maxsize=4096)(self._resolve)
+
+    def __contains__(self, name: str) -> bool:
+        return self.resolve(name) is not None
+
+    def _resolve(self, name: str) -> Optional[str]:
+        """Returns the canonical name of a drug, or None when it is unknown"""
+        return self._names.get(normalize_drug_name(name))
+
+
+def conversion_matrix(factors: Mapping[str, float]) -> Dict[str, Dict[str, float]]:
+    """
+    Precomputes the ratio between every pair of drugs
+
+    Args:
+        factors (Mapping[str, float]): Equivalence factor of each drug relative
+            to a common reference (dose × factor = reference dose)
+
+    Returns:
+        Dict[str, Dict[str, float]]: matrix[from][to] such that
+        dose_from × matrix[from][to] is the equivalent dose of "to"
+    """
+    return {
+        source: {target: source_factor / target_factor for target, target_factor in factors.items()}
+        for source, source_factor in factors.items()
+    }
+
+
+def taper_schedules(doses: Sequence[float], reduction: float = 0.1, interval_days: int = 28,
+                    method: str = "proportional", increment: Optional[float] = None,
+                    final_dose: Optional[float] = None) -> List[List[Tuple[int, float]]]:
+    """
+    Builds one dose-reduction schedule per starting dose
+
+    Args:
+        doses (Sequence[float]): Starting daily dose per patient
+        reduction (float): Fraction removed at each step (0-1)
+        interval_days (int): Days between steps
+        method (str): "proportional" removes a fraction of the current dose
+            at each step; "linear" removes a fraction of the starting dose
+        increment (float, optional): Dose unit each step is rounded to (e.g.
+            the smallest tablet strength); every step still lowers the dose
+        final_dose (float, optional): Lowest dose given before stopping;
+            defaults to one reduction step of the starting dose
+
+    Returns:
+        List[List[Tuple[int, float]]]: (day, daily dose) steps per patient,
+        starting at day 0 with the current dose and ending with 0
+
+    Raises:
+        ValueError: If the taper parameters are invalid
+    """
+    if not 0.0 < reduction < 1.0:
+        raise ValueError("Reduction must be a fraction between 0 and 1")
+    if interval_days <= 0:
+        raise ValueError("Interval must be a positive number of days")
+    if method not in ("proportional", "linear"):
+        raise ValueError("Method must be 'proportional' or 'linear'")
+    if increment is not None and increment <= 0:
+        raise ValueError("Rounding increment must be positive")
+
+    schedules = []
+    for start in doses:
+        if start <= 0:
+            raise ValueError("Starting doses must be positive")
+
+        floor_dose = final_dose if final_dose is not None else start * reduction
+        if increment is not None:
+            floor_dose = max(floor_dose, increment)
+        step = start * reduction
+
+        steps = [(0, start)]
+        dose = start
+        day = 0
+        while True:
+            day += interval_days
+            target = dose * (1.0 - reduction) if method == "proportional" else dose - step
+            if increment is not None:
+                target = round(target / increment) * increment
+                # Rounding must never leave the dose unchanged
+                if target >= dose:
+                    target = dose - increment
+            target = round(target, 6)
+            if target < floor_dose - 1e-9:
+                steps.append((day, 0.0))
+                break
+            steps.append((day, target))
+            dose = target
+        schedules.append(steps)
+
+    return schedules
@@ -0,0 +1,224 @@
+"""
+Logistic Model Kernel
+
+Reusable kernel for logistic-regression risk equations of the form
+
+    risk = exp(lp) / (1 + exp(lp)),   lp = intercept + Σ β_j x_j + Σ β_k [category_k == level]
+
+Categorical parameters are one-hot encoded through level -> column maps that
+are built once when the model is declared. Because exactly one column per
+categorical parameter is active, the dot product for that parameter collapses
+to a single lookup of the active column's coefficient, so evaluating a patient
+costs one dictionary lookup per categorical and one multiply per numeric
+parameter, with no string comparison chains.
+
+Reference levels (coefficient 0) can be listed explicitly so that they are
+accepted as valid levels without adding a column.
+"""
+
+import math
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+
+class LogisticModel:
+    """Compiled logistic-regression model with numeric and categorical terms"""
+
+    def __init__(self, intercept: float,
+                 numeric: Optional[Mapping[str, float]] = None,
+                 categorical: Optional[Mapping[str, Mapping[str, float]]] = None):
+        """
+        Compiles the model definition
+
+        Args:
+            intercept (float): Constant term of the linear predictor
+            numeric (Mapping[str, float], optional): β per numeric parameter
+            categorical (Mapping[str, Mapping[str, float]], optional): β per
+                level for each categorical parameter (reference levels use 0)
+
+        Raises:
+            ValueError: If a parameter is declared as both numeric and categorical
+        """
+        numeric = numeric or {}
+        categorical = categorical or {}
+
+        overlap = set(numeric) & set(categorical)
+        if overlap:
+            raise ValueError(f"Parameters declared twice: {', '.join(sorted(overlap))}")
+
+        self.intercept = float(intercept)
+        self._numeric: Tuple[Tuple[str, float], ...] = tuple(
+            (name, float(beta)) for name, beta in numeric.items()
+        )
+
+        # Design-matrix columns: numeric parameters first, then one column per
+        # non-reference categorical level
+        columns: List[str] = [name for name, _ in self._numeric]
+        coefficients: List[float] = [beta for _, beta in self._numeric]
+        self._level_columns: Dict[str, Dict[str, Optional[int]]] = {}
+        self._level_weights: Dict[str, Dict[str, float]] = {}
+
+        for name, levels in categorical.items():
+            level_columns: Dict[str, Optional[int]] = {}
+            for level, beta in levels.items():
+                if beta:
+                    level_columns[level] = len(columns)
+                    columns.append(f"{name}={level}")
+                    coefficients.append(float(beta))
+                else:
+                    level_columns[level] = None
+            self._level_columns[name] = level_columns
+            self._level_weights[name] = {level: float(beta) for level, beta in levels.items()}
+
+        self.columns: Tuple[str, ...] = tuple(columns)
+        self.coefficients: Tuple[float, ...] = tuple(coefficients)
+        self._categorical: Tuple[Tuple[str, Dict[str, float]], ...] = tuple(self._level_weights.items())
+        self.parameters: Tuple[str, ...] = tuple(name for name, _ in self._numeric) + tuple(self._level_weights)
+
+    def levels(self, name: str) -> List[str]:
+        """
+        Returns the accepted levels of a categorical parameter
+
+        Args:
+            name (str): Categorical parameter name
+
+        Returns:
+            List[str]: Accepted levels in declaration order
+        """
+        return list(self._level_weights[name])
+
+    def encode(self, values: Mapping[str, object]) -> List[float]:
+        """
+        Builds the one-hot design row for one patient
+
+        Args:
+            values (Mapping[str, object]): Value per model parameter
+
+        Returns:
+            List[float]: Design row aligned with `columns`
+        """
+        row = [0.0] * len(self.columns)
+
+        for index, (name, _) in enumerate(self._numeric):
+            row[index] = float(self._value(values, name))
+
+        for name, level_columns in self._level_columns.items():
+            level = self._value(values, name)
+            if level not in level_columns:
+                raise ValueError(self._invalid_level(name, level))
+            column = level_columns[level]
+            if column is not None:
+                row[column] = 1.0
+
+        return row
+
+    def linear_predictor(self, values: Mapping[str, object]) -> float:
+        """
+        Calculates the linear predictor (logit) for one patient
+
+        Args:
+            values (Mapping[str, object]): Value per model parameter
+
+        Returns:
+            float: Linear predictor
+        """
+        lp = self.intercept
+
+        try:
+            for name, beta in self._numeric:
+                lp += beta * values[name]
+            for name, weights in self._categorical:
+                lp += weights[values[name]]
+        except KeyError:
+            self._raise_missing(values)
+
+        return lp
+
+    def predict(self, values: Mapping[str, object]) -> float:
+        """
+        Calculates the predicted probability (0-1) for one patient
+
+        Args:
+            values (Mapping[str, object]): Value per model parameter
+
+        Returns:
+            float: Predicted probability
+        """
+        return self.probability(self.linear_predictor(values))
+
+    def predict_batch(self, rows: Iterable[Mapping[str, object]]) -> List[float]:
+        """
+        Calculates predicted probabilities (0-1) for many patients
+
+        Args:
+            rows (Iterable[Mapping[str, object]]): One parameter mapping per patient
+
+        Returns:
+            List[float]: Predicted probability per patient, in input order
+        """
+        linear_predictor = self.linear_predictor
+        probability = self.probability
+        return [probability(linear_predictor(values)) for values in rows]
+
+    def predict_columns(self, columns: Mapping[str, Sequence[object]]) -> List[float]:
+        """
+        Calculates predicted probabilities from columnar input
+
+        Args:
+            columns (Mapping[str, Sequence[object]]): Value column per parameter
+
+        Returns:
+            List[float]: Predicted probability per patient, in input order
+        """
+        missing = [name for name in self.parameters if name not in columns]
+        if missing:
+            raise ValueError(f"Missing parameter columns: {', '.join(missing)}")
+
+        count = len(columns[self.parameters[0]]) if self.parameters else 0
+        lps = [self.intercept] * count
+
+        # Accumulate the dot product one column at a time
+        for name, beta in self._numeric:
+            lps = [lp + beta * value for lp, value in zip(lps, columns[name])]
+
+        for name, weights in self._categorical:
+            try:
+                lps = [lp + weights[level] for lp, level in zip(lps, columns[name])]
+            except KeyError as e:
+                raise ValueError(self._invalid_level(name, e.args[0]))
+
+        probability = self.probability
+        return [probability(lp) for lp in lps]
+
+    @staticmethod
+    def probability(lp: float) -> float:
+        """
+        Converts a linear predictor into a probability without overflow
+
+        Args:
+            lp (float): Linear predictor
+
+        Returns:
+            float: exp(lp) / (1 + exp(lp))
+        """
+        if lp >= 0:
+            return 1 / (1 + math.exp(-lp))
+        exp_lp = math.exp(lp)
+        return exp_lp / (1 + exp_lp)
+
+    def _value(self, values: Mapping[str, object], name: str) -> object:
+        """Returns a parameter value or raises a ValueError if it is missing"""
+        if name not in values:
+            raise ValueError(f"Missing parameter '{name}' for logistic model")
+        return values[name]
+
+    def _raise_missing(self, values: Mapping[str, object]):
+        """Raises a descriptive ValueError for a missing parameter or invalid level"""
+        for name in self.parameters:
+            self._value(values, name)
+        for name, weights in self._categorical:
+            if values[name] not in weights:
+                raise ValueError(self._invalid_level(name, values[name]))
+
+    def _invalid_level(self, name: str, level: object) -> str:
+        """Formats the error message for an unknown categorical level"""
+        return f"Invalid value '{level}' for {name}. Must be one of: {', '.join(self._level_weights[name])}"
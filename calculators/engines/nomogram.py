@@ -0,0 +1,283 @@
+"""
+Nomogram Interpolation Engine
+
+Percentile curves published as knot tables (e.g. the Bhutani bilirubin
+nomogram, growth-chart LMS parameters) are resampled once at import time
+into dense, evenly spaced grids stored in `array('d')` buffers. A query on
+the grid is a single index computation; a query between grid points
+interpolates linearly between the two neighbouring samples, so no sorting or
+neighbour scans happen per call.
+
+- CurveGrid: one piecewise-linear curve
+- Nomogram: several percentile curves sharing one axis, with zone lookup
+- LMSTable: age-indexed LMS parameters with z-score and percentile lookup
+"""
+
+import math
+from array import array
+from bisect import bisect_right
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+
+class CurveGrid:
+    """Piecewise-linear curve resampled on a regular grid"""
+
+    def __init__(self, knots: Mapping[float, float], step: float = 1, digits: Optional[int] = None):
+        """
+        Resamples the curve defined by its knots
+
+        Args:
+            knots (Mapping[float, float]): Curve value per axis point
+            step (float): Grid spacing on the axis
+            digits (int, optional): Rounding applied to the resampled values
+
+        Raises:
+            ValueError: If fewer than two knots are given or the step is invalid
+        """
+        if len(knots) < 2:
+            raise ValueError("A curve needs at least two knots")
+        if step <= 0:
+            raise ValueError("Grid step must be positive")
+
+        xs = sorted(knots)
+        ys = [knots[x] for x in xs]
+
+        self.start = xs[0]
+        self.stop = xs[-1]
+        self.step = step
+        self.size = int(round((self.stop - self.start) / step)) + 1
+
+        values = array('d')
+        segment = 0
+        for index in range(self.size):
+            x = min(self.start + index * step, self.stop)
+            while segment < len(xs) - 2 and x > xs[segment + 1]:
+                segment += 1
+            x0, x1 = xs[segment], xs[segment + 1]
+            y0, y1 = ys[segment], ys[segment + 1]
+            y = y0 + (x - x0) / (x1 - x0) * (y1 - y0)
+            values.append(round(y, digits) if digits is not None else y)
+
+        self.values = values
+
+    def __call__(self, x: float) -> float:
+        """
+        Returns the curve value at an axis point within the grid
+
+        Args:
+            x (float): Axis point
+
+        Returns:
+            float: Curve value
+
+        Raises:
+            ValueError: If x lies outside the curve
+        """
+        position = (x - self.start) / self.step
+        if position < 0 or position > self.size - 1:
+            raise ValueError(f"Value {x} is outside the curve range {self.start}-{self.stop}")
+
+        index = int(position)
+        fraction = position - index
+        if not fraction:
+            return self.values[index]
+        lower = self.values[index]
+        return lower + fraction * (self.values[index + 1] - lower)
+
+    def batch(self, xs: Sequence[float]) -> List[float]:
+        """
+        Returns the curve values at many axis points
+
+        Args:
+            xs (Sequence[float]): Axis points
+
+        Returns:
+            List[float]: Curve value per axis point
+        """
+        return [self(x) for x in xs]
+
+    def points(self) -> List[Tuple[float, float]]:
+        """
+        Returns the resampled curve as (axis, value) pairs, e.g. for plotting
+
+        Returns:
+            List[Tuple[float, float]]: Grid points in axis order
+        """
+        return [(self.start + index * self.step, value) for index, value in enumerate(self.values)]
+
+
+class Nomogram:
+    """Ordered percentile curves over a shared axis"""
+
+    def __init__(self, curves: Mapping[str, Mapping[float, float]], step: float = 1,
+                 digits: Optional[int] = None):
+        """
+        Resamples every curve on the same grid
+
+        Args:
+            curves (Mapping[str, Mapping[float, float]]): Knots per curve label,
+                from the lowest to the highest curve
+            step (float): Grid spacing on the axis
+            digits (int, optional): Rounding applied to the resampled values
+
+        Raises:
+            ValueError: If the curves do not share the same axis range
+        """
+        self.labels: Tuple[str, ...] = tuple(curves)
+        self.curves: Dict[str, CurveGrid] = {
+            label: CurveGrid(knots, step, digits) for label, knots in curves.items()
+        }
+
+        grids = list(self.curves.values())
+        first = grids[0]
+        if any((grid.start, grid.stop) != (first.start, first.stop) for grid in grids):
+            raise ValueError("All nomogram curves must cover the same axis range")
+
+        self.start = first.start
+        self.stop = first.stop
+
+        # One threshold tuple per grid point for O(1) lookups on the grid
+        self._rows: Tuple[Tuple[float, ...], ...] = tuple(zip(*(grid.values for grid in grids)))
+
+    def thresholds(self, x: float) -> Tuple[float, ...]:
+        """
+        Returns the value of every curve at an axis point
+
+        Args:
+            x (float): Axis point
+
+        Returns:
+            Tuple[float, ...]: Curve values in label order
+        """
+        first = self.curves[self.labels[0]]
+        position = (x - first.start) / first.step
+        index = int(position)
+        if position == index and 0 <= index < first.size:
+            return self._rows[index]
+        return tuple(self.curves[label](x) for label in self.labels)
+
+    def zone(self, x: float, y: float) -> int:
+        """
+        Locates a measurement between the curves
+
+        Args:
+            x (float): Axis point
+            y (float): Measured value
+
+        Returns:
+            int: Number of curves at or below the measurement (0 = below all)
+        """
+        return bisect_right(self.thresholds(x), y)
+
+    def zones(self, xs: Sequence[float], ys: Sequence[float]) -> List[int]:
+        """
+        Locates many measurements between the curves
+
+        Args:
+            xs (Sequence[float]): Axis points
+            ys (Sequence[float]): Measured values
+
+        Returns:
+            List[int]: Zone per measurement, in input order
+        """
+        thresholds = self.thresholds
+        return [bisect_right(thresholds(x), y) for x, y in zip(xs, ys)]
+
+    def points(self) -> Dict[str, List[Tuple[float, float]]]:
+        """
+        Returns every resampled curve as (axis, value) pairs, e.g. for plotting
+
+        Returns:
+            Dict[str, List[Tuple[float, float]]]: Grid points per curve label
+        """
+        return {label: self.curves[label].points() for label in self.labels}
+
+
+class LMSTable:
+    """Age-indexed LMS (Box-Cox power, median, coefficient of variation) reference"""
+
+    def __init__(self, l_values: Mapping[float, float], m_values: Mapping[float, float],
+                 s_values: Mapping[float, float], step: float = 1):
+        """
+        Resamples the L, M and S curves on a shared grid
+
+        Args:
+            l_values (Mapping[float, float]): Box-Cox power per age
+            m_values (Mapping[float, float]): Median per age
+            s_values (Mapping[float, float]): Coefficient of variation per age
+            step (float): Grid spacing on the age axis
+        """
+        self.l_curve = CurveGrid(l_values, step)
+        self.m_curve = CurveGrid(m_values, step)
+        self.s_curve = CurveGrid(s_values, step)
+        self.start = self.m_curve.start
+        self.stop = self.m_curve.stop
+
+    def parameters(self, age: float) -> Tuple[float, float, float]:
+        """
+        Returns the L, M and S parameters at an age
+
+        Args:
+            age (float): Age on the table axis (clamped to the table range)
+
+        Returns:
+            Tuple[float, float, float]: (L, M, S)
+        """
+        age = min(max(age, self.start), self.stop)
+        return self.l_curve(age), self.m_curve(age), self.s_curve(age)
+
+    def z_score(self, age: float, value: float) -> float:
+        """
+        Calculates the LMS z-score of a measurement
+
+        Args:
+            age (float): Age on the table axis
+            value (float): Measurement
+
+        Returns:
+            float: z-score
+        """
+        l, m, s = self.parameters(age)
+        if l == 0:
+            return math.log(value / m) / s
+        return ((value / m) ** l - 1) / (l * s)
+
+    def percentile(self, age: float, value: float) -> float:
+        """
+        Calculates the percentile (0-100) of a measurement
+
+        Args:
+            age (float): Age on the table axis
+            value (float): Measurement
+
+        Returns:
+            float: Percentile
+        """
+        return z_to_percentile(self.z_score(age, value))
+
+    def percentiles(self, ages: Sequence[float], values: Sequence[float]) -> List[float]:
+        """
+        Calculates percentiles for many measurements
+
+        Args:
+            ages (Sequence[float]): Ages on the table axis
+            values (Sequence[float]): Measurements
+
+        Returns:
+            List[float]: Percentile per measurement, in input order
+        """
+        percentile = self.percentile
+        return [percentile(age, value) for age, value in zip(ages, values)]
+
+
+def z_to_percentile(z_score: float) -> float:
+    """
+    Converts a z-score into a percentile of the standard normal distribution
+
+    Args:
+        z_score (float): z-score
+
+    Returns:
+        float: Percentile (0-100)
+    """
+    return 50.0 * (1.0 + math.erf(z_score / math.sqrt(2.0)))
@@ -0,0 +1,289 @@
+"""
+Point Score Engine
+
+Compiles declarative additive point-score definitions into scalar and
+columnar evaluators. Each calculator module declares its points table as
+data next to the calculator and compiles it once at import time, so the
+table is shared by the scalar and the bulk evaluator and importing a
+calculator never reads files.
+
+Spec format:
+
+    POINTS = {
+        "components": [
+            {"name": "hypertension", "when": {"parameter": "hypertension", "eq": "yes"}, "points": 1},
+            {"name": "blood_pressure", "any": [{"parameter": "systolic_bp", "lt": 90},
+                                               {"parameter": "diastolic_bp", "le": 60}], "points": 1},
+            {"name": "sex_category", "parameter": "sex", "map": {"female": 1}},
+            {"name": "age_points", "parameter": "age", "ge": [65, 75], "points": [0, 1, 2]},
+            {"name": "history", "parameter": "history", "per_unit": 1}
+        ]
+    }
+    POINT_SCORE = PointScore("score_id", POINTS)
+
+Component kinds:
+- "when" / "any": award "points" when all / any of the conditions hold
+- "map": award the points mapped to the parameter value ("default" otherwise)
+- "ge" / "gt": banded thresholds; "points" has one more entry than thresholds
+- "per_unit": award parameter value × per_unit
+
+Conditions compare one parameter with eq, ne, in, gt, ge, lt and le (all
+operators given in one condition must hold).
+"""
+
+import operator
+from bisect import bisect_left, bisect_right
+from typing import Any, Callable, Dict, List, Mapping, Sequence, Tuple
+
+OPERATORS: Dict[str, Callable[[Any, Any], bool]] = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "gt": operator.gt,
+    "ge": operator.ge,
+    "lt": operator.lt,
+    "le": operator.le,
+    "in": lambda value, options: value in options
+}
+
+Evaluator = Callable[[Mapping[str, Any]], float]
+ColumnEvaluator = Callable[[Mapping[str, Sequence[Any]]], List[Any]]
+Predicate = Callable[[Mapping[str, Any]], bool]
+ColumnPredicate = Callable[[Mapping[str, Sequence[Any]]], List[bool]]
+
+
+class PointScore:
+    """Compiled additive point score"""
+
+    def __init__(self, score_id: str, spec: Mapping[str, Any]):
+        """
+        Compiles a point-score definition
+
+        Args:
+            score_id (str): ID of the score the definition belongs to
+            spec (Mapping): Points table of the score (see the module docstring)
+
+        Raises:
+            ValueError: If the definition is invalid
+        """
+        self.score_id = score_id
+        components = spec.get("components")
+        if not components:
+            raise ValueError(f"Point score '{score_id}' has no components")
+
+        # Integer scores stay integers; any fractional weight makes the total a float
+        self.zero = 0.0 if _has_float_points(components) else 0
+
+        compiled: List[Tuple[str, Evaluator]] = []
+        column_compiled: List[Tuple[str, ColumnEvaluator]] = []
+        parameters: List[str] = []
+        for component in components:
+            name = component.get("name")
+            if not name:
+                raise ValueError(f"Point score '{score_id}' has a component without a name")
+            evaluator, column_evaluator = self._compile_component(component)
+            compiled.append((name, evaluator))
+            column_compiled.append((name, column_evaluator))
+            for parameter in _component_parameters(component):
+                if parameter not in parameters:
+                    parameters.append(parameter)
+
+        self.components: Tuple[Tuple[str, Evaluator], ...] = tuple(compiled)
+        self.component_names: Tuple[str, ...] = tuple(name for name, _ in compiled)
+        self.parameters: Tuple[str, ...] = tuple(parameters)
+        self._evaluators: Tuple[Evaluator, ...] = tuple(evaluator for _, evaluator in compiled)
+        self._column_evaluators: Tuple[Tuple[str, ColumnEvaluator], ...] = tuple(column_compiled)
+
+    def total(self, values: Mapping[str, Any]):
+        """
+        Calculates the total score for one patient
+
+        Args:
+            values (Mapping[str, Any]): Value per parameter
+
+        Returns:
+            int or float: Total points
+        """
+        total = self.zero
+        for evaluator in self._evaluators:
+            total += evaluator(values)
+        return total
+
+    def evaluate(self, values: Mapping[str, Any]) -> Tuple[Any, Dict[str, Any]]:
+        """
+        Calculates the total score and the per-component breakdown
+
+        Args:
+            values (Mapping[str, Any]): Value per parameter
+
+        Returns:
+            Tuple: (total points, points per component)
+        """
+        breakdown = {name: evaluator(values) for name, evaluator in self.components}
+        total = self.zero
+        for points in breakdown.values():
+            total += points
+        return total, breakdown
+
+    def evaluate_columns(self, columns: Mapping[str, Sequence[Any]]) -> Dict[str, Any]:
+        """
+        Scores a whole table given as one value column per parameter
+
+        Args:
+            columns (Mapping[str, Sequence[Any]]): Value column per parameter
+
+        Returns:
+            Dict: "total" column and "components" mapping of point columns
+        """
+        missing = [name for name in self.parameters if name not in columns]
+        if missing:
+            raise ValueError(f"Missing parameter columns for {self.score_id}: {', '.join(missing)}")
+
+        lengths = {len(columns[name]) for name in self.parameters}
+        if len(lengths) > 1:
+            raise ValueError(f"Parameter columns for {self.score_id} differ in length")
+
+        component_columns = {name: evaluator(columns) for name, evaluator in self._column_evaluators}
+        totals = [self.zero] * lengths.pop()
+        for points in component_columns.values():
+            totals = [total + value for total, value in zip(totals, points)]
+
+        return {"total": totals, "components": component_columns}
+
+    def evaluate_batch(self, rows: Sequence[Mapping[str, Any]]) -> List[Any]:
+        """
+        Calculates the total score for many patients
+
+        Args:
+            rows (Sequence[Mapping[str, Any]]): One parameter mapping per patient
+
+        Returns:
+            List: Total points per patient, in input order
+        """
+        total = self.total
+        return [total(values) for values in rows]
+
+    def _compile_component(self, component: Mapping[str, Any]) -> Tuple[Evaluator, ColumnEvaluator]:
+        """Builds the scalar and the column evaluator closures of one component"""
+        name = component["name"]
+        zero = self.zero
+
+        if "when" in component or "any" in component:
+            points = component.get("points", 1)
+            if "when" in component:
+                conditions = [self._compile_condition(name, c) for c in _as_list(component["when"])]
+                test, column_test = _all_of(conditions)
+            else:
+                conditions = [self._compile_condition(name, c) for c in component["any"]]
+                test, column_test = _any_of(conditions)
+            return (
+                lambda values: points if test(values) else zero,
+                lambda columns: [points if hit else zero for hit in column_test(columns)]
+            )
+
+        parameter = component.get("parameter")
+        if not parameter:
+            raise ValueError(f"Component '{name}' of {self.score_id} needs a parameter")
+
+        if "map" in component:
+            mapping = dict(component["map"])
+            default = component.get("default", zero)
+            return (
+                lambda values: mapping.get(values[parameter], default),
+                lambda columns: [mapping.get(value, default) for value in columns[parameter]]
+            )
+
+        for band_operator, locate in (("ge", bisect_right), ("gt", bisect_left)):
+            if band_operator in component:
+                edges = list(component[band_operator])
+                points = list(component["points"])
+                if len(points) != len(edges) + 1:
+                    raise ValueError(
+                        f"Component '{name}' of {self.score_id} needs {len(edges) + 1} point values"
+                    )
+                if edges != sorted(edges):
+                    raise ValueError(f"Component '{name}' of {self.score_id} thresholds must be ascending")
+                return (
+                    lambda values: points[locate(edges, values[parameter])],
+                    lambda columns: [points[locate(edges, value)] for value in columns[parameter]]
+                )
+
+        if "per_unit" in component:
+            per_unit = component["per_unit"]
+            return (
+                lambda values: values[parameter] * per_unit,
+                lambda columns: [value * per_unit for value in columns[parameter]]
+            )
+
+        raise ValueError(f"Component '{name}' of {self.score_id} has no scoring rule")
+
+    def _compile_condition(self, name: str, condition: Mapping[str, Any]) -> Tuple[Predicate, ColumnPredicate]:
+        """Builds the scalar and the column predicate closures of one condition"""
+        parameter = condition.get("parameter")
+        checks = [(OPERATORS[key], value) for key, value in condition.items() if key in OPERATORS]
+        if not parameter or not checks:
+            raise ValueError(f"Component '{name}' of {self.score_id} has an invalid condition")
+
+        if len(checks) == 1:
+            compare, expected = checks[0]
+            return (
+                lambda values: compare(values[parameter], expected),
+                lambda columns: [compare(value, expected) for value in columns[parameter]]
+            )
+
+        def holds(value: Any) -> bool:
+            return all(compare(value, expected) for compare, expected in checks)
+
+        return (
+            lambda values: holds(values[parameter]),
+            lambda columns: [holds(value) for value in columns[parameter]]
+        )
+
+
+def _as_list(value: Any) -> List[Any]:
+    """Wraps a single condition in a list"""
+    return value if isinstance(value, list) else [value]
+
+
+def _all_of(conditions: List[Tuple[Predicate, ColumnPredicate]]) -> Tuple[Predicate, ColumnPredicate]:
+    """Combines scalar and column predicates with AND"""
+    if len(conditions) == 1:
+        return conditions[0]
+    tests = [test for test, _ in conditions]
+    column_tests = [column_test for _, column_test in conditions]
+    return (
+        lambda values: all(test(values) for test in tests),
+        lambda columns: [all(hits) for hits in zip(*(column_test(columns) for column_test in column_tests))]
+    )
+
+
+def _any_of(conditions: List[Tuple[Predicate, ColumnPredicate]]) -> Tuple[Predicate, ColumnPredicate]:
+    """Combines scalar and column predicates with OR"""
+    tests = [test for test, _ in conditions]
+    column_tests = [column_test for _, column_test in conditions]
+    return (
+        lambda values: any(test(values) for test in tests),
+        lambda columns: [any(hits) for hits in zip(*(column_test(columns) for column_test in column_tests))]
+    )
+
+
+def _component_parameters(component: Mapping[str, Any]) -> List[str]:
+    """Lists the parameters referenced by a component"""
+    if "when" in component:
+        return [condition["parameter"] for condition in _as_list(component["when"])]
+    if "any" in component:
+        return [condition["parameter"] for condition in component["any"]]
+    return [component["parameter"]]
+
+
+def _has_float_points(components: Sequence[Mapping[str, Any]]) -> bool:
+    """Checks whether any component awards fractional points"""
+    for component in components:
+        values = []
+        for key in ("points", "per_unit", "default"):
+            value = component.get(key)
+            values.extend(value if isinstance(value, list) else [value])
+        values.extend(component.get("map", {}).values())
+        if any(isinstance(value, float) for value in values):
+            return True
+    return False
+
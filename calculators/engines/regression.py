@@ -0,0 +1,263 @@
+"""
+Least-Squares Regression Engine
+
+Closed-form simple linear regression for trend-based scores (e.g. PSA
+doubling time from the slope of ln(PSA) over time), without SciPy.
+
+A fit is reduced to the running co-moments of its points (count, means,
+Sxx, Sxy, Syy), updated one point at a time with Welford's recurrences so
+that long or badly centred series keep their precision. Slope, intercept,
+R² and the slope standard error follow from the co-moments directly, and
+confidence intervals use a Student t quantile computed from the regularized
+incomplete beta function and cached per degrees of freedom.
+
+- fit_line: one series
+- fit_groups: many series given as flat columns with a group key per point,
+  fitted in a single pass
+- slope_interval: confidence interval of a fitted slope
+"""
+
+import math
+from functools import lru_cache
+from typing import Dict, Hashable, List, NamedTuple, Optional, Sequence, Tuple
+
+
+class LinearFit(NamedTuple):
+    """Result of a least-squares fit y = intercept + slope * x"""
+    n: int
+    slope: float
+    intercept: float
+    r_squared: float
+    slope_stderr: float
+
+
+def fit_line(xs: Sequence[float], ys: Sequence[float]) -> LinearFit:
+    """
+    Fits a straight line to one series
+
+    Args:
+        xs (Sequence[float]): Predictor values
+        ys (Sequence[float]): Response values
+
+    Returns:
+        LinearFit: Slope, intercept, R² and slope standard error
+
+    Raises:
+        ValueError: If the series are shorter than two points, differ in
+            length or all predictor values are equal
+    """
+    if len(xs) != len(ys):
+        raise ValueError("Predictor and response series must have the same length")
+
+    n = 0
+    mean_x = mean_y = sxx = sxy = syy = 0.0
+    for x, y in zip(xs, ys):
+        n += 1
+        dx = x - mean_x
+        dy = y - mean_y
+        mean_x += dx / n
+        mean_y += dy / n
+        sxx += dx * (x - mean_x)
+        sxy += dx * (y - mean_y)
+        syy += dy * (y - mean_y)
+
+    return _finish(n, mean_x, mean_y, sxx, sxy, syy)
+
+
+def fit_groups(groups: Sequence[Hashable], xs: Sequence[float], ys: Sequence[float],
+               errors: Optional[Dict[Hashable, str]] = None) -> Dict[Hashable, LinearFit]:
+    """
+    Fits one straight line per group from flat columns
+
+    Points of a group do not need to be contiguous; every group is fitted
+    from its own co-moments, accumulated in a single pass over the columns.
+
+    Args:
+        groups (Sequence[Hashable]): Group key per point (e.g. patient ID)
+        xs (Sequence[float]): Predictor value per point
+        ys (Sequence[float]): Response value per point
+        errors (Dict, optional): Receives the error message of each group that
+            cannot be fitted, instead of raising; such groups get no fit
+
+    Returns:
+        Dict[Hashable, LinearFit]: Fit per group, in order of first appearance
+
+    Raises:
+        ValueError: If the columns differ in length, or a group cannot be
+            fitted and no errors dict is given
+    """
+    if not len(groups) == len(xs) == len(ys):
+        raise ValueError("Group, predictor and response columns must have the same length")
+
+    index: Dict[Hashable, int] = {}
+    counts: List[int] = []
+    means_x: List[float] = []
+    means_y: List[float] = []
+    sums_xx: List[float] = []
+    sums_xy: List[float] = []
+    sums_yy: List[float] = []
+
+    for group, x, y in zip(groups, xs, ys):
+        position = index.get(group)
+        if position is None:
+            position = index[group] = len(counts)
+            counts.append(0)
+            means_x.append(0.0)
+            means_y.append(0.0)
+            sums_xx.append(0.0)
+            sums_xy.append(0.0)
+            sums_yy.append(0.0)
+
+        n = counts[position] = counts[position] + 1
+        mean_x = means_x[position]
+        mean_y = means_y[position]
+        dx = x - mean_x
+        dy = y - mean_y
+        mean_x += dx / n
+        mean_y += dy / n
+        means_x[position] = mean_x
+        means_y[position] = mean_y
+        sums_xx[position] += dx * (x - mean_x)
+        sums_xy[position] += dx * (y - mean_y)
+        sums_yy[position] += dy * (y - mean_y)
+
+    fits = {}
+    for group, position in index.items():
+        try:
+            fits[group] = _finish(counts[position], means_x[position], means_y[position],
+                                  sums_xx[position], sums_xy[position], sums_yy[position])
+        except ValueError as e:
+            if errors is None:
+                raise ValueError(f"Group {group!r}: {e}")
+            errors[group] = str(e)
+    return fits
+
+
+def slope_interval(fit: LinearFit, confidence: float = 0.95) -> Optional[Tuple[float, float]]:
+    """
+    Calculates the two-sided confidence interval of a fitted slope
+
+    Args:
+        fit (LinearFit): Fitted line
+        confidence (float): Confidence level between 0 and 1
+
+    Returns:
+        Optional[Tuple[float, float]]: (lower, upper), or None for fits with
+        fewer than three points (no residual degrees of freedom)
+    """
+    if fit.n < 3:
+        return None
+    margin = t_quantile(0.5 + confidence / 2.0, fit.n - 2) * fit.slope_stderr
+    return fit.slope - margin, fit.slope + margin
+
+
+@lru_cache(maxsize=256)
+def t_quantile(probability: float, df: int) -> float:
+    """
+    Inverse cumulative distribution function of Student's t distribution
+
+    Args:
+        probability (float): Cumulative probability between 0 and 1
+        df (int): Degrees of freedom
+
+    Returns:
+        float: Quantile
+    """
+    if not 0.0 < probability < 1.0:
+        raise ValueError("Probability must lie strictly between 0 and 1")
+    if df < 1:
+        raise ValueError("Degrees of freedom must be at least 1")
+    if probability < 0.5:
+        return -t_quantile(1.0 - probability, df)
+    if probability == 0.5:
+        return 0.0
+
+    upper = 1.0
+    while _t_cdf(upper, df) < probability:
+        upper *= 2.0
+    lower = 0.0
+    # The CDF is monotonic, so bisection converges to full double precision
+    for _ in range(200):
+        middle = (lower + upper) / 2.0
+        if middle in (lower, upper):
+            break
+        if _t_cdf(middle, df) < probability:
+            lower = middle
+        else:
+            upper = middle
+    return (lower + upper) / 2.0
+
+
+def _finish(n: int, mean_x: float, mean_y: float, sxx: float, sxy: float, syy: float) -> LinearFit:
+    """Derives the fitted line from the co-moments of a series"""
+    if n < 2:
+        raise ValueError("At least two points are required for a fit")
+    if sxx <= 0.0:
+        raise ValueError("Predictor values must not all be equal")
+
+    slope = sxy / sxx
+    intercept = mean_y - slope * mean_x
+
+    if syy <= 0.0:
+        # Constant response: the correlation is undefined, reported as 0
+        r_squared = 0.0
+    else:
+        r_squared = min(sxy * sxy / (sxx * syy), 1.0)
+
+    if n > 2:
+        residual = max(syy - slope * sxy, 0.0)
+        slope_stderr = math.sqrt(residual / (n - 2) / sxx)
+    else:
+        slope_stderr = 0.0
+
+    return LinearFit(n, slope, intercept, r_squared, slope_stderr)
+
+
+def _t_cdf(t: float, df: int) -> float:
+    """Cumulative distribution function of Student's t distribution for t >= 0"""
+    return 1.0 - 0.5 * _regularized_beta(df / (df + t * t), df / 2.0, 0.5)
+
+
+def _regularized_beta(x: float, a: float, b: float) -> float:
+    """Regularized incomplete beta function I_x(a, b)"""
+    if x <= 0.0:
+        return 0.0
+    if x >= 1.0:
+        return 1.0
+
+    log_front = (math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b)
+                 + a * math.log(x) + b * math.log1p(-x))
+    # The continued fraction converges quickly on this side of the mode
+    if x < (a + 1.0) / (a + b + 2.0):
+        return math.exp(log_front) * _beta_fraction(x, a, b) / a
+    return 1.0 - math.exp(log_front) * _beta_fraction(1.0 - x, b, a) / b
+
+
+def _beta_fraction(x: float, a: float, b: float) -> float:
+    """Continued fraction of the incomplete beta function (modified Lentz)"""
+    tiny = 1e-300
+    c = 1.0
+    d = 1.0 - (a + b) * x / (a + 1.0)
+    d = 1.0 / (d if abs(d) > tiny else tiny)
+    fraction = d
+
+    for m in range(1, 301):
+        m2 = 2 * m
+        numerator = m * (b - m) * x / ((a + m2 - 1.0) * (a + m2))
+        d = 1.0 + numerator * d
+        d = 1.0 / (d if abs(d) > tiny else tiny)
+        c = 1.0 + numerator / c
+        c = c if abs(c) > tiny else tiny
+        fraction *= d * c
+
+        numerator = -(a + m) * (a + b + m) * x / ((a + m2) * (a + m2 + 1.0))
+        d = 1.0 + numerator * d
+        d = 1.0 / (d if abs(d) > tiny else tiny)
+        c = 1.0 + numerator / c
+        c = c if abs(c) > tiny else tiny
+        delta = d * c
+        fraction *= delta
+        if abs(delta - 1.0) < 1e-15:
+            break
+
+    return fraction
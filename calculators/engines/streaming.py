@@ -0,0 +1,302 @@
+"""
+Streaming Score Engine
+
+Follows early warning scores over a feed of raw vital-sign events. Each score
+is declared as a set of components, each depending on one or more raw vitals,
+plus a tier function mapping the aggregate to an escalation tier.
+
+Per patient the engine keeps the last value of every vital and the points of
+every component in a compact state record. An event re-scores only the
+components whose inputs changed, updates the running total incrementally and
+emits a change event only when the aggregate score or the escalation tier
+changes, so one process can follow a whole ward's vitals feed.
+"""
+
+from array import array
+from bisect import bisect_left
+from typing import Any, Callable, Dict, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+
+# Marker for components that have not been scored yet
+UNSCORED = -1
+
+
+class StreamComponent(NamedTuple):
+    """One score component computed from raw vitals"""
+    name: str
+    inputs: Tuple[str, ...]
+    score: Callable[..., int]
+
+
+class Bands:
+    """Maps a raw measurement to a category label by inclusive upper bounds"""
+
+    def __init__(self, upper_bounds: Sequence[float], labels: Sequence[str]):
+        """
+        Args:
+            upper_bounds (Sequence[float]): Inclusive upper bound of each band
+            labels (Sequence[str]): Band labels, one more than upper bounds
+
+        Raises:
+            ValueError: If the number of labels does not match the bounds
+        """
+        if len(labels) != len(upper_bounds) + 1:
+            raise ValueError("Bands need exactly one more label than upper bounds")
+        self.upper_bounds = tuple(upper_bounds)
+        self.labels = tuple(labels)
+
+    def __call__(self, value: float) -> str:
+        check_numeric(value)
+        return self.labels[bisect_left(self.upper_bounds, value)]
+
+
+def numeric(score: Callable[..., int]) -> Callable[..., int]:
+    """
+    Wraps a component scorer so that non-numeric readings raise a ValueError
+
+    Args:
+        score (Callable): Scorer taking raw numeric measurements
+
+    Returns:
+        Callable: Validating scorer
+    """
+    def scorer(*values):
+        for value in values:
+            check_numeric(value)
+        return score(*values)
+    return scorer
+
+
+def check_numeric(value: Any):
+    """
+    Rejects readings that are not numbers
+
+    Raises:
+        ValueError: If the value is not an int or float
+    """
+    if not isinstance(value, (int, float)) or isinstance(value, bool):
+        raise ValueError(f"Expected a numeric measurement, got {value!r}")
+
+
+class StreamingScore:
+    """Declarative definition of a streamable score"""
+
+    def __init__(self, score_id: str, components: Sequence[StreamComponent],
+                 tier: Callable[[int, Sequence[int]], str]):
+        """
+        Args:
+            score_id (str): ID of the score
+            components (Sequence[StreamComponent]): Score components
+            tier (Callable): Maps (total, component points) to an escalation tier
+        """
+        self.score_id = score_id
+        self.components: Tuple[StreamComponent, ...] = tuple(components)
+        self.component_names: Tuple[str, ...] = tuple(component.name for component in self.components)
+        self.tier = tier
+
+        dependents: Dict[str, List[int]] = {}
+        for index, component in enumerate(self.components):
+            for name in component.inputs:
+                dependents.setdefault(name, []).append(index)
+
+        self.inputs: Tuple[str, ...] = tuple(dependents)
+        self._dependents: Dict[str, Tuple[int, ...]] = {
+            name: tuple(indexes) for name, indexes in dependents.items()
+        }
+
+    def dependents(self, vital: str) -> Tuple[int, ...]:
+        """Returns the indexes of the components that read a vital"""
+        return self._dependents.get(vital, ())
+
+
+class PatientState:
+    """Compact per-patient state: last vitals, component points and aggregate"""
+
+    __slots__ = ("values", "points", "unscored", "total", "tier")
+
+    def __init__(self, components: int):
+        self.values: Dict[str, Any] = {}
+        self.points = array('b', [UNSCORED] * components)
+        self.unscored = components
+        self.total = 0
+        self.tier: Optional[str] = None
+
+
+class PendingUpdate(NamedTuple):
+    """Validated vital-sign event for one patient, scored but not yet applied"""
+    patient_id: str
+    changed: Dict[str, Any]
+    rescored: Tuple[Tuple[int, int], ...]
+
+
+class ScoreStream:
+    """Incremental scorer for one streaming score over many patients"""
+
+    def __init__(self, score: StreamingScore):
+        """
+        Args:
+            score (StreamingScore): Score definition to follow
+        """
+        self.score = score
+        self._patients: Dict[str, PatientState] = {}
+
+    def __len__(self) -> int:
+        return len(self._patients)
+
+    def update(self, patient_id: str, vitals: Mapping[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Applies a vital-sign event for one patient
+
+        Args:
+            patient_id (str): Patient identifier
+            vitals (Mapping[str, Any]): New raw values of one or more vitals
+
+        Returns:
+            Optional[Dict]: Change event when the score or tier changed, else None
+
+        Raises:
+            ValueError: If a vital is unknown to the score or a value is invalid
+        """
+        return self.commit(self.prepare(patient_id, vitals))
+
+    def prepare(self, patient_id: str, vitals: Mapping[str, Any]) -> Optional["PendingUpdate"]:
+        """
+        Validates a vital-sign event and scores the affected components
+        without changing the patient's state
+
+        Lets a caller update several scores from one event all or nothing:
+        prepare every stream first, then commit them.
+
+        Args:
+            patient_id (str): Patient identifier
+            vitals (Mapping[str, Any]): New raw values of one or more vitals
+
+        Returns:
+            Optional[PendingUpdate]: Update to commit, or None if no vital changed
+
+        Raises:
+            ValueError: If a vital is unknown to the score or a value is invalid
+        """
+        score = self.score
+        unknown = [name for name in vitals if not score.dependents(name)]
+        if unknown:
+            raise ValueError(f"Unknown vitals for {score.score_id}: {', '.join(unknown)}")
+
+        state = self._patients.get(patient_id)
+        values = state.values if state is not None else {}
+        changed = {name: value for name, value in vitals.items()
+                   if name not in values or values[name] != value}
+        if not changed:
+            return None
+
+        # Re-score only the components reading a changed vital
+        merged = {**values, **changed}
+        dirty = sorted({index for name in changed for index in score.dependents(name)})
+        rescored: List[Tuple[int, int]] = []
+        for index in dirty:
+            component = score.components[index]
+            if all(name in merged for name in component.inputs):
+                try:
+                    points = component.score(*(merged[name] for name in component.inputs))
+                except (KeyError, TypeError) as e:
+                    raise ValueError(f"Invalid value for {component.name} in {score.score_id}: {e}")
+                rescored.append((index, points))
+
+        return PendingUpdate(patient_id, changed, tuple(rescored))
+
+    def commit(self, update: Optional["PendingUpdate"]) -> Optional[Dict[str, Any]]:
+        """
+        Applies an update returned by prepare()
+
+        Must be called before any other update of the same patient in this
+        stream; it does not fail.
+
+        Args:
+            update (PendingUpdate, optional): Prepared update (None is a no-op)
+
+        Returns:
+            Optional[Dict]: Change event when the score or tier changed, else None
+        """
+        if update is None:
+            return None
+
+        score = self.score
+        patient_id = update.patient_id
+        state = self._patients.get(patient_id)
+        if state is None:
+            state = self._patients[patient_id] = PatientState(len(score.components))
+
+        previous_total = state.total if not state.unscored else None
+        previous_tier = state.tier
+
+        state.values.update(update.changed)
+        moved = False
+        for index, points in update.rescored:
+            previous = state.points[index]
+            if previous == points:
+                continue
+            moved = True
+            if previous == UNSCORED:
+                state.unscored -= 1
+                state.total += points
+            else:
+                state.total += points - previous
+            state.points[index] = points
+
+        # The score is only defined once every component has been observed;
+        # a vital change that stays within its band leaves everything as is
+        if state.unscored or not moved:
+            return None
+
+        state.tier = score.tier(state.total, state.points)
+        if state.total == previous_total and state.tier == previous_tier:
+            return None
+
+        return {
+            "score_id": score.score_id,
+            "patient_id": patient_id,
+            "score": state.total,
+            "tier": state.tier,
+            "previous_score": previous_total,
+            "previous_tier": previous_tier,
+            "components": dict(zip(score.component_names, state.points))
+        }
+
+    def state(self, patient_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Returns the current state of a patient
+
+        Args:
+            patient_id (str): Patient identifier
+
+        Returns:
+            Optional[Dict]: Last vitals, component points, score and tier, or
+            None if the patient is not followed
+        """
+        state = self._patients.get(patient_id)
+        if state is None:
+            return None
+
+        return {
+            "score_id": self.score.score_id,
+            "patient_id": patient_id,
+            "score": None if state.unscored else state.total,
+            "tier": state.tier,
+            "vitals": dict(state.values),
+            "components": {
+                name: (None if points == UNSCORED else points)
+                for name, points in zip(self.score.component_names, state.points)
+            }
+        }
+
+    def discharge(self, patient_id: str) -> bool:
+        """
+        Stops following a patient and drops its state
+
+        Args:
+            patient_id (str): Patient identifier
+
+        Returns:
+            bool: True if the patient was followed
+        """
+        return self._patients.pop(patient_id, None) is not None
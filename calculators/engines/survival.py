@@ -0,0 +1,189 @@
+"""
+Survival Model Kernel
+
+Reusable kernel for proportional-hazards risk equations of the form
+
+    risk(t) = 1 - S0(t) ^ exp(intercept + Σ β_i (x_i - mean_i))
+
+Coefficients, means and baseline survivals are declared as data and compiled
+once into flat tuples. A compiled model is then evaluated for one feature
+vector or for a batch of vectors, returning every horizon (e.g. KFRE 2- and
+5-year risk) from a single pass over the linear predictors.
+
+Models whose horizons share one set of coefficients (KFRE, SCORE2) compute
+the linear predictor once per patient; models with a separate equation per
+horizon (GARFIELD-AF) declare one coefficient mapping per horizon.
+"""
+
+import math
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+
+Coefficients = Mapping[str, float]
+
+
+class SurvivalModel:
+    """Compiled proportional-hazards model evaluated at one or more horizons"""
+
+    def __init__(self, features: Sequence[str],
+                 coefficients: Union[Coefficients, Mapping[str, Coefficients]],
+                 baseline_survival: Mapping[str, float],
+                 means: Optional[Mapping[str, float]] = None,
+                 intercept: Union[float, Mapping[str, float]] = 0.0):
+        """
+        Compiles the model definition
+
+        Args:
+            features (Sequence[str]): Ordered feature names of the input vector
+            coefficients: β per feature, shared by all horizons, or a mapping
+                horizon -> (β per feature) when each horizon has its own equation
+            baseline_survival (Mapping[str, float]): S0(t) per horizon
+            means (Mapping[str, float], optional): Centering value per feature
+            intercept: Constant term, shared or per horizon
+
+        Raises:
+            ValueError: If the definition is inconsistent
+        """
+        self.features: Tuple[str, ...] = tuple(features)
+        self.horizons: Tuple[str, ...] = tuple(baseline_survival)
+
+        if not self.horizons:
+            raise ValueError("At least one baseline survival horizon is required")
+
+        means = means or {}
+        unknown = set(means) - set(self.features)
+        if unknown:
+            raise ValueError(f"Means declared for unknown features: {', '.join(sorted(unknown))}")
+
+        per_horizon = all(isinstance(value, Mapping) for value in coefficients.values())
+
+        # Each distinct equation becomes one row: (offset, betas)
+        self._rows: List[Tuple[float, Tuple[float, ...]]] = []
+        row_index: Dict[Tuple[float, Tuple[float, ...]], int] = {}
+        horizon_rows: List[Tuple[str, int, float]] = []
+
+        for horizon in self.horizons:
+            survival = baseline_survival[horizon]
+            if not 0 < survival < 1:
+                raise ValueError(f"Baseline survival for '{horizon}' must be between 0 and 1")
+
+            if per_horizon:
+                if horizon not in coefficients:
+                    raise ValueError(f"Missing coefficients for horizon '{horizon}'")
+                horizon_coefficients = coefficients[horizon]
+            else:
+                horizon_coefficients = coefficients
+
+            unknown = set(horizon_coefficients) - set(self.features)
+            if unknown:
+                raise ValueError(f"Coefficients declared for unknown features: {', '.join(sorted(unknown))}")
+
+            betas = tuple(float(horizon_coefficients.get(name, 0.0)) for name in self.features)
+            constant = intercept[horizon] if isinstance(intercept, Mapping) else intercept
+            offset = float(constant) - sum(
+                beta * means.get(name, 0.0) for name, beta in zip(self.features, betas)
+            )
+
+            key = (offset, betas)
+            if key not in row_index:
+                row_index[key] = len(self._rows)
+                self._rows.append(key)
+
+            # Store ln S0(t) so that risk = -expm1(ln S0 * exp(lp))
+            horizon_rows.append((horizon, row_index[key], math.log(survival)))
+
+        self._horizon_rows = tuple(horizon_rows)
+
+    def vector(self, values: Mapping[str, float]) -> Tuple[float, ...]:
+        """
+        Orders a feature mapping into the model's input vector
+
+        Args:
+            values (Mapping[str, float]): Value per feature name
+
+        Returns:
+            Tuple[float, ...]: Feature vector in model order
+        """
+        try:
+            return tuple(values[name] for name in self.features)
+        except KeyError as e:
+            raise ValueError(f"Missing feature {e} for survival model")
+
+    def linear_predictors(self, x: Sequence[float]) -> Tuple[float, ...]:
+        """
+        Calculates the linear predictor of each distinct equation
+
+        Args:
+            x (Sequence[float]): Feature vector in model order
+
+        Returns:
+            Tuple[float, ...]: One linear predictor per compiled equation
+        """
+        return tuple(
+            offset + sum(beta * value for beta, value in zip(betas, x))
+            for offset, betas in self._rows
+        )
+
+    def predict(self, x: Union[Sequence[float], Mapping[str, float]]) -> Dict[str, float]:
+        """
+        Calculates the absolute risk (0-1) at every horizon for one patient
+
+        Args:
+            x: Feature vector in model order or a mapping of feature values
+
+        Returns:
+            Dict[str, float]: Risk per horizon
+        """
+        if isinstance(x, Mapping):
+            x = self.vector(x)
+
+        hazards = [math.exp(lp) for lp in self.linear_predictors(x)]
+
+        return {
+            horizon: -math.expm1(log_survival * hazards[row])
+            for horizon, row, log_survival in self._horizon_rows
+        }
+
+    def predict_batch(self, rows: Sequence[Sequence[float]]) -> Dict[str, List[float]]:
+        """
+        Calculates the absolute risk (0-1) at every horizon for many patients
+
+        Args:
+            rows (Sequence[Sequence[float]]): One feature vector per patient
+
+        Returns:
+            Dict[str, List[float]]: Risk column per horizon, in input order
+        """
+        exp = math.exp
+        expm1 = math.expm1
+        equations = self._rows
+        horizon_rows = self._horizon_rows
+
+        results: Dict[str, List[float]] = {horizon: [] for horizon in self.horizons}
+        appenders = [(results[horizon].append, row, log_survival)
+                     for horizon, row, log_survival in horizon_rows]
+
+        for x in rows:
+            hazards = [exp(offset + sum(beta * value for beta, value in zip(betas, x)))
+                       for offset, betas in equations]
+            for append, row, log_survival in appenders:
+                append(-expm1(log_survival * hazards[row]))
+
+        return results
+
+    def predict_columns(self, columns: Mapping[str, Sequence[float]]) -> Dict[str, List[float]]:
+        """
+        Calculates risks from columnar input (one sequence per feature)
+
+        Args:
+            columns (Mapping[str, Sequence[float]]): Value column per feature
+
+        Returns:
+            Dict[str, List[float]]: Risk column per horizon, in input order
+        """
+        try:
+            ordered = [columns[name] for name in self.features]
+        except KeyError as e:
+            raise ValueError(f"Missing feature column {e} for survival model")
+
+        return self.predict_batch(list(zip(*ordered)))
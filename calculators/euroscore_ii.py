@@ -15,85 +15,154 @@ References:
    2012 Dec;98(21):1568-72. doi: 10.1136/heartjnl-2012-302483.
 """
 
-import math
-from typing import Dict, Any
+from typing import Dict, Any, List, Mapping, Sequence
+
+from calculators.engines.logistic import LogisticModel
+
+
+# Logistic regression constant
+CONSTANT = -5.324537
+
+# Patient-related factors coefficients
+COEFFICIENTS = {
+    # Age: increases by 1 point per year after 60
+    "age": 0.0285181,
+    
+    # Sex
+    "female": 0.2196434,
+    
+    # Insulin-dependent diabetes
+    "insulin_dependent_diabetes": 0.3542749,
+    
+    # Chronic pulmonary dysfunction
+    "chronic_pulmonary_dysfunction": 0.1886564,
+    
+    # Neurological/musculoskeletal mobility dysfunction
+    "mobility_dysfunction": 0.2407181,
+    
+    # Renal dysfunction (creatinine clearance)
+    "creatinine_clearance_51_to_85": 0.303553,
+    "creatinine_clearance_50_or_less": 0.8592256,
+    "on_dialysis": 0.6421508,
+    
+    # Critical preoperative state
+    "critical_preoperative_state": 1.086517,
+    
+    # Cardiac-related factors
+    # NYHA Class
+    "nyha_class_2": 0.1070545,
+    "nyha_class_3": 0.2958358,
+    "nyha_class_4": 0.5597929,
+    
+    # CCS Class 4 angina
+    "ccs_class_4": 0.2226147,
+    
+    # Extracardiac arteriopathy
+    "extracardiac_arteriopathy": 0.5360268,
+    
+    # Previous cardiac surgery
+    "previous_cardiac_surgery": 1.118599,
+    
+    # Active endocarditis
+    "active_endocarditis": 0.6194522,
+    
+    # Left ventricular function
+    "lv_function_moderate": 0.3150652,
+    "lv_function_poor": 0.8084096,
+    "lv_function_very_poor": 0.9346919,
+    
+    # Recent MI ≤90 days
+    "recent_mi": 0.1528943,
+    
+    # Pulmonary hypertension
+    "pulmonary_hypertension": 0.1788899,
+    
+    # Operation-related factors
+    # Urgency
+    "urgent": 0.3174673,
+    "emergency": 0.7039121,
+    "salvage": 1.362947,
+    
+    # Weight of intervention
+    "two_procedures": 0.5521478,
+    "three_or_more_procedures": 0.9724533,
+    
+    # Surgery on thoracic aorta
+    "surgery_on_thoracic_aorta": 0.6527205
+}
+
+# Parameters in the order expected by calculate()
+PARAMETERS = (
+    "age_years", "sex", "insulin_dependent_diabetes", "chronic_pulmonary_dysfunction",
+    "mobility_dysfunction", "creatinine_clearance", "critical_preoperative_state",
+    "nyha_class", "ccs_class_4", "extracardiac_arteriopathy", "previous_cardiac_surgery",
+    "active_endocarditis", "left_ventricular_function", "recent_mi",
+    "pulmonary_hypertension", "urgency", "weight_of_intervention", "surgery_on_thoracic_aorta"
+)
+
+YES_NO_FACTORS = (
+    "insulin_dependent_diabetes",
+    "chronic_pulmonary_dysfunction",
+    "mobility_dysfunction",
+    "critical_preoperative_state",
+    "ccs_class_4",
+    "extracardiac_arteriopathy",
+    "previous_cardiac_surgery",
+    "active_endocarditis",
+    "recent_mi",
+    "pulmonary_hypertension",
+    "surgery_on_thoracic_aorta"
+)
+
+# Compiled model: age above 60 is numeric, every other factor is one-hot
+# encoded with its reference level carrying a zero coefficient
+MODEL = LogisticModel(
+    intercept=CONSTANT,
+    numeric={"age_over_60": COEFFICIENTS["age"]},
+    categorical={
+        "sex": {"male": 0.0, "female": COEFFICIENTS["female"]},
+        "creatinine_clearance": {
+            "greater_than_85": 0.0,
+            "51_to_85": COEFFICIENTS["creatinine_clearance_51_to_85"],
+            "50_or_less": COEFFICIENTS["creatinine_clearance_50_or_less"],
+            "on_dialysis": COEFFICIENTS["on_dialysis"]
+        },
+        "nyha_class": {
+            "class_1": 0.0,
+            "class_2": COEFFICIENTS["nyha_class_2"],
+            "class_3": COEFFICIENTS["nyha_class_3"],
+            "class_4": COEFFICIENTS["nyha_class_4"]
+        },
+        "left_ventricular_function": {
+            "good_51_or_more": 0.0,
+            "moderate_31_to_50": COEFFICIENTS["lv_function_moderate"],
+            "poor_21_to_30": COEFFICIENTS["lv_function_poor"],
+            "very_poor_20_or_less": COEFFICIENTS["lv_function_very_poor"]
+        },
+        "urgency": {
+            "elective": 0.0,
+            "urgent": COEFFICIENTS["urgent"],
+            "emergency": COEFFICIENTS["emergency"],
+            "salvage": COEFFICIENTS["salvage"]
+        },
+        "weight_of_intervention": {
+            "single_non_cabg": 0.0,
+            "two_procedures": COEFFICIENTS["two_procedures"],
+            "three_or_more_procedures": COEFFICIENTS["three_or_more_procedures"]
+        },
+        **{factor: {"no": 0.0, "yes": COEFFICIENTS[factor]} for factor in YES_NO_FACTORS}
+    }
+)
 
 
 class EuroScoreIICalculator:
     """Calculator for European System for Cardiac Operative Risk Evaluation (EuroSCORE) II"""
     
     def __init__(self):
-        """Initialize calculator with logistic regression coefficients"""
-        # Logistic regression constant
-        self.CONSTANT = -5.324537
-        
-        # Patient-related factors coefficients
-        self.COEFFICIENTS = {
-            # Age: increases by 1 point per year after 60
-            "age": 0.0285181,
-            
-            # Sex
-            "female": 0.2196434,
-            
-            # Insulin-dependent diabetes
-            "insulin_dependent_diabetes": 0.3542749,
-            
-            # Chronic pulmonary dysfunction
-            "chronic_pulmonary_dysfunction": 0.1886564,
-            
-            # Neurological/musculoskeletal mobility dysfunction
-            "mobility_dysfunction": 0.2407181,
-            
-            # Renal dysfunction (creatinine clearance)
-            "creatinine_clearance_51_to_85": 0.303553,
-            "creatinine_clearance_50_or_less": 0.8592256,
-            "on_dialysis": 0.6421508,
-            
-            # Critical preoperative state
-            "critical_preoperative_state": 1.086517,
-            
-            # Cardiac-related factors
-            # NYHA Class
-            "nyha_class_2": 0.1070545,
-            "nyha_class_3": 0.2958358,
-            "nyha_class_4": 0.5597929,
-            
-            # CCS Class 4 angina
-            "ccs_class_4": 0.2226147,
-            
-            # Extracardiac arteriopathy
-            "extracardiac_arteriopathy": 0.5360268,
-            
-            # Previous cardiac surgery
-            "previous_cardiac_surgery": 1.118599,
-            
-            # Active endocarditis
-            "active_endocarditis": 0.6194522,
-            
-            # Left ventricular function
-            "lv_function_moderate": 0.3150652,
-            "lv_function_poor": 0.8084096,
-            "lv_function_very_poor": 0.9346919,
-            
-            # Recent MI ≤90 days
-            "recent_mi": 0.1528943,
-            
-            # Pulmonary hypertension
-            "pulmonary_hypertension": 0.1788899,
-            
-            # Operation-related factors
-            # Urgency
-            "urgent": 0.3174673,
-            "emergency": 0.7039121,
-            "salvage": 1.362947,
-            
-            # Weight of intervention
-            "two_procedures": 0.5521478,
-            "three_or_more_procedures": 0.9724533,
-            
-            # Surgery on thoracic aorta
-            "surgery_on_thoracic_aorta": 0.6527205
-        }
+        """Initialize calculator with the compiled logistic regression model"""
+        self.CONSTANT = CONSTANT
+        self.COEFFICIENTS = COEFFICIENTS
+        self.model = MODEL
     
     def calculate(self, age_years: int, sex: str, insulin_dependent_diabetes: str,
                  chronic_pulmonary_dysfunction: str, mobility_dysfunction: str,
@@ -162,6 +231,26 @@ class EuroScoreIICalculator:
             "logistic_score": round(y_value, 4)
         }
     
+    def calculate_batch(self, patients: Sequence[Mapping[str, Any]]) -> List[float]:
+        """
+        Calculates predicted mortality for many patients (e.g. an OR schedule)
+        
+        Args:
+            patients: One mapping per patient with the same keys as calculate()
+            
+        Returns:
+            List[float]: Predicted mortality percentage per patient, in input order
+        """
+        
+        rows = []
+        for patient in patients:
+            self._validate_inputs(*(patient[name] for name in PARAMETERS))
+            row = dict(patient)
+            row["age_over_60"] = max(patient["age_years"] - 60, 0)
+            rows.append(row)
+        
+        return [round(risk * 100, 2) for risk in self.model.predict_batch(rows)]
+    
     def _validate_inputs(self, *args):
         """Validates input parameters"""
         # Basic validation - in a full implementation, would validate each parameter
@@ -204,88 +293,26 @@ class EuroScoreIICalculator:
             float: Logistic score for mortality calculation
         """
         
-        y = self.CONSTANT
-        
-        # Age contribution (increases per year after 60)
-        if age_years > 60:
-            y += self.COEFFICIENTS["age"] * (age_years - 60)
-        
-        # Sex
-        if sex == "female":
-            y += self.COEFFICIENTS["female"]
-        
-        # Patient factors
-        if insulin_dependent_diabetes == "yes":
-            y += self.COEFFICIENTS["insulin_dependent_diabetes"]
-        
-        if chronic_pulmonary_dysfunction == "yes":
-            y += self.COEFFICIENTS["chronic_pulmonary_dysfunction"]
-        
-        if mobility_dysfunction == "yes":
-            y += self.COEFFICIENTS["mobility_dysfunction"]
-        
-        # Creatinine clearance
-        if creatinine_clearance == "51_to_85":
-            y += self.COEFFICIENTS["creatinine_clearance_51_to_85"]
-        elif creatinine_clearance == "50_or_less":
-            y += self.COEFFICIENTS["creatinine_clearance_50_or_less"]
-        elif creatinine_clearance == "on_dialysis":
-            y += self.COEFFICIENTS["on_dialysis"]
-        
-        if critical_preoperative_state == "yes":
-            y += self.COEFFICIENTS["critical_preoperative_state"]
-        
-        # Cardiac factors
-        if nyha_class == "class_2":
-            y += self.COEFFICIENTS["nyha_class_2"]
-        elif nyha_class == "class_3":
-            y += self.COEFFICIENTS["nyha_class_3"]
-        elif nyha_class == "class_4":
-            y += self.COEFFICIENTS["nyha_class_4"]
-        
-        if ccs_class_4 == "yes":
-            y += self.COEFFICIENTS["ccs_class_4"]
-        
-        if extracardiac_arteriopathy == "yes":
-            y += self.COEFFICIENTS["extracardiac_arteriopathy"]
-        
-        if previous_cardiac_surgery == "yes":
-            y += self.COEFFICIENTS["previous_cardiac_surgery"]
-        
-        if active_endocarditis == "yes":
-            y += self.COEFFICIENTS["active_endocarditis"]
-        
-        # Left ventricular function
-        if left_ventricular_function == "moderate_31_to_50":
-            y += self.COEFFICIENTS["lv_function_moderate"]
-        elif left_ventricular_function == "poor_21_to_30":
-            y += self.COEFFICIENTS["lv_function_poor"]
-        elif left_ventricular_function == "very_poor_20_or_less":
-            y += self.COEFFICIENTS["lv_function_very_poor"]
-        
-        if recent_mi == "yes":
-            y += self.COEFFICIENTS["recent_mi"]
-        
-        if pulmonary_hypertension == "yes":
-            y += self.COEFFICIENTS["pulmonary_hypertension"]
-        
-        # Operation factors
-        if urgency == "urgent":
-            y += self.COEFFICIENTS["urgent"]
-        elif urgency == "emergency":
-            y += self.COEFFICIENTS["emergency"]
-        elif urgency == "salvage":
-            y += self.COEFFICIENTS["salvage"]
-        
-        if weight_of_intervention == "two_procedures":
-            y += self.COEFFICIENTS["two_procedures"]
-        elif weight_of_intervention == "three_or_more_procedures":
-            y += self.COEFFICIENTS["three_or_more_procedures"]
-        
-        if surgery_on_thoracic_aorta == "yes":
-            y += self.COEFFICIENTS["surgery_on_thoracic_aorta"]
-        
-        return y
+        return self.model.linear_predictor({
+            "age_over_60": max(age_years - 60, 0),
+            "sex": sex,
+            "insulin_dependent_diabetes": insulin_dependent_diabetes,
+            "chronic_pulmonary_dysfunction": chronic_pulmonary_dysfunction,
+            "mobility_dysfunction": mobility_dysfunction,
+            "creatinine_clearance": creatinine_clearance,
+            "critical_preoperative_state": critical_preoperative_state,
+            "nyha_class": nyha_class,
+            "ccs_class_4": ccs_class_4,
+            "extracardiac_arteriopathy": extracardiac_arteriopathy,
+            "previous_cardiac_surgery": previous_cardiac_surgery,
+            "active_endocarditis": active_endocarditis,
+            "left_ventricular_function": left_ventricular_function,
+            "recent_mi": recent_mi,
+            "pulmonary_hypertension": pulmonary_hypertension,
+            "urgency": urgency,
+            "weight_of_intervention": weight_of_intervention,
+            "surgery_on_thoracic_aorta": surgery_on_thoracic_aorta
+        })
     
     def _calculate_mortality_percentage(self, y_value: float) -> float:
         """
@@ -299,16 +326,7 @@ class EuroScoreIICalculator:
         """
         
         # Logistic regression formula: P = e^y / (1 + e^y)
-        try:
-            exp_y = math.exp(y_value)
-            probability = exp_y / (1 + exp_y)
-            return probability * 100
-        except OverflowError:
-            # Handle extreme values
-            if y_value > 0:
-                return 99.99
-            else:
-                return 0.01
+        return self.model.probability(y_value) * 100
     
     def _get_risk_category(self, mortality_percentage: float) -> str:
         """
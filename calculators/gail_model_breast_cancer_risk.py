@@ -13,92 +13,158 @@ References:
 3. Matsuno RK, Costantino JP, Ziegler RG, et al. Projecting individualized absolute 
    invasive breast cancer risk in Asian and Pacific Islander American women. 
    J Natl Cancer Inst. 2011;103(12):951-61. doi: 10.1093/jnci/djr154.
+4. Gail MH, Costantino JP, Pee D, et al. Projecting individualized absolute invasive 
+   breast cancer risk in African American women. J Natl Cancer Inst. 
+   2007;99(23):1782-92. doi: 10.1093/jnci/djm223.
 
-Note: This is a simplified implementation using representative relative risk values 
-from the literature. The exact NCI Gail Model uses complex race-specific coefficients 
-and competing hazards calculations that are proprietary.
+Absolute risk follows the NCI Breast Cancer Risk Assessment Tool (BCRAT):
+the individual relative risk scales the attributable-risk-adjusted baseline
+incidence of each 5-year age interval, and the projection integrates
+incidence against competing mortality from other causes, giving the 5-year
+risk and the lifetime risk to age 90. White and African American women use
+their published BCRAT tables; American Indian/Alaska Native women and unknown
+race use the white model, as in the NCI tool. Hispanic and Asian American
+women are not covered: BCRAT projects them with their own relative risks and
+rates (San Francisco Bay Area Breast Cancer Study and Asian American Breast
+Cancer Study), which are not bundled here.
 """
 
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Dict, Any, List, Sequence, Tuple
 import math
 
+from calculators.engines.hazards import CompetingRiskTable
+
+
+# Age range of the 5-year projection; lifetime projections run to LIFETIME_AGE
+MIN_AGE = 35
+MAX_AGE = 85
+PROJECTION_YEARS = 5
+LIFETIME_AGE = 90
+
+# Chemoprevention threshold for the 5-year risk (%)
+HIGH_RISK_THRESHOLD = 1.67
+
+# Covariate categories of the BCRAT relative-risk model; unknown answers fall
+# into the reference category, as in the NCI tool
+MENARCHE_CATEGORIES = {"over_13": 0, "12_to_13": 1, "7_to_11": 2, "unknown": 0}
+FIRST_BIRTH_CATEGORIES = {
+    "under_20": 0,
+    "20_to_24": 1,
+    "25_to_29": 2,
+    "no_births": 2,
+    "30_or_over": 3,
+    "unknown": 0
+}
+RELATIVES_CATEGORIES = {"0": 0, "1": 1, "more_than_1": 2, "unknown": 0}
+BIOPSIES_CATEGORIES = {"0": 0, "1": 1, "more_than_1": 2, "unknown": 0}
+
+# Relative risk for atypical hyperplasia, applied only after a biopsy
+ATYPICAL_HYPERPLASIA_RR = {"no": 0.93, "yes": 1.82, "unknown": 1.00}
+
+RACES = ("white", "african_american", "american_indian_alaskan_native", "unknown")
+
+# Race-specific BCRAT model: log relative risks (biopsies, menarche, first
+# birth, relatives, biopsies × age ≥ 50, first birth × relatives), 1 - AR
+# before and after age 50, and invasive incidence / competing mortality per
+# 5-year age interval from 20-24 to 85-89.
+# White: Gail 1989 coefficients, SEER 1983-87 incidence, NCHS 1985-87 mortality.
+# African American: CARE model (Gail 2007), SEER 1994-98 incidence, NCHS 1996-2000 mortality.
+MODEL_TABLES = {
+    "white": {
+        "log_rr": (0.5292641686, 0.0940103059, 0.2186262218, 0.9583027845, -0.2880424830, -0.1908113865),
+        "one_minus_ar": (0.5788413, 0.5788413),
+        "incidence": (0.00001000, 0.00007600, 0.00026600, 0.00066100, 0.00126500, 0.00186600, 0.00221100,
+                      0.00272100, 0.00334800, 0.00392300, 0.00417800, 0.00443900, 0.00442100, 0.00410900),
+        "mortality": (0.00049300, 0.00053100, 0.00062500, 0.00082500, 0.00130700, 0.00218100, 0.00365500,
+                      0.00585200, 0.00943900, 0.01502800, 0.02383900, 0.03883200, 0.06682800, 0.14490800)
+    },
+    "african_american": {
+        "log_rr": (0.1822121131, 0.2672530336, 0.0, 0.4757242578, -0.1119411682, 0.0),
+        "one_minus_ar": (0.72949880, 0.74397137),
+        "incidence": (0.00002696, 0.00011295, 0.00031094, 0.00067639, 0.00119444, 0.00187394, 0.00233035,
+                      0.00251511, 0.00297712, 0.00358723, 0.00398057, 0.00385918, 0.00346208, 0.00307478),
+        "mortality": (0.00074354, 0.00101698, 0.00145937, 0.00215933, 0.00315077, 0.00448779, 0.00632281,
+                      0.00963037, 0.01405394, 0.02166550, 0.03087696, 0.04478818, 0.06759264, 0.12685554)
+    }
+}
+
+# First age of the tables and interval width (years)
+TABLE_START_AGE = 20
+TABLE_INTERVAL = 5
+
+# Age from which the biopsy × age interaction and the second 1 - AR apply
+OLDER_AGE = 50
+
+# Groups projected with the white model, as in the NCI tool
+WHITE_MODEL_RACES = ("american_indian_alaskan_native", "unknown")
+
+# Menarche categories of the CARE model: menarche at 7-11 years shares the
+# relative risk of 12-13 years
+CARE_MENARCHE_CATEGORIES = (0, 1, 1)
+
+
+def _compile_table(model: Dict[str, Tuple[float, ...]]) -> CompetingRiskTable:
+    """Folds 1 - AR into the baseline incidence"""
+    incidence = [
+        rate * model["one_minus_ar"][TABLE_START_AGE + TABLE_INTERVAL * index >= OLDER_AGE]
+        for index, rate in enumerate(model["incidence"])
+    ]
+    return CompetingRiskTable(TABLE_START_AGE, TABLE_INTERVAL, incidence, model["mortality"])
+
+
+# Compiled tables per race/ethnicity
+RISK_TABLES: Dict[str, CompetingRiskTable] = {race: _compile_table(MODEL_TABLES[race]) for race in MODEL_TABLES}
+RISK_TABLES.update({race: RISK_TABLES["white"] for race in WHITE_MODEL_RACES})
+
+# Index of the first table interval at or after OLDER_AGE
+OLDER_INTERVAL = (OLDER_AGE - TABLE_START_AGE) // TABLE_INTERVAL
+
+
+@lru_cache(maxsize=65536)
+def _project(age: int, menarche: int, first_birth: int, relatives: int, biopsies: int,
+             hyperplasia_rr: float, race_ethnicity: str) -> Tuple[float, float]:
+    """
+    Projects 5-year and lifetime risk for one covariate profile
+
+    Screening lists repeat a small number of distinct profiles, so results
+    are memoized.
+
+    Returns:
+        Tuple[float, float]: 5-year and lifetime (to LIFETIME_AGE) risk in %
+    """
+    if race_ethnicity == "african_american":
+        menarche = CARE_MENARCHE_CATEGORIES[menarche]
+    log_rr = MODEL_TABLES.get(race_ethnicity, MODEL_TABLES["white"])["log_rr"]
+    linear = (biopsies * log_rr[0] + menarche * log_rr[1] + first_birth * log_rr[2]
+              + relatives * log_rr[3] + first_birth * relatives * log_rr[5])
+    younger_rr = math.exp(linear) * hyperplasia_rr
+    older_rr = math.exp(linear + biopsies * log_rr[4]) * hyperplasia_rr
+
+    table = RISK_TABLES[race_ethnicity]
+    intervals = len(table.incidence)
+    multipliers = (younger_rr,) * OLDER_INTERVAL + (older_rr,) * (intervals - OLDER_INTERVAL)
+
+    five_year = table.absolute_risk(age, age + PROJECTION_YEARS, multipliers)
+    lifetime = table.absolute_risk(age, LIFETIME_AGE, multipliers)
+    return five_year * 100, lifetime * 100
+
 
 class GailModelBreastCancerRiskCalculator:
     """Calculator for Gail Model Breast Cancer Risk Assessment"""
-    
+
     def __init__(self):
-        # Simplified relative risk factors based on literature
-        # Note: These are representative values, not the exact NCI coefficients
-        
-        # Age-specific baseline risks (per 100,000 women per year)
-        self.BASELINE_RISKS = {
-            (35, 39): 0.00088,
-            (40, 44): 0.00152,
-            (45, 49): 0.00231,
-            (50, 54): 0.00262,
-            (55, 59): 0.00346,
-            (60, 64): 0.00412,
-            (65, 69): 0.00453,
-            (70, 74): 0.00455,
-            (75, 79): 0.00433,
-            (80, 85): 0.00386
-        }
-        
-        # Relative risks for age at menarche
-        self.MENARCHE_RR = {
-            "7_to_11": 1.21,
-            "12_to_13": 1.10,
-            "over_13": 1.00,
-            "unknown": 1.00
-        }
-        
-        # Relative risks for age at first birth
-        self.FIRST_BIRTH_RR = {
-            "no_births": 1.24,
-            "under_20": 1.00,
-            "20_to_24": 1.10,
-            "25_to_29": 1.25,
-            "30_or_over": 1.62,
-            "unknown": 1.13
-        }
-        
-        # Relative risks for family history
-        self.FAMILY_HISTORY_RR = {
-            "0": 1.00,
-            "1": 2.30,
-            "more_than_1": 4.30,
-            "unknown": 1.15
-        }
-        
-        # Relative risks for previous biopsies
-        self.BIOPSIES_RR = {
-            "0": 1.00,
-            "1": 1.70,
-            "more_than_1": 2.88,
-            "unknown": 1.00
-        }
-        
-        # Additional risk for atypical hyperplasia
-        self.ATYPICAL_HYPERPLASIA_MULTIPLIER = {
-            "yes": 4.17,
-            "no": 1.00,
-            "unknown": 1.00
-        }
-        
-        # Race/ethnicity adjustment factors
-        self.RACE_ADJUSTMENT = {
-            "white": 1.00,
-            "african_american": 0.78,
-            "hispanic": 0.73,
-            "asian_american": 0.50,
-            "american_indian_alaskan_native": 0.85,
-            "unknown": 1.00
-        }
-    
+        # Covariate categories and race-specific compiled tables
+        self.MENARCHE_CATEGORIES = MENARCHE_CATEGORIES
+        self.FIRST_BIRTH_CATEGORIES = FIRST_BIRTH_CATEGORIES
+        self.RELATIVES_CATEGORIES = RELATIVES_CATEGORIES
+        self.BIOPSIES_CATEGORIES = BIOPSIES_CATEGORIES
+        self.ATYPICAL_HYPERPLASIA_RR = ATYPICAL_HYPERPLASIA_RR
+        self.RISK_TABLES = RISK_TABLES
+
     def calculate(self, age: int, age_at_menarche: str, age_at_first_birth: str,
                   relatives_with_breast_cancer: str, previous_biopsies: str,
-                  atypical_hyperplasia: str, race_ethnicity: str,
-                  asian_subrace: Optional[str] = None) -> Dict[str, Any]:
+                  atypical_hyperplasia: str, race_ethnicity: str) -> Dict[str, Any]:
         """
         Calculates Gail Model breast cancer risk assessment
         
@@ -110,160 +176,126 @@ class GailModelBreastCancerRiskCalculator:
             previous_biopsies (str): Number of previous breast biopsies
             atypical_hyperplasia (str): History of atypical hyperplasia
             race_ethnicity (str): Race/ethnicity
-            asian_subrace (str, optional): Asian sub-race if applicable
             
         Returns:
-            Dict with 5-year breast cancer risk and interpretation
+            Dict with 5-year and lifetime breast cancer risk and interpretation
         """
         
         # Validations
         self._validate_inputs(age, age_at_menarche, age_at_first_birth,
                             relatives_with_breast_cancer, previous_biopsies,
-                            atypical_hyperplasia, race_ethnicity, asian_subrace)
+                            atypical_hyperplasia, race_ethnicity)
         
-        # Calculate relative risk
-        relative_risk = self._calculate_relative_risk(
+        # Project 5-year and lifetime absolute risk
+        five_year_risk, lifetime_risk = self._project(
             age, age_at_menarche, age_at_first_birth,
             relatives_with_breast_cancer, previous_biopsies,
-            atypical_hyperplasia, race_ethnicity, asian_subrace
+            atypical_hyperplasia, race_ethnicity
         )
         
-        # Calculate 5-year absolute risk
-        five_year_risk = self._calculate_absolute_risk(age, relative_risk)
-        
         # Get interpretation
-        interpretation = self._get_interpretation(five_year_risk)
+        interpretation = self._get_interpretation(round(five_year_risk, 2))
         
         return {
             "result": round(five_year_risk, 2),
+            "lifetime_risk": round(lifetime_risk, 2),
             "unit": "percentage",
             "interpretation": interpretation["interpretation"],
             "stage": interpretation["stage"],
             "stage_description": interpretation["description"]
         }
     
+    def calculate_batch(self, ages: Sequence[int], age_at_menarche: Sequence[str],
+                        age_at_first_birth: Sequence[str],
+                        relatives_with_breast_cancer: Sequence[str],
+                        previous_biopsies: Sequence[str], atypical_hyperplasia: Sequence[str],
+                        race_ethnicity: Sequence[str]) -> Dict[str, List[Any]]:
+        """
+        Projects risk for a screening list given as columns
+        
+        Args:
+            ages (Sequence[int]): Current age per woman (35-85)
+            age_at_menarche, age_at_first_birth, relatives_with_breast_cancer,
+            previous_biopsies, atypical_hyperplasia, race_ethnicity (Sequence[str]):
+                One answer per woman, as accepted by calculate
+            
+        Returns:
+            Dict[str, List[Any]]: Columns "five_year_risk" and "lifetime_risk"
+            (%, rounded to 2 decimals) and "high_risk" (5-year risk at or
+            above the chemoprevention threshold)
+            
+        Raises:
+            ValueError: If the columns differ in length or a row is invalid
+        """
+        columns = (ages, age_at_menarche, age_at_first_birth, relatives_with_breast_cancer,
+                   previous_biopsies, atypical_hyperplasia, race_ethnicity)
+        size = len(ages)
+        if any(len(column) != size for column in columns):
+            raise ValueError("All columns must have the same length")
+        
+        five_year_column, lifetime_column, high_risk_column = [], [], []
+        for row, values in enumerate(zip(*columns)):
+            try:
+                self._validate_inputs(*values)
+            except ValueError as error:
+                raise ValueError(f"Row {row}: {error}") from None
+            five_year_risk, lifetime_risk = self._project(*values)
+            five_year_risk = round(five_year_risk, 2)
+            five_year_column.append(five_year_risk)
+            lifetime_column.append(round(lifetime_risk, 2))
+            high_risk_column.append(five_year_risk >= HIGH_RISK_THRESHOLD)
+        
+        return {
+            "five_year_risk": five_year_column,
+            "lifetime_risk": lifetime_column,
+            "high_risk": high_risk_column
+        }
+    
     def _validate_inputs(self, age: int, age_at_menarche: str, age_at_first_birth: str,
                         relatives_with_breast_cancer: str, previous_biopsies: str,
-                        atypical_hyperplasia: str, race_ethnicity: str,
-                        asian_subrace: Optional[str]):
+                        atypical_hyperplasia: str, race_ethnicity: str):
         """Validates input parameters"""
         
-        if not isinstance(age, int) or age < 35 or age > 85:
-            raise ValueError("Age must be an integer between 35 and 85")
+        if not isinstance(age, int) or age < MIN_AGE or age > MAX_AGE:
+            raise ValueError(f"Age must be an integer between {MIN_AGE} and {MAX_AGE}")
         
-        valid_menarche = ["unknown", "7_to_11", "12_to_13", "over_13"]
-        if age_at_menarche not in valid_menarche:
+        if age_at_menarche not in self.MENARCHE_CATEGORIES:
             raise ValueError(f"Invalid age_at_menarche: {age_at_menarche}")
         
-        valid_first_birth = ["unknown", "no_births", "under_20", "20_to_24", "25_to_29", "30_or_over"]
-        if age_at_first_birth not in valid_first_birth:
+        if age_at_first_birth not in self.FIRST_BIRTH_CATEGORIES:
             raise ValueError(f"Invalid age_at_first_birth: {age_at_first_birth}")
         
-        valid_relatives = ["unknown", "0", "1", "more_than_1"]
-        if relatives_with_breast_cancer not in valid_relatives:
+        if relatives_with_breast_cancer not in self.RELATIVES_CATEGORIES:
             raise ValueError(f"Invalid relatives_with_breast_cancer: {relatives_with_breast_cancer}")
         
-        valid_biopsies = ["unknown", "0", "1", "more_than_1"]
-        if previous_biopsies not in valid_biopsies:
+        if previous_biopsies not in self.BIOPSIES_CATEGORIES:
             raise ValueError(f"Invalid previous_biopsies: {previous_biopsies}")
         
-        valid_hyperplasia = ["unknown", "no", "yes"]
-        if atypical_hyperplasia not in valid_hyperplasia:
+        if atypical_hyperplasia not in self.ATYPICAL_HYPERPLASIA_RR:
             raise ValueError(f"Invalid atypical_hyperplasia: {atypical_hyperplasia}")
         
-        valid_race = ["white", "african_american", "hispanic", "asian_american", 
-                      "american_indian_alaskan_native", "unknown"]
-        if race_ethnicity not in valid_race:
+        if race_ethnicity not in RACES:
             raise ValueError(f"Invalid race_ethnicity: {race_ethnicity}")
-        
-        if race_ethnicity == "asian_american" and asian_subrace:
-            valid_subrace = ["chinese", "japanese", "filipino", "hawaiian", "pacific_islander"]
-            if asian_subrace not in valid_subrace:
-                raise ValueError(f"Invalid asian_subrace: {asian_subrace}")
     
-    def _calculate_relative_risk(self, age: int, age_at_menarche: str, age_at_first_birth: str,
-                                relatives_with_breast_cancer: str, previous_biopsies: str,
-                                atypical_hyperplasia: str, race_ethnicity: str,
-                                asian_subrace: Optional[str]) -> float:
-        """Calculates the composite relative risk"""
-        
-        # Base relative risk
-        rr = 1.0
-        
-        # Apply age at menarche risk
-        rr *= self.MENARCHE_RR[age_at_menarche]
-        
-        # Apply age at first birth risk
-        rr *= self.FIRST_BIRTH_RR[age_at_first_birth]
-        
-        # Apply family history risk
-        rr *= self.FAMILY_HISTORY_RR[relatives_with_breast_cancer]
-        
-        # Apply biopsy history risk
-        rr *= self.BIOPSIES_RR[previous_biopsies]
-        
-        # Apply atypical hyperplasia multiplier (only if previous biopsies)
-        if previous_biopsies in ["1", "more_than_1"]:
-            rr *= self.ATYPICAL_HYPERPLASIA_MULTIPLIER[atypical_hyperplasia]
-        
-        # Apply race/ethnicity adjustment
-        rr *= self.RACE_ADJUSTMENT[race_ethnicity]
-        
-        # Additional Asian subrace adjustments (simplified)
-        if race_ethnicity == "asian_american" and asian_subrace:
-            asian_adjustments = {
-                "chinese": 0.9,
-                "japanese": 1.1,
-                "filipino": 1.2,
-                "hawaiian": 1.3,
-                "pacific_islander": 1.1
-            }
-            rr *= asian_adjustments.get(asian_subrace, 1.0)
-        
-        return rr
-    
-    def _calculate_absolute_risk(self, age: int, relative_risk: float) -> float:
-        """Converts relative risk to 5-year absolute risk"""
-        
-        # Find appropriate age bracket for baseline risk
-        baseline_risk = 0.003  # Default baseline
-        for (min_age, max_age), risk in self.BASELINE_RISKS.items():
-            if min_age <= age <= max_age:
-                baseline_risk = risk
-                break
-        
-        # Calculate 5-year cumulative risk
-        # Simplified formula: not accounting for competing hazards
-        five_year_baseline = 5 * baseline_risk
-        five_year_risk = five_year_baseline * relative_risk
-        
-        # Convert to percentage and cap at reasonable maximum
-        five_year_risk_percent = min(five_year_risk * 100, 50.0)
-        
-        return five_year_risk_percent
-    
-    def _get_age_bracket(self, age: int) -> tuple:
-        """Helper to get age bracket for baseline risk lookup"""
-        if age < 40:
-            return (35, 39)
-        elif age < 45:
-            return (40, 44)
-        elif age < 50:
-            return (45, 49)
-        elif age < 55:
-            return (50, 54)
-        elif age < 60:
-            return (55, 59)
-        elif age < 65:
-            return (60, 64)
-        elif age < 70:
-            return (65, 69)
-        elif age < 75:
-            return (70, 74)
-        elif age < 80:
-            return (75, 79)
-        else:
-            return (80, 85)
+    def _project(self, age: int, age_at_menarche: str, age_at_first_birth: str,
+                 relatives_with_breast_cancer: str, previous_biopsies: str,
+                 atypical_hyperplasia: str, race_ethnicity: str) -> Tuple[float, float]:
+        """Maps validated answers to model categories and projects 5-year and lifetime risk (%)"""
+        
+        biopsies = self.BIOPSIES_CATEGORIES[previous_biopsies]
+        
+        # Atypical hyperplasia is only known after at least one biopsy
+        hyperplasia_rr = self.ATYPICAL_HYPERPLASIA_RR[atypical_hyperplasia] if biopsies else 1.0
+        
+        return _project(
+            age,
+            self.MENARCHE_CATEGORIES[age_at_menarche],
+            self.FIRST_BIRTH_CATEGORIES[age_at_first_birth],
+            self.RELATIVES_CATEGORIES[relatives_with_breast_cancer],
+            biopsies,
+            hyperplasia_rr,
+            race_ethnicity
+        )
     
     def _get_interpretation(self, five_year_risk: float) -> Dict[str, str]:
         """
@@ -276,7 +308,7 @@ class GailModelBreastCancerRiskCalculator:
             Dict with interpretation
         """
         
-        if five_year_risk < 1.67:
+        if five_year_risk < HIGH_RISK_THRESHOLD:
             return {
                 "stage": "Low Risk",
                 "description": "Low risk for breast cancer",
@@ -301,8 +333,7 @@ class GailModelBreastCancerRiskCalculator:
 
 def calculate_gail_model_breast_cancer_risk(age: int, age_at_menarche: str, age_at_first_birth: str,
                                           relatives_with_breast_cancer: str, previous_biopsies: str,
-                                          atypical_hyperplasia: str, race_ethnicity: str,
-                                          asian_subrace: Optional[str] = None) -> Dict[str, Any]:
+                                          atypical_hyperplasia: str, race_ethnicity: str) -> Dict[str, Any]:
     """
     Convenience function for the dynamic loading system
     
@@ -312,5 +343,5 @@ def calculate_gail_model_breast_cancer_risk(age: int, age_at_menarche: str, age_
     return calculator.calculate(
         age, age_at_menarche, age_at_first_birth,
         relatives_with_breast_cancer, previous_biopsies,
-        atypical_hyperplasia, race_ethnicity, asian_subrace
+        atypical_hyperplasia, race_ethnicity
     )
\ No newline at end of file
@@ -22,142 +22,182 @@ References (Vancouver style):
 import math
 from typing import Dict, Any
 
+from calculators.engines.survival import SurvivalModel
+
+
+# Mortality risk coefficients (1-year)
+MORTALITY_1Y_INTERCEPT = -7.8435
+MORTALITY_1Y_COEFFICIENTS = {
+    'age': 0.0655,
+    'weight': -0.0056,
+    'race_asian': -0.4770,
+    'race_black': -0.2765,
+    'sex_male': 0.3655,
+    'pulse': 0.0056,
+    'diastolic_bp': -0.0089,
+    'history_of_bleeding': 0.6656,
+    'heart_failure': 1.0139,
+    'history_of_stroke': 0.4219,
+    'chronic_kidney_disease': 0.6919,
+    'vascular_disease': 0.2658,
+    'diabetes_mellitus': 0.1540,
+    'current_smoking': 0.2262,
+    'dementia': 1.2963,
+    'antiplatelet_use': 0.2469,
+    'carotid_disease': 0.2624
+}
+
+# Mortality risk coefficients (2-year)
+MORTALITY_2Y_INTERCEPT = -7.4528
+MORTALITY_2Y_COEFFICIENTS = {
+    'age': 0.0634,
+    'weight': -0.0051,
+    'race_asian': -0.4356,
+    'race_black': -0.2543,
+    'sex_male': 0.3421,
+    'pulse': 0.0052,
+    'diastolic_bp': -0.0083,
+    'history_of_bleeding': 0.6198,
+    'heart_failure': 0.9458,
+    'history_of_stroke': 0.3825,
+    'chronic_kidney_disease': 0.6438,
+    'vascular_disease': 0.2485,
+    'diabetes_mellitus': 0.1445,
+    'current_smoking': 0.2112,
+    'dementia': 1.2056,
+    'antiplatelet_use': 0.2298,
+    'carotid_disease': 0.2447
+}
+
+# Stroke/SE risk coefficients (1-year)
+STROKE_1Y_INTERCEPT = -8.2581
+STROKE_1Y_COEFFICIENTS = {
+    'age': 0.0421,
+    'weight': -0.0078,
+    'race_asian': 0.1875,
+    'race_black': 0.4538,
+    'sex_male': -0.1369,
+    'pulse': 0.0029,
+    'diastolic_bp': -0.0051,
+    'history_of_bleeding': 0.2842,
+    'heart_failure': 0.2658,
+    'history_of_stroke': 1.1756,
+    'chronic_kidney_disease': 0.2847,
+    'vascular_disease': 0.3895,
+    'diabetes_mellitus': 0.2658,
+    'current_smoking': 0.1947,
+    'dementia': 0.4219,
+    'antiplatelet_use': 0.1584,
+    'carotid_disease': 0.5187
+}
+
+# Stroke/SE risk coefficients (2-year)
+STROKE_2Y_INTERCEPT = -7.8974
+STROKE_2Y_COEFFICIENTS = {
+    'age': 0.0405,
+    'weight': -0.0072,
+    'race_asian': 0.1798,
+    'race_black': 0.4365,
+    'sex_male': -0.1278,
+    'pulse': 0.0028,
+    'diastolic_bp': -0.0047,
+    'history_of_bleeding': 0.2736,
+    'heart_failure': 0.2554,
+    'history_of_stroke': 1.1296,
+    'chronic_kidney_disease': 0.2738,
+    'vascular_disease': 0.3742,
+    'diabetes_mellitus': 0.2554,
+    'current_smoking': 0.1869,
+    'dementia': 0.4055,
+    'antiplatelet_use': 0.1522,
+    'carotid_disease': 0.4982
+}
+
+# Major bleeding risk coefficients (1-year)
+BLEEDING_1Y_INTERCEPT = -9.1584
+BLEEDING_1Y_COEFFICIENTS = {
+    'age': 0.0298,
+    'weight': -0.0065,
+    'race_asian': -0.5869,
+    'race_black': -0.1542,
+    'sex_male': -0.2847,
+    'pulse': 0.0045,
+    'diastolic_bp': -0.0078,
+    'history_of_bleeding': 1.2639,
+    'heart_failure': 0.1584,
+    'history_of_stroke': 0.4658,
+    'chronic_kidney_disease': 0.5487,
+    'vascular_disease': 0.2154,
+    'diabetes_mellitus': 0.0847,
+    'current_smoking': 0.2639,
+    'dementia': 0.6219,
+    'antiplatelet_use': 0.4985,
+    'carotid_disease': 0.1869
+}
+
+# Major bleeding risk coefficients (2-year)
+BLEEDING_2Y_INTERCEPT = -8.7896
+BLEEDING_2Y_COEFFICIENTS = {
+    'age': 0.0287,
+    'weight': -0.0061,
+    'race_asian': -0.5635,
+    'race_black': -0.1481,
+    'sex_male': -0.2736,
+    'pulse': 0.0043,
+    'diastolic_bp': -0.0075,
+    'history_of_bleeding': 1.2145,
+    'heart_failure': 0.1522,
+    'history_of_stroke': 0.4475,
+    'chronic_kidney_disease': 0.5271,
+    'vascular_disease': 0.2069,
+    'diabetes_mellitus': 0.0814,
+    'current_smoking': 0.2536,
+    'dementia': 0.5974,
+    'antiplatelet_use': 0.4792,
+    'carotid_disease': 0.1796
+}
+
+FEATURES = tuple(MORTALITY_1Y_COEFFICIENTS)
+
+# The GARFIELD-AF equations use risk = 1 - exp(-exp(lp)), i.e. a baseline
+# survival of exp(-1) raised to exp(lp)
+GARFIELD_BASELINE_SURVIVAL = math.exp(-1)
+
+# All six outcome/horizon equations compiled into one model
+MODEL = SurvivalModel(
+    FEATURES,
+    coefficients={
+        "mortality_1_year": MORTALITY_1Y_COEFFICIENTS,
+        "mortality_2_year": MORTALITY_2Y_COEFFICIENTS,
+        "stroke_se_1_year": STROKE_1Y_COEFFICIENTS,
+        "stroke_se_2_year": STROKE_2Y_COEFFICIENTS,
+        "major_bleeding_1_year": BLEEDING_1Y_COEFFICIENTS,
+        "major_bleeding_2_year": BLEEDING_2Y_COEFFICIENTS
+    },
+    baseline_survival={
+        "mortality_1_year": GARFIELD_BASELINE_SURVIVAL,
+        "mortality_2_year": GARFIELD_BASELINE_SURVIVAL,
+        "stroke_se_1_year": GARFIELD_BASELINE_SURVIVAL,
+        "stroke_se_2_year": GARFIELD_BASELINE_SURVIVAL,
+        "major_bleeding_1_year": GARFIELD_BASELINE_SURVIVAL,
+        "major_bleeding_2_year": GARFIELD_BASELINE_SURVIVAL
+    },
+    intercept={
+        "mortality_1_year": MORTALITY_1Y_INTERCEPT,
+        "mortality_2_year": MORTALITY_2Y_INTERCEPT,
+        "stroke_se_1_year": STROKE_1Y_INTERCEPT,
+        "stroke_se_2_year": STROKE_2Y_INTERCEPT,
+        "major_bleeding_1_year": BLEEDING_1Y_INTERCEPT,
+        "major_bleeding_2_year": BLEEDING_2Y_INTERCEPT
+    }
+)
+
 
 class GarfieldAfCalculator:
     """Calculator for GARFIELD-AF Risk Score"""
     
     def __init__(self):
-        # Mortality risk coefficients (1-year)
-        self.MORTALITY_1Y_INTERCEPT = -7.8435
-        self.MORTALITY_1Y_COEFFICIENTS = {
-            'age': 0.0655,
-            'weight': -0.0056,
-            'race_asian': -0.4770,
-            'race_black': -0.2765,
-            'sex_male': 0.3655,
-            'pulse': 0.0056,
-            'diastolic_bp': -0.0089,
-            'history_of_bleeding': 0.6656,
-            'heart_failure': 1.0139,
-            'history_of_stroke': 0.4219,
-            'chronic_kidney_disease': 0.6919,
-            'vascular_disease': 0.2658,
-            'diabetes_mellitus': 0.1540,
-            'current_smoking': 0.2262,
-            'dementia': 1.2963,
-            'antiplatelet_use': 0.2469,
-            'carotid_disease': 0.2624
-        }
-        
-        # Mortality risk coefficients (2-year)
-        self.MORTALITY_2Y_INTERCEPT = -7.4528
-        self.MORTALITY_2Y_COEFFICIENTS = {
-            'age': 0.0634,
-            'weight': -0.0051,
-            'race_asian': -0.4356,
-            'race_black': -0.2543,
-            'sex_male': 0.3421,
-            'pulse': 0.0052,
-            'diastolic_bp': -0.0083,
-            'history_of_bleeding': 0.6198,
-            'heart_failure': 0.9458,
-            'history_of_stroke': 0.3825,
-            'chronic_kidney_disease': 0.6438,
-            'vascular_disease': 0.2485,
-            'diabetes_mellitus': 0.1445,
-            'current_smoking': 0.2112,
-            'dementia': 1.2056,
-            'antiplatelet_use': 0.2298,
-            'carotid_disease': 0.2447
-        }
-        
-        # Stroke/SE risk coefficients (1-year)
-        self.STROKE_1Y_INTERCEPT = -8.2581
-        self.STROKE_1Y_COEFFICIENTS = {
-            'age': 0.0421,
-            'weight': -0.0078,
-            'race_asian': 0.1875,
-            'race_black': 0.4538,
-            'sex_male': -0.1369,
-            'pulse': 0.0029,
-            'diastolic_bp': -0.0051,
-            'history_of_bleeding': 0.2842,
-            'heart_failure': 0.2658,
-            'history_of_stroke': 1.1756,
-            'chronic_kidney_disease': 0.2847,
-            'vascular_disease': 0.3895,
-            'diabetes_mellitus': 0.2658,
-            'current_smoking': 0.1947,
-            'dementia': 0.4219,
-            'antiplatelet_use': 0.1584,
-            'carotid_disease': 0.5187
-        }
-        
-        # Stroke/SE risk coefficients (2-year)
-        self.STROKE_2Y_INTERCEPT = -7.8974
-        self.STROKE_2Y_COEFFICIENTS = {
-            'age': 0.0405,
-            'weight': -0.0072,
-            'race_asian': 0.1798,
-            'race_black': 0.4365,
-            'sex_male': -0.1278,
-            'pulse': 0.0028,
-            'diastolic_bp': -0.0047,
-            'history_of_bleeding': 0.2736,
-            'heart_failure': 0.2554,
-            'history_of_stroke': 1.1296,
-            'chronic_kidney_disease': 0.2738,
-            'vascular_disease': 0.3742,
-            'diabetes_mellitus': 0.2554,
-            'current_smoking': 0.1869,
-            'dementia': 0.4055,
-            'antiplatelet_use': 0.1522,
-            'carotid_disease': 0.4982
-        }
-        
-        # Major bleeding risk coefficients (1-year)
-        self.BLEEDING_1Y_INTERCEPT = -9.1584
-        self.BLEEDING_1Y_COEFFICIENTS = {
-            'age': 0.0298,
-            'weight': -0.0065,
-            'race_asian': -0.5869,
-            'race_black': -0.1542,
-            'sex_male': -0.2847,
-            'pulse': 0.0045,
-            'diastolic_bp': -0.0078,
-            'history_of_bleeding': 1.2639,
-            'heart_failure': 0.1584,
-            'history_of_stroke': 0.4658,
-            'chronic_kidney_disease': 0.5487,
-            'vascular_disease': 0.2154,
-            'diabetes_mellitus': 0.0847,
-            'current_smoking': 0.2639,
-            'dementia': 0.6219,
-            'antiplatelet_use': 0.4985,
-            'carotid_disease': 0.1869
-        }
-        
-        # Major bleeding risk coefficients (2-year)
-        self.BLEEDING_2Y_INTERCEPT = -8.7896
-        self.BLEEDING_2Y_COEFFICIENTS = {
-            'age': 0.0287,
-            'weight': -0.0061,
-            'race_asian': -0.5635,
-            'race_black': -0.1481,
-            'sex_male': -0.2736,
-            'pulse': 0.0043,
-            'diastolic_bp': -0.0075,
-            'history_of_bleeding': 1.2145,
-            'heart_failure': 0.1522,
-            'history_of_stroke': 0.4475,
-            'chronic_kidney_disease': 0.5271,
-            'vascular_disease': 0.2069,
-            'diabetes_mellitus': 0.0814,
-            'current_smoking': 0.2536,
-            'dementia': 0.5974,
-            'antiplatelet_use': 0.4792,
-            'carotid_disease': 0.1796
-        }
+        self.model = MODEL
     
     def calculate(self, age: int, weight: float, race: str, sex: str, pulse: int, 
                  diastolic_bp: int, history_of_bleeding: str, heart_failure: str,
@@ -195,54 +235,19 @@ class GarfieldAfCalculator:
                              chronic_kidney_disease, vascular_disease, diabetes_mellitus,
                              current_smoking, dementia, antiplatelet_use, carotid_disease)
         
-        # Calculate risk predictions
-        mortality_1y = self._calculate_mortality_risk(age, weight, race, sex, pulse, 
-                                                     diastolic_bp, history_of_bleeding, 
-                                                     heart_failure, history_of_stroke,
-                                                     chronic_kidney_disease, vascular_disease, 
-                                                     diabetes_mellitus, current_smoking, 
-                                                     dementia, antiplatelet_use, carotid_disease, 
-                                                     years=1)
-        
-        mortality_2y = self._calculate_mortality_risk(age, weight, race, sex, pulse, 
-                                                     diastolic_bp, history_of_bleeding, 
-                                                     heart_failure, history_of_stroke,
-                                                     chronic_kidney_disease, vascular_disease, 
-                                                     diabetes_mellitus, current_smoking, 
-                                                     dementia, antiplatelet_use, carotid_disease, 
-                                                     years=2)
-        
-        stroke_1y = self._calculate_stroke_risk(age, weight, race, sex, pulse, 
-                                               diastolic_bp, history_of_bleeding, 
-                                               heart_failure, history_of_stroke,
-                                               chronic_kidney_disease, vascular_disease, 
-                                               diabetes_mellitus, current_smoking, 
-                                               dementia, antiplatelet_use, carotid_disease, 
-                                               years=1)
-        
-        stroke_2y = self._calculate_stroke_risk(age, weight, race, sex, pulse, 
-                                               diastolic_bp, history_of_bleeding, 
-                                               heart_failure, history_of_stroke,
-                                               chronic_kidney_disease, vascular_disease, 
-                                               diabetes_mellitus, current_smoking, 
-                                               dementia, antiplatelet_use, carotid_disease, 
-                                               years=2)
+        # Calculate all outcome/horizon risks in one pass
+        features = self._features(age, weight, race, sex, pulse, diastolic_bp,
+                                  history_of_bleeding, heart_failure, history_of_stroke,
+                                  chronic_kidney_disease, vascular_disease, diabetes_mellitus,
+                                  current_smoking, dementia, antiplatelet_use, carotid_disease)
+        risks = self.model.predict(features)
         
-        bleeding_1y = self._calculate_bleeding_risk(age, weight, race, sex, pulse, 
-                                                   diastolic_bp, history_of_bleeding, 
-                                                   heart_failure, history_of_stroke,
-                                                   chronic_kidney_disease, vascular_disease, 
-                                                   diabetes_mellitus, current_smoking, 
-                                                   dementia, antiplatelet_use, carotid_disease, 
-                                                   years=1)
-        
-        bleeding_2y = self._calculate_bleeding_risk(age, weight, race, sex, pulse, 
-                                                   diastolic_bp, history_of_bleeding, 
-                                                   heart_failure, history_of_stroke,
-                                                   chronic_kidney_disease, vascular_disease, 
-                                                   diabetes_mellitus, current_smoking, 
-                                                   dementia, antiplatelet_use, carotid_disease, 
-                                                   years=2)
+        mortality_1y = 100 * risks["mortality_1_year"]
+        mortality_2y = 100 * risks["mortality_2_year"]
+        stroke_1y = 100 * risks["stroke_se_1_year"]
+        stroke_2y = 100 * risks["stroke_se_2_year"]
+        bleeding_1y = 100 * risks["major_bleeding_1_year"]
+        bleeding_2y = 100 * risks["major_bleeding_2_year"]
         
         # Determine overall risk level
         max_risk = max(mortality_1y, stroke_1y, bleeding_1y)
@@ -306,119 +311,31 @@ class GarfieldAfCalculator:
             if param_value not in ["yes", "no"]:
                 raise ValueError(f"{param_name} must be 'yes' or 'no'")
     
-    def _calculate_mortality_risk(self, age, weight, race, sex, pulse, diastolic_bp,
-                                 history_of_bleeding, heart_failure, history_of_stroke,
-                                 chronic_kidney_disease, vascular_disease, diabetes_mellitus,
-                                 current_smoking, dementia, antiplatelet_use, carotid_disease,
-                                 years):
-        """Calculates mortality risk for specified time horizon"""
-        
-        if years == 1:
-            intercept = self.MORTALITY_1Y_INTERCEPT
-            coefficients = self.MORTALITY_1Y_COEFFICIENTS
-        else:
-            intercept = self.MORTALITY_2Y_INTERCEPT
-            coefficients = self.MORTALITY_2Y_COEFFICIENTS
-        
-        # Calculate linear predictor
-        linear_predictor = intercept
-        linear_predictor += coefficients['age'] * age
-        linear_predictor += coefficients['weight'] * weight
-        linear_predictor += coefficients['race_asian'] * (1 if race == 'asian' else 0)
-        linear_predictor += coefficients['race_black'] * (1 if race == 'black' else 0)
-        linear_predictor += coefficients['sex_male'] * (1 if sex == 'male' else 0)
-        linear_predictor += coefficients['pulse'] * pulse
-        linear_predictor += coefficients['diastolic_bp'] * diastolic_bp
-        linear_predictor += coefficients['history_of_bleeding'] * (1 if history_of_bleeding == 'yes' else 0)
-        linear_predictor += coefficients['heart_failure'] * (1 if heart_failure == 'yes' else 0)
-        linear_predictor += coefficients['history_of_stroke'] * (1 if history_of_stroke == 'yes' else 0)
-        linear_predictor += coefficients['chronic_kidney_disease'] * (1 if chronic_kidney_disease == 'yes' else 0)
-        linear_predictor += coefficients['vascular_disease'] * (1 if vascular_disease == 'yes' else 0)
-        linear_predictor += coefficients['diabetes_mellitus'] * (1 if diabetes_mellitus == 'yes' else 0)
-        linear_predictor += coefficients['current_smoking'] * (1 if current_smoking == 'yes' else 0)
-        linear_predictor += coefficients['dementia'] * (1 if dementia == 'yes' else 0)
-        linear_predictor += coefficients['antiplatelet_use'] * (1 if antiplatelet_use == 'yes' else 0)
-        linear_predictor += coefficients['carotid_disease'] * (1 if carotid_disease == 'yes' else 0)
-        
-        # Convert to probability
-        probability = 100 * (1 - math.exp(-math.exp(linear_predictor)))
-        return probability
-    
-    def _calculate_stroke_risk(self, age, weight, race, sex, pulse, diastolic_bp,
-                              history_of_bleeding, heart_failure, history_of_stroke,
-                              chronic_kidney_disease, vascular_disease, diabetes_mellitus,
-                              current_smoking, dementia, antiplatelet_use, carotid_disease,
-                              years):
-        """Calculates stroke/systemic embolism risk for specified time horizon"""
-        
-        if years == 1:
-            intercept = self.STROKE_1Y_INTERCEPT
-            coefficients = self.STROKE_1Y_COEFFICIENTS
-        else:
-            intercept = self.STROKE_2Y_INTERCEPT
-            coefficients = self.STROKE_2Y_COEFFICIENTS
-        
-        # Calculate linear predictor
-        linear_predictor = intercept
-        linear_predictor += coefficients['age'] * age
-        linear_predictor += coefficients['weight'] * weight
-        linear_predictor += coefficients['race_asian'] * (1 if race == 'asian' else 0)
-        linear_predictor += coefficients['race_black'] * (1 if race == 'black' else 0)
-        linear_predictor += coefficients['sex_male'] * (1 if sex == 'male' else 0)
-        linear_predictor += coefficients['pulse'] * pulse
-        linear_predictor += coefficients['diastolic_bp'] * diastolic_bp
-        linear_predictor += coefficients['history_of_bleeding'] * (1 if history_of_bleeding == 'yes' else 0)
-        linear_predictor += coefficients['heart_failure'] * (1 if heart_failure == 'yes' else 0)
-        linear_predictor += coefficients['history_of_stroke'] * (1 if history_of_stroke == 'yes' else 0)
-        linear_predictor += coefficients['chronic_kidney_disease'] * (1 if chronic_kidney_disease == 'yes' else 0)
-        linear_predictor += coefficients['vascular_disease'] * (1 if vascular_disease == 'yes' else 0)
-        linear_predictor += coefficients['diabetes_mellitus'] * (1 if diabetes_mellitus == 'yes' else 0)
-        linear_predictor += coefficients['current_smoking'] * (1 if current_smoking == 'yes' else 0)
-        linear_predictor += coefficients['dementia'] * (1 if dementia == 'yes' else 0)
-        linear_predictor += coefficients['antiplatelet_use'] * (1 if antiplatelet_use == 'yes' else 0)
-        linear_predictor += coefficients['carotid_disease'] * (1 if carotid_disease == 'yes' else 0)
-        
-        # Convert to probability
-        probability = 100 * (1 - math.exp(-math.exp(linear_predictor)))
-        return probability
-    
-    def _calculate_bleeding_risk(self, age, weight, race, sex, pulse, diastolic_bp,
-                                history_of_bleeding, heart_failure, history_of_stroke,
-                                chronic_kidney_disease, vascular_disease, diabetes_mellitus,
-                                current_smoking, dementia, antiplatelet_use, carotid_disease,
-                                years):
-        """Calculates major bleeding risk for specified time horizon"""
-        
-        if years == 1:
-            intercept = self.BLEEDING_1Y_INTERCEPT
-            coefficients = self.BLEEDING_1Y_COEFFICIENTS
-        else:
-            intercept = self.BLEEDING_2Y_INTERCEPT
-            coefficients = self.BLEEDING_2Y_COEFFICIENTS
-        
-        # Calculate linear predictor
-        linear_predictor = intercept
-        linear_predictor += coefficients['age'] * age
-        linear_predictor += coefficients['weight'] * weight
-        linear_predictor += coefficients['race_asian'] * (1 if race == 'asian' else 0)
-        linear_predictor += coefficients['race_black'] * (1 if race == 'black' else 0)
-        linear_predictor += coefficients['sex_male'] * (1 if sex == 'male' else 0)
-        linear_predictor += coefficients['pulse'] * pulse
-        linear_predictor += coefficients['diastolic_bp'] * diastolic_bp
-        linear_predictor += coefficients['history_of_bleeding'] * (1 if history_of_bleeding == 'yes' else 0)
-        linear_predictor += coefficients['heart_failure'] * (1 if heart_failure == 'yes' else 0)
-        linear_predictor += coefficients['history_of_stroke'] * (1 if history_of_stroke == 'yes' else 0)
-        linear_predictor += coefficients['chronic_kidney_disease'] * (1 if chronic_kidney_disease == 'yes' else 0)
-        linear_predictor += coefficients['vascular_disease'] * (1 if vascular_disease == 'yes' else 0)
-        linear_predictor += coefficients['diabetes_mellitus'] * (1 if diabetes_mellitus == 'yes' else 0)
-        linear_predictor += coefficients['current_smoking'] * (1 if current_smoking == 'yes' else 0)
-        linear_predictor += coefficients['dementia'] * (1 if dementia == 'yes' else 0)
-        linear_predictor += coefficients['antiplatelet_use'] * (1 if antiplatelet_use == 'yes' else 0)
-        linear_predictor += coefficients['carotid_disease'] * (1 if carotid_disease == 'yes' else 0)
-        
-        # Convert to probability
-        probability = 100 * (1 - math.exp(-math.exp(linear_predictor)))
-        return probability
+    def _features(self, age, weight, race, sex, pulse, diastolic_bp,
+                  history_of_bleeding, heart_failure, history_of_stroke,
+                  chronic_kidney_disease, vascular_disease, diabetes_mellitus,
+                  current_smoking, dementia, antiplatelet_use, carotid_disease):
+        """Builds the model feature vector (order matches FEATURES)"""
+        
+        return (
+            age,
+            weight,
+            1 if race == 'asian' else 0,
+            1 if race == 'black' else 0,
+            1 if sex == 'male' else 0,
+            pulse,
+            diastolic_bp,
+            1 if history_of_bleeding == 'yes' else 0,
+            1 if heart_failure == 'yes' else 0,
+            1 if history_of_stroke == 'yes' else 0,
+            1 if chronic_kidney_disease == 'yes' else 0,
+            1 if vascular_disease == 'yes' else 0,
+            1 if diabetes_mellitus == 'yes' else 0,
+            1 if current_smoking == 'yes' else 0,
+            1 if dementia == 'yes' else 0,
+            1 if antiplatelet_use == 'yes' else 0,
+            1 if carotid_disease == 'yes' else 0
+        )
     
     def _get_interpretation(self, max_risk, mortality_1y, mortality_2y, stroke_1y, stroke_2y, 
                            bleeding_1y, bleeding_2y):
@@ -30,75 +30,98 @@ References (Vancouver style):
    2010;152(1):26-35. doi: 10.7326/0003-4819-152-1-201001050-00007
 """
 
-import math
-from typing import Dict, Any
+from typing import Dict, Any, List, Mapping, Sequence
+
+from calculators.engines.logistic import LogisticModel
+
+
+# Age coefficient (points per year)
+AGE_COEFFICIENT = 0.02
+
+# Functional status points
+FUNCTIONAL_STATUS_POINTS = {
+    "independent": 0.0,
+    "partially_dependent": 0.65,
+    "totally_dependent": 1.03
+}
+
+# ASA class points
+ASA_CLASS_POINTS = {
+    "1": -5.17,  # Normal healthy patient
+    "2": -3.29,  # Mild systemic disease
+    "3": -1.92,  # Severe systemic disease
+    "4": -0.95,  # Severe systemic disease threatening life
+    "5": 0.0     # Moribund patient
+}
+
+# Creatinine status points
+CREATININE_POINTS = {
+    "normal": 0.0,      # ≤1.5 mg/dL
+    "elevated": 0.61,   # >1.5 mg/dL
+    "unknown": -0.10
+}
+
+# Surgery type points (from highest to lowest risk)
+SURGERY_TYPE_POINTS = {
+    "aortic": 1.60,
+    "brain": 1.40,
+    "cardiac": 1.01,
+    "foregut_hepatobiliary": 0.82,
+    "gallbladder_appendix_adrenals_spleen": 0.67,
+    "intestinal": 0.58,
+    "neck": 0.40,
+    "obstetric_gynecologic": 0.28,
+    "orthopedic_non_spine": 0.20,
+    "peripheral_vascular": 0.16,
+    "skin": 0.12,
+    "spine": 0.10,
+    "thoracic_non_cardiac": 0.06,
+    "urology_non_renal": 0.04,
+    "renal": 0.02,
+    "hernia": 0.0,
+    "thyroid_parathyroid": -0.32,
+    "breast": -1.61,
+    "eye": -1.05,
+    "vein": -1.09
+}
+
+# Base constant for logistic regression
+BASE_CONSTANT = -5.25
+
+# Risk interpretation thresholds
+RISK_THRESHOLDS = [
+    {"min": 0.0, "max": 0.5, "level": "Very Low Risk", "description": "Minimal perioperative cardiac risk"},
+    {"min": 0.5, "max": 1.0, "level": "Low Risk", "description": "Low perioperative cardiac risk"},
+    {"min": 1.0, "max": 2.0, "level": "Moderate Risk", "description": "Moderate perioperative cardiac risk"},
+    {"min": 2.0, "max": 5.0, "level": "High Risk", "description": "High perioperative cardiac risk"},
+    {"min": 5.0, "max": 100.0, "level": "Very High Risk", "description": "Very high perioperative cardiac risk"}
+]
+
+# Compiled model: age is numeric, the remaining factors are one-hot encoded
+MODEL = LogisticModel(
+    intercept=BASE_CONSTANT,
+    numeric={"age": AGE_COEFFICIENT},
+    categorical={
+        "functional_status": FUNCTIONAL_STATUS_POINTS,
+        "asa_class": ASA_CLASS_POINTS,
+        "creatinine_status": CREATININE_POINTS,
+        "surgery_type": SURGERY_TYPE_POINTS
+    }
+)
 
 
 class GuptaMicaCalculator:
     """Calculator for Gupta Perioperative Risk for Myocardial Infarction or Cardiac Arrest"""
     
     def __init__(self):
-        # Age coefficient (points per year)
-        self.AGE_COEFFICIENT = 0.02
-        
-        # Functional status points
-        self.FUNCTIONAL_STATUS_POINTS = {
-            "independent": 0.0,
-            "partially_dependent": 0.65,
-            "totally_dependent": 1.03
-        }
-        
-        # ASA class points
-        self.ASA_CLASS_POINTS = {
-            "1": -5.17,  # Normal healthy patient
-            "2": -3.29,  # Mild systemic disease
-            "3": -1.92,  # Severe systemic disease
-            "4": -0.95,  # Severe systemic disease threatening life
-            "5": 0.0     # Moribund patient
-        }
-        
-        # Creatinine status points
-        self.CREATININE_POINTS = {
-            "normal": 0.0,      # ≤1.5 mg/dL
-            "elevated": 0.61,   # >1.5 mg/dL
-            "unknown": -0.10
-        }
-        
-        # Surgery type points (from highest to lowest risk)
-        self.SURGERY_TYPE_POINTS = {
-            "aortic": 1.60,
-            "brain": 1.40,
-            "cardiac": 1.01,
-            "foregut_hepatobiliary": 0.82,
-            "gallbladder_appendix_adrenals_spleen": 0.67,
-            "intestinal": 0.58,
-            "neck": 0.40,
-            "obstetric_gynecologic": 0.28,
-            "orthopedic_non_spine": 0.20,
-            "peripheral_vascular": 0.16,
-            "skin": 0.12,
-            "spine": 0.10,
-            "thoracic_non_cardiac": 0.06,
-            "urology_non_renal": 0.04,
-            "renal": 0.02,
-            "hernia": 0.0,
-            "thyroid_parathyroid": -0.32,
-            "breast": -1.61,
-            "eye": -1.05,
-            "vein": -1.09
-        }
-        
-        # Base constant for logistic regression
-        self.BASE_CONSTANT = -5.25
-        
-        # Risk interpretation thresholds
-        self.RISK_THRESHOLDS = [
-            {"min": 0.0, "max": 0.5, "level": "Very Low Risk", "description": "Minimal perioperative cardiac risk"},
-            {"min": 0.5, "max": 1.0, "level": "Low Risk", "description": "Low perioperative cardiac risk"},
-            {"min": 1.0, "max": 2.0, "level": "Moderate Risk", "description": "Moderate perioperative cardiac risk"},
-            {"min": 2.0, "max": 5.0, "level": "High Risk", "description": "High perioperative cardiac risk"},
-            {"min": 5.0, "max": 100.0, "level": "Very High Risk", "description": "Very high perioperative cardiac risk"}
-        ]
+        self.AGE_COEFFICIENT = AGE_COEFFICIENT
+        self.FUNCTIONAL_STATUS_POINTS = FUNCTIONAL_STATUS_POINTS
+        self.ASA_CLASS_POINTS = ASA_CLASS_POINTS
+        self.CREATININE_POINTS = CREATININE_POINTS
+        self.SURGERY_TYPE_POINTS = SURGERY_TYPE_POINTS
+        self.BASE_CONSTANT = BASE_CONSTANT
+        self.RISK_THRESHOLDS = RISK_THRESHOLDS
+        self.model = MODEL
     
     def calculate(self, age: int, functional_status: str, asa_class: str,
                  creatinine_status: str, surgery_type: str) -> Dict[str, Any]:
@@ -119,25 +142,15 @@ class GuptaMicaCalculator:
         # Validate inputs
         self._validate_inputs(age, functional_status, asa_class, creatinine_status, surgery_type)
         
-        # Calculate risk score components
-        age_points = age * self.AGE_COEFFICIENT
-        functional_points = self.FUNCTIONAL_STATUS_POINTS[functional_status]
-        asa_points = self.ASA_CLASS_POINTS[asa_class]
-        creatinine_points = self.CREATININE_POINTS[creatinine_status]
-        surgery_points = self.SURGERY_TYPE_POINTS[surgery_type]
-        
-        # Calculate logistic regression score (x)
-        x = (self.BASE_CONSTANT + age_points + functional_points + 
-             asa_points + creatinine_points + surgery_points)
-        
         # Calculate risk percentage using logistic function
         # Risk = e^x / (1 + e^x) * 100
-        try:
-            exp_x = math.exp(x)
-            risk_percentage = (exp_x / (1 + exp_x)) * 100
-        except OverflowError:
-            # Handle overflow for very high scores
-            risk_percentage = 100.0 if x > 0 else 0.0
+        risk_percentage = self.model.predict({
+            "age": age,
+            "functional_status": functional_status,
+            "asa_class": asa_class,
+            "creatinine_status": creatinine_status,
+            "surgery_type": surgery_type
+        }) * 100
         
         # Get risk interpretation
         interpretation = self._get_interpretation(risk_percentage, age, functional_status,
@@ -151,6 +164,49 @@ class GuptaMicaCalculator:
             "stage_description": interpretation["description"]
         }
     
+    def calculate_batch(self, patients: Sequence[Mapping[str, Any]]) -> List[float]:
+        """
+        Calculates MICA risk for many patients (e.g. an OR schedule)
+        
+        Args:
+            patients: One mapping per patient with the same keys as calculate()
+            
+        Returns:
+            List[float]: MICA risk percentage per patient, in input order
+        """
+        
+        for patient in patients:
+            self._validate_inputs(**patient)
+        
+        return [round(risk * 100, 2) for risk in self.model.predict_batch(patients)]
+    
+    def calculate_results(self, patients: Sequence[Mapping[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Calculates complete results, as returned by calculate(), for many patients
+        
+        Args:
+            patients: One mapping per patient with the same keys as calculate()
+            
+        Returns:
+            List[Dict]: Result, stage and interpretation per patient, in input order
+        """
+        
+        for patient in patients:
+            self._validate_inputs(**patient)
+        
+        results = []
+        for patient, risk in zip(patients, self.model.predict_batch(patients)):
+            risk_percentage = risk * 100
+            interpretation = self._get_interpretation(risk_percentage, **patient)
+            results.append({
+                "result": round(risk_percentage, 2),
+                "unit": "percentage",
+                "interpretation": interpretation["interpretation"],
+                "stage": interpretation["level"],
+                "stage_description": interpretation["description"]
+            })
+        return results
+    
     def _validate_inputs(self, age: int, functional_status: str, asa_class: str,
                         creatinine_status: str, surgery_type: str):
         """Validates input parameters"""
@@ -299,4 +355,14 @@ def calculate_gupta_mica(age: int, functional_status: str, asa_class: str,
     IMPORTANT: This function must follow the calculate_gupta_mica pattern
     """
     calculator = GuptaMicaCalculator()
-    return calculator.calculate(age, functional_status, asa_class, creatinine_status, surgery_type)
\ No newline at end of file
+    return calculator.calculate(age, functional_status, asa_class, creatinine_status, surgery_type)
+
+
+def calculate_gupta_mica_batch(parameter_sets: Sequence[Mapping[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Batch counterpart of calculate_gupta_mica for the calculator service
+    
+    Evaluates the logistic model once over all parameter sets.
+    """
+    calculator = GuptaMicaCalculator()
+    return calculator.calculate_results(parameter_sets)
@@ -28,87 +28,114 @@ References (Vancouver style):
    the American College of Physicians. Ann Intern Med. 2006;144(8):581-595.
 """
 
-import math
-from typing import Dict, Any
+from typing import Dict, Any, List, Mapping, Sequence
+
+from calculators.engines.logistic import LogisticModel
+
+
+# Age coefficient (points per year)
+AGE_COEFFICIENT = 0.0144
+
+# COPD points
+COPD_POINTS = {
+    "no": -0.4553,
+    "yes": 0.0
+}
+
+# Functional status points
+FUNCTIONAL_STATUS_POINTS = {
+    "independent": 0.0,
+    "partially_dependent": 0.7653,
+    "totally_dependent": 0.9400
+}
+
+# ASA class points
+ASA_CLASS_POINTS = {
+    "1": -3.0225,  # Normal healthy patient
+    "2": -1.6057,  # Mild systemic disease
+    "3": -0.4915,  # Severe systemic disease
+    "4": 0.0123,   # Severe systemic disease threatening life
+    "5": 0.0       # Moribund patient
+}
+
+# Sepsis status points
+SEPSIS_POINTS = {
+    "none": -0.7641,        # No sepsis
+    "sirs": 0.0,            # Preoperative SIRS
+    "sepsis": -0.0842,      # Preoperative sepsis
+    "septic_shock": 0.1048  # Preoperative septic shock
+}
+
+# Smoking points
+SMOKING_POINTS = {
+    "no": -0.4306,
+    "yes": 0.0
+}
+
+# Procedure type points (from highest to lowest risk)
+PROCEDURE_TYPE_POINTS = {
+    "aortic": 0.7178,
+    "brain": 0.6405,
+    "cardiac": 0.4492,
+    "thoracic_non_cardiac": 0.2806,
+    "neck": 0.1633,
+    "peripheral_vascular": 0.1382,
+    "foregut_hepatobiliary": 0.1239,
+    "gallbladder_appendix_adrenals_spleen": 0.0823,
+    "intestinal": 0.0645,
+    "orthopedic_non_spine": 0.0189,
+    "renal": -0.0234,
+    "spine": -0.0689,
+    "urology_non_renal": -0.1347,
+    "hernia": -0.1456,
+    "obstetric_gynecologic": -0.1789,
+    "skin": -0.3254,
+    "thyroid_parathyroid": -0.5632,
+    "vein": -0.8945,
+    "breast": -2.3318
+}
+
+# Base constant for logistic regression
+BASE_CONSTANT = -2.8977
+
+# Risk interpretation thresholds
+RISK_THRESHOLDS = [
+    {"min": 0.0, "max": 1.0, "level": "Very Low Risk", "description": "Minimal pneumonia risk"},
+    {"min": 1.0, "max": 3.0, "level": "Low Risk", "description": "Low pneumonia risk"},
+    {"min": 3.0, "max": 6.0, "level": "Moderate Risk", "description": "Moderate pneumonia risk"},
+    {"min": 6.0, "max": 15.0, "level": "High Risk", "description": "High pneumonia risk"},
+    {"min": 15.0, "max": 100.0, "level": "Very High Risk", "description": "Very high pneumonia risk"}
+]
+
+# Compiled model: age is numeric, the remaining factors are one-hot encoded
+MODEL = LogisticModel(
+    intercept=BASE_CONSTANT,
+    numeric={"age": AGE_COEFFICIENT},
+    categorical={
+        "copd": COPD_POINTS,
+        "functional_status": FUNCTIONAL_STATUS_POINTS,
+        "asa_class": ASA_CLASS_POINTS,
+        "sepsis_status": SEPSIS_POINTS,
+        "smoking": SMOKING_POINTS,
+        "procedure_type": PROCEDURE_TYPE_POINTS
+    }
+)
 
 
 class GuptaPostoperativePneumoniaRiskCalculator:
     """Calculator for Gupta Postoperative Pneumonia Risk"""
     
     def __init__(self):
-        # Age coefficient (points per year)
-        self.AGE_COEFFICIENT = 0.0144
-        
-        # COPD points
-        self.COPD_POINTS = {
-            "no": -0.4553,
-            "yes": 0.0
-        }
-        
-        # Functional status points
-        self.FUNCTIONAL_STATUS_POINTS = {
-            "independent": 0.0,
-            "partially_dependent": 0.7653,
-            "totally_dependent": 0.9400
-        }
-        
-        # ASA class points
-        self.ASA_CLASS_POINTS = {
-            "1": -3.0225,  # Normal healthy patient
-            "2": -1.6057,  # Mild systemic disease
-            "3": -0.4915,  # Severe systemic disease
-            "4": 0.0123,   # Severe systemic disease threatening life
-            "5": 0.0       # Moribund patient
-        }
-        
-        # Sepsis status points
-        self.SEPSIS_POINTS = {
-            "none": -0.7641,        # No sepsis
-            "sirs": 0.0,            # Preoperative SIRS
-            "sepsis": -0.0842,      # Preoperative sepsis
-            "septic_shock": 0.1048  # Preoperative septic shock
-        }
-        
-        # Smoking points
-        self.SMOKING_POINTS = {
-            "no": -0.4306,
-            "yes": 0.0
-        }
-        
-        # Procedure type points (from highest to lowest risk)
-        self.PROCEDURE_TYPE_POINTS = {
-            "aortic": 0.7178,
-            "brain": 0.6405,
-            "cardiac": 0.4492,
-            "thoracic_non_cardiac": 0.2806,
-            "neck": 0.1633,
-            "peripheral_vascular": 0.1382,
-            "foregut_hepatobiliary": 0.1239,
-            "gallbladder_appendix_adrenals_spleen": 0.0823,
-            "intestinal": 0.0645,
-            "orthopedic_non_spine": 0.0189,
-            "renal": -0.0234,
-            "spine": -0.0689,
-            "urology_non_renal": -0.1347,
-            "hernia": -0.1456,
-            "obstetric_gynecologic": -0.1789,
-            "skin": -0.3254,
-            "thyroid_parathyroid": -0.5632,
-            "vein": -0.8945,
-            "breast": -2.3318
-        }
-        
-        # Base constant for logistic regression
-        self.BASE_CONSTANT = -2.8977
-        
-        # Risk interpretation thresholds
-        self.RISK_THRESHOLDS = [
-            {"min": 0.0, "max": 1.0, "level": "Very Low Risk", "description": "Minimal pneumonia risk"},
-            {"min": 1.0, "max": 3.0, "level": "Low Risk", "description": "Low pneumonia risk"},
-            {"min": 3.0, "max": 6.0, "level": "Moderate Risk", "description": "Moderate pneumonia risk"},
-            {"min": 6.0, "max": 15.0, "level": "High Risk", "description": "High pneumonia risk"},
-            {"min": 15.0, "max": 100.0, "level": "Very High Risk", "description": "Very high pneumonia risk"}
-        ]
+        self.AGE_COEFFICIENT = AGE_COEFFICIENT
+        self.COPD_POINTS = COPD_POINTS
+        self.FUNCTIONAL_STATUS_POINTS = FUNCTIONAL_STATUS_POINTS
+        self.ASA_CLASS_POINTS = ASA_CLASS_POINTS
+        self.SEPSIS_POINTS = SEPSIS_POINTS
+        self.SMOKING_POINTS = SMOKING_POINTS
+        self.PROCEDURE_TYPE_POINTS = PROCEDURE_TYPE_POINTS
+        self.BASE_CONSTANT = BASE_CONSTANT
+        self.RISK_THRESHOLDS = RISK_THRESHOLDS
+        self.model = MODEL
     
     def calculate(self, age: int, copd: str, functional_status: str, asa_class: str,
                  sepsis_status: str, smoking: str, procedure_type: str) -> Dict[str, Any]:
@@ -132,27 +159,17 @@ class GuptaPostoperativePneumoniaRiskCalculator:
         self._validate_inputs(age, copd, functional_status, asa_class, 
                             sepsis_status, smoking, procedure_type)
         
-        # Calculate risk score components
-        age_points = age * self.AGE_COEFFICIENT
-        copd_points = self.COPD_POINTS[copd]
-        functional_points = self.FUNCTIONAL_STATUS_POINTS[functional_status]
-        asa_points = self.ASA_CLASS_POINTS[asa_class]
-        sepsis_points = self.SEPSIS_POINTS[sepsis_status]
-        smoking_points = self.SMOKING_POINTS[smoking]
-        procedure_points = self.PROCEDURE_TYPE_POINTS[procedure_type]
-        
-        # Calculate logistic regression score (x)
-        x = (self.BASE_CONSTANT + age_points + copd_points + functional_points + 
-             asa_points + sepsis_points + smoking_points + procedure_points)
-        
         # Calculate risk percentage using logistic function
         # Risk = e^x / (1 + e^x) * 100
-        try:
-            exp_x = math.exp(x)
-            risk_percentage = (exp_x / (1 + exp_x)) * 100
-        except OverflowError:
-            # Handle overflow for very high scores
-            risk_percentage = 100.0 if x > 0 else 0.0
+        risk_percentage = self.model.predict({
+            "age": age,
+            "copd": copd,
+            "functional_status": functional_status,
+            "asa_class": asa_class,
+            "sepsis_status": sepsis_status,
+            "smoking": smoking,
+            "procedure_type": procedure_type
+        }) * 100
         
         # Get risk interpretation
         interpretation = self._get_interpretation(risk_percentage, age, copd, functional_status,
@@ -166,6 +183,49 @@ class GuptaPostoperativePneumoniaRiskCalculator:
             "stage_description": interpretation["description"]
         }
     
+    def calculate_batch(self, patients: Sequence[Mapping[str, Any]]) -> List[float]:
+        """
+        Calculates pneumonia risk for many patients (e.g. an OR schedule)
+        
+        Args:
+            patients: One mapping per patient with the same keys as calculate()
+            
+        Returns:
+            List[float]: Pneumonia risk percentage per patient, in input order
+        """
+        
+        for patient in patients:
+            self._validate_inputs(**patient)
+        
+        return [round(risk * 100, 2) for risk in self.model.predict_batch(patients)]
+    
+    def calculate_results(self, patients: Sequence[Mapping[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Calculates complete results, as returned by calculate(), for many patients
+        
+        Args:
+            patients: One mapping per patient with the same keys as calculate()
+            
+        Returns:
+            List[Dict]: Result, stage and interpretation per patient, in input order
+        """
+        
+        for patient in patients:
+            self._validate_inputs(**patient)
+        
+        results = []
+        for patient, risk in zip(patients, self.model.predict_batch(patients)):
+            risk_percentage = risk * 100
+            interpretation = self._get_interpretation(risk_percentage, **patient)
+            results.append({
+                "result": round(risk_percentage, 2),
+                "unit": "percentage",
+                "interpretation": interpretation["interpretation"],
+                "stage": interpretation["level"],
+                "stage_description": interpretation["description"]
+            })
+        return results
+    
     def _validate_inputs(self, age: int, copd: str, functional_status: str, 
                         asa_class: str, sepsis_status: str, smoking: str, procedure_type: str):
         """Validates input parameters"""
@@ -314,4 +374,14 @@ def calculate_gupta_postoperative_pneumonia_risk(age: int, copd: str, functional
     """
     calculator = GuptaPostoperativePneumoniaRiskCalculator()
     return calculator.calculate(age, copd, functional_status, asa_class, 
-                              sepsis_status, smoking, procedure_type)
\ No newline at end of file
+                              sepsis_status, smoking, procedure_type)
+
+
+def calculate_gupta_postoperative_pneumonia_risk_batch(parameter_sets: Sequence[Mapping[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Batch counterpart of calculate_gupta_postoperative_pneumonia_risk for the calculator service
+    
+    Evaluates the logistic model once over all parameter sets.
+    """
+    calculator = GuptaPostoperativePneumoniaRiskCalculator()
+    return calculator.calculate_results(parameter_sets)
@@ -29,81 +29,104 @@ References (Vancouver style):
    2010;113(6):1338-1350.
 """
 
-import math
-from typing import Dict, Any
+from typing import Dict, Any, List, Mapping, Sequence
+
+from calculators.engines.logistic import LogisticModel
+
+
+# Functional status points
+FUNCTIONAL_STATUS_POINTS = {
+    "independent": 0.0,
+    "partially_dependent": 0.7678,
+    "totally_dependent": 1.4046
+}
+
+# ASA class points
+ASA_CLASS_POINTS = {
+    "1": -3.5265,  # Normal healthy patient
+    "2": -2.0008,  # Mild systemic disease
+    "3": -0.6201,  # Severe systemic disease
+    "4": 0.2441,   # Severe systemic disease threatening life
+    "5": 0.0       # Moribund patient
+}
+
+# Sepsis status points
+SEPSIS_POINTS = {
+    "none": -0.7840,        # No sepsis
+    "sirs": 0.0,            # Preoperative SIRS (reference)
+    "sepsis": 0.2752,       # Preoperative sepsis
+    "septic_shock": 0.9035  # Preoperative septic shock
+}
+
+# Emergency case points
+EMERGENCY_POINTS = {
+    "no": -0.5739,
+    "yes": 0.0
+}
+
+# Procedure type points (from highest to lowest risk)
+PROCEDURE_TYPE_POINTS = {
+    "aortic": 1.0781,
+    "brain": 0.8086,
+    "thoracic_non_cardiac": 0.7737,
+    "cardiac": 0.6959,
+    "foregut_hepatobiliary": 0.4949,
+    "peripheral_vascular": 0.3646,
+    "neck": 0.2701,
+    "gallbladder_appendix_adrenals_spleen": 0.2135,
+    "intestinal": 0.1964,
+    "renal": 0.1460,
+    "spine": 0.1139,
+    "orthopedic_non_spine": 0.0654,
+    "other_abdomen": 0.0481,
+    "urology_non_renal": 0.0089,
+    "hernia": 0.0,  # Reference category
+    "gynecologic_oncology": -0.0234,
+    "obstetric_gynecologic": -0.1456,
+    "other_hematologic": -0.2341,
+    "skin": -0.3678,
+    "thyroid_parathyroid": -0.4927,
+    "vein": -0.8934,
+    "breast": -2.6462
+}
+
+# Base constant for logistic regression
+BASE_CONSTANT = -1.7397
+
+# Risk interpretation thresholds
+RISK_THRESHOLDS = [
+    {"min": 0.0, "max": 1.0, "level": "Very Low Risk", "description": "Minimal respiratory failure risk"},
+    {"min": 1.0, "max": 3.0, "level": "Low Risk", "description": "Low respiratory failure risk"},
+    {"min": 3.0, "max": 8.0, "level": "Moderate Risk", "description": "Moderate respiratory failure risk"},
+    {"min": 8.0, "max": 20.0, "level": "High Risk", "description": "High respiratory failure risk"},
+    {"min": 20.0, "max": 100.0, "level": "Very High Risk", "description": "Very high respiratory failure risk"}
+]
+
+# Compiled model: every factor is one-hot encoded
+MODEL = LogisticModel(
+    intercept=BASE_CONSTANT,
+    categorical={
+        "functional_status": FUNCTIONAL_STATUS_POINTS,
+        "asa_class": ASA_CLASS_POINTS,
+        "sepsis_status": SEPSIS_POINTS,
+        "emergency_case": EMERGENCY_POINTS,
+        "procedure_type": PROCEDURE_TYPE_POINTS
+    }
+)
 
 
 class GuptaPostoperativeRespiratoryFailureRiskCalculator:
     """Calculator for Gupta Postoperative Respiratory Failure Risk"""
     
     def __init__(self):
-        # Functional status points
-        self.FUNCTIONAL_STATUS_POINTS = {
-            "independent": 0.0,
-            "partially_dependent": 0.7678,
-            "totally_dependent": 1.4046
-        }
-        
-        # ASA class points
-        self.ASA_CLASS_POINTS = {
-            "1": -3.5265,  # Normal healthy patient
-            "2": -2.0008,  # Mild systemic disease
-            "3": -0.6201,  # Severe systemic disease
-            "4": 0.2441,   # Severe systemic disease threatening life
-            "5": 0.0       # Moribund patient
-        }
-        
-        # Sepsis status points
-        self.SEPSIS_POINTS = {
-            "none": -0.7840,        # No sepsis
-            "sirs": 0.0,            # Preoperative SIRS (reference)
-            "sepsis": 0.2752,       # Preoperative sepsis
-            "septic_shock": 0.9035  # Preoperative septic shock
-        }
-        
-        # Emergency case points
-        self.EMERGENCY_POINTS = {
-            "no": -0.5739,
-            "yes": 0.0
-        }
-        
-        # Procedure type points (from highest to lowest risk)
-        self.PROCEDURE_TYPE_POINTS = {
-            "aortic": 1.0781,
-            "brain": 0.8086,
-            "thoracic_non_cardiac": 0.7737,
-            "cardiac": 0.6959,
-            "foregut_hepatobiliary": 0.4949,
-            "peripheral_vascular": 0.3646,
-            "neck": 0.2701,
-            "gallbladder_appendix_adrenals_spleen": 0.2135,
-            "intestinal": 0.1964,
-            "renal": 0.1460,
-            "spine": 0.1139,
-            "orthopedic_non_spine": 0.0654,
-            "other_abdomen": 0.0481,
-            "urology_non_renal": 0.0089,
-            "hernia": 0.0,  # Reference category
-            "gynecologic_oncology": -0.0234,
-            "obstetric_gynecologic": -0.1456,
-            "other_hematologic": -0.2341,
-            "skin": -0.3678,
-            "thyroid_parathyroid": -0.4927,
-            "vein": -0.8934,
-            "breast": -2.6462
-        }
-        
-        # Base constant for logistic regression
-        self.BASE_CONSTANT = -1.7397
-        
-        # Risk interpretation thresholds
-        self.RISK_THRESHOLDS = [
-            {"min": 0.0, "max": 1.0, "level": "Very Low Risk", "description": "Minimal respiratory failure risk"},
-            {"min": 1.0, "max": 3.0, "level": "Low Risk", "description": "Low respiratory failure risk"},
-            {"min": 3.0, "max": 8.0, "level": "Moderate Risk", "description": "Moderate respiratory failure risk"},
-            {"min": 8.0, "max": 20.0, "level": "High Risk", "description": "High respiratory failure risk"},
-            {"min": 20.0, "max": 100.0, "level": "Very High Risk", "description": "Very high respiratory failure risk"}
-        ]
+        self.FUNCTIONAL_STATUS_POINTS = FUNCTIONAL_STATUS_POINTS
+        self.ASA_CLASS_POINTS = ASA_CLASS_POINTS
+        self.SEPSIS_POINTS = SEPSIS_POINTS
+        self.EMERGENCY_POINTS = EMERGENCY_POINTS
+        self.PROCEDURE_TYPE_POINTS = PROCEDURE_TYPE_POINTS
+        self.BASE_CONSTANT = BASE_CONSTANT
+        self.RISK_THRESHOLDS = RISK_THRESHOLDS
+        self.model = MODEL
     
     def calculate(self, functional_status: str, asa_class: str, sepsis_status: str,
                  emergency_case: str, procedure_type: str) -> Dict[str, Any]:
@@ -125,25 +148,15 @@ class GuptaPostoperativeRespiratoryFailureRiskCalculator:
         self._validate_inputs(functional_status, asa_class, sepsis_status, 
                             emergency_case, procedure_type)
         
-        # Calculate risk score components
-        functional_points = self.FUNCTIONAL_STATUS_POINTS[functional_status]
-        asa_points = self.ASA_CLASS_POINTS[asa_class]
-        sepsis_points = self.SEPSIS_POINTS[sepsis_status]
-        emergency_points = self.EMERGENCY_POINTS[emergency_case]
-        procedure_points = self.PROCEDURE_TYPE_POINTS[procedure_type]
-        
-        # Calculate logistic regression score (x)
-        x = (self.BASE_CONSTANT + functional_points + asa_points + 
-             sepsis_points + emergency_points + procedure_points)
-        
         # Calculate risk percentage using logistic function
         # Risk = e^x / (1 + e^x) * 100
-        try:
-            exp_x = math.exp(x)
-            risk_percentage = (exp_x / (1 + exp_x)) * 100
-        except OverflowError:
-            # Handle overflow for very high scores
-            risk_percentage = 100.0 if x > 0 else 0.0
+        risk_percentage = self.model.predict({
+            "functional_status": functional_status,
+            "asa_class": asa_class,
+            "sepsis_status": sepsis_status,
+            "emergency_case": emergency_case,
+            "procedure_type": procedure_type
+        }) * 100
         
         # Get risk interpretation
         interpretation = self._get_interpretation(risk_percentage, functional_status, asa_class,
@@ -157,6 +170,22 @@ class GuptaPostoperativeRespiratoryFailureRiskCalculator:
             "stage_description": interpretation["description"]
         }
     
+    def calculate_batch(self, patients: Sequence[Mapping[str, Any]]) -> List[float]:
+        """
+        Calculates respiratory failure risk for many patients (e.g. an OR schedule)
+        
+        Args:
+            patients: One mapping per patient with the same keys as calculate()
+            
+        Returns:
+            List[float]: Respiratory failure risk percentage per patient, in input order
+        """
+        
+        for patient in patients:
+            self._validate_inputs(**patient)
+        
+        return [round(risk * 100, 2) for risk in self.model.predict_batch(patients)]
+    
     def _validate_inputs(self, functional_status: str, asa_class: str, sepsis_status: str,
                         emergency_case: str, procedure_type: str):
         """Validates input parameters"""
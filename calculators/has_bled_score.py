@@ -12,6 +12,27 @@ References:
 
 from typing import Dict, Any
 
+from calculators.engines.points import PointScore
+
+
+# Points table, evaluated by the point-score engine
+POINTS = {
+    "components": [
+        {"name": "hypertension", "when": {"parameter": "hypertension", "eq": "yes"}, "points": 1},
+        {"name": "abnormal_renal_function", "when": {"parameter": "abnormal_renal_function", "eq": "yes"}, "points": 1},
+        {"name": "abnormal_liver_function", "when": {"parameter": "abnormal_liver_function", "eq": "yes"}, "points": 1},
+        {"name": "stroke_history", "when": {"parameter": "stroke_history", "eq": "yes"}, "points": 1},
+        {"name": "bleeding_history", "when": {"parameter": "bleeding_history", "eq": "yes"}, "points": 1},
+        {"name": "labile_inr", "when": {"parameter": "labile_inr", "eq": "yes"}, "points": 1},
+        {"name": "elderly", "when": {"parameter": "elderly", "eq": "yes"}, "points": 1},
+        {"name": "drugs", "when": {"parameter": "drugs", "eq": "yes"}, "points": 1},
+        {"name": "alcohol", "when": {"parameter": "alcohol", "eq": "yes"}, "points": 1}
+    ]
+}
+
+# Compiled HAS-BLED points table
+POINT_SCORE = PointScore("has_bled_score", POINTS)
+
 
 class HasBledScoreCalculator:
     """Calculator for HAS-BLED Score for Major Bleeding Risk"""
@@ -60,39 +81,18 @@ class HasBledScoreCalculator:
                             drugs, alcohol)
         
         # Calculate HAS-BLED score - each positive factor adds 1 point
-        score = 0
-        
-        # H - Hypertension
-        if hypertension == "yes":
-            score += 1
-            
-        # A - Abnormal renal/liver function (max 2 points - 1 for each)
-        if abnormal_renal_function == "yes":
-            score += 1
-        if abnormal_liver_function == "yes":
-            score += 1
-            
-        # S - Stroke history
-        if stroke_history == "yes":
-            score += 1
-            
-        # B - Bleeding history or predisposition
-        if bleeding_history == "yes":
-            score += 1
-            
-        # L - Labile INR
-        if labile_inr == "yes":
-            score += 1
-            
-        # E - Elderly (>65)
-        if elderly == "yes":
-            score += 1
-            
-        # D - Drugs/alcohol (max 2 points - 1 for each)
-        if drugs == "yes":
-            score += 1
-        if alcohol == "yes":
-            score += 1
+        # (declarative points table POINTS)
+        score = POINT_SCORE.total({
+            "hypertension": hypertension,
+            "abnormal_renal_function": abnormal_renal_function,
+            "abnormal_liver_function": abnormal_liver_function,
+            "stroke_history": stroke_history,
+            "bleeding_history": bleeding_history,
+            "labile_inr": labile_inr,
+            "elderly": elderly,
+            "drugs": drugs,
+            "alcohol": alcohol
+        })
         
         # Get interpretation and risk percentage
         interpretation = self._get_interpretation(score)
@@ -9,26 +9,34 @@ References:
 2. Elliott PM, et al. Eur Heart J. 2014;35(39):2733-79.
 """
 
-import math
 from typing import Dict, Any
 
+from calculators.engines.survival import SurvivalModel
+
+
+# Model coefficients from the original paper
+COEFFICIENTS = {
+    "max_wall_thickness": 0.15939858,
+    "max_wall_thickness_sq": -0.00294271,
+    "left_atrial_diameter": 0.0259082,
+    "max_lvot_gradient": 0.00446131,
+    "family_history_scd": 0.4583082,
+    "nsvt": 0.82639195,
+    "unexplained_syncope": 0.71650361,
+    "age": -0.01799934
+}
+
+# Baseline survival probability at 5 years
+BASELINE_SURVIVAL = 0.998
+
+MODEL = SurvivalModel(tuple(COEFFICIENTS), COEFFICIENTS, {"5_year": BASELINE_SURVIVAL})
+
 
 class HcmRiskScdCalculator:
     """Calculator for HCM Risk-SCD"""
     
     def __init__(self):
-        # Model coefficients from the original paper
-        self.COEFF_MAX_WALL_THICKNESS = 0.15939858
-        self.COEFF_MAX_WALL_THICKNESS_SQ = -0.00294271
-        self.COEFF_LA_DIAMETER = 0.0259082
-        self.COEFF_MAX_LVOT_GRADIENT = 0.00446131
-        self.COEFF_FAMILY_HISTORY = 0.4583082
-        self.COEFF_NSVT = 0.82639195
-        self.COEFF_UNEXPLAINED_SYNCOPE = 0.71650361
-        self.COEFF_AGE = -0.01799934
-        
-        # Baseline survival probability at 5 years
-        self.BASELINE_SURVIVAL = 0.998
+        self.model = MODEL
     
     def calculate(self, age: int, family_history_scd: str, max_wall_thickness: float,
                   left_atrial_diameter: float, max_lvot_gradient: float,
@@ -54,26 +62,18 @@ class HcmRiskScdCalculator:
                             left_atrial_diameter, max_lvot_gradient,
                             nsvt, unexplained_syncope)
         
-        # Convert binary variables to numeric
-        family_history_binary = 1 if family_history_scd == "yes" else 0
-        nsvt_binary = 1 if nsvt == "yes" else 0
-        syncope_binary = 1 if unexplained_syncope == "yes" else 0
-        
-        # Calculate prognostic index
-        prognostic_index = (
-            self.COEFF_MAX_WALL_THICKNESS * max_wall_thickness +
-            self.COEFF_MAX_WALL_THICKNESS_SQ * (max_wall_thickness ** 2) +
-            self.COEFF_LA_DIAMETER * left_atrial_diameter +
-            self.COEFF_MAX_LVOT_GRADIENT * max_lvot_gradient +
-            self.COEFF_FAMILY_HISTORY * family_history_binary +
-            self.COEFF_NSVT * nsvt_binary +
-            self.COEFF_UNEXPLAINED_SYNCOPE * syncope_binary +
-            self.COEFF_AGE * age
-        )
-        
         # Calculate 5-year SCD risk
         # Risk = 1 - (baseline survival)^exp(prognostic index)
-        five_year_risk = (1 - math.pow(self.BASELINE_SURVIVAL, math.exp(prognostic_index))) * 100
+        five_year_risk = self.model.predict((
+            max_wall_thickness,
+            max_wall_thickness ** 2,
+            left_atrial_diameter,
+            max_lvot_gradient,
+            1 if family_history_scd == "yes" else 0,
+            1 if nsvt == "yes" else 0,
+            1 if unexplained_syncope == "yes" else 0,
+            age
+        ))["5_year"] * 100
         
         # Ensure risk is within 0-100% range
         five_year_risk = max(0, min(100, five_year_risk))
@@ -10,6 +10,23 @@ References:
 
 from typing import Dict, Any
 
+from calculators.engines.points import PointScore
+
+
+# Points table, evaluated by the point-score engine
+POINTS = {
+    "components": [
+        {"name": "history", "parameter": "history", "per_unit": 1},
+        {"name": "ekg", "parameter": "ekg", "per_unit": 1},
+        {"name": "age", "parameter": "age", "per_unit": 1},
+        {"name": "risk_factors", "parameter": "risk_factors", "per_unit": 1},
+        {"name": "troponin", "parameter": "troponin", "per_unit": 1}
+    ]
+}
+
+# Compiled HEART points table
+POINT_SCORE = PointScore("heart_score", POINTS)
+
 
 class HeartScoreCalculator:
     """Calculator for HEART Score for Major Cardiac Events"""
@@ -33,8 +50,14 @@ class HeartScoreCalculator:
         # Validations
         self._validate_inputs(history, ekg, age, risk_factors, troponin)
         
-        # Calculate total score
-        result = history + ekg + age + risk_factors + troponin
+        # Calculate total score (declarative points table POINTS)
+        result = POINT_SCORE.total({
+            "history": history,
+            "ekg": ekg,
+            "age": age,
+            "risk_factors": risk_factors,
+            "troponin": troponin
+        })
         
         # Get interpretation
         interpretation = self._get_interpretation(result)
@@ -10,38 +10,62 @@ References:
   near-term newborns. Pediatrics. 1999 Jan;103(1):6-14.
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, List, Sequence
+
+from calculators.engines.nomogram import Nomogram
+
+
+# Define Bhutani nomogram percentile curves (hours: bilirubin mg/dL)
+# Based on the published nomogram data points
+PERCENTILE_40 = {
+    12: 4.0, 18: 5.0, 24: 5.8, 30: 6.5, 36: 7.2, 42: 7.8,
+    48: 8.4, 54: 8.9, 60: 9.3, 66: 9.7, 72: 10.0, 78: 10.3,
+    84: 10.5, 90: 10.7, 96: 10.9, 102: 11.0, 108: 11.1, 114: 11.2,
+    120: 11.3, 126: 11.4, 132: 11.5, 138: 11.6, 144: 11.7, 150: 11.8,
+    156: 11.9, 162: 11.9, 168: 12.0
+}
+
+PERCENTILE_75 = {
+    12: 5.5, 18: 6.7, 24: 7.8, 30: 8.7, 36: 9.5, 42: 10.2,
+    48: 10.9, 54: 11.5, 60: 12.0, 66: 12.4, 72: 12.8, 78: 13.1,
+    84: 13.4, 90: 13.6, 96: 13.8, 102: 14.0, 108: 14.1, 114: 14.2,
+    120: 14.3, 126: 14.4, 132: 14.5, 138: 14.6, 144: 14.7, 150: 14.8,
+    156: 14.9, 162: 14.9, 168: 15.0
+}
+
+PERCENTILE_95 = {
+    12: 7.0, 18: 8.5, 24: 10.0, 30: 11.1, 36: 12.1, 42: 12.9,
+    48: 13.7, 54: 14.3, 60: 14.9, 66: 15.4, 72: 15.8, 78: 16.2,
+    84: 16.5, 90: 16.8, 96: 17.0, 102: 17.2, 108: 17.4, 114: 17.5,
+    120: 17.6, 126: 17.7, 132: 17.8, 138: 17.9, 144: 18.0, 150: 18.1,
+    156: 18.2, 162: 18.2, 168: 18.3
+}
+
+# Dense per-hour grid of the three curves, built once at import time
+NOMOGRAM = Nomogram({
+    "p40": PERCENTILE_40,
+    "p75": PERCENTILE_75,
+    "p95": PERCENTILE_95
+}, step=1, digits=2)
+
+# Risk zone and interpretation percentile per nomogram zone (curves at or below the TSB)
+RISK_ZONES = (
+    ("Low Risk", 0),
+    ("Low-Intermediate Risk", 50),
+    ("High-Intermediate Risk", 85),
+    ("High Risk", 95)
+)
 
 
 class HourSpecificNeonatalHyperbilirubinemiaCalculator:
     """Calculator for Hour-Specific Risk for Neonatal Hyperbilirubinemia"""
     
     def __init__(self):
-        # Define Bhutani nomogram percentile curves (hours: bilirubin mg/dL)
-        # Based on the published nomogram data points
-        self.percentile_40 = {
-            12: 4.0, 18: 5.0, 24: 5.8, 30: 6.5, 36: 7.2, 42: 7.8,
-            48: 8.4, 54: 8.9, 60: 9.3, 66: 9.7, 72: 10.0, 78: 10.3,
-            84: 10.5, 90: 10.7, 96: 10.9, 102: 11.0, 108: 11.1, 114: 11.2,
-            120: 11.3, 126: 11.4, 132: 11.5, 138: 11.6, 144: 11.7, 150: 11.8,
-            156: 11.9, 162: 11.9, 168: 12.0
-        }
-        
-        self.percentile_75 = {
-            12: 5.5, 18: 6.7, 24: 7.8, 30: 8.7, 36: 9.5, 42: 10.2,
-            48: 10.9, 54: 11.5, 60: 12.0, 66: 12.4, 72: 12.8, 78: 13.1,
-            84: 13.4, 90: 13.6, 96: 13.8, 102: 14.0, 108: 14.1, 114: 14.2,
-            120: 14.3, 126: 14.4, 132: 14.5, 138: 14.6, 144: 14.7, 150: 14.8,
-            156: 14.9, 162: 14.9, 168: 15.0
-        }
-        
-        self.percentile_95 = {
-            12: 7.0, 18: 8.5, 24: 10.0, 30: 11.1, 36: 12.1, 42: 12.9,
-            48: 13.7, 54: 14.3, 60: 14.9, 66: 15.4, 72: 15.8, 78: 16.2,
-            84: 16.5, 90: 16.8, 96: 17.0, 102: 17.2, 108: 17.4, 114: 17.5,
-            120: 17.6, 126: 17.7, 132: 17.8, 138: 17.9, 144: 18.0, 150: 18.1,
-            156: 18.2, 162: 18.2, 168: 18.3
-        }
+        # Bhutani nomogram percentile curves (hours: bilirubin mg/dL)
+        self.percentile_40 = PERCENTILE_40
+        self.percentile_75 = PERCENTILE_75
+        self.percentile_95 = PERCENTILE_95
+        self.nomogram = NOMOGRAM
     
     def calculate(self, age_hours: int, total_bilirubin: float) -> Dict[str, Any]:
         """
@@ -58,24 +82,12 @@ class HourSpecificNeonatalHyperbilirubinemiaCalculator:
         # Validate inputs
         self._validate_inputs(age_hours, total_bilirubin)
         
-        # Get interpolated percentile thresholds for the specific hour
-        p40_threshold = self._interpolate_percentile(age_hours, self.percentile_40)
-        p75_threshold = self._interpolate_percentile(age_hours, self.percentile_75)
-        p95_threshold = self._interpolate_percentile(age_hours, self.percentile_95)
+        # Percentile thresholds for the specific hour (precomputed per-hour grid)
+        p40_threshold, p75_threshold, p95_threshold = self.nomogram.thresholds(age_hours)
         
         # Determine risk zone based on bilirubin level
-        if total_bilirubin < p40_threshold:
-            zone = "Low Risk"
-            interpretation = self._get_interpretation(0)
-        elif total_bilirubin < p75_threshold:
-            zone = "Low-Intermediate Risk"
-            interpretation = self._get_interpretation(50)
-        elif total_bilirubin < p95_threshold:
-            zone = "High-Intermediate Risk"
-            interpretation = self._get_interpretation(85)
-        else:
-            zone = "High Risk"
-            interpretation = self._get_interpretation(95)
+        zone, zone_percentile = RISK_ZONES[self.nomogram.zone(age_hours, total_bilirubin)]
+        interpretation = self._get_interpretation(zone_percentile)
         
         # Calculate approximate percentile
         percentile = self._calculate_percentile(age_hours, total_bilirubin, 
@@ -90,6 +102,41 @@ class HourSpecificNeonatalHyperbilirubinemiaCalculator:
             "percentile": round(percentile, 1)
         }
     
+    def calculate_batch(self, age_hours: Sequence[int],
+                        total_bilirubin: Sequence[float]) -> Dict[str, Any]:
+        """
+        Plots a series of bilirubin measurements against the nomogram
+        
+        Args:
+            age_hours (Sequence[int]): Age of neonate in hours per measurement
+            total_bilirubin (Sequence[float]): Total serum bilirubin in mg/dL per measurement
+            
+        Returns:
+            Dict with the hourly nomogram curves and the zone and percentile
+            of every measurement, in input order
+        """
+        
+        if len(age_hours) != len(total_bilirubin):
+            raise ValueError("Age and bilirubin series must have the same length")
+        
+        readings: List[Dict[str, Any]] = []
+        for hours, bilirubin in zip(age_hours, total_bilirubin):
+            self._validate_inputs(hours, bilirubin)
+            p40, p75, p95 = self.nomogram.thresholds(hours)
+            zone, _ = RISK_ZONES[self.nomogram.zone(hours, bilirubin)]
+            percentile = self._calculate_percentile(hours, bilirubin, p40, p75, p95)
+            readings.append({
+                "age_hours": hours,
+                "total_bilirubin": bilirubin,
+                "result": zone,
+                "percentile": round(percentile, 1)
+            })
+        
+        return {
+            "curves": self.nomogram.points(),
+            "readings": readings
+        }
+    
     def _validate_inputs(self, age_hours: int, total_bilirubin: float):
         """Validates input parameters"""
         
@@ -105,39 +152,6 @@ class HourSpecificNeonatalHyperbilirubinemiaCalculator:
         if total_bilirubin < 0.1 or total_bilirubin > 30:
             raise ValueError("Total bilirubin must be between 0.1 and 30 mg/dL")
     
-    def _interpolate_percentile(self, age_hours: int, percentile_data: dict) -> float:
-        """
-        Interpolates percentile threshold for specific hour
-        
-        Args:
-            age_hours: Age in hours
-            percentile_data: Dictionary of hour: bilirubin values
-            
-        Returns:
-            Interpolated bilirubin threshold
-        """
-        
-        # Get exact data points
-        hours_list = sorted(percentile_data.keys())
-        
-        # If exact hour exists, return it
-        if age_hours in percentile_data:
-            return percentile_data[age_hours]
-        
-        # Find surrounding hours for interpolation
-        lower_hour = max([h for h in hours_list if h < age_hours])
-        upper_hour = min([h for h in hours_list if h > age_hours])
-        
-        # Linear interpolation
-        lower_value = percentile_data[lower_hour]
-        upper_value = percentile_data[upper_hour]
-        
-        # Calculate interpolated value
-        fraction = (age_hours - lower_hour) / (upper_hour - lower_hour)
-        interpolated = lower_value + fraction * (upper_value - lower_value)
-        
-        return round(interpolated, 2)
-    
     def _calculate_percentile(self, age_hours: int, total_bilirubin: float,
                             p40: float, p75: float, p95: float) -> float:
         """
@@ -21,40 +21,56 @@ References:
 """
 
 import math
-from typing import Dict, Any
+from typing import Dict, Any, List, Sequence, Tuple
+
+from calculators.engines.survival import SurvivalModel
+
+
+# Baseline survival probabilities
+BASELINE_SURVIVAL = {
+    "north_america": {
+        "2_year": 0.9832,
+        "5_year": 0.9365
+    },
+    "non_north_america": {
+        "2_year": 0.9870,
+        "5_year": 0.9520
+    }
+}
+
+# Mean values for centering (from original cohort)
+MEANS = {
+    "age_decades": 7.036,
+    "male": 0.5642,
+    "egfr_5units": 7.222,
+    "log_acr": 5.137
+}
+
+# Beta coefficients for 4-variable model
+COEFFICIENTS = {
+    "age_decades": -0.2201,
+    "male": 0.2467,
+    "egfr_5units": -0.5567,
+    "log_acr": 0.4510
+}
+
+FEATURES = ("age_decades", "male", "egfr_5units", "log_acr")
+
+# One compiled model per region, evaluated at both horizons in a single pass
+MODELS = {
+    region: SurvivalModel(FEATURES, COEFFICIENTS, baseline_survival, means=MEANS)
+    for region, baseline_survival in BASELINE_SURVIVAL.items()
+}
 
 
 class KidneyFailureRiskCalculator:
     """Calculator for Kidney Failure Risk (4-Variable KFRE)"""
     
     def __init__(self):
-        # Baseline survival probabilities
-        self.baseline_survival = {
-            "north_america": {
-                "2_year": 0.9832,
-                "5_year": 0.9365
-            },
-            "non_north_america": {
-                "2_year": 0.9870,
-                "5_year": 0.9520
-            }
-        }
-        
-        # Mean values for centering (from original cohort)
-        self.means = {
-            "age_decades": 7.036,
-            "male_proportion": 0.5642,
-            "egfr_5units": 7.222,
-            "log_acr": 5.137
-        }
-        
-        # Beta coefficients for 4-variable model
-        self.coefficients = {
-            "age": -0.2201,
-            "male": 0.2467,
-            "egfr": -0.5567,
-            "log_acr": 0.4510
-        }
+        self.baseline_survival = BASELINE_SURVIVAL
+        self.means = MEANS
+        self.coefficients = COEFFICIENTS
+        self.models = MODELS
     
     def calculate(self, age: int, sex: str, egfr: float, urine_acr: float, 
                  region: str) -> Dict[str, Any]:
@@ -75,12 +91,10 @@ class KidneyFailureRiskCalculator:
         # Validate inputs
         self._validate_inputs(age, sex, egfr, urine_acr, region)
         
-        # Calculate linear predictor
-        linear_predictor = self._calculate_linear_predictor(age, sex, egfr, urine_acr)
-        
-        # Calculate risks
-        risk_2_year = self._calculate_risk(linear_predictor, region, "2_year")
-        risk_5_year = self._calculate_risk(linear_predictor, region, "5_year")
+        # Calculate 2- and 5-year risks from one linear predictor
+        risks = self.models[region].predict(self._features(age, sex, egfr, urine_acr))
+        risk_2_year = risks["2_year"] * 100
+        risk_5_year = risks["5_year"] * 100
         
         # Get clinical interpretation
         interpretation = self._get_interpretation(risk_2_year, risk_5_year, egfr)
@@ -124,50 +138,48 @@ class KidneyFailureRiskCalculator:
         if region not in ["north_america", "non_north_america"]:
             raise ValueError("Region must be 'north_america' or 'non_north_america'")
     
-    def _calculate_linear_predictor(self, age: int, sex: str, egfr: float, 
-                                   urine_acr: float) -> float:
-        """Calculates the linear predictor (Xβ) for the Cox model"""
-        
-        # Convert variables to appropriate scales and center
-        age_decades = age / 10.0
-        male = 1 if sex == "male" else 0
-        egfr_5units = egfr / 5.0
-        log_acr = math.log(urine_acr)
-        
-        # Calculate linear predictor
-        linear_predictor = (
-            self.coefficients["age"] * (age_decades - self.means["age_decades"]) +
-            self.coefficients["male"] * (male - self.means["male_proportion"]) +
-            self.coefficients["egfr"] * (egfr_5units - self.means["egfr_5units"]) +
-            self.coefficients["log_acr"] * (log_acr - self.means["log_acr"])
-        )
-        
-        return linear_predictor
-    
-    def _calculate_risk(self, linear_predictor: float, region: str, 
-                       time_period: str) -> float:
+    def calculate_batch(self, ages: Sequence[int], sexes: Sequence[str],
+                        egfrs: Sequence[float], urine_acrs: Sequence[float],
+                        region: str) -> Dict[str, List[float]]:
         """
-        Calculates the absolute risk of kidney failure
+        Calculates 2- and 5-year kidney failure risk for a cohort
+        
+        Inputs are parallel columns (one entry per patient) and are expected to
+        be already validated; no interpretation text is generated.
         
         Args:
-            linear_predictor (float): Xβ from Cox model
-            region (str): Geographic region
-            time_period (str): "2_year" or "5_year"
+            ages (Sequence[int]): Patient ages in years
+            sexes (Sequence[str]): Biological sex per patient (male/female)
+            egfrs (Sequence[float]): eGFR per patient in mL/min/1.73 m²
+            urine_acrs (Sequence[float]): Urine ACR per patient in mg/g
+            region (str): Geographic region (north_america/non_north_america)
             
         Returns:
-            float: Risk percentage
+            Dict with "risk_2_year" and "risk_5_year" percentage columns
         """
         
-        # Get baseline survival for region and time
-        baseline_survival = self.baseline_survival[region][time_period]
+        if region not in self.models:
+            raise ValueError("Region must be 'north_america' or 'non_north_america'")
         
-        # Calculate risk: 1 - S0(t)^exp(Xβ)
-        risk = 1 - math.pow(baseline_survival, math.exp(linear_predictor))
+        rows = [self._features(age, sex, egfr, urine_acr)
+                for age, sex, egfr, urine_acr in zip(ages, sexes, egfrs, urine_acrs)]
+        risks = self.models[region].predict_batch(rows)
         
-        # Convert to percentage
-        risk_percentage = risk * 100
+        return {
+            "risk_2_year": [round(risk * 100, 1) for risk in risks["2_year"]],
+            "risk_5_year": [round(risk * 100, 1) for risk in risks["5_year"]]
+        }
+    
+    def _features(self, age: int, sex: str, egfr: float,
+                  urine_acr: float) -> Tuple[float, float, float, float]:
+        """Converts inputs to the model scales (age/10, male, eGFR/5, ln ACR)"""
         
-        return risk_percentage
+        return (
+            age / 10.0,
+            1 if sex == "male" else 0,
+            egfr / 5.0,
+            math.log(urine_acr)
+        )
     
     def _get_interpretation(self, risk_2_year: float, risk_5_year: float, 
                            egfr: float) -> Dict[str, str]:
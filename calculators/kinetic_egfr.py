@@ -16,27 +16,153 @@ References:
 """
 
 import math
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict, Any, Optional, Sequence, Tuple
+
+
+# Constants for MDRD equation
+MDRD_CONSTANT = 175
+
+# Volume of distribution constants (mL/kg)
+VD_MALE = 600
+VD_FEMALE = 500
+
+# Creatinine production rate (mg/kg/day)
+CR_PRODUCTION_RATE = 20
+
+# BSA calculation constants (DuBois formula)
+BSA_CONSTANT = 0.007184
+BSA_HEIGHT_EXP = 0.725
+BSA_WEIGHT_EXP = 0.425
+
+# Estimated weight (kg), height (cm) and volume of distribution (mL/kg) by sex,
+# used in place of measured anthropometrics
+ANTHROPOMETRICS = {
+    "male": (70, 170, VD_MALE),
+    "female": (60, 160, VD_FEMALE)
+}
+
+# Validation limits shared by the scalar, series and incremental paths
+MIN_CREATININE = 0.1
+MAX_CREATININE = 25
+MIN_INTERVAL_HOURS = 1
+MAX_INTERVAL_HOURS = 168
+
+# (lower keGFR bound, stage, stage description, AKI risk), highest band first
+AKI_RISK_LEVELS = (
+    (60, "Low AKI Risk", "Normal/near-normal kidney function", "low"),
+    (30, "Intermediate AKI Risk", "Moderate kidney dysfunction", "intermediate"),
+    (15, "High AKI Risk", "Severe kidney dysfunction", "high"),
+    (-math.inf, "Very High AKI Risk", "Kidney failure", "very high")
+)
+
+
+def _volume_and_bsa(sex: str) -> Tuple[float, float]:
+    """Returns the volume of distribution (mL) and DuBois BSA (m²) for a sex"""
+    weight, height, vd_per_kg = ANTHROPOMETRICS[sex]
+    bsa = BSA_CONSTANT * (weight ** BSA_WEIGHT_EXP) * (height ** BSA_HEIGHT_EXP)
+    return vd_per_kg * weight, bsa
+
+
+# Volume of distribution and BSA are fixed per sex, so they are computed once
+VOLUME_AND_BSA = {sex: _volume_and_bsa(sex) for sex in ANTHROPOMETRICS}
+
+
+@lru_cache(maxsize=4096)
+def mdrd_egfr(age: int, sex: str, race: str, creatinine: float) -> float:
+    """
+    Calculates eGFR using the MDRD equation (cached per patient profile)
+    
+    Args:
+        age (int): Patient age
+        sex (str): Patient sex
+        race (str): Patient race
+        creatinine (float): Serum creatinine in mg/dL
+        
+    Returns:
+        float: eGFR in mL/min/1.73 m²
+    """
+    
+    # MDRD equation: 175 × (Scr)^-1.154 × (Age)^-0.203 × (0.742 if female) × (1.212 if black)
+    egfr = MDRD_CONSTANT * (creatinine ** -1.154) * (age ** -0.203)
+    
+    # Apply sex factor
+    if sex == "female":
+        egfr *= 0.742
+    
+    # Apply race factor
+    if race == "black":
+        egfr *= 1.212
+    
+    return egfr
+
+
+def _kinetic_egfr(baseline_egfr: float, delta_creatinine: float, time_hours: float,
+                  vd: float, bsa: float) -> float:
+    """
+    Applies Chen's formula to one creatinine change
+    
+    keGFR = baseline_eGFR - (ΔCr × Vd) / (time × BSA), with time in days and
+    1440 minutes per day converting the units; floored at zero.
+    """
+    time_days = time_hours / 24.0
+    kinetic_egfr = baseline_egfr - (delta_creatinine * vd) / (time_days * bsa * 1440)
+    return max(0, kinetic_egfr)
+
+
+def _risk_level(kinetic_egfr: float) -> Tuple[float, str, str, str]:
+    """Returns the AKI risk band of a keGFR value"""
+    for level in AKI_RISK_LEVELS:
+        if kinetic_egfr >= level[0]:
+            return level
+    return AKI_RISK_LEVELS[-1]
+
+
+def _check_patient(age: int, sex: str, race: str, baseline_creatinine: float):
+    """Validates the patient profile and baseline creatinine"""
+    if not isinstance(age, int) or age < 18 or age > 120:
+        raise ValueError("Age must be an integer between 18 and 120 years")
+    
+    if sex not in ["male", "female"]:
+        raise ValueError("Sex must be 'male' or 'female'")
+    
+    if race not in ["black", "non_black"]:
+        raise ValueError("Race must be 'black' or 'non_black'")
+    
+    if not isinstance(baseline_creatinine, (int, float)) or baseline_creatinine <= 0:
+        raise ValueError("Baseline creatinine must be a positive number")
+    
+    if baseline_creatinine < 0.1 or baseline_creatinine > 15:
+        raise ValueError("Baseline creatinine must be between 0.1 and 15 mg/dL")
+
+
+def _check_creatinine(creatinine: float, label: str):
+    """Validates one creatinine measurement"""
+    if not isinstance(creatinine, (int, float)) or creatinine <= 0:
+        raise ValueError(f"{label} must be a positive number")
+    if creatinine < MIN_CREATININE or creatinine > MAX_CREATININE:
+        raise ValueError(f"{label} must be between {MIN_CREATININE} and {MAX_CREATININE} mg/dL")
+
+
+def _check_interval(time_hours: float, label: str):
+    """Validates the time between two measurements"""
+    if not isinstance(time_hours, (int, float)) or time_hours <= 0:
+        raise ValueError(f"{label} must be a positive number")
+    if time_hours < MIN_INTERVAL_HOURS or time_hours > MAX_INTERVAL_HOURS:
+        raise ValueError(f"{label} must be between {MIN_INTERVAL_HOURS} and {MAX_INTERVAL_HOURS} hours")
 
 
 class KineticEgfrCalculator:
     """Calculator for Kinetic Estimated Glomerular Filtration Rate (keGFR)"""
     
     def __init__(self):
-        # Constants for MDRD equation
-        self.MDRD_CONSTANT = 175
-        
-        # Volume of distribution constants (mL/kg)
-        self.VD_MALE = 600  # mL/kg
-        self.VD_FEMALE = 500  # mL/kg
-        
-        # Creatinine production rate (mg/kg/day)
-        self.CR_PRODUCTION_RATE = 20  # mg/kg/day
-        
-        # BSA calculation constants (DuBois formula)
-        self.BSA_CONSTANT = 0.007184
-        self.BSA_HEIGHT_EXP = 0.725
-        self.BSA_WEIGHT_EXP = 0.425
+        self.MDRD_CONSTANT = MDRD_CONSTANT
+        self.VD_MALE = VD_MALE
+        self.VD_FEMALE = VD_FEMALE
+        self.CR_PRODUCTION_RATE = CR_PRODUCTION_RATE
+        self.BSA_CONSTANT = BSA_CONSTANT
+        self.BSA_HEIGHT_EXP = BSA_HEIGHT_EXP
+        self.BSA_WEIGHT_EXP = BSA_WEIGHT_EXP
     
     def calculate(self, age: int, sex: str, race: str, baseline_creatinine: float,
                  creatinine_1: float, creatinine_2: float, time_hours: float) -> Dict[str, Any]:
@@ -83,42 +209,67 @@ class KineticEgfrCalculator:
             "stage_description": interpretation["stage_description"]
         }
     
-    def _validate_inputs(self, age: int, sex: str, race: str, baseline_creatinine: float,
-                        creatinine_1: float, creatinine_2: float, time_hours: float):
-        """Validates input parameters"""
-        
-        if not isinstance(age, int) or age < 18 or age > 120:
-            raise ValueError("Age must be an integer between 18 and 120 years")
-        
-        if sex not in ["male", "female"]:
-            raise ValueError("Sex must be 'male' or 'female'")
+    def calculate_series(self, age: int, sex: str, race: str, baseline_creatinine: float,
+                         creatinine_values: Sequence[float], time_hours: Sequence[float]) -> Dict[str, Any]:
+        """
+        Calculates the kinetic eGFR trajectory over a creatinine time series
         
-        if race not in ["black", "non_black"]:
-            raise ValueError("Race must be 'black' or 'non_black'")
+        Every pair of consecutive measurements yields one keGFR estimate; the
+        baseline MDRD eGFR and the patient constants are computed once.
         
-        if not isinstance(baseline_creatinine, (int, float)) or baseline_creatinine <= 0:
-            raise ValueError("Baseline creatinine must be a positive number")
+        Args:
+            age (int): Patient age in years
+            sex (str): Biological sex (male/female)
+            race (str): Race (black/non_black)
+            baseline_creatinine (float): Baseline creatinine in mg/dL
+            creatinine_values (Sequence[float]): Creatinine measurements in mg/dL
+            time_hours (Sequence[float]): Time of each measurement in hours,
+                strictly increasing (e.g. hours since ICU admission)
+            
+        Returns:
+            Dict with the baseline eGFR and one column entry per consecutive pair:
+            time_hours (end of the pair), kinetic_egfr, change_in_gfr and stage
+        """
         
-        if baseline_creatinine < 0.1 or baseline_creatinine > 15:
-            raise ValueError("Baseline creatinine must be between 0.1 and 15 mg/dL")
+        _check_patient(age, sex, race, baseline_creatinine)
         
-        if not isinstance(creatinine_1, (int, float)) or creatinine_1 <= 0:
-            raise ValueError("First creatinine must be a positive number")
+        if len(creatinine_values) != len(time_hours):
+            raise ValueError("Each creatinine measurement needs exactly one time point")
+        if len(creatinine_values) < 2:
+            raise ValueError("At least two creatinine measurements are required")
         
-        if creatinine_1 < 0.1 or creatinine_1 > 25:
-            raise ValueError("First creatinine must be between 0.1 and 25 mg/dL")
+        for number, creatinine in enumerate(creatinine_values, start=1):
+            _check_creatinine(creatinine, f"Creatinine {number}")
+        for number, (start, end) in enumerate(zip(time_hours, time_hours[1:]), start=2):
+            _check_interval(end - start, f"Time between creatinine {number - 1} and {number}")
         
-        if not isinstance(creatinine_2, (int, float)) or creatinine_2 <= 0:
-            raise ValueError("Second creatinine must be a positive number")
+        baseline_egfr = mdrd_egfr(age, sex, race, baseline_creatinine)
+        vd, bsa = VOLUME_AND_BSA[sex]
         
-        if creatinine_2 < 0.1 or creatinine_2 > 25:
-            raise ValueError("Second creatinine must be between 0.1 and 25 mg/dL")
+        trajectory = [
+            _kinetic_egfr(baseline_egfr, creatinine_2 - creatinine_1, end - start, vd, bsa)
+            for creatinine_1, creatinine_2, start, end in zip(
+                creatinine_values, creatinine_values[1:], time_hours, time_hours[1:]
+            )
+        ]
         
-        if not isinstance(time_hours, (int, float)) or time_hours <= 0:
-            raise ValueError("Time must be a positive number")
+        return {
+            "baseline_egfr": round(baseline_egfr, 1),
+            "time_hours": list(time_hours[1:]),
+            "kinetic_egfr": [round(value, 1) for value in trajectory],
+            "change_in_gfr": [round(value - baseline_egfr, 1) for value in trajectory],
+            "stage": [_risk_level(value)[1] for value in trajectory],
+            "unit": "mL/min/1.73 m²"
+        }
+    
+    def _validate_inputs(self, age: int, sex: str, race: str, baseline_creatinine: float,
+                        creatinine_1: float, creatinine_2: float, time_hours: float):
+        """Validates input parameters"""
         
-        if time_hours < 1 or time_hours > 168:
-            raise ValueError("Time must be between 1 and 168 hours")
+        _check_patient(age, sex, race, baseline_creatinine)
+        _check_creatinine(creatinine_1, "First creatinine")
+        _check_creatinine(creatinine_2, "Second creatinine")
+        _check_interval(time_hours, "Time")
     
     def _calculate_mdrd_egfr(self, age: int, sex: str, race: str, creatinine: float) -> float:
         """
@@ -134,18 +285,7 @@ class KineticEgfrCalculator:
             float: eGFR in mL/min/1.73 m²
         """
         
-        # MDRD equation: 175 × (Scr)^-1.154 × (Age)^-0.203 × (0.742 if female) × (1.212 if black)
-        egfr = self.MDRD_CONSTANT * (creatinine ** -1.154) * (age ** -0.203)
-        
-        # Apply sex factor
-        if sex == "female":
-            egfr *= 0.742
-        
-        # Apply race factor
-        if race == "black":
-            egfr *= 1.212
-        
-        return egfr
+        return mdrd_egfr(age, sex, race, creatinine)
     
     def _calculate_kinetic_egfr(self, baseline_egfr: float, creatinine_1: float,
                                creatinine_2: float, time_hours: float, 
@@ -165,41 +305,11 @@ class KineticEgfrCalculator:
             float: Kinetic eGFR
         """
         
-        # Estimate weight based on age and sex (for volume of distribution)
-        # This is a rough approximation - ideally actual weight would be used
-        if sex == "male":
-            estimated_weight = 70  # kg - typical adult male
-            vd_per_kg = self.VD_MALE
-        else:
-            estimated_weight = 60  # kg - typical adult female
-            vd_per_kg = self.VD_FEMALE
-        
-        # Calculate volume of distribution
-        vd = vd_per_kg * estimated_weight  # mL
-        
-        # Calculate BSA (assuming height of 170cm for males, 160cm for females)
-        if sex == "male":
-            estimated_height = 170  # cm
-        else:
-            estimated_height = 160  # cm
-        
-        bsa = self.BSA_CONSTANT * (estimated_weight ** self.BSA_WEIGHT_EXP) * (estimated_height ** self.BSA_HEIGHT_EXP)
-        
-        # Calculate change in creatinine
-        delta_creatinine = creatinine_2 - creatinine_1
+        # Volume of distribution and BSA use typical adult anthropometrics by sex;
+        # ideally actual weight and height would be used
+        vd, bsa = VOLUME_AND_BSA[sex]
         
-        # Convert time to days
-        time_days = time_hours / 24.0
-        
-        # Calculate kinetic eGFR using Chen's formula
-        # keGFR = baseline_eGFR - (ΔCr × Vd) / (time × BSA)
-        # Adjustment factor to convert units properly
-        kinetic_egfr = baseline_egfr - (delta_creatinine * vd) / (time_days * bsa * 1440)  # 1440 = minutes per day
-        
-        # Ensure keGFR doesn't go negative
-        kinetic_egfr = max(0, kinetic_egfr)
-        
-        return kinetic_egfr
+        return _kinetic_egfr(baseline_egfr, creatinine_2 - creatinine_1, time_hours, vd, bsa)
     
     def _get_interpretation(self, kinetic_egfr: float, baseline_egfr: float) -> Dict[str, str]:
         """
@@ -218,22 +328,7 @@ class KineticEgfrCalculator:
         percent_change = (gfr_change / baseline_egfr) * 100 if baseline_egfr > 0 else 0
         
         # Determine AKI risk based on keGFR thresholds
-        if kinetic_egfr >= 60:
-            stage = "Low AKI Risk"
-            stage_description = "Normal/near-normal kidney function"
-            aki_risk = "low"
-        elif kinetic_egfr >= 30:
-            stage = "Intermediate AKI Risk"
-            stage_description = "Moderate kidney dysfunction"
-            aki_risk = "intermediate"
-        elif kinetic_egfr >= 15:
-            stage = "High AKI Risk"
-            stage_description = "Severe kidney dysfunction"
-            aki_risk = "high"
-        else:
-            stage = "Very High AKI Risk"
-            stage_description = "Kidney failure"
-            aki_risk = "very high"
+        _, stage, stage_description, aki_risk = _risk_level(kinetic_egfr)
         
         # Generate interpretation
         interpretation = (
@@ -278,6 +373,70 @@ class KineticEgfrCalculator:
         }
 
 
+class KineticEgfrTracker:
+    """
+    Incremental keGFR for one patient's creatinine feed
+    
+    Keeps only the patient constants and the last measurement, so appending a
+    new creatinine value updates the estimate in constant time without
+    resubmitting the history.
+    """
+    
+    __slots__ = ("baseline_egfr", "vd", "bsa", "last_creatinine", "last_time_hours", "kinetic_egfr")
+    
+    def __init__(self, age: int, sex: str, race: str, baseline_creatinine: float):
+        """
+        Args:
+            age (int): Patient age in years
+            sex (str): Biological sex (male/female)
+            race (str): Race (black/non_black)
+            baseline_creatinine (float): Baseline creatinine in mg/dL
+        """
+        _check_patient(age, sex, race, baseline_creatinine)
+        self.baseline_egfr = mdrd_egfr(age, sex, race, baseline_creatinine)
+        self.vd, self.bsa = VOLUME_AND_BSA[sex]
+        self.last_creatinine: Optional[float] = None
+        self.last_time_hours: Optional[float] = None
+        self.kinetic_egfr: Optional[float] = None
+    
+    def append(self, creatinine: float, time_hours: float) -> Optional[Dict[str, Any]]:
+        """
+        Adds the next creatinine measurement
+        
+        Args:
+            creatinine (float): Creatinine in mg/dL
+            time_hours (float): Time of the measurement in hours, later than the
+                previous one
+            
+        Returns:
+            Optional[Dict]: Updated estimate (time_hours, kinetic_egfr,
+            baseline_egfr, change_in_gfr, stage), or None for the first
+            measurement
+        """
+        _check_creatinine(creatinine, "Creatinine")
+        
+        if self.last_creatinine is None:
+            self.last_creatinine = creatinine
+            self.last_time_hours = time_hours
+            return None
+        
+        _check_interval(time_hours - self.last_time_hours, "Time since the previous creatinine")
+        
+        kinetic_egfr = _kinetic_egfr(self.baseline_egfr, creatinine - self.last_creatinine,
+                                     time_hours - self.last_time_hours, self.vd, self.bsa)
+        self.last_creatinine = creatinine
+        self.last_time_hours = time_hours
+        self.kinetic_egfr = kinetic_egfr
+        
+        return {
+            "time_hours": time_hours,
+            "kinetic_egfr": round(kinetic_egfr, 1),
+            "baseline_egfr": round(self.baseline_egfr, 1),
+            "change_in_gfr": round(kinetic_egfr - self.baseline_egfr, 1),
+            "stage": _risk_level(kinetic_egfr)[1]
+        }
+
+
 def calculate_kinetic_egfr(age: int, sex: str, race: str, baseline_creatinine: float,
                           creatinine_1: float, creatinine_2: float, time_hours: float) -> Dict[str, Any]:
     """
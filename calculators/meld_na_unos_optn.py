@@ -11,7 +11,7 @@ References:
 """
 
 import math
-from typing import Dict, Any
+from typing import Dict, Any, List, Mapping, Sequence
 
 
 class MeldNaUnosOptnCalculator:
@@ -58,6 +58,39 @@ class MeldNaUnosOptnCalculator:
         # Validate inputs
         self._validate_inputs(creatinine, bilirubin, inr, sodium, dialysis_twice_past_week)
         
+        # Calculate bounded MELD Na
+        meld_na_final = self._calculate_meld_na(creatinine, bilirubin, inr, sodium,
+                                                dialysis_twice_past_week)
+        
+        return self._format_result(meld_na_final)
+    
+    def calculate_results(self, parameter_sets: Sequence[Mapping[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Calculates complete results, as returned by calculate(), for many parameter sets
+        
+        Args:
+            parameter_sets: One mapping per patient with the same keys as calculate()
+            
+        Returns:
+            List[Dict]: Result, stage and interpretation per patient, in input order
+        """
+        
+        columns = [
+            (parameters["creatinine"], parameters["bilirubin"], parameters["inr"],
+             parameters["sodium"], parameters["dialysis_twice_past_week"])
+            for parameters in parameter_sets
+        ]
+        for row in columns:
+            self._validate_inputs(*row)
+        
+        calculate_meld_na = self._calculate_meld_na
+        format_result = self._format_result
+        return [format_result(calculate_meld_na(*row)) for row in columns]
+    
+    def _calculate_meld_na(self, creatinine: float, bilirubin: float, inr: float,
+                           sodium: float, dialysis_twice_past_week: str) -> int:
+        """Calculates the MELD Na score bounded to 6-40"""
+        
         # Adjust values according to MELD rules
         cr_adjusted = self._adjust_creatinine(creatinine, dialysis_twice_past_week)
         bili_adjusted = max(bilirubin, self.MIN_VALUE)
@@ -76,6 +109,11 @@ class MeldNaUnosOptnCalculator:
         # Bound final score
         meld_na_final = max(self.MIN_MELD, min(self.MAX_MELD, meld_na))
         
+        return meld_na_final
+    
+    def _format_result(self, meld_na_final: int) -> Dict[str, Any]:
+        """Builds the result with its interpretation"""
+        
         # Get interpretation
         interpretation = self._get_interpretation(meld_na_final)
         
@@ -213,4 +251,14 @@ def calculate_meld_na_unos_optn(creatinine: float, bilirubin: float, inr: float,
     IMPORTANT: This function must follow the calculate_{score_id} pattern
     """
     calculator = MeldNaUnosOptnCalculator()
-    return calculator.calculate(creatinine, bilirubin, inr, sodium, dialysis_twice_past_week)
\ No newline at end of file
+    return calculator.calculate(creatinine, bilirubin, inr, sodium, dialysis_twice_past_week)
+
+
+def calculate_meld_na_unos_optn_batch(parameter_sets: Sequence[Mapping[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Batch counterpart of calculate_meld_na_unos_optn for the calculator service
+    
+    Evaluates all parameter sets with one calculator instance.
+    """
+    calculator = MeldNaUnosOptnCalculator()
+    return calculator.calculate_results(parameter_sets)
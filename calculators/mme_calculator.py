@@ -11,65 +11,174 @@ References:
 """
 
 import json
-from typing import Dict, Any, List
+from datetime import date
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+from calculators.engines.dosing import AliasIndex, conversion_matrix, normalize_drug_name, taper_schedules
+
+
+# CDC 2022 Conversion Factors (oral morphine equivalents)
+CONVERSION_FACTORS = {
+    # Opioid name: conversion factor to oral morphine
+    "morphine_oral": 1.0,
+    "morphine_iv": 3.0,  # IV morphine to oral morphine equivalent
+    "oxycodone": 1.5,
+    "hydrocodone": 1.0,
+    "codeine": 0.15,
+    "fentanyl_patch": 2.4,  # mcg/hr to mg/day oral morphine
+    "fentanyl_oral": 0.13,  # Oral transmucosal fentanyl
+    "hydromorphone_oral": 4.0,
+    "hydromorphone_iv": 20.0,
+    "oxymorphone_oral": 3.0,
+    "oxymorphone_iv": 10.0,
+    "methadone_1_20": 4.0,    # 1-20 mg/day
+    "methadone_21_40": 8.0,   # 21-40 mg/day
+    "methadone_41_60": 10.0,  # 41-60 mg/day
+    "methadone_61_plus": 12.0, # >60 mg/day
+    "tramadol": 0.1,
+    "tapentadol": 0.4,
+    "buprenorphine_patch": 12.6,  # mcg/hr to mg/day oral morphine
+    "buprenorphine_sublingual": 30.0,
+    "meperidine": 0.1,
+    "pentazocine": 0.37
+}
+
+# Alternative medication names mapping
+MEDICATION_ALIASES = {
+    "morphine": "morphine_oral",
+    "ms_contin": "morphine_oral",
+    "oxycontin": "oxycodone",
+    "percocet": "oxycodone",
+    "vicodin": "hydrocodone",
+    "norco": "hydrocodone",
+    "tylenol_3": "codeine",
+    "duragesic": "fentanyl_patch",
+    "dilaudid": "hydromorphone_oral",
+    "opana": "oxymorphone_oral",
+    "ultram": "tramadol",
+    "nucynta": "tapentadol",
+    "suboxone": "buprenorphine_sublingual",
+    "butrans": "buprenorphine_patch",
+    "demerol": "meperidine",
+    "talwin": "pentazocine"
+}
+
+# Methadone conversion factor by total daily dose (inclusive upper bound, mg/day)
+METHADONE_TIERS = (
+    (20, "methadone_1_20"),
+    (40, "methadone_21_40"),
+    (60, "methadone_41_60")
+)
+
+# Transdermal systems dosed in mcg/hr; their MME does not depend on frequency
+PATCH_MEDICATIONS = ("fentanyl_patch", "buprenorphine_patch")
+
+IV_ROUTES = ("iv", "intravenous")
+
+# MME thresholds of the CDC risk bands (mg/day)
+MODERATE_RISK_MME = 50
+HIGH_RISK_MME = 90
+
+# Name, brand and alias lookups, built once
+ALIAS_INDEX = AliasIndex(CONVERSION_FACTORS, MEDICATION_ALIASES)
+
+# Full drug × drug MME ratio table: dose_from × matrix[from][to] carries the
+# same MME as that dose of "to", in each drug's dosing unit (mg/day, or mcg/hr
+# for patches). This describes MME equivalence for surveillance and is not a
+# dosing table for opioid rotation.
+OPIOID_CONVERSION_MATRIX = conversion_matrix(CONVERSION_FACTORS)
+
+
+def resolve_medication(name: str) -> str:
+    """
+    Returns the canonical name of an opioid medication
+    
+    Unknown names are returned normalized, as entered.
+    """
+    return ALIAS_INDEX.resolve(name) or normalize_drug_name(name)
+
+
+def conversion_factor(medication: str, daily_dose: float, route: str = "oral") -> float:
+    """
+    Returns the MME conversion factor of a canonical medication
+    
+    Args:
+        medication (str): Canonical medication name
+        daily_dose (float): Total daily dose (selects the methadone tier)
+        route (str): Administration route
+        
+    Returns:
+        float: Oral morphine equivalents per unit of daily dose
+    """
+    if medication.startswith("methadone"):
+        # Methadone has dose-dependent conversion factors
+        for upper_bound, tier in METHADONE_TIERS:
+            if daily_dose <= upper_bound:
+                return CONVERSION_FACTORS[tier]
+        return CONVERSION_FACTORS["methadone_61_plus"]
+    
+    if medication in PATCH_MEDICATIONS:
+        return CONVERSION_FACTORS[medication]
+    
+    # Handle route variations
+    if route.lower() in IV_ROUTES:
+        iv_medication = f"{medication.split('_')[0]}_iv"
+        if iv_medication in CONVERSION_FACTORS:
+            return CONVERSION_FACTORS[iv_medication]
+    
+    return CONVERSION_FACTORS.get(medication, 1.0)
+
+
+def medication_mme(medication: str, dose: float, frequency_per_day: float, route: str = "oral") -> float:
+    """
+    Calculates the daily MME of one canonical medication
+    
+    Args:
+        medication (str): Canonical medication name
+        dose (float): Dose per administration (patch strength in mcg/hr)
+        frequency_per_day (float): Administrations per day
+        route (str): Administration route
+        
+    Returns:
+        float: Daily MME
+    """
+    if medication in PATCH_MEDICATIONS:
+        # Patches are continuous; the dose is the mcg/hr strength
+        return dose * CONVERSION_FACTORS[medication]
+    
+    daily_dose = dose * frequency_per_day
+    return daily_dose * conversion_factor(medication, daily_dose, route)
+
+
+def _day_number(value: Union[date, str, int]) -> int:
+    """Converts a fill date (date, ISO string or day number) to a day number"""
+    if isinstance(value, date):
+        return value.toordinal()
+    if isinstance(value, str):
+        return date.fromisoformat(value).toordinal()
+    return int(value)
+
+
+def _format_dose(value: float) -> str:
+    """Formats a dose without trailing zeros (30 and 30.0 both read 30)"""
+    return f"{value:.2f}".rstrip("0").rstrip(".")
 
 
 class MmeCalculator:
     """Calculator for Morphine Milligram Equivalents (MME)"""
     
     def __init__(self):
-        # CDC 2022 Conversion Factors (oral morphine equivalents)
-        self.CONVERSION_FACTORS = {
-            # Opioid name: conversion factor to oral morphine
-            "morphine_oral": 1.0,
-            "morphine_iv": 3.0,  # IV morphine to oral morphine equivalent
-            "oxycodone": 1.5,
-            "hydrocodone": 1.0,
-            "codeine": 0.15,
-            "fentanyl_patch": 2.4,  # mcg/hr to mg/day oral morphine
-            "fentanyl_oral": 0.13,  # Oral transmucosal fentanyl
-            "hydromorphone_oral": 4.0,
-            "hydromorphone_iv": 20.0,
-            "oxymorphone_oral": 3.0,
-            "oxymorphone_iv": 10.0,
-            "methadone_1_20": 4.0,    # 1-20 mg/day
-            "methadone_21_40": 8.0,   # 21-40 mg/day
-            "methadone_41_60": 10.0,  # 41-60 mg/day
-            "methadone_61_plus": 12.0, # >60 mg/day
-            "tramadol": 0.1,
-            "tapentadol": 0.4,
-            "buprenorphine_patch": 12.6,  # mcg/hr to mg/day oral morphine
-            "buprenorphine_sublingual": 30.0,
-            "meperidine": 0.1,
-            "pentazocine": 0.37
-        }
-        
-        # Alternative medication names mapping
-        self.MEDICATION_ALIASES = {
-            "morphine": "morphine_oral",
-            "ms_contin": "morphine_oral",
-            "oxycontin": "oxycodone",
-            "percocet": "oxycodone",
-            "vicodin": "hydrocodone",
-            "norco": "hydrocodone",
-            "tylenol_3": "codeine",
-            "duragesic": "fentanyl_patch",
-            "dilaudid": "hydromorphone_oral",
-            "opana": "oxymorphone_oral",
-            "ultram": "tramadol",
-            "nucynta": "tapentadol",
-            "suboxone": "buprenorphine_sublingual",
-            "butrans": "buprenorphine_patch",
-            "demerol": "meperidine",
-            "talwin": "pentazocine"
-        }
+        self.CONVERSION_FACTORS = CONVERSION_FACTORS
+        self.MEDICATION_ALIASES = MEDICATION_ALIASES
     
-    def calculate(self, opioid_medications: str) -> Dict[str, Any]:
+    def calculate(self, opioid_medications: Union[str, Sequence[Mapping[str, Any]]]) -> Dict[str, Any]:
         """
         Calculates total daily MME from multiple opioid medications
         
         Args:
-            opioid_medications (str): JSON string of medication list
+            opioid_medications: Medication list, either structured (a list of
+                {"medication", "dose", "frequency_per_day", "route"} mappings)
+                or as a JSON string of that list
             
         Returns:
             Dict with total MME and risk interpretation
@@ -106,23 +215,198 @@ class MmeCalculator:
             "stage_description": interpretation["description"]
         }
     
-    def _parse_medications(self, medications_json: str) -> List[Dict]:
-        """Parses and validates medication JSON input"""
+    def calculate_dispensing(
+        self,
+        patient_ids: Sequence[Any],
+        medications: Sequence[str],
+        strengths: Sequence[float],
+        quantities: Sequence[float],
+        days_supply: Sequence[int],
+        fill_dates: Sequence[Union[date, str, int]],
+        routes: Optional[Sequence[str]] = None,
+        window_days: int = 90,
+        include_daily: bool = False
+    ) -> Dict[str, List[Any]]:
+        """
+        Scores a pharmacy-dispensing extract, one row per dispensing
         
-        try:
-            medications = json.loads(medications_json)
-        except json.JSONDecodeError:
-            raise ValueError("Invalid JSON format for opioid medications")
+        Each dispensing contributes strength × quantity / days supply (mg/day)
+        converted to MME on every day it covers (patches contribute their
+        mcg/hr strength). Overlapping dispensings add up, giving a daily MME
+        timeline per patient that is summarized with a rolling window.
         
-        if not isinstance(medications, list):
-            raise ValueError("Medications must be provided as a JSON array")
+        Args:
+            patient_ids: Patient identifier per dispensing
+            medications: Medication name per dispensing (aliases accepted)
+            strengths: Unit strength in mg (mcg/hr for patches)
+            quantities: Units dispensed
+            days_supply: Days covered by the dispensing
+            fill_dates: Fill date (date, ISO string or day number)
+            routes: Administration route per dispensing (default oral)
+            window_days: Length of the rolling average window in days
+            include_daily: Also return each patient's daily MME timeline
+            
+        Returns:
+            Dict of columns, one entry per patient in order of first appearance:
+            patient_id, days_covered, max_daily_mme, mean_daily_mme (over
+            covered days), max_window_mme (highest average daily MME over any
+            window), days_at_or_above_50 and days_at_or_above_90; plus
+            first_day and daily_mme when include_daily is set
+        """
+        
+        rows = len(patient_ids)
+        if not (len(medications) == len(strengths) == len(quantities)
+                == len(days_supply) == len(fill_dates) == rows):
+            raise ValueError("All dispensing columns must have the same length")
+        if routes is None:
+            routes = ["oral"] * rows
+        elif len(routes) != rows:
+            raise ValueError("Route column must match the extract length")
+        if window_days <= 0:
+            raise ValueError("Window must be a positive number of days")
+        
+        # (first day, days covered, daily MME) per dispensing, grouped by patient
+        dispensings: Dict[Any, List[Tuple[int, int, float]]] = {}
+        for row, (patient_id, name, strength, quantity, days, filled, route) in enumerate(
+            zip(patient_ids, medications, strengths, quantities, days_supply, fill_dates, routes), start=1
+        ):
+            if not isinstance(strength, (int, float)) or strength <= 0:
+                raise ValueError(f"Dispensing {row} strength must be a positive number")
+            if not isinstance(quantity, (int, float)) or quantity <= 0:
+                raise ValueError(f"Dispensing {row} quantity must be a positive number")
+            if not isinstance(days, int) or days <= 0:
+                raise ValueError(f"Dispensing {row} days supply must be a positive integer")
+            
+            medication = resolve_medication(name)
+            if medication in PATCH_MEDICATIONS:
+                daily_mme = medication_mme(medication, strength, 1, route)
+            else:
+                daily_mme = medication_mme(medication, strength * quantity / days, 1, route)
+            dispensings.setdefault(patient_id, []).append((_day_number(filled), days, daily_mme))
+        
+        columns: Dict[str, List[Any]] = {
+            name: [] for name in (
+                "patient_id", "days_covered", "max_daily_mme", "mean_daily_mme",
+                "max_window_mme", "days_at_or_above_50", "days_at_or_above_90"
+            )
+        }
+        if include_daily:
+            columns["first_day"] = []
+            columns["daily_mme"] = []
+        
+        for patient_id, fills in dispensings.items():
+            first_day = min(start for start, _, _ in fills)
+            span = max(start + days for start, days, _ in fills) - first_day
+            
+            # Difference array: each dispensing adds its rate over its days
+            changes = [0.0] * (span + 1)
+            for start, days, daily_mme in fills:
+                changes[start - first_day] += daily_mme
+                changes[start - first_day + days] -= daily_mme
+            
+            daily = []
+            running = 0.0
+            for change in changes[:-1]:
+                running += change
+                daily.append(round(running, 6))
+            
+            covered = [value for value in daily if value > 0]
+            
+            # Rolling window sums from prefix sums; days past the last
+            # dispensing count as zero
+            prefix = [0.0]
+            for value in daily:
+                prefix.append(prefix[-1] + value)
+            last_start = max(span - window_days, 0)
+            max_window = max(
+                prefix[min(start + window_days, span)] - prefix[start]
+                for start in range(last_start + 1)
+            ) / window_days
+            
+            columns["patient_id"].append(patient_id)
+            columns["days_covered"].append(len(covered))
+            columns["max_daily_mme"].append(round(max(daily), 1))
+            columns["mean_daily_mme"].append(round(sum(covered) / len(covered), 1) if covered else 0.0)
+            columns["max_window_mme"].append(round(max_window, 1))
+            columns["days_at_or_above_50"].append(sum(1 for value in daily if value >= MODERATE_RISK_MME))
+            columns["days_at_or_above_90"].append(sum(1 for value in daily if value >= HIGH_RISK_MME))
+            if include_daily:
+                columns["first_day"].append(first_day)
+                columns["daily_mme"].append(daily)
+        
+        return columns
+    
+    def taper_schedules(
+        self,
+        medications: Sequence[str],
+        daily_doses: Sequence[float],
+        reduction: float = 0.1,
+        interval_days: int = 28,
+        method: str = "proportional",
+        increment: Optional[float] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Builds opioid taper schedules for many patients
+        
+        The default removes 10% of the current dose every four weeks, in line
+        with the CDC 2022 guidance for patients on long-term opioid therapy.
+        
+        Args:
+            medications: Medication per patient (aliases accepted)
+            daily_doses: Current total daily dose per patient (mg/day, or mcg/hr
+                for patches)
+            reduction: Fraction removed at each step
+            interval_days: Days between steps
+            method: "proportional" (fraction of the current dose) or "linear"
+                (fraction of the starting dose)
+            increment: Dose unit each step is rounded to (optional)
+            
+        Returns:
+            List of schedules, one per patient, each a list of
+            {"day", "daily_dose", "daily_mme"} steps ending at zero
+        """
+        
+        if len(medications) != len(daily_doses):
+            raise ValueError("Each medication needs exactly one daily dose")
+        
+        schedules = taper_schedules(daily_doses, reduction, interval_days, method, increment)
+        
+        result = []
+        for name, schedule in zip(medications, schedules):
+            medication = resolve_medication(name)
+            result.append([
+                {
+                    "day": day,
+                    "daily_dose": dose,
+                    "daily_mme": round(medication_mme(medication, dose, 1), 1)
+                }
+                for day, dose in schedule
+            ])
+        return result
+    
+    def _parse_medications(self, opioid_medications: Union[str, Sequence[Mapping[str, Any]]]) -> List[Dict]:
+        """Parses and validates the medication list (structured or JSON string)"""
+        
+        if isinstance(opioid_medications, str):
+            try:
+                medications = json.loads(opioid_medications)
+            except json.JSONDecodeError:
+                raise ValueError("Invalid JSON format for opioid medications")
+            
+            if not isinstance(medications, list):
+                raise ValueError("Medications must be provided as a JSON array")
+        elif isinstance(opioid_medications, (list, tuple)):
+            medications = list(opioid_medications)
+        else:
+            raise ValueError("Medications must be provided as a list or a JSON array")
         
         if not medications:
             raise ValueError("At least one opioid medication must be provided")
         
         # Validate each medication entry
+        parsed = []
         for i, med in enumerate(medications):
-            if not isinstance(med, dict):
+            if not isinstance(med, Mapping):
                 raise ValueError(f"Medication {i+1} must be an object")
             
             required_fields = ["medication", "dose", "frequency_per_day"]
@@ -137,64 +421,24 @@ class MmeCalculator:
             if not isinstance(med["frequency_per_day"], (int, float)) or med["frequency_per_day"] <= 0:
                 raise ValueError(f"Medication {i+1} frequency must be a positive number")
             
-            # Normalize medication name
-            med_name = med["medication"].lower().replace(" ", "_").replace("-", "_")
-            if med_name in self.MEDICATION_ALIASES:
-                med["medication"] = self.MEDICATION_ALIASES[med_name]
-            else:
-                med["medication"] = med_name
+            # Normalize medication name without modifying the caller's entry
+            med = dict(med)
+            med["medication"] = resolve_medication(med["medication"])
+            if med.get("route") is None:
+                med.pop("route", None)
+            parsed.append(med)
         
-        return medications
+        return parsed
     
     def _calculate_single_mme(self, medication: Dict) -> float:
         """Calculates MME for a single medication"""
         
-        med_name = medication["medication"]
-        dose = medication["dose"]
-        frequency = medication["frequency_per_day"]
-        route = medication.get("route", "oral").lower()
-        
-        # Handle special cases
-        if med_name.startswith("methadone"):
-            # Methadone has dose-dependent conversion factors
-            daily_dose = dose * frequency
-            if daily_dose <= 20:
-                conversion_factor = self.CONVERSION_FACTORS["methadone_1_20"]
-            elif daily_dose <= 40:
-                conversion_factor = self.CONVERSION_FACTORS["methadone_21_40"]
-            elif daily_dose <= 60:
-                conversion_factor = self.CONVERSION_FACTORS["methadone_41_60"]
-            else:
-                conversion_factor = self.CONVERSION_FACTORS["methadone_61_plus"]
-        
-        elif med_name == "fentanyl_patch":
-            # Fentanyl patch is dosed in mcg/hr, frequency should be 1 for 72-hour patch
-            # Dose represents mcg/hr strength of patch
-            conversion_factor = self.CONVERSION_FACTORS["fentanyl_patch"]
-            # Don't multiply by frequency for patches (already continuous)
-            return dose * conversion_factor
-        
-        elif med_name == "buprenorphine_patch":
-            # Buprenorphine patch similar to fentanyl
-            conversion_factor = self.CONVERSION_FACTORS["buprenorphine_patch"]
-            return dose * conversion_factor
-        
-        else:
-            # Handle route variations
-            if route == "iv" or route == "intravenous":
-                iv_med_name = f"{med_name.split('_')[0]}_iv"
-                if iv_med_name in self.CONVERSION_FACTORS:
-                    conversion_factor = self.CONVERSION_FACTORS[iv_med_name]
-                else:
-                    conversion_factor = self.CONVERSION_FACTORS.get(med_name, 1.0)
-            else:
-                conversion_factor = self.CONVERSION_FACTORS.get(med_name, 1.0)
-        
-        # Calculate daily MME
-        daily_dose = dose * frequency
-        mme = daily_dose * conversion_factor
-        
-        return mme
+        return medication_mme(
+            medication["medication"],
+            medication["dose"],
+            medication["frequency_per_day"],
+            medication.get("route", "oral")
+        )
     
     def _get_interpretation(self, total_mme: float, med_details: List[Dict]) -> Dict[str, str]:
         """
@@ -210,11 +454,11 @@ class MmeCalculator:
         
         # Create medication summary
         med_summary = ", ".join([
-            f"{med['medication']} {med['daily_dose']}{med.get('unit', 'mg')}/day (MME: {med['mme_contribution']:.1f})"
+            f"{med['medication']} {_format_dose(med['daily_dose'])}{med.get('unit', 'mg')}/day (MME: {med['mme_contribution']:.1f})"
             for med in med_details
         ])
         
-        if total_mme < 50:
+        if total_mme < MODERATE_RISK_MME:
             return {
                 "stage": "Low Risk",
                 "description": "Standard monitoring recommended",
@@ -227,7 +471,7 @@ class MmeCalculator:
                                 f"CDC guidelines recommend caution when increasing doses and considering the "
                                 f"benefits and risks of continued opioid therapy.")
             }
-        elif total_mme < 90:
+        elif total_mme < HIGH_RISK_MME:
             return {
                 "stage": "Moderate Risk",
                 "description": "Increased monitoring recommended",
@@ -259,7 +503,7 @@ class MmeCalculator:
             }
 
 
-def calculate_mme_calculator(opioid_medications: str) -> Dict[str, Any]:
+def calculate_mme_calculator(opioid_medications: Union[str, Sequence[Mapping[str, Any]]]) -> Dict[str, Any]:
     """
     Convenience function for the dynamic loading system
     
@@ -12,6 +12,8 @@ References:
 
 from typing import Dict, Any
 
+from calculators.engines.streaming import StreamComponent, StreamingScore, numeric
+
 
 class ModifiedEarlyWarningScoreCalculator:
     """Calculator for Modified Early Warning Score (MEWS) for Clinical Deterioration"""
@@ -213,6 +215,35 @@ class ModifiedEarlyWarningScoreCalculator:
         return base_interpretation
 
 
+# Streamed consciousness uses the ACVPU scale shared with NEWS and NEWS 2;
+# new confusion scores as responding to voice
+ACVPU_LEVELS = {
+    "alert": "alert",
+    "confusion": "voice",
+    "voice": "voice",
+    "pain": "pain",
+    "unresponsive": "unresponsive"
+}
+
+_calculator = ModifiedEarlyWarningScoreCalculator()
+
+
+def _mews_tier(score: int, points) -> str:
+    """Escalation tier of a complete MEWS observation set"""
+    return _calculator._get_interpretation(score, 3 in points)["stage"]
+
+
+# Streaming definition over raw vitals (see calculators.engines.streaming)
+STREAMING_SCORE = StreamingScore("modified_early_warning_score", [
+    StreamComponent("systolic_bp", ("systolic_bp",), numeric(_calculator._calculate_bp_score)),
+    StreamComponent("heart_rate", ("heart_rate",), numeric(_calculator._calculate_hr_score)),
+    StreamComponent("respiratory_rate", ("respiratory_rate",), numeric(_calculator._calculate_rr_score)),
+    StreamComponent("temperature", ("temperature",), numeric(_calculator._calculate_temp_score)),
+    StreamComponent("consciousness", ("consciousness",),
+                    lambda value: _calculator._calculate_consciousness_score(ACVPU_LEVELS[value]))
+], tier=_mews_tier)
+
+
 def calculate_modified_early_warning_score(systolic_bp: int, heart_rate: int,
                                          respiratory_rate: int, temperature: float,
                                          consciousness_level: str) -> Dict[str, Any]:
@@ -13,6 +13,8 @@ References:
 
 from typing import Dict, Any
 
+from calculators.engines.streaming import StreamComponent, StreamingScore, check_numeric, numeric
+
 
 class ModifiedSofaCalculator:
     """Calculator for Modified Sequential Organ Failure Assessment (mSOFA) Score"""
@@ -251,6 +253,27 @@ class ModifiedSofaCalculator:
             }
 
 
+_calculator = ModifiedSofaCalculator()
+
+
+def _cardiovascular_points(mean_arterial_pressure: int, vasopressor_use: str) -> int:
+    """Cardiovascular points from a raw MAP and the current vasopressor dose"""
+    if vasopressor_use not in _calculator.VASOPRESSOR_MAPPING:
+        raise ValueError(f"Vasopressor use must be one of: {list(_calculator.VASOPRESSOR_MAPPING.keys())}")
+    check_numeric(mean_arterial_pressure)
+    return _calculator._calculate_cardiovascular_score(mean_arterial_pressure, vasopressor_use)
+
+
+# Streaming definition over raw vitals and labs (see calculators.engines.streaming)
+STREAMING_SCORE = StreamingScore("modified_sofa", [
+    StreamComponent("respiratory", ("spo2_fio2_ratio",), numeric(_calculator._calculate_respiratory_score)),
+    StreamComponent("liver", ("scleral_icterus",), _calculator._calculate_liver_score),
+    StreamComponent("cardiovascular", ("mean_arterial_pressure", "vasopressor_use"), _cardiovascular_points),
+    StreamComponent("cns", ("glasgow_coma_scale",), numeric(_calculator._calculate_cns_score)),
+    StreamComponent("renal", ("creatinine",), numeric(_calculator._calculate_renal_score))
+], tier=lambda score, points: _calculator._get_interpretation(score)["stage"])
+
+
 def calculate_modified_sofa(spo2_fio2_ratio: int, scleral_icterus: str, mean_arterial_pressure: int,
                            vasopressor_use: str, glasgow_coma_scale: int, creatinine: float) -> Dict[str, Any]:
     """
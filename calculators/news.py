@@ -15,6 +15,8 @@ References:
 
 from typing import Dict, Any
 
+from calculators.engines.streaming import Bands, StreamComponent, StreamingScore
+
 
 class NewsCalculator:
     """Calculator for National Early Warning Score (NEWS)"""
@@ -191,6 +193,52 @@ class NewsCalculator:
             }
 
 
+# Raw vital-sign bands for streaming mode (breaths/min, %, °C, mmHg, beats/min)
+RESPIRATORY_RATE_BANDS = Bands((8, 11, 20, 24), ("8_or_less", "9_to_11", "12_to_20", "21_to_24", "25_or_more"))
+OXYGEN_SATURATION_BANDS = Bands((91, 93, 95), ("91_or_less", "92_to_93", "94_to_95", "96_or_more"))
+TEMPERATURE_BANDS = Bands((35.0, 36.0, 38.0, 39.0),
+                          ("35_or_less", "35_1_to_36", "36_1_to_38", "38_1_to_39", "39_1_or_more"))
+SYSTOLIC_BP_BANDS = Bands((90, 100, 110, 219),
+                          ("90_or_less", "91_to_100", "101_to_110", "111_to_219", "220_or_more"))
+HEART_RATE_BANDS = Bands((40, 50, 90, 110, 130),
+                         ("40_or_less", "41_to_50", "51_to_90", "91_to_110", "111_to_130", "131_or_more"))
+# Streamed consciousness uses the ACVPU scale shared with NEWS 2 and MEWS;
+# new confusion is non-alert, as in NEWS 2
+AVPU_LEVELS = {
+    "alert": "alert",
+    "confusion": "voice_pain_unresponsive",
+    "voice": "voice_pain_unresponsive",
+    "pain": "voice_pain_unresponsive",
+    "unresponsive": "voice_pain_unresponsive"
+}
+
+_calculator = NewsCalculator()
+
+
+def _news_tier(score: int, points) -> str:
+    """Escalation tier of a complete NEWS observation set"""
+    return _calculator._get_interpretation(score, 3 in points)["stage"]
+
+
+# Streaming definition over raw vitals (see calculators.engines.streaming)
+STREAMING_SCORE = StreamingScore("news", [
+    StreamComponent("respiratory_rate", ("respiratory_rate",),
+                    lambda value: _calculator.respiratory_rate_scores[RESPIRATORY_RATE_BANDS(value)]),
+    StreamComponent("oxygen_saturation", ("oxygen_saturation",),
+                    lambda value: _calculator.oxygen_saturation_scores[OXYGEN_SATURATION_BANDS(value)]),
+    StreamComponent("supplemental_oxygen", ("supplemental_oxygen",),
+                    lambda value: _calculator.supplemental_oxygen_scores[value]),
+    StreamComponent("temperature", ("temperature",),
+                    lambda value: _calculator.temperature_scores[TEMPERATURE_BANDS(value)]),
+    StreamComponent("systolic_bp", ("systolic_bp",),
+                    lambda value: _calculator.systolic_bp_scores[SYSTOLIC_BP_BANDS(value)]),
+    StreamComponent("heart_rate", ("heart_rate",),
+                    lambda value: _calculator.heart_rate_scores[HEART_RATE_BANDS(value)]),
+    StreamComponent("consciousness", ("consciousness",),
+                    lambda value: _calculator.avpu_scores[AVPU_LEVELS[value]])
+], tier=_news_tier)
+
+
 def calculate_news(respiratory_rate, oxygen_saturation, supplemental_oxygen,
                   temperature, systolic_bp, heart_rate, avpu_score) -> Dict[str, Any]:
     """
@@ -11,6 +11,8 @@ References:
 
 from typing import Dict, Any
 
+from calculators.engines.streaming import Bands, StreamComponent, StreamingScore
+
 
 class News2Calculator:
     """Calculator for National Early Warning Score (NEWS) 2"""
@@ -279,6 +281,68 @@ class News2Calculator:
             }
 
 
+# Raw vital-sign bands for streaming mode (breaths/min, %, °C, mmHg, beats/min)
+RESPIRATORY_RATE_BANDS = Bands((8, 11, 20, 24), ("8_or_less", "9_to_11", "12_to_20", "21_to_24", "25_or_more"))
+STANDARD_SPO2_BANDS = Bands((91, 93, 95), ("91_or_less", "92_to_93", "94_to_95", "96_or_more"))
+HYPERCAPNIC_SPO2_BANDS = Bands((83, 85, 87, 92, 94, 96),
+                               ("83_or_less", "84_to_85", "86_to_87", "88_to_92",
+                                "93_to_94", "95_to_96", "97_or_more"))
+TEMPERATURE_BANDS = Bands((35.0, 36.0, 38.0, 39.0),
+                          ("35_or_less", "35_1_to_36", "36_1_to_38", "38_1_to_39", "39_1_or_more"))
+SYSTOLIC_BP_BANDS = Bands((90, 100, 110, 219),
+                          ("90_or_less", "91_to_100", "101_to_110", "111_to_219", "220_or_more"))
+HEART_RATE_BANDS = Bands((40, 50, 90, 110, 130),
+                         ("40_or_less", "41_to_50", "51_to_90", "91_to_110", "111_to_130", "131_or_more"))
+ACVPU_LEVELS = {
+    "alert": "alert",
+    "confusion": "altered",
+    "voice": "altered",
+    "pain": "altered",
+    "unresponsive": "altered"
+}
+
+_calculator = News2Calculator()
+
+
+def _spo2_points(oxygen_saturation: float, hypercapnic_respiratory_failure: str,
+                 supplemental_oxygen: str) -> int:
+    """SpO₂ points from a raw saturation on scale 1 or, in hypercapnic failure, scale 2"""
+    if hypercapnic_respiratory_failure not in ("yes", "no"):
+        raise ValueError(f"Invalid hypercapnic_respiratory_failure: {hypercapnic_respiratory_failure}")
+    if supplemental_oxygen not in _calculator.supplemental_oxygen_scores:
+        raise ValueError(f"Invalid supplemental_oxygen: {supplemental_oxygen}")
+    
+    is_hypercapnic = hypercapnic_respiratory_failure == "yes"
+    bands = HYPERCAPNIC_SPO2_BANDS if is_hypercapnic else STANDARD_SPO2_BANDS
+    return _calculator._calculate_spo2_score(bands(oxygen_saturation), is_hypercapnic,
+                                             supplemental_oxygen == "yes")
+
+
+def _news_2_tier(score: int, points) -> str:
+    """Escalation tier of a complete NEWS 2 observation set"""
+    return _calculator._get_interpretation(score, 3 in points)["stage"]
+
+
+# Streaming definition over raw vitals (see calculators.engines.streaming)
+STREAMING_SCORE = StreamingScore("news_2", [
+    StreamComponent("respiratory_rate", ("respiratory_rate",),
+                    lambda value: _calculator.respiratory_rate_scores[RESPIRATORY_RATE_BANDS(value)]),
+    StreamComponent("oxygen_saturation",
+                    ("oxygen_saturation", "hypercapnic_respiratory_failure", "supplemental_oxygen"),
+                    _spo2_points),
+    StreamComponent("supplemental_oxygen", ("supplemental_oxygen",),
+                    lambda value: _calculator.supplemental_oxygen_scores[value]),
+    StreamComponent("temperature", ("temperature",),
+                    lambda value: _calculator.temperature_scores[TEMPERATURE_BANDS(value)]),
+    StreamComponent("systolic_bp", ("systolic_bp",),
+                    lambda value: _calculator.systolic_bp_scores[SYSTOLIC_BP_BANDS(value)]),
+    StreamComponent("heart_rate", ("heart_rate",),
+                    lambda value: _calculator.heart_rate_scores[HEART_RATE_BANDS(value)]),
+    StreamComponent("consciousness", ("consciousness",),
+                    lambda value: _calculator.consciousness_scores[ACVPU_LEVELS[value]])
+], tier=_news_2_tier)
+
+
 def calculate_news_2(respiratory_rate: str, hypercapnic_respiratory_failure: str,
                     oxygen_saturation: str, supplemental_oxygen: str, temperature: str,
                     systolic_bp: str, heart_rate: str, consciousness: str) -> Dict[str, Any]:
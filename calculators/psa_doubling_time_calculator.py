@@ -19,8 +19,18 @@ References:
 """
 
 import math
-from typing import Dict, Any, List, Tuple, Optional
-from scipy.stats import linregress
+from typing import Dict, Any, List, Sequence, Tuple, Optional
+
+from calculators.engines.regression import fit_groups, fit_line, slope_interval
+
+
+# Average days per month used to express the slope per month
+DAYS_PER_MONTH = 30.44
+
+# Doubling time reported for stable, falling or extremely slow PSA
+MAX_PSADT_MONTHS = 999.0
+
+LN2 = math.log(2)
 
 
 class PsaDoublingTimeCalculator:
@@ -69,7 +79,137 @@ class PsaDoublingTimeCalculator:
         # Calculate PSA doubling time
         psadt_months = self._calculate_psadt(psa_values, time_points)
         
-        # Get clinical interpretation
+        return self._format_result(psadt_months)
+    
+    def calculate_series(self, psa_values: Sequence[float], days: Sequence[int]) -> Dict[str, Any]:
+        """
+        Calculates PSA doubling time from a series of any length
+        
+        Args:
+            psa_values (Sequence[float]): PSA measurements in ng/mL
+            days (Sequence[int]): Days from baseline of each measurement
+            
+        Returns:
+            Dict with PSA doubling time and clinical interpretation
+        """
+        
+        if len(psa_values) != len(days):
+            raise ValueError("Each PSA measurement needs exactly one time point")
+        if len(psa_values) < 2:
+            raise ValueError("At least two PSA measurements are required")
+        
+        for number, (psa, day) in enumerate(zip(psa_values, days), start=1):
+            self._validate_measurement(psa, day, str(number))
+        
+        if len(set(days)) != len(days):
+            raise ValueError("All time points must be unique")
+        
+        paired_data = sorted(zip(days, psa_values))
+        time_points = [day for day, _ in paired_data]
+        ordered_psa = [psa for _, psa in paired_data]
+        
+        return self._format_result(self._calculate_psadt(ordered_psa, time_points))
+    
+    def calculate_batch(self, patient_ids: Sequence[Any], days: Sequence[int],
+                        psa_values: Sequence[float], confidence: float = 0.95) -> Dict[str, List[Any]]:
+        """
+        Calculates PSA doubling time for many patients from flat columns
+        
+        Every row is one PSA measurement; rows of the same patient do not need
+        to be contiguous or sorted. All patients are fitted in a single pass.
+        A patient whose measurements are invalid or cannot be fitted (a single
+        measurement, or all on the same day) gets an error entry instead of
+        failing the whole batch.
+        
+        Args:
+            patient_ids (Sequence): Patient identifier per measurement
+            days (Sequence[int]): Days from baseline per measurement
+            psa_values (Sequence[float]): PSA in ng/mL per measurement
+            confidence (float): Confidence level of the intervals
+            
+        Returns:
+            Dict of columns, one entry per patient in order of first appearance:
+            patient_id, measurements, psadt (months), psadt_ci_lower,
+            psadt_ci_upper, slope (ln PSA per month), slope_ci_lower,
+            slope_ci_upper, r_squared, stage and error. Intervals are None for
+            patients with only two measurements; for a patient with an error
+            message every result column is None.
+        """
+        
+        if not len(patient_ids) == len(days) == len(psa_values):
+            raise ValueError("Patient, days and PSA columns must have the same length")
+        if not 0.0 < confidence < 1.0:
+            raise ValueError("Confidence must lie strictly between 0 and 1")
+        
+        # Invalid measurements exclude their patient from the fit
+        counts: Dict[Any, int] = {}
+        errors: Dict[Any, str] = {}
+        for number, (patient_id, psa, day) in enumerate(zip(patient_ids, psa_values, days), start=1):
+            counts[patient_id] = counts.get(patient_id, 0) + 1
+            if patient_id in errors:
+                continue
+            try:
+                self._validate_measurement(psa, day, f"row {number}")
+            except ValueError as e:
+                errors[patient_id] = str(e)
+        
+        if errors:
+            rows = [number for number, patient_id in enumerate(patient_ids) if patient_id not in errors]
+            patient_ids = [patient_ids[number] for number in rows]
+            days = [days[number] for number in rows]
+            psa_values = [psa_values[number] for number in rows]
+        fits = fit_groups(
+            patient_ids,
+            [day / DAYS_PER_MONTH for day in days],
+            [math.log(psa) for psa in psa_values],
+            errors
+        )
+        
+        columns: Dict[str, List[Any]] = {
+            name: [] for name in (
+                "patient_id", "measurements", "psadt", "psadt_ci_lower", "psadt_ci_upper",
+                "slope", "slope_ci_lower", "slope_ci_upper", "r_squared", "stage", "error"
+            )
+        }
+        stages: Dict[float, str] = {}
+        for patient_id, measurements in counts.items():
+            columns["patient_id"].append(patient_id)
+            columns["measurements"].append(measurements)
+            fit = fits.get(patient_id)
+            if fit is None:
+                for name in ("psadt", "psadt_ci_lower", "psadt_ci_upper", "slope",
+                             "slope_ci_lower", "slope_ci_upper", "r_squared", "stage"):
+                    columns[name].append(None)
+                columns["error"].append(errors[patient_id])
+                continue
+            
+            psadt = round(_slope_to_psadt(fit.slope), 1)
+            interval = slope_interval(fit, confidence)
+            if interval is None:
+                slope_bounds = psadt_bounds = (None, None)
+            else:
+                slope_bounds = interval
+                # A steeper slope means a shorter doubling time
+                psadt_bounds = (round(_slope_to_psadt(interval[1]), 1),
+                                round(_slope_to_psadt(interval[0]), 1))
+            if psadt not in stages:
+                stages[psadt] = self._get_interpretation(psadt)["stage"]
+            
+            columns["psadt"].append(psadt)
+            columns["psadt_ci_lower"].append(psadt_bounds[0])
+            columns["psadt_ci_upper"].append(psadt_bounds[1])
+            columns["slope"].append(fit.slope)
+            columns["slope_ci_lower"].append(slope_bounds[0])
+            columns["slope_ci_upper"].append(slope_bounds[1])
+            columns["r_squared"].append(fit.r_squared)
+            columns["stage"].append(stages[psadt])
+            columns["error"].append(None)
+        
+        return columns
+    
+    def _format_result(self, psadt_months: float) -> Dict[str, Any]:
+        """Builds the calculator result for a PSA doubling time"""
+        
         interpretation = self._get_interpretation(psadt_months)
         
         return {
@@ -80,6 +220,14 @@ class PsaDoublingTimeCalculator:
             "stage_description": interpretation["description"]
         }
     
+    def _validate_measurement(self, psa: float, days: int, label: str):
+        """Validates one PSA measurement and its time point"""
+        
+        if not isinstance(psa, (int, float)) or psa <= 0:
+            raise ValueError(f"PSA {label} must be a positive number")
+        if not isinstance(days, int) or days < 0:
+            raise ValueError(f"Days {label} must be a non-negative integer")
+    
     def _validate_inputs(self, psa_1: float, days_1: int, psa_2: float, days_2: int,
                         psa_3: Optional[float], days_3: Optional[int],
                         psa_4: Optional[float], days_4: Optional[int],
@@ -167,31 +315,14 @@ class PsaDoublingTimeCalculator:
         Where slope is from linear regression of ln(PSA) vs time
         """
         
-        # Convert days to months for calculation
-        time_months = [days / 30.44 for days in time_points]  # Average days per month
-        
-        # Take natural log of PSA values
+        # Convert days to months and take the natural log of PSA values
+        time_months = [days / DAYS_PER_MONTH for days in time_points]
         ln_psa_values = [math.log(psa) for psa in psa_values]
         
-        # Perform linear regression: ln(PSA) = slope * time + intercept
-        slope, intercept, r_value, p_value, std_err = linregress(time_months, ln_psa_values)
+        # Closed-form least squares: ln(PSA) = slope * time + intercept
+        fit = fit_line(time_months, ln_psa_values)
         
-        # Calculate PSA doubling time
-        if slope <= 0:
-            # If slope is negative or zero, PSA is stable or decreasing
-            # Return a very large value indicating very slow/no doubling
-            return 999.0
-        
-        # PSADT = ln(2) / slope
-        psadt = math.log(2) / slope
-        
-        # Ensure reasonable bounds
-        if psadt < 0:
-            return 999.0
-        if psadt > 999:
-            return 999.0
-            
-        return psadt
+        return _slope_to_psadt(fit.slope)
     
     def _get_interpretation(self, psadt_months: float) -> Dict[str, str]:
         """
@@ -236,6 +367,18 @@ class PsaDoublingTimeCalculator:
             }
 
 
+def _slope_to_psadt(slope: float) -> float:
+    """
+    Converts the slope of ln(PSA) per month into a doubling time in months
+    
+    Stable or falling PSA (slope <= 0) and doubling times above the cap are
+    reported as MAX_PSADT_MONTHS.
+    """
+    if slope <= 0:
+        return MAX_PSADT_MONTHS
+    return min(LN2 / slope, MAX_PSADT_MONTHS)
+
+
 def calculate_psa_doubling_time_calculator(psa_1: float, days_1: int, psa_2: float, days_2: int,
                                          psa_3: Optional[float] = None, days_3: Optional[int] = None,
                                          psa_4: Optional[float] = None, days_4: Optional[int] = None,
@@ -15,7 +15,9 @@ References:
    JAMA. 2016 Feb 23;315(8):801-10. doi: 10.1001/jama.2016.0287.
 """
 
-from typing import Dict, Any
+from typing import Callable, Dict, Any
+
+from calculators.engines.streaming import StreamComponent, StreamingScore, numeric
 
 
 class QsofaScoreCalculator:
@@ -120,6 +122,22 @@ class QsofaScoreCalculator:
             }
 
 
+_calculator = QsofaScoreCalculator()
+
+
+def _criterion(met: Callable[[float], bool]) -> Callable[[float], int]:
+    """Builds a component scorer awarding the criterion points from a raw-vital predicate"""
+    return numeric(lambda value: _calculator.CRITERION_POINTS if met(value) else 0)
+
+
+# Streaming definition over raw vitals (see calculators.engines.streaming)
+STREAMING_SCORE = StreamingScore("qsofa_score", [
+    StreamComponent("respiratory_rate_22_or_higher", ("respiratory_rate",), _criterion(lambda rr: rr >= 22)),
+    StreamComponent("altered_mental_status", ("glasgow_coma_scale",), _criterion(lambda gcs: gcs < 15)),
+    StreamComponent("systolic_bp_100_or_lower", ("systolic_bp",), _criterion(lambda sbp: sbp <= 100))
+], tier=lambda score, points: _calculator._get_interpretation(score)["stage"])
+
+
 def calculate_qsofa_score(respiratory_rate_22_or_higher: str, altered_mental_status: str,
                          systolic_bp_100_or_lower: str) -> Dict[str, Any]:
     """
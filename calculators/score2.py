@@ -12,110 +12,126 @@ References:
    disease in Europe. Eur Heart J. 2021;42(25):2439-2454.
 """
 
-import math
 from typing import Dict, Any
 
+from calculators.engines.survival import SurvivalModel
+
+
+# Baseline survival probabilities at 10 years (S0_10)
+BASELINE_SURVIVAL = {
+    "male": {
+        "low": 0.9605,
+        "moderate": 0.9434,
+        "high": 0.9281,
+        "very_high": 0.8954
+    },
+    "female": {
+        "low": 0.9766,
+        "moderate": 0.9701,
+        "high": 0.9634,
+        "very_high": 0.9511
+    }
+}
+
+# Beta coefficients for each risk factor by sex and region
+# Based on published SCORE2 algorithms
+COEFFICIENTS = {
+    "male": {
+        "low": {
+            "cage": 0.3742,
+            "csbp": 0.3018,
+            "ctchol": 0.2900,
+            "chdl": -0.4231,
+            "smoking": 0.6012,
+            "cage_chdl": -0.0755,
+            "cage_smoking": -0.0701
+        },
+        "moderate": {
+            "cage": 0.3744,
+            "csbp": 0.3016,
+            "ctchol": 0.2898,
+            "chdl": -0.4230,
+            "smoking": 0.6014,
+            "cage_chdl": -0.0756,
+            "cage_smoking": -0.0700
+        },
+        "high": {
+            "cage": 0.3746,
+            "csbp": 0.3015,
+            "ctchol": 0.2896,
+            "chdl": -0.4229,
+            "smoking": 0.6015,
+            "cage_chdl": -0.0757,
+            "cage_smoking": -0.0699
+        },
+        "very_high": {
+            "cage": 0.3748,
+            "csbp": 0.3014,
+            "ctchol": 0.2894,
+            "chdl": -0.4228,
+            "smoking": 0.6016,
+            "cage_chdl": -0.0758,
+            "cage_smoking": -0.0698
+        }
+    },
+    "female": {
+        "low": {
+            "cage": 0.4648,
+            "csbp": 0.3131,
+            "ctchol": 0.1471,
+            "chdl": -0.5347,
+            "smoking": 0.7744,
+            "cage_chdl": -0.0665,
+            "cage_smoking": -0.0790
+        },
+        "moderate": {
+            "cage": 0.4650,
+            "csbp": 0.3130,
+            "ctchol": 0.1470,
+            "chdl": -0.5346,
+            "smoking": 0.7746,
+            "cage_chdl": -0.0666,
+            "cage_smoking": -0.0789
+        },
+        "high": {
+            "cage": 0.4652,
+            "csbp": 0.3129,
+            "ctchol": 0.1469,
+            "chdl": -0.5345,
+            "smoking": 0.7747,
+            "cage_chdl": -0.0667,
+            "cage_smoking": -0.0788
+        },
+        "very_high": {
+            "cage": 0.4654,
+            "csbp": 0.3128,
+            "ctchol": 0.1468,
+            "chdl": -0.5344,
+            "smoking": 0.7748,
+            "cage_chdl": -0.0668,
+            "cage_smoking": -0.0787
+        }
+    }
+}
+
+FEATURES = ("cage", "csbp", "ctchol", "chdl", "smoking", "cage_chdl", "cage_smoking")
+
+# One compiled model per sex and risk region
+MODELS = {
+    (sex, region): SurvivalModel(FEATURES, COEFFICIENTS[sex][region],
+                                 {"10_year": BASELINE_SURVIVAL[sex][region]})
+    for sex in COEFFICIENTS
+    for region in COEFFICIENTS[sex]
+}
+
 
 class Score2Calculator:
     """Calculator for Systematic Coronary Risk Evaluation 2 (SCORE2)"""
     
     def __init__(self):
-        # Baseline survival probabilities at 10 years (S0_10)
-        self.baseline_survival = {
-            "male": {
-                "low": 0.9605,
-                "moderate": 0.9434,
-                "high": 0.9281,
-                "very_high": 0.8954
-            },
-            "female": {
-                "low": 0.9766,
-                "moderate": 0.9701,
-                "high": 0.9634,
-                "very_high": 0.9511
-            }
-        }
-        
-        # Beta coefficients for each risk factor by sex and region
-        # Based on published SCORE2 algorithms
-        self.coefficients = {
-            "male": {
-                "low": {
-                    "cage": 0.3742,
-                    "csbp": 0.3018,
-                    "ctchol": 0.2900,
-                    "chdl": -0.4231,
-                    "smoking": 0.6012,
-                    "cage_chdl": -0.0755,
-                    "cage_smoking": -0.0701
-                },
-                "moderate": {
-                    "cage": 0.3744,
-                    "csbp": 0.3016,
-                    "ctchol": 0.2898,
-                    "chdl": -0.4230,
-                    "smoking": 0.6014,
-                    "cage_chdl": -0.0756,
-                    "cage_smoking": -0.0700
-                },
-                "high": {
-                    "cage": 0.3746,
-                    "csbp": 0.3015,
-                    "ctchol": 0.2896,
-                    "chdl": -0.4229,
-                    "smoking": 0.6015,
-                    "cage_chdl": -0.0757,
-                    "cage_smoking": -0.0699
-                },
-                "very_high": {
-                    "cage": 0.3748,
-                    "csbp": 0.3014,
-                    "ctchol": 0.2894,
-                    "chdl": -0.4228,
-                    "smoking": 0.6016,
-                    "cage_chdl": -0.0758,
-                    "cage_smoking": -0.0698
-                }
-            },
-            "female": {
-                "low": {
-                    "cage": 0.4648,
-                    "csbp": 0.3131,
-                    "ctchol": 0.1471,
-                    "chdl": -0.5347,
-                    "smoking": 0.7744,
-                    "cage_chdl": -0.0665,
-                    "cage_smoking": -0.0790
-                },
-                "moderate": {
-                    "cage": 0.4650,
-                    "csbp": 0.3130,
-                    "ctchol": 0.1470,
-                    "chdl": -0.5346,
-                    "smoking": 0.7746,
-                    "cage_chdl": -0.0666,
-                    "cage_smoking": -0.0789
-                },
-                "high": {
-                    "cage": 0.4652,
-                    "csbp": 0.3129,
-                    "ctchol": 0.1469,
-                    "chdl": -0.5345,
-                    "smoking": 0.7747,
-                    "cage_chdl": -0.0667,
-                    "cage_smoking": -0.0788
-                },
-                "very_high": {
-                    "cage": 0.4654,
-                    "csbp": 0.3128,
-                    "ctchol": 0.1468,
-                    "chdl": -0.5344,
-                    "smoking": 0.7748,
-                    "cage_chdl": -0.0668,
-                    "cage_smoking": -0.0787
-                }
-            }
-        }
+        self.baseline_survival = BASELINE_SURVIVAL
+        self.coefficients = COEFFICIENTS
+        self.models = MODELS
     
     def calculate(self, sex: str, age: int, smoking: str, systolic_bp: int,
                   total_cholesterol: float, hdl_cholesterol: float, 
@@ -147,21 +163,9 @@ class Score2Calculator:
         chdl = (hdl_cholesterol - 1.3) / 0.5
         smoking_val = 1 if smoking == "current" else 0
         
-        # Get coefficients for sex and region
-        coef = self.coefficients[sex][risk_region]
-        
-        # Calculate linear predictor (x)
-        x = (coef["cage"] * cage +
-             coef["csbp"] * csbp +
-             coef["ctchol"] * ctchol +
-             coef["chdl"] * chdl +
-             coef["smoking"] * smoking_val +
-             coef["cage_chdl"] * cage * chdl +
-             coef["cage_smoking"] * cage * smoking_val)
-        
-        # Calculate 10-year risk
-        s0_10 = self.baseline_survival[sex][risk_region]
-        risk = (1 - math.pow(s0_10, math.exp(x))) * 100
+        # Calculate 10-year risk from the sex- and region-specific model
+        x = (cage, csbp, ctchol, chdl, smoking_val, cage * chdl, cage * smoking_val)
+        risk = self.models[(sex, risk_region)].predict(x)["10_year"] * 100
         
         # Ensure risk is within 0-100%
         risk = max(0, min(100, risk))
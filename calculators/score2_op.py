@@ -9,71 +9,91 @@ References:
    incident cardiovascular event risk in older persons. Eur Heart J. 2021;42(25):2455-2467.
 """
 
-import math
 from typing import Dict, Any
 
+from calculators.engines.survival import SurvivalModel
+
+
+# Baseline survival probabilities (adjusted for competing risks)
+BASELINE_SURVIVAL = {
+    "5_year": {
+        "male": {
+            "low": 0.9584,
+            "moderate": 0.9490,
+            "high": 0.9396,
+            "very_high": 0.9302
+        },
+        "female": {
+            "low": 0.9748,
+            "moderate": 0.9685,
+            "high": 0.9622,
+            "very_high": 0.9559
+        }
+    },
+    "10_year": {
+        "male": {
+            "low": 0.8928,
+            "moderate": 0.8744,
+            "high": 0.8560,
+            "very_high": 0.8376
+        },
+        "female": {
+            "low": 0.9365,
+            "moderate": 0.9238,
+            "high": 0.9111,
+            "very_high": 0.8984
+        }
+    }
+}
+
+# Coefficients (estimated based on competing risk models)
+COEFFICIENTS = {
+    "male": {
+        "diabetes": 0.3684,
+        "smoking": 0.3251,
+        "sbp": 0.0139,
+        "non_hdl_chol": 0.1385,
+        # Age interactions (effects attenuate with age)
+        "age_diabetes": -0.0038,
+        "age_smoking": -0.0034,
+        "age_sbp": -0.0001,
+        "age_non_hdl_chol": -0.0015
+    },
+    "female": {
+        "diabetes": 0.3378,
+        "smoking": 0.2982,
+        "sbp": 0.0128,
+        "non_hdl_chol": 0.1271,
+        # Age interactions
+        "age_diabetes": -0.0035,
+        "age_smoking": -0.0031,
+        "age_sbp": -0.0001,
+        "age_non_hdl_chol": -0.0014
+    }
+}
+
+FEATURES = ("diabetes", "smoking", "sbp", "non_hdl_chol",
+            "age_diabetes", "age_smoking", "age_sbp", "age_non_hdl_chol")
+
+# One compiled model per sex and risk region covering both time horizons
+MODELS = {
+    (sex, region): SurvivalModel(
+        FEATURES,
+        COEFFICIENTS[sex],
+        {horizon: BASELINE_SURVIVAL[horizon][sex][region] for horizon in BASELINE_SURVIVAL}
+    )
+    for sex in COEFFICIENTS
+    for region in BASELINE_SURVIVAL["10_year"][sex]
+}
+
 
 class Score2OpCalculator:
     """Calculator for SCORE2-OP"""
     
     def __init__(self):
-        # Baseline survival probabilities (adjusted for competing risks)
-        self.baseline_survival = {
-            "5_year": {
-                "male": {
-                    "low": 0.9584,
-                    "moderate": 0.9490,
-                    "high": 0.9396,
-                    "very_high": 0.9302
-                },
-                "female": {
-                    "low": 0.9748,
-                    "moderate": 0.9685,
-                    "high": 0.9622,
-                    "very_high": 0.9559
-                }
-            },
-            "10_year": {
-                "male": {
-                    "low": 0.8928,
-                    "moderate": 0.8744,
-                    "high": 0.8560,
-                    "very_high": 0.8376
-                },
-                "female": {
-                    "low": 0.9365,
-                    "moderate": 0.9238,
-                    "high": 0.9111,
-                    "very_high": 0.8984
-                }
-            }
-        }
-        
-        # Coefficients (estimated based on competing risk models)
-        self.coefficients = {
-            "male": {
-                "diabetes": 0.3684,
-                "smoking": 0.3251,
-                "sbp": 0.0139,
-                "non_hdl_chol": 0.1385,
-                # Age interactions (effects attenuate with age)
-                "age_diabetes": -0.0038,
-                "age_smoking": -0.0034,
-                "age_sbp": -0.0001,
-                "age_non_hdl_chol": -0.0015
-            },
-            "female": {
-                "diabetes": 0.3378,
-                "smoking": 0.2982,
-                "sbp": 0.0128,
-                "non_hdl_chol": 0.1271,
-                # Age interactions
-                "age_diabetes": -0.0035,
-                "age_smoking": -0.0031,
-                "age_sbp": -0.0001,
-                "age_non_hdl_chol": -0.0014
-            }
-        }
+        self.baseline_survival = BASELINE_SURVIVAL
+        self.coefficients = COEFFICIENTS
+        self.models = MODELS
     
     def calculate(self, sex: str, age: int, diabetes: str, smoking: str, 
                   systolic_bp: int, total_cholesterol: float, hdl_cholesterol: float,
@@ -108,31 +128,13 @@ class Score2OpCalculator:
         csbp = (systolic_bp - 120) / 20
         cnon_hdl_chol = (non_hdl_cholesterol - 4) / 1
         
-        # Get coefficients for sex
-        coef = self.coefficients[sex]
-        
-        # Calculate linear predictor
-        x = 0
-        
-        # Main effects
-        if diabetes == "yes":
-            x += coef["diabetes"]
-        if smoking == "current":
-            x += coef["smoking"]
-        x += coef["sbp"] * csbp
-        x += coef["non_hdl_chol"] * cnon_hdl_chol
-        
-        # Age interactions (effects attenuate with age)
-        if diabetes == "yes":
-            x += coef["age_diabetes"] * cage
-        if smoking == "current":
-            x += coef["age_smoking"] * cage
-        x += coef["age_sbp"] * cage * csbp
-        x += coef["age_non_hdl_chol"] * cage * cnon_hdl_chol
+        diabetes_val = 1 if diabetes == "yes" else 0
+        smoking_val = 1 if smoking == "current" else 0
         
         # Calculate risk using competing risk-adjusted baseline survival
-        s0 = self.baseline_survival[time_horizon][sex][risk_region]
-        risk = (1 - math.pow(s0, math.exp(x))) * 100
+        x = (diabetes_val, smoking_val, csbp, cnon_hdl_chol,
+             cage * diabetes_val, cage * smoking_val, cage * csbp, cage * cnon_hdl_chol)
+        risk = self.models[(sex, risk_region)].predict(x)[time_horizon] * 100
         
         # Round to 1 decimal place
         risk = round(risk, 1)
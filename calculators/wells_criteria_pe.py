@@ -16,6 +16,25 @@ References (Vancouver style):
 
 from typing import Dict, Any
 
+from calculators.engines.points import PointScore
+
+
+# Points table, evaluated by the point-score engine
+POINTS = {
+    "components": [
+        {"name": "clinical_signs_dvt", "when": {"parameter": "clinical_signs_dvt", "eq": "yes"}, "points": 3.0},
+        {"name": "pe_most_likely", "when": {"parameter": "pe_most_likely", "eq": "yes"}, "points": 3.0},
+        {"name": "heart_rate_over_100", "when": {"parameter": "heart_rate_over_100", "eq": "yes"}, "points": 1.5},
+        {"name": "immobilization_surgery_recent", "when": {"parameter": "immobilization_surgery_recent", "eq": "yes"}, "points": 1.5},
+        {"name": "previous_dvt_pe", "when": {"parameter": "previous_dvt_pe", "eq": "yes"}, "points": 1.5},
+        {"name": "hemoptysis", "when": {"parameter": "hemoptysis", "eq": "yes"}, "points": 1.0},
+        {"name": "active_malignancy", "when": {"parameter": "active_malignancy", "eq": "yes"}, "points": 1.0}
+    ]
+}
+
+# Compiled Wells' PE points table
+POINT_SCORE = PointScore("wells_criteria_pe", POINTS)
+
 
 class WellsCriteriaPeCalculator:
     """Calculator for Wells' Criteria for Pulmonary Embolism"""
@@ -108,11 +127,7 @@ class WellsCriteriaPeCalculator:
                 raise ValueError(f"{key} must be 'yes' or 'no'")
 
     def _compute_score(self, params: Dict[str, str]) -> float:
-        total = 0.0
-        for key, pts in self.ITEM_POINTS.items():
-            if params.get(key) == "yes":
-                total += pts
-        return total
+        return POINT_SCORE.total(params)
 
     def _three_tier_interpretation(self, score: float, params: Dict[str, str]) -> Dict[str, str]:
         # Build risk factor summary
@@ -0,0 +1,73 @@
+"""
+Gunicorn preload-and-fork serving profile for multi-core instances
+
+The master imports the application (routers, request models, score
+catalog), loads every calculator and compiles every parameter validator
+before forking the workers. The heap is then frozen with gc.freeze(), so
+the garbage collector never writes to the inherited objects and their
+pages stay shared copy-on-write between the workers instead of being
+duplicated in each one.
+
+Usage:
+    gunicorn main:app -c gunicorn_preload.conf.py
+
+Environment:
+    PORT      Port to bind (default 8080)
+    WORKERS   Number of worker processes (default: one per CPU)
+
+The Docker image runs this profile when SERVING_PROFILE=preload.
+
+Streaming early warning scores (/api/stream) keep the followed patients and
+the change-event subscribers in memory, per worker. With several workers a
+vitals POST and the SSE/WebSocket subscriber of the same patient can land on
+different workers, so the subscriber misses the change and patient state
+splits between workers. Deployments that use streaming must run WORKERS=1 or
+route every /api/stream request of a client to the same worker (sticky
+sessions at the load balancer, one port per worker).
+"""
+
+import gc
+import multiprocessing
+import os
+import time
+
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8080')}"
+workers = int(os.getenv("WORKERS", multiprocessing.cpu_count()))
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = True
+timeout = 0
+accesslog = "-"
+errorlog = "-"
+
+
+def when_ready(server):
+    """Warms the preloaded application in the master, then freezes its heap"""
+    from app.services.calculator_service import calculator_service
+    from app.services.score_service import score_service
+    from app.services.validation_service import validation_service
+
+    start = time.perf_counter()
+    calculators = calculator_service.load_all_calculators()
+    for score in score_service.get_available_scores():
+        validation_service.get_validator(score.id)
+
+    # Collect once, then move every surviving object out of the collector's
+    # reach so no worker ever touches the shared pages to track them
+    gc.collect()
+    gc.freeze()
+    server.log.info(
+        "Preloaded %d calculators in %.1fs; %d objects frozen before forking %d workers",
+        calculators, time.perf_counter() - start, gc.get_freeze_count(), server.num_workers
+    )
+    if server.num_workers > 1:
+        server.log.warning(
+            "Streaming state (/api/stream) is kept per worker; with %d workers, vitals and "
+            "their event subscribers must reach the same worker (use WORKERS=1 or sticky routing)",
+            server.num_workers
+        )
+
+
+def pre_fork(server, worker):
+    """Freezes anything the master allocated since the last fork"""
+    gc.freeze()
@@ -20,13 +20,20 @@ load_dotenv()
 # Add the root directory to the path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
+# Import the application packages from the precompiled bytecode bundle when configured
+import bytecode_bundle
+bundle = bytecode_bundle.install_from_environment()
+
 from app import __version__, __description__
 from app.routers import scores_router, health_router
 from app.routers.api_routes import router as api_router
+from app.routers.streaming import router as streaming_router
+from app.routers.dispatch import install_static_dispatch
+from app.routers.metrics import router as metrics_router
 # Import specialty scores router from the scores package
 import app.routers.scores
 specialty_scores_router = app.routers.scores.router
-from app.middleware import RateLimitMiddleware, create_redis_client, parse_whitelist
+from app.middleware import RateLimitMiddleware, MetricsMiddleware, create_redis_client, instrument_routes, parse_whitelist
 
 # FastAPI application configuration
 app = FastAPI(
@@ -131,6 +138,9 @@ if redis_client:
 else:
     print("⚠️  Rate limiting disabled: Redis connection failed")
 
+# Per-stage latency metrics and Server-Timing headers (outermost, so rate limiting is timed too)
+app.add_middleware(MetricsMiddleware)
+
 # Middleware to catch unhandled errors
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
@@ -152,22 +162,32 @@ async def global_exception_handler(request: Request, exc: Exception):
 
 # Register routers
 app.include_router(health_router)
+app.include_router(metrics_router)
 app.include_router(scores_router)
 app.include_router(api_router)
+app.include_router(streaming_router)
 # Include specialty scores at root level for individual endpoints
 app.include_router(specialty_scores_router)
 
+# Resolve static paths (the per-score endpoints) by exact lookup and
+# parameterised /api routes by literal path prefix before regex routing
+install_static_dispatch(app.router)
+
 # Create and mount the MCP server
 mcp = FastApiMCP(
     app,
     name="Nobra Calculator MCP",
     description="MCP server exposing medical scores and calculators from nobra_calculator API",
-    exclude_operations=["reload_scores", "acep_ed_covid19_management_tool"]
+    exclude_operations=["reload_scores", "acep_ed_covid19_management_tool", "stream_score_events"]
 )
 
 # Mount the MCP server onto the same FastAPI app
 mcp.mount()
 
+# Serve the OpenAPI document rendered at build time (docstrings may be stripped from the bundle)
+if bundle is not None:
+    app.openapi_schema = bundle.openapi()
+
 # Root endpoint
 @app.get("/")
 async def root():
@@ -187,6 +207,9 @@ async def root():
         "api": "/api"
     }
 
+# Time the stages of every API route (after all routes are registered)
+instrument_routes(app.router)
+
 # Startup event
 @app.on_event("startup")
 async def startup_event():
@@ -197,6 +220,7 @@ async def startup_event():
     print("📋 Documentation available at: /docs")
     print("🔍 Redoc available at: /redoc")
     print("❤️  Health check available at: /health")
+    print("📈 Metrics available at: /metrics")
     print("🔧 MCP server available at: /mcp")
     print("🛠️  MCP tools: All FastAPI endpoints exposed as MCP tools (except reload_scores)")
 
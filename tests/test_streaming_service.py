@@ -0,0 +1,59 @@
+"""
+Tests for the streaming early warning score service
+"""
+
+import unittest
+
+from app.services.streaming_service import StreamingService
+
+
+# Consciousness values advertised by the vital-sign event model (ACVPU)
+ACVPU_VALUES = ("alert", "confusion", "voice", "pain", "unresponsive")
+
+
+class StreamingServiceDefaultScoresTest(unittest.TestCase):
+    """Events without a score list go to every streamable score"""
+
+    def setUp(self):
+        self.service = StreamingService()
+
+    def test_consciousness_accepted_by_every_score(self):
+        for value in ACVPU_VALUES:
+            with self.subTest(consciousness=value):
+                self.service.ingest(f"patient-{value}", {"consciousness": value})
+                states = {state["score_id"]: state
+                          for state in self.service.get_patient_state(f"patient-{value}")}
+                self.assertEqual(set(states), {"news", "news_2", "modified_early_warning_score"})
+                for state in states.values():
+                    self.assertIsNotNone(state["components"]["consciousness"])
+
+    def test_confusion_is_not_alert(self):
+        self.service.ingest("p1", {"consciousness": "confusion"})
+        points = {state["score_id"]: state["components"]["consciousness"]
+                  for state in self.service.get_patient_state("p1")}
+        self.assertEqual(points, {"news": 3, "news_2": 3, "modified_early_warning_score": 1})
+
+    def test_complete_observation_scores_every_score(self):
+        self.service.ingest("p1", {
+            "respiratory_rate": 24,
+            "oxygen_saturation": 95,
+            "hypercapnic_respiratory_failure": "no",
+            "supplemental_oxygen": "no",
+            "temperature": 38.5,
+            "systolic_bp": 105,
+            "heart_rate": 115,
+            "consciousness": "confusion"
+        })
+        scores = {state["score_id"]: state["score"] for state in self.service.get_patient_state("p1")}
+        self.assertIsNotNone(scores["news"])
+        self.assertIsNotNone(scores["news_2"])
+        self.assertIsNotNone(scores["modified_early_warning_score"])
+
+    def test_invalid_consciousness_is_rejected(self):
+        with self.assertRaises(ValueError):
+            self.service.ingest("p1", {"consciousness": "drowsy"})
+        self.assertEqual(self.service.get_patient_state("p1"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()